@@ -0,0 +1,560 @@
+#!/usr/bin/env python3
+"""
+Optimizer benchmark suite
+
+Measures how the scheduling solvers scale on seeded synthetic workloads and
+compares runs against a stored JSON baseline. Runs fully offline: no database,
+no OpenAI.
+
+Usage:
+    python -m benchmarks.optimizer_benchmark run             # Print results
+    python -m benchmarks.optimizer_benchmark run --output=current.json
+    python -m benchmarks.optimizer_benchmark run --update-baseline
+    python -m benchmarks.optimizer_benchmark compare current.json
+"""
+
+import argparse
+import json
+import logging
+import platform
+import random
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from datetime import time as dt_time
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from humancompiler_optimizer.daily import (  # noqa: E402
+    DailySolverConfig,
+    SchedulerTask,
+    SlotKind,
+    TaskKind,
+    TimeSlot,
+    optimize_daily_schedule,
+)
+from humancompiler_optimizer.weekly import (  # noqa: E402
+    ProjectAllocationSpec,
+    WeeklySolverConfig,
+    WeeklyTaskSpec,
+    optimize_weekly_selection,
+)
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+DEFAULT_SIZES = (10, 50, 200, 500, 2000)
+SOLVERS = ("optimize_daily_schedule", "optimize_weekly_selection", "optimize_schedule")
+SCHEDULE_DATE = datetime(2025, 6, 23)
+FORMAT_VERSION = 1
+
+WORK_KINDS = (TaskKind.LIGHT_WORK, TaskKind.FOCUSED_WORK, TaskKind.STUDY)
+
+# A working day split the way users typically configure it in the UI
+DAY_SLOTS = (
+    (dt_time(9, 0), dt_time(10, 30), SlotKind.FOCUSED_WORK),
+    (dt_time(10, 30), dt_time(12, 0), SlotKind.FOCUSED_WORK),
+    (dt_time(13, 0), dt_time(14, 0), SlotKind.LIGHT_WORK),
+    (dt_time(14, 0), dt_time(15, 30), SlotKind.STUDY),
+    (dt_time(15, 30), dt_time(17, 0), SlotKind.FOCUSED_WORK),
+    (dt_time(17, 0), dt_time(18, 0), SlotKind.LIGHT_WORK),
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Workload:
+    """Synthetic solver input for one size"""
+
+    size: int
+    tasks: list[SchedulerTask]
+    time_slots: list[TimeSlot]
+    task_dependencies: dict[str, list[str]] = field(default_factory=dict)
+    goal_dependencies: dict[str, list[str]] = field(default_factory=dict)
+    weekly_tasks: list[WeeklyTaskSpec] = field(default_factory=list)
+    recurring_tasks: list[WeeklyTaskSpec] = field(default_factory=list)
+    project_allocations: list[ProjectAllocationSpec] = field(default_factory=list)
+    weekly_capacity_hours: float = 40.0
+
+
+def generate_workload(size: int, seed: int = 42) -> Workload:
+    """
+    Build a reproducible workload of ``size`` tasks.
+
+    Tasks are spread over projects (one per ~50 tasks) and goals (one per
+    ~8 tasks). About 10% of tasks depend on an earlier task and about 5% of
+    goals on an earlier goal of the same project, so dependency constraints
+    grow with the backlog like they do in real accounts.
+    """
+    rng = random.Random(seed * 100_003 + size)
+    project_ids = [f"project-{i}" for i in range(max(2, size // 50))]
+    goal_ids = [f"goal-{i}" for i in range(max(2, size // 8))]
+    goal_project = {goal_id: rng.choice(project_ids) for goal_id in goal_ids}
+
+    tasks: list[SchedulerTask] = []
+    for i in range(size):
+        goal_id = rng.choice(goal_ids)
+        due_date = None
+        if rng.random() < 0.7:
+            due_date = SCHEDULE_DATE + timedelta(days=rng.randint(-2, 14))
+        estimate = rng.choice((0.25, 0.5, 1.0, 1.5, 2.0, 3.0, 4.0))
+        tasks.append(
+            SchedulerTask(
+                id=f"task-{i}",
+                title=f"Task {i}",
+                estimate_hours=estimate,
+                priority=rng.randint(1, 5),
+                due_date=due_date,
+                kind=rng.choice(WORK_KINDS),
+                goal_id=goal_id,
+                project_id=goal_project[goal_id],
+                actual_hours=round(estimate * rng.choice((0, 0, 0, 0.25, 0.5)), 2),
+            )
+        )
+
+    task_dependencies: dict[str, list[str]] = {}
+    for i in range(1, size):
+        if rng.random() < 0.1:
+            task_dependencies[f"task-{i}"] = [f"task-{rng.randrange(i)}"]
+
+    goal_dependencies: dict[str, list[str]] = {}
+    for index, goal_id in enumerate(goal_ids[1:], start=1):
+        same_project = [
+            earlier
+            for earlier in goal_ids[:index]
+            if goal_project[earlier] == goal_project[goal_id]
+        ]
+        if same_project and rng.random() < 0.05:
+            goal_dependencies[goal_id] = [rng.choice(same_project)]
+
+    time_slots = [
+        TimeSlot(start=start, end=end, kind=kind) for start, end, kind in DAY_SLOTS
+    ]
+    # One project block per day, as with the UI's slot-to-project assignment
+    time_slots[-2].assigned_project_id = project_ids[0]
+
+    weekly_tasks = [
+        WeeklyTaskSpec(
+            id=task.id,
+            title=task.title,
+            hours=task.remaining_hours,
+            priority_score=round(rng.uniform(1.0, 10.0), 2),
+            project_id=task.project_id,
+        )
+        for task in tasks
+        if task.remaining_hours > 0
+    ]
+    recurring_tasks = [
+        WeeklyTaskSpec(
+            id=f"weekly-{i}",
+            title=f"Weekly {i}",
+            hours=rng.choice((0.5, 1.0, 2.0)),
+            priority_score=8.0,
+        )
+        for i in range(min(10, max(1, size // 20)))
+    ]
+    capacity = 40.0
+    share = capacity / len(project_ids)
+    project_allocations = [
+        ProjectAllocationSpec(
+            project_id=project_id,
+            target_hours=share,
+            max_hours=share * 1.5,
+            priority_weight=round(rng.uniform(0.0, 1.0), 2),
+        )
+        for project_id in project_ids
+    ]
+
+    return Workload(
+        size=size,
+        tasks=tasks,
+        time_slots=time_slots,
+        task_dependencies=task_dependencies,
+        goal_dependencies=goal_dependencies,
+        weekly_tasks=weekly_tasks,
+        recurring_tasks=recurring_tasks,
+        project_allocations=project_allocations,
+        weekly_capacity_hours=capacity,
+    )
+
+
+def _bench_daily(workload: Workload, settings: dict[str, Any]) -> dict[str, Any]:
+    result = optimize_daily_schedule(
+        workload.tasks,
+        workload.time_slots,
+        date=SCHEDULE_DATE,
+        task_dependencies=workload.task_dependencies,
+        goal_dependencies=workload.goal_dependencies,
+        config=DailySolverConfig(
+            max_time_in_seconds=settings["time_limit"],
+            max_deterministic_time=settings["deterministic_time"],
+            num_workers=settings["workers"],
+        ),
+    )
+    return {
+        "build_seconds": result.solve_time_seconds - result.solver_wall_time_seconds,
+        "solve_seconds": result.solver_wall_time_seconds,
+        "model_variables": result.model_variables,
+        "model_constraints": result.model_constraints,
+        "objective": result.objective_value,
+        "status": result.optimization_status,
+    }
+
+
+def _bench_weekly(workload: Workload, settings: dict[str, Any]) -> dict[str, Any]:
+    result = optimize_weekly_selection(
+        tasks=workload.weekly_tasks,
+        recurring_tasks=workload.recurring_tasks,
+        project_allocations=workload.project_allocations,
+        total_capacity_hours=workload.weekly_capacity_hours,
+        config=WeeklySolverConfig(
+            max_time_in_seconds=settings["time_limit"],
+            max_deterministic_time=settings["deterministic_time"],
+            num_workers=settings["workers"],
+        ),
+    )
+    return {
+        "build_seconds": result.solve_time_seconds - result.solver_wall_time_seconds,
+        "solve_seconds": result.solver_wall_time_seconds,
+        "model_variables": result.model_variables,
+        "model_constraints": result.model_constraints,
+        "objective": result.objective_value,
+        "status": result.status,
+    }
+
+
+def _bench_api_schedule(workload: Workload, settings: dict[str, Any]) -> dict[str, Any]:
+    """
+    The API daily path (routers.scheduler.optimize_schedule) on an all_tasks
+    backlog: candidate pruning and fixture build, then the planner. The steps
+    are timed separately and the solver result cache is bypassed.
+    """
+    from humancompiler_api.routers.scheduler import (
+        _prepare_daily_solve,
+        _schedule_result_from_report,
+        plan_daily_schedule,
+    )
+
+    started = time.perf_counter()
+    prepared = _prepare_daily_solve(
+        workload.tasks,
+        workload.time_slots,
+        SCHEDULE_DATE,
+        prune_candidates=True,
+    )
+    built = time.perf_counter()
+    if prepared.early_result is not None:
+        result = prepared.early_result
+        solved = built
+    else:
+        report = plan_daily_schedule(prepared.fixture)
+        solved = time.perf_counter()
+        result = _schedule_result_from_report(prepared, report)
+
+    return {
+        "build_seconds": built - started,
+        "solve_seconds": solved - built,
+        "model_variables": len(prepared.fixture.tasks) if prepared.fixture else 0,
+        "model_constraints": 0,
+        "objective": result.objective_value,
+        "status": result.optimization_status,
+    }
+
+
+BENCHMARKS: dict[str, Callable[[Workload, dict[str, Any]], dict[str, Any]]] = {
+    "optimize_daily_schedule": _bench_daily,
+    "optimize_weekly_selection": _bench_weekly,
+    "optimize_schedule": _bench_api_schedule,
+}
+
+
+def _package_version(name: str) -> str:
+    try:
+        return version(name)
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def run_benchmarks(
+    sizes: tuple[int, ...] = DEFAULT_SIZES,
+    solvers: tuple[str, ...] = SOLVERS,
+    seed: int = 42,
+    repeat: int = 3,
+    time_limit: float = 30.0,
+    deterministic_time: float = 5.0,
+    workers: int = 1,
+) -> dict[str, Any]:
+    """
+    Run every solver on every size and return a baseline-format document.
+
+    Times are the median of ``repeat`` runs. CP-SAT is limited by
+    deterministic time with a single worker by default, so objectives and
+    model sizes are reproducible across machines and only timings vary.
+    """
+    settings = {
+        "time_limit": time_limit,
+        "deterministic_time": deterministic_time,
+        "workers": workers,
+    }
+    results = []
+    for size in sizes:
+        workload = generate_workload(size, seed)
+        for solver in solvers:
+            runs = [BENCHMARKS[solver](workload, settings) for _ in range(repeat)]
+            last = runs[-1]
+            build = statistics.median(run["build_seconds"] for run in runs)
+            solve = statistics.median(run["solve_seconds"] for run in runs)
+            entry = {
+                "solver": solver,
+                "size": size,
+                "build_seconds": round(build, 4),
+                "solve_seconds": round(solve, 4),
+                "total_seconds": round(build + solve, 4),
+                "model_variables": last["model_variables"],
+                "model_constraints": last["model_constraints"],
+                "objective": last["objective"],
+                "status": last["status"],
+            }
+            logger.info(
+                f"{solver} size={size}: build {entry['build_seconds']:.3f}s, "
+                f"solve {entry['solve_seconds']:.3f}s, status {entry['status']}"
+            )
+            results.append(entry)
+
+    return {
+        "format_version": FORMAT_VERSION,
+        "created_at": datetime.now(UTC).isoformat(),
+        "parameters": {
+            "seed": seed,
+            "sizes": list(sizes),
+            "repeat": repeat,
+            "time_limit_seconds": time_limit,
+            "deterministic_time": deterministic_time,
+            "workers": workers,
+        },
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "ortools": _package_version("ortools"),
+            "humancompiler_scheduler": _package_version("humancompiler-scheduler"),
+        },
+        "results": results,
+    }
+
+
+def compare_results(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    time_tolerance: float = 0.5,
+    min_time_delta: float = 0.05,
+    objective_tolerance: float = 0.01,
+    size_tolerance: float = 0.1,
+) -> list[str]:
+    """
+    Return human-readable regressions of ``current`` against ``baseline``.
+
+    A timing regression needs both a relative slowdown above
+    ``time_tolerance`` and an absolute one above ``min_time_delta`` so tiny
+    sizes don't flap on noise. Objectives are maximised, so only drops count.
+    """
+    baseline_by_key = {(r["solver"], r["size"]): r for r in baseline["results"]}
+    regressions: list[str] = []
+
+    for entry in current["results"]:
+        key = (entry["solver"], entry["size"])
+        reference = baseline_by_key.get(key)
+        if reference is None:
+            continue
+        label = f"{entry['solver']} size={entry['size']}"
+
+        for metric in ("build_seconds", "solve_seconds", "total_seconds"):
+            before, after = reference[metric], entry[metric]
+            if after - before > min_time_delta and after > before * (
+                1 + time_tolerance
+            ):
+                regressions.append(
+                    f"{label}: {metric} {before:.3f}s -> {after:.3f}s "
+                    f"(+{(after / before - 1) * 100 if before else 100:.0f}%)"
+                )
+
+        before_objective = reference["objective"]
+        if entry["objective"] < before_objective - abs(before_objective) * (
+            objective_tolerance
+        ):
+            regressions.append(
+                f"{label}: objective {before_objective:g} -> {entry['objective']:g}"
+            )
+
+        for metric in ("model_variables", "model_constraints"):
+            before, after = reference[metric], entry[metric]
+            if after > before * (1 + size_tolerance):
+                regressions.append(f"{label}: {metric} {before} -> {after}")
+
+        if reference["status"] in ("OPTIMAL", "FEASIBLE") and entry["status"] not in (
+            "OPTIMAL",
+            "FEASIBLE",
+        ):
+            regressions.append(
+                f"{label}: status {reference['status']} -> {entry['status']}"
+            )
+
+    return regressions
+
+
+def _print_results(document: dict[str, Any]) -> None:
+    header = f"{'solver':<28}{'size':>6}{'build s':>10}{'solve s':>10}{'vars':>9}{'cons':>9}  status"
+    print(header)
+    print("-" * len(header))
+    for r in document["results"]:
+        print(
+            f"{r['solver']:<28}{r['size']:>6}{r['build_seconds']:>10.3f}"
+            f"{r['solve_seconds']:>10.3f}{r['model_variables']:>9}"
+            f"{r['model_constraints']:>9}  {r['status']}"
+        )
+
+
+def _quiet_api_logging() -> None:
+    # The API path logs per-call notices (no DB session, pruning) on every
+    # run; the scheduler router pins its own logger to DEBUG at import time,
+    # so import it first and then turn both down.
+    import humancompiler_api.routers.scheduler  # noqa: F401
+
+    for name in ("humancompiler_api", "humancompiler_api.routers.scheduler"):
+        logging.getLogger(name).setLevel(logging.ERROR)
+
+
+def _load(path: Path) -> dict[str, Any]:
+    with path.open(encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _write(document: dict[str, Any], path: Path) -> None:
+    with path.open("w", encoding="utf-8") as f:
+        json.dump(document, f, indent=2)
+        f.write("\n")
+
+
+def _parse_sizes(value: str) -> tuple[int, ...]:
+    return tuple(int(part) for part in value.split(",") if part.strip())
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="HumanCompiler optimizer benchmarks",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python -m benchmarks.optimizer_benchmark run --sizes=10,50,200
+  python -m benchmarks.optimizer_benchmark run --output=current.json --check
+  python -m benchmarks.optimizer_benchmark run --update-baseline
+  python -m benchmarks.optimizer_benchmark compare current.json
+        """,
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run benchmarks")
+    run_parser.add_argument(
+        "--sizes",
+        type=_parse_sizes,
+        default=DEFAULT_SIZES,
+        help="Comma-separated task counts (default: 10,50,200,500,2000)",
+    )
+    run_parser.add_argument(
+        "--solvers",
+        type=lambda value: tuple(value.split(",")),
+        default=SOLVERS,
+        help=f"Comma-separated subset of: {','.join(SOLVERS)}",
+    )
+    run_parser.add_argument("--seed", type=int, default=42)
+    run_parser.add_argument("--repeat", type=int, default=3)
+    run_parser.add_argument("--time-limit", type=float, default=30.0)
+    run_parser.add_argument(
+        "--deterministic-time",
+        type=float,
+        default=5.0,
+        help="CP-SAT deterministic time limit (keeps objectives reproducible)",
+    )
+    run_parser.add_argument("--workers", type=int, default=1)
+    run_parser.add_argument("--output", type=Path, help="Write results to this file")
+    run_parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help=f"Overwrite {BASELINE_PATH.name} with the results",
+    )
+    run_parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Compare against the baseline and fail on regressions",
+    )
+
+    compare_parser = subparsers.add_parser(
+        "compare", help="Compare a results file with the baseline"
+    )
+    compare_parser.add_argument("current", type=Path)
+    compare_parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+
+    for sub in (run_parser, compare_parser):
+        sub.add_argument("--time-tolerance", type=float, default=0.5)
+        sub.add_argument("--min-time-delta", type=float, default=0.05)
+        sub.add_argument("--objective-tolerance", type=float, default=0.01)
+        sub.add_argument("--verbose", "-v", action="store_true")
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    if not args.verbose:
+        _quiet_api_logging()
+
+    if args.command == "run":
+        unknown = set(args.solvers) - set(SOLVERS)
+        if unknown:
+            parser.error(f"Unknown solvers: {', '.join(sorted(unknown))}")
+        current = run_benchmarks(
+            sizes=args.sizes,
+            solvers=args.solvers,
+            seed=args.seed,
+            repeat=args.repeat,
+            time_limit=args.time_limit,
+            deterministic_time=args.deterministic_time,
+            workers=args.workers,
+        )
+        _print_results(current)
+        if args.output:
+            _write(current, args.output)
+        if args.update_baseline:
+            _write(current, BASELINE_PATH)
+            print(f"\nBaseline updated: {BASELINE_PATH}")
+        if not args.check:
+            return 0
+        baseline_path = BASELINE_PATH
+    else:
+        current = _load(args.current)
+        baseline_path = args.baseline
+
+    regressions = compare_results(
+        _load(baseline_path),
+        current,
+        time_tolerance=args.time_tolerance,
+        min_time_delta=args.min_time_delta,
+        objective_tolerance=args.objective_tolerance,
+    )
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) against {baseline_path}:")
+        for line in regressions:
+            print(f"  - {line}")
+        return 1
+
+    print(f"\nNo regressions against {baseline_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -141,6 +141,26 @@ def override_settings():
     settings.environment = original_env
 
 
+@pytest.fixture(autouse=True)
+def clear_solver_result_cache():
+    """Keep cached solver results from leaking between tests"""
+    from humancompiler_api.solver_cache import solver_result_cache
+
+    solver_result_cache.clear()
+    yield
+    solver_result_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_llm_response_cache():
+    """Keep cached model answers from leaking between tests"""
+    from humancompiler_api.ai.response_cache import llm_response_cache
+
+    llm_response_cache.clear()
+    yield
+    llm_response_cache.clear()
+
+
 @pytest.fixture
 def test_user_id():
     """Provide a test user ID"""
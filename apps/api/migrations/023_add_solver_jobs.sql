@@ -0,0 +1,53 @@
+-- Migration: Add solver jobs table
+-- Date: 2026-10-16
+-- Description: Persist background solver jobs (weekly task solver, daily schedule) so
+-- clients can poll for results and results survive API restarts.
+
+DO $$
+BEGIN
+    IF to_regclass('public.users') IS NULL THEN
+        RAISE EXCEPTION 'Required table public.users is missing. Apply earlier migrations before 023_add_solver_jobs.sql.';
+    END IF;
+    IF to_regprocedure('public.update_updated_at_column()') IS NULL THEN
+        RAISE EXCEPTION 'Required function public.update_updated_at_column() is missing. Apply earlier migrations before 023_add_solver_jobs.sql.';
+    END IF;
+END $$;
+
+CREATE TABLE IF NOT EXISTS public.solver_jobs (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    user_id UUID NOT NULL REFERENCES public.users(id) ON DELETE CASCADE,
+    job_type TEXT NOT NULL CHECK (job_type IN ('weekly_task_solver', 'daily_schedule')),
+    status TEXT NOT NULL DEFAULT 'queued' CHECK (status IN ('queued', 'running', 'completed', 'failed')),
+    progress INTEGER NOT NULL DEFAULT 0 CHECK (progress >= 0 AND progress <= 100),
+    progress_message TEXT CHECK (length(progress_message) <= 200),
+    request_json JSONB NOT NULL DEFAULT '{}'::jsonb,
+    result_json JSONB,
+    error_message TEXT CHECK (length(error_message) <= 1000),
+    started_at TIMESTAMP WITH TIME ZONE,
+    completed_at TIMESTAMP WITH TIME ZONE,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_solver_jobs_user_created ON public.solver_jobs(user_id, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_solver_jobs_status ON public.solver_jobs(status);
+
+ALTER TABLE public.solver_jobs ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS solver_jobs_policy ON public.solver_jobs;
+
+CREATE POLICY solver_jobs_policy
+    ON public.solver_jobs
+    FOR ALL
+    TO authenticated
+    USING (auth.uid()::text = user_id::text)
+    WITH CHECK (auth.uid()::text = user_id::text);
+
+GRANT SELECT, INSERT, UPDATE, DELETE ON public.solver_jobs TO authenticated;
+
+DROP TRIGGER IF EXISTS update_solver_jobs_updated_at ON public.solver_jobs;
+CREATE TRIGGER update_solver_jobs_updated_at
+    BEFORE UPDATE ON public.solver_jobs
+    FOR EACH ROW EXECUTE FUNCTION public.update_updated_at_column();
+
+COMMENT ON TABLE public.solver_jobs IS 'Background solver runs with persisted request, progress and result';
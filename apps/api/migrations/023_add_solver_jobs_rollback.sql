@@ -0,0 +1,3 @@
+-- Rollback: Add solver jobs table
+
+DROP TABLE IF EXISTS public.solver_jobs;
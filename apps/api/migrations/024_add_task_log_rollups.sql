@@ -0,0 +1,61 @@
+-- Migration: Add task log rollups
+-- Date: 2026-10-16
+-- Description: Per-task totals of logs.actual_minutes and log count, maintained by the
+-- log service on every log write so progress, timeline, scheduling and triage reads do
+-- not aggregate all logs. Backfilled from existing logs; `python rollups.py reconcile`
+-- recomputes them later if they drift.
+
+DO $$
+BEGIN
+    IF to_regclass('public.tasks') IS NULL OR to_regclass('public.logs') IS NULL THEN
+        RAISE EXCEPTION 'Required tables public.tasks and public.logs are missing. Apply earlier migrations before 024_add_task_log_rollups.sql.';
+    END IF;
+END $$;
+
+CREATE TABLE IF NOT EXISTS public.task_log_rollups (
+    task_id UUID PRIMARY KEY REFERENCES public.tasks(id) ON DELETE CASCADE,
+    actual_minutes INTEGER NOT NULL DEFAULT 0,
+    log_count INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+-- Backfill from existing logs
+INSERT INTO public.task_log_rollups (task_id, actual_minutes, log_count, updated_at)
+SELECT task_id, SUM(actual_minutes), COUNT(*), NOW()
+FROM public.logs
+GROUP BY task_id
+ON CONFLICT (task_id) DO UPDATE
+    SET actual_minutes = EXCLUDED.actual_minutes,
+        log_count = EXCLUDED.log_count,
+        updated_at = EXCLUDED.updated_at;
+
+ALTER TABLE public.task_log_rollups ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS task_log_rollups_via_tasks ON public.task_log_rollups;
+
+CREATE POLICY task_log_rollups_via_tasks
+    ON public.task_log_rollups
+    FOR ALL
+    TO authenticated
+    USING (
+        EXISTS (
+            SELECT 1 FROM public.tasks t
+            JOIN public.goals g ON g.id = t.goal_id
+            JOIN public.projects p ON p.id = g.project_id
+            WHERE t.id = task_log_rollups.task_id
+            AND auth.uid()::text = p.owner_id::text
+        )
+    )
+    WITH CHECK (
+        EXISTS (
+            SELECT 1 FROM public.tasks t
+            JOIN public.goals g ON g.id = t.goal_id
+            JOIN public.projects p ON p.id = g.project_id
+            WHERE t.id = task_log_rollups.task_id
+            AND auth.uid()::text = p.owner_id::text
+        )
+    );
+
+GRANT SELECT, INSERT, UPDATE, DELETE ON public.task_log_rollups TO authenticated;
+
+COMMENT ON TABLE public.task_log_rollups IS 'Per-task sum of logged minutes and log count, maintained on log writes';
@@ -0,0 +1,3 @@
+-- Rollback: Add task log rollups
+
+DROP TABLE IF EXISTS public.task_log_rollups;
@@ -0,0 +1,153 @@
+-- Migration: Add goal and project progress rollups
+-- Date: 2026-10-16
+-- Description: Per-goal and per-project totals (task counts by status, estimated hours,
+-- logged minutes, and goal count/estimate per project), maintained by the task, goal
+-- and log services on every write so progress pages and the all-projects progress
+-- endpoint do not walk every task. Backfilled from existing rows; `python rollups.py
+-- reconcile` recomputes them later if they drift. Requires 024_add_task_log_rollups.sql.
+
+DO $$
+BEGIN
+    IF to_regclass('public.task_log_rollups') IS NULL THEN
+        RAISE EXCEPTION 'Required table public.task_log_rollups is missing. Apply 024_add_task_log_rollups.sql before 025_add_progress_rollups.sql.';
+    END IF;
+END $$;
+
+CREATE TABLE IF NOT EXISTS public.goal_progress_rollups (
+    goal_id UUID PRIMARY KEY REFERENCES public.goals(id) ON DELETE CASCADE,
+    task_count INTEGER NOT NULL DEFAULT 0,
+    pending_tasks INTEGER NOT NULL DEFAULT 0,
+    in_progress_tasks INTEGER NOT NULL DEFAULT 0,
+    completed_tasks INTEGER NOT NULL DEFAULT 0,
+    cancelled_tasks INTEGER NOT NULL DEFAULT 0,
+    task_estimate_hours NUMERIC(10, 2) NOT NULL DEFAULT 0,
+    actual_minutes INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+CREATE TABLE IF NOT EXISTS public.project_progress_rollups (
+    project_id UUID PRIMARY KEY REFERENCES public.projects(id) ON DELETE CASCADE,
+    goal_count INTEGER NOT NULL DEFAULT 0,
+    goal_estimate_hours NUMERIC(10, 2) NOT NULL DEFAULT 0,
+    task_count INTEGER NOT NULL DEFAULT 0,
+    pending_tasks INTEGER NOT NULL DEFAULT 0,
+    in_progress_tasks INTEGER NOT NULL DEFAULT 0,
+    completed_tasks INTEGER NOT NULL DEFAULT 0,
+    cancelled_tasks INTEGER NOT NULL DEFAULT 0,
+    task_estimate_hours NUMERIC(10, 2) NOT NULL DEFAULT 0,
+    actual_minutes INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+-- Backfill goal totals from tasks and task log rollups
+INSERT INTO public.goal_progress_rollups (
+    goal_id, task_count, pending_tasks, in_progress_tasks, completed_tasks,
+    cancelled_tasks, task_estimate_hours, actual_minutes, updated_at
+)
+SELECT
+    t.goal_id,
+    COUNT(*),
+    COUNT(*) FILTER (WHERE t.status = 'pending'),
+    COUNT(*) FILTER (WHERE t.status = 'in_progress'),
+    COUNT(*) FILTER (WHERE t.status = 'completed'),
+    COUNT(*) FILTER (WHERE t.status = 'cancelled'),
+    COALESCE(SUM(t.estimate_hours), 0),
+    COALESCE(SUM(r.actual_minutes), 0),
+    NOW()
+FROM public.tasks t
+LEFT JOIN public.task_log_rollups r ON r.task_id = t.id
+GROUP BY t.goal_id
+ON CONFLICT (goal_id) DO UPDATE
+    SET task_count = EXCLUDED.task_count,
+        pending_tasks = EXCLUDED.pending_tasks,
+        in_progress_tasks = EXCLUDED.in_progress_tasks,
+        completed_tasks = EXCLUDED.completed_tasks,
+        cancelled_tasks = EXCLUDED.cancelled_tasks,
+        task_estimate_hours = EXCLUDED.task_estimate_hours,
+        actual_minutes = EXCLUDED.actual_minutes,
+        updated_at = EXCLUDED.updated_at;
+
+-- Backfill project totals from goals and the goal totals above
+INSERT INTO public.project_progress_rollups (
+    project_id, goal_count, goal_estimate_hours, task_count, pending_tasks,
+    in_progress_tasks, completed_tasks, cancelled_tasks, task_estimate_hours,
+    actual_minutes, updated_at
+)
+SELECT
+    g.project_id,
+    COUNT(*),
+    COALESCE(SUM(g.estimate_hours), 0),
+    COALESCE(SUM(gr.task_count), 0),
+    COALESCE(SUM(gr.pending_tasks), 0),
+    COALESCE(SUM(gr.in_progress_tasks), 0),
+    COALESCE(SUM(gr.completed_tasks), 0),
+    COALESCE(SUM(gr.cancelled_tasks), 0),
+    COALESCE(SUM(gr.task_estimate_hours), 0),
+    COALESCE(SUM(gr.actual_minutes), 0),
+    NOW()
+FROM public.goals g
+LEFT JOIN public.goal_progress_rollups gr ON gr.goal_id = g.id
+GROUP BY g.project_id
+ON CONFLICT (project_id) DO UPDATE
+    SET goal_count = EXCLUDED.goal_count,
+        goal_estimate_hours = EXCLUDED.goal_estimate_hours,
+        task_count = EXCLUDED.task_count,
+        pending_tasks = EXCLUDED.pending_tasks,
+        in_progress_tasks = EXCLUDED.in_progress_tasks,
+        completed_tasks = EXCLUDED.completed_tasks,
+        cancelled_tasks = EXCLUDED.cancelled_tasks,
+        task_estimate_hours = EXCLUDED.task_estimate_hours,
+        actual_minutes = EXCLUDED.actual_minutes,
+        updated_at = EXCLUDED.updated_at;
+
+ALTER TABLE public.goal_progress_rollups ENABLE ROW LEVEL SECURITY;
+ALTER TABLE public.project_progress_rollups ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS goal_progress_rollups_via_goals ON public.goal_progress_rollups;
+DROP POLICY IF EXISTS project_progress_rollups_via_projects ON public.project_progress_rollups;
+
+CREATE POLICY goal_progress_rollups_via_goals
+    ON public.goal_progress_rollups
+    FOR ALL
+    TO authenticated
+    USING (
+        EXISTS (
+            SELECT 1 FROM public.goals g
+            JOIN public.projects p ON p.id = g.project_id
+            WHERE g.id = goal_progress_rollups.goal_id
+            AND auth.uid()::text = p.owner_id::text
+        )
+    )
+    WITH CHECK (
+        EXISTS (
+            SELECT 1 FROM public.goals g
+            JOIN public.projects p ON p.id = g.project_id
+            WHERE g.id = goal_progress_rollups.goal_id
+            AND auth.uid()::text = p.owner_id::text
+        )
+    );
+
+CREATE POLICY project_progress_rollups_via_projects
+    ON public.project_progress_rollups
+    FOR ALL
+    TO authenticated
+    USING (
+        EXISTS (
+            SELECT 1 FROM public.projects p
+            WHERE p.id = project_progress_rollups.project_id
+            AND auth.uid()::text = p.owner_id::text
+        )
+    )
+    WITH CHECK (
+        EXISTS (
+            SELECT 1 FROM public.projects p
+            WHERE p.id = project_progress_rollups.project_id
+            AND auth.uid()::text = p.owner_id::text
+        )
+    );
+
+GRANT SELECT, INSERT, UPDATE, DELETE ON public.goal_progress_rollups TO authenticated;
+GRANT SELECT, INSERT, UPDATE, DELETE ON public.project_progress_rollups TO authenticated;
+
+COMMENT ON TABLE public.goal_progress_rollups IS 'Per-goal task counts by status, estimated hours and logged minutes, maintained on task and log writes';
+COMMENT ON TABLE public.project_progress_rollups IS 'Per-project goal and task totals, maintained on goal, task and log writes';
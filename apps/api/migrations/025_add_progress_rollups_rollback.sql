@@ -0,0 +1,4 @@
+-- Rollback: Add goal and project progress rollups
+
+DROP TABLE IF EXISTS public.project_progress_rollups;
+DROP TABLE IF EXISTS public.goal_progress_rollups;
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Task log and progress rollup maintenance CLI
+
+Usage:
+    python rollups.py reconcile                  # Backfill and fix all rollups
+    python rollups.py reconcile --dry-run        # Only report differences
+    python rollups.py reconcile --user-id=<id>   # Limit to one user's tasks
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from humancompiler_api.database import db
+from humancompiler_api.progress_rollups import reconcile_progress_rollups
+from humancompiler_api.task_rollups import reconcile_task_rollups
+from sqlmodel import Session
+from uuid import UUID
+import argparse
+import logging
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Recompute task, goal and project totals from their source rows",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python rollups.py reconcile                 # Backfill and fix all rollups
+  python rollups.py reconcile --dry-run       # Only report differences
+  python rollups.py reconcile --user-id=<id>  # Limit to one user's tasks
+        """,
+    )
+
+    parser.add_argument("command", choices=["reconcile"], help="Command to execute")
+    parser.add_argument("--user-id", type=UUID, help="Only reconcile this user's tasks")
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Report differences without fixing"
+    )
+    parser.add_argument(
+        "--verbose", "-v", action="store_true", help="Enable verbose logging"
+    )
+
+    args = parser.parse_args()
+
+    # Setup logging
+    log_level = logging.DEBUG if args.verbose else logging.INFO
+    logging.basicConfig(
+        level=log_level, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+
+    try:
+        with Session(db.get_engine()) as session:
+            print("🔍 Comparing task log rollups with logs...")
+            task_result = reconcile_task_rollups(
+                session, owner_id=args.user_id, dry_run=args.dry_run
+            )
+            # Goal and project minutes are summed from the task rollups
+            print("🔍 Comparing goal and project rollups with tasks...")
+            progress_result = reconcile_progress_rollups(
+                session, owner_id=args.user_id, dry_run=args.dry_run
+            )
+
+        action = "Would fix" if args.dry_run else "Fixed"
+        for label, result in (
+            ("task", task_result),
+            ("goal/project", progress_result),
+        ):
+            print(
+                f"✅ Checked {result.checked} {label} rollup(s). {action}: "
+                f"{result.created} created, {result.updated} updated, "
+                f"{result.removed} removed"
+            )
+
+    except KeyboardInterrupt:
+        print("\n⚠️  Operation cancelled by user")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n❌ Unexpected error: {e}")
+        if args.verbose:
+            import traceback
+
+            traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
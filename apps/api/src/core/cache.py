@@ -1,59 +1,274 @@
 """
 Caching module for TaskAgent API
 Provides TTL-based in-memory caching with configurable strategies
+
+Entries of functions decorated with ``cached(user_arg=..., tags=...)`` live in
+a per-user namespace and are indexed by tag, so the service layer can drop
+exactly the entries a write affects (``invalidate_user_cache(user_id,
+"tasks")``) instead of clearing whole caches.
+A result whose tags were invalidated while it was being computed is returned
+but not stored, since it may have been built from data the write replaced.
+
+Concurrent misses for the same key share one computation (``SingleFlight``):
+only the first caller runs the function, the others wait for its result and
+are counted as ``coalesced``.
+
+Entries are stored through a ``CacheBackend`` (see ``core.cache_backends``).
+The default keeps them in this process; ``configure_cache_backend`` can
+switch to a shared store so several API instances reuse each other's results.
 """
 
 from typing import Any, TypeVar
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable, Iterable
 from functools import wraps
 import hashlib
 import asyncio
+import inspect
+import threading
+import time
 from cachetools import TTLCache  # type: ignore[import-untyped]
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 import logging
 
+from core.cache_backends import (
+    MISSING,
+    CacheBackend,
+    InProcessCacheBackend,
+    RedisCacheBackend,
+)
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Tags used by cached functions and invalidated by the service layer
+CACHE_TAG_PROJECTS = "projects"
+CACHE_TAG_GOALS = "goals"
+CACHE_TAG_TASKS = "tasks"
+CACHE_TAG_LOGS = "logs"
+
+
+class CountingTTLCache(TTLCache):
+    """TTLCache that counts entries dropped for size or age"""
+
+    def __init__(self, maxsize, ttl, **kwargs):
+        super().__init__(maxsize=maxsize, ttl=ttl, **kwargs)
+        self.evictions = 0
+        self.expirations = 0
+
+    def popitem(self):
+        # Called by cachetools only when an insert exceeds maxsize
+        item = super().popitem()
+        self.evictions += 1
+        return item
+
+    def expire(self, time=None):
+        expired = super().expire(time)
+        self.expirations += len(expired or ())
+        return expired
+
+
 # Global cache instances with different TTL configurations
 caches = {
-    "short": TTLCache(maxsize=500, ttl=60),  # 1 minute TTL for frequently changing data
-    "medium": TTLCache(maxsize=200, ttl=300),  # 5 minutes TTL for user data
-    "long": TTLCache(maxsize=100, ttl=3600),  # 1 hour TTL for AI responses
-    "extended": TTLCache(maxsize=50, ttl=900),  # 15 minutes TTL for analysis results
+    "short": CountingTTLCache(
+        maxsize=500, ttl=60
+    ),  # 1 minute TTL for frequently changing data
+    "medium": CountingTTLCache(maxsize=200, ttl=300),  # 5 minutes TTL for user data
+    "long": CountingTTLCache(maxsize=100, ttl=3600),  # 1 hour TTL for AI responses
+    "extended": CountingTTLCache(
+        maxsize=50, ttl=900
+    ),  # 15 minutes TTL for analysis results
 }
 
+# Hit/miss counters per cache type
+_counters: dict[str, dict[str, int]] = {}
+
+
+class _Flight:
+    """A computation in progress in some thread"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """
+    Share one in-flight computation between concurrent identical calls
+
+    ``do`` coalesces calls from different threads (sync functions run in the
+    threadpool); ``do_async`` coalesces coroutines on the same event loop.
+    Both return ``(result, shared)`` where ``shared`` tells whether the result
+    came from another caller's computation. Errors propagate to every caller.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights: dict[str, _Flight] = {}
+        self._tasks: dict[tuple[int, str], asyncio.Future] = {}
+
+    def do(self, key: str, fn: Callable[[], T]) -> tuple[T, bool]:
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result, True
+
+        try:
+            flight.result = fn()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+        return flight.result, False
+
+    async def do_async(
+        self, key: str, fn: Callable[[], Awaitable[T]]
+    ) -> tuple[T, bool]:
+        task_key = (id(asyncio.get_running_loop()), key)
+        task = self._tasks.get(task_key)
+        shared = task is not None
+        if task is None:
+            # A separate task, so cancelling one caller does not cancel the rest
+            task = asyncio.ensure_future(fn())
+            self._tasks[task_key] = task
+            task.add_done_callback(lambda done: self._finish(task_key, done))
+        return await asyncio.shield(task), shared
+
+    def _finish(self, task_key: tuple[int, str], task: asyncio.Future) -> None:
+        if self._tasks.get(task_key) is task:
+            del self._tasks[task_key]
+        if not task.cancelled():
+            # Mark the exception retrieved even if every caller went away
+            task.exception()
+
+    def in_flight(self) -> int:
+        return len(self._flights) + len(self._tasks)
+
+
+_flights = SingleFlight()
+
+# Where entries are stored; in-process unless configured otherwise
+_backend: CacheBackend = InProcessCacheBackend(caches)
+
+# Arguments that identify a connection, not the data requested
+_UNKEYED_TYPES = (Session, AsyncSession)
+
+
+def get_cache_backend() -> CacheBackend:
+    return _backend
+
+
+def set_cache_backend(backend: CacheBackend) -> CacheBackend:
+    """Install a backend and return the previous one (which is not closed)"""
+    global _backend
+    previous, _backend = _backend, backend
+    return previous
+
+
+def configure_cache_backend(
+    backend: str = "memory", url: str | None = None, **options
+) -> CacheBackend:
+    """
+    Select the cache backend by name ('memory' or 'redis')
+
+    The previous backend is closed. ``options`` are passed to the backend.
+    """
+    if backend == "memory":
+        new_backend: CacheBackend = InProcessCacheBackend(caches)
+    elif backend == "redis":
+        if not url:
+            raise ValueError("The redis cache backend requires a URL")
+        new_backend = RedisCacheBackend.from_url(url, caches, **options)
+    else:
+        raise ValueError(f"Unknown cache backend: {backend}")
+
+    set_cache_backend(new_backend).close()
+    return new_backend
+
+
+def _count(cache_type: str, outcome: str) -> None:
+    counters = _counters.setdefault(
+        cache_type, {"hits": 0, "misses": 0, "coalesced": 0, "errors": 0}
+    )
+    counters[outcome] = counters.get(outcome, 0) + 1
+
+
+def count_lookup(cache_type: str, hit: bool) -> None:
+    """Record a lookup made outside ``cached`` so it shows in ``cache_stats``"""
+    _count(cache_type, "hits" if hit else "misses")
+
+
+def count_error(cache_type: str) -> None:
+    """Record a failed backend call made outside ``cached``"""
+    _count(cache_type, "errors")
+
+
+def _key_part(value: Any) -> str:
+    if isinstance(value, str | int | float | bool):
+        return str(value)
+    if hasattr(value, "id"):
+        return f"{value.__class__.__name__}:{value.id}"
+    # For complex objects, use hash (not for security)
+    return hashlib.sha256(str(value).encode()).hexdigest()[:16]
+
 
 def get_cache_key(prefix: str, *args, **kwargs) -> str:
     """
     Generate a consistent cache key from prefix and arguments
+
+    Database sessions are skipped: a new session per request would otherwise
+    make every key unique.
     """
     key_parts = [prefix]
 
     # Add positional arguments
     for arg in args:
-        if isinstance(arg, str | int | float | bool):
-            key_parts.append(str(arg))
-        elif hasattr(arg, "id"):
-            key_parts.append(f"{arg.__class__.__name__}:{arg.id}")
-        else:
-            # For complex objects, use hash (not for security)
-            key_parts.append(hashlib.sha256(str(arg).encode()).hexdigest()[:16])
+        if isinstance(arg, _UNKEYED_TYPES):
+            continue
+        key_parts.append(_key_part(arg))
 
     # Add keyword arguments
     for k, v in sorted(kwargs.items()):
-        if isinstance(v, str | int | float | bool):
-            key_parts.append(f"{k}:{v}")
-        else:
-            key_parts.append(f"{k}:{hashlib.sha256(str(v).encode()).hexdigest()[:16]}")
+        if isinstance(v, _UNKEYED_TYPES):
+            continue
+        key_parts.append(f"{k}:{_key_part(v)}")
 
     return ":".join(key_parts)
 
 
+def user_cache_key(user_id: Any, prefix: str, *args, **kwargs) -> str:
+    """Build a key inside a user's namespace"""
+    return get_cache_key(f"user:{user_id}:{prefix}", *args, **kwargs)
+
+
+def _resolve_user_id(
+    signature: inspect.Signature, user_arg: str, args: tuple, kwargs: dict
+) -> Any:
+    try:
+        bound = signature.bind_partial(*args, **kwargs)
+    except TypeError:
+        return None
+    return bound.arguments.get(user_arg)
+
+
 def cached(
     cache_type: str = "medium",
     key_prefix: str | None = None,
     condition: Callable[..., bool] | None = None,
+    user_arg: str | None = None,
+    tags: Iterable[str] = (),
 ):
     """
     Decorator for caching function results
@@ -62,9 +277,156 @@ def cached(
         cache_type: Type of cache to use ('short', 'medium', 'long', 'extended')
         key_prefix: Custom prefix for cache key (defaults to function name)
         condition: Optional function to determine if result should be cached
+        user_arg: Name of the argument holding the user ID; entries are then
+            stored in that user's namespace
+        tags: Data the result depends on (e.g. ``CACHE_TAG_TASKS``); writes
+            tagged the same way for the same user invalidate the entry
     """
+    tags = tuple(tags)
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        signature = inspect.signature(func) if user_arg else None
+        prefix = key_prefix or f"{func.__module__}.{func.__name__}"
+
+        def build_key(args: tuple, kwargs: dict) -> tuple[str, Any]:
+            if signature is None:
+                return get_cache_key(prefix, *args, **kwargs), None
+            user_id = _resolve_user_id(signature, user_arg, args, kwargs)
+            if user_id is None:
+                return get_cache_key(prefix, *args, **kwargs), None
+            return user_cache_key(user_id, prefix, *args, **kwargs), user_id
+
+        def backend_failed(action: str, cache_key: str, error: Exception) -> None:
+            # A cache outage must not fail the request; the result is computed
+            logger.warning(f"Cache {action} failed for {cache_key}: {error}")
+            count_error(cache_type)
+
+        def generation(backend: CacheBackend, cache_key: str, user_id: Any) -> Any:
+            """The tags' invalidation marker, None if untagged, MISSING on failure"""
+            if user_id is None or not tags:
+                return None
+            try:
+                return backend.tag_generation(str(user_id), tags)
+            except Exception as e:
+                backend_failed("generation", cache_key, e)
+                return MISSING
+
+        def store(cache_key: str, user_id: Any, result: Any, started_at: Any) -> None:
+            # Store in cache if not None
+            if result is None or started_at is MISSING:
+                return
+            backend = get_cache_backend()
+            # A write invalidated the tags while computing; the result is stale
+            if generation(backend, cache_key, user_id) != started_at:
+                logger.debug(f"Not caching {cache_key}: invalidated while computing")
+                return
+            try:
+                backend.set(cache_type, cache_key, result)
+                if user_id is not None and tags:
+                    backend.tag(cache_type, cache_key, str(user_id), tags)
+            except Exception as e:
+                backend_failed("store", cache_key, e)
+                return
+            logger.debug(f"Cached result for {cache_key}")
+
+        def lookup(backend: CacheBackend, cache_key: str) -> Any:
+            try:
+                value = backend.get(cache_type, cache_key)
+            except Exception as e:
+                backend_failed("lookup", cache_key, e)
+                return MISSING
+            if value is not MISSING:
+                logger.debug(f"Cache hit for {cache_key}")
+                _count(cache_type, "hits")
+            return value
+
+        def acquire(backend: CacheBackend, cache_key: str) -> Any:
+            """A lock token, None if another holder has it, MISSING on failure"""
+            try:
+                return backend.acquire(cache_type, cache_key)
+            except Exception as e:
+                backend_failed("lock", cache_key, e)
+                return MISSING
+
+        def release(backend: CacheBackend, cache_key: str, token: str) -> None:
+            try:
+                backend.release(cache_type, cache_key, token)
+            except Exception as e:
+                backend_failed("unlock", cache_key, e)
+
+        def keep_waiting(backend: CacheBackend, cache_key: str, started: float) -> bool:
+            """Whether another instance is still computing the entry"""
+            if time.monotonic() - started >= backend.lock_timeout_seconds:
+                return False
+            try:
+                return backend.is_locked(cache_type, cache_key)
+            except Exception as e:
+                backend_failed("lock check", cache_key, e)
+                return False
+
+        def coalesced(cache_key: str, shared: bool) -> None:
+            if shared:
+                logger.debug(f"Coalesced request for {cache_key}")
+                _count(cache_type, "coalesced")
+
+        async def compute_async(
+            args: tuple, kwargs: dict, cache_key: str, user_id: Any
+        ) -> Any:
+            backend = get_cache_backend()
+
+            # Let one instance compute the result; others wait for it
+            token = acquire(backend, cache_key)
+            if token is None:
+                started = time.monotonic()
+                while keep_waiting(backend, cache_key, started):
+                    await asyncio.sleep(backend.poll_interval_seconds)
+                    value = lookup(backend, cache_key)
+                    if value is not MISSING:
+                        return value
+
+            # Execute function and cache result
+            logger.debug(f"Cache miss for {cache_key}")
+            _count(cache_type, "misses")
+            started_at = generation(backend, cache_key, user_id)
+            try:
+                result = func(*args, **kwargs)
+                if asyncio.iscoroutine(result):
+                    result = await result
+                if token is not MISSING:
+                    store(cache_key, user_id, result, started_at)
+            finally:
+                if token is not None and token is not MISSING:
+                    release(backend, cache_key, token)
+            return result
+
+        def compute_sync(
+            args: tuple, kwargs: dict, cache_key: str, user_id: Any
+        ) -> Any:
+            backend = get_cache_backend()
+
+            # Let one instance compute the result; others wait for it
+            token = acquire(backend, cache_key)
+            if token is None:
+                started = time.monotonic()
+                while keep_waiting(backend, cache_key, started):
+                    time.sleep(backend.poll_interval_seconds)
+                    value = lookup(backend, cache_key)
+                    if value is not MISSING:
+                        return value
+
+            # Execute function and cache result
+            logger.debug(f"Cache miss for {cache_key}")
+            _count(cache_type, "misses")
+            started_at = generation(backend, cache_key, user_id)
+            try:
+                result = func(*args, **kwargs)
+                if token is not MISSING:
+                    store(cache_key, user_id, result, started_at)
+            finally:
+                if token is not None and token is not MISSING:
+                    release(backend, cache_key, token)
+            return result
+
         @wraps(func)
         async def async_wrapper(*args, **kwargs) -> Any:
             # Skip caching if condition is False
@@ -75,28 +437,19 @@ def cached(
                 return result
 
             # Generate cache key
-            prefix = key_prefix or f"{func.__module__}.{func.__name__}"
-            cache_key = get_cache_key(prefix, *args, **kwargs)
-
-            # Get cache instance
-            cache = caches.get(cache_type, caches["medium"])
+            cache_key, user_id = build_key(args, kwargs)
 
             # Check cache
-            if cache_key in cache:
-                logger.debug(f"Cache hit for {cache_key}")
-                return cache[cache_key]
-
-            # Execute function and cache result
-            logger.debug(f"Cache miss for {cache_key}")
-            result = func(*args, **kwargs)
-            if asyncio.iscoroutine(result):
-                result = await result
-
-            # Store in cache if not None
-            if result is not None:
-                cache[cache_key] = result
-                logger.debug(f"Cached result for {cache_key}")
-
+            value = lookup(get_cache_backend(), cache_key)
+            if value is not MISSING:
+                return value
+
+            # Concurrent misses for the same key share one computation
+            result, shared = await _flights.do_async(
+                f"{cache_type}:{cache_key}",
+                lambda: compute_async(args, kwargs, cache_key, user_id),
+            )
+            coalesced(cache_key, shared)
             return result
 
         @wraps(func)
@@ -106,26 +459,19 @@ def cached(
                 return func(*args, **kwargs)
 
             # Generate cache key
-            prefix = key_prefix or f"{func.__module__}.{func.__name__}"
-            cache_key = get_cache_key(prefix, *args, **kwargs)
-
-            # Get cache instance
-            cache = caches.get(cache_type, caches["medium"])
+            cache_key, user_id = build_key(args, kwargs)
 
             # Check cache
-            if cache_key in cache:
-                logger.debug(f"Cache hit for {cache_key}")
-                return cache[cache_key]
-
-            # Execute function and cache result
-            logger.debug(f"Cache miss for {cache_key}")
-            result = func(*args, **kwargs)
-
-            # Store in cache if not None
-            if result is not None:
-                cache[cache_key] = result
-                logger.debug(f"Cached result for {cache_key}")
-
+            value = lookup(get_cache_backend(), cache_key)
+            if value is not MISSING:
+                return value
+
+            # Concurrent misses for the same key share one computation
+            result, shared = _flights.do(
+                f"{cache_type}:{cache_key}",
+                lambda: compute_sync(args, kwargs, cache_key, user_id),
+            )
+            coalesced(cache_key, shared)
             return result
 
         # Return appropriate wrapper based on function type
@@ -137,6 +483,20 @@ def cached(
     return decorator
 
 
+def invalidate_user_cache(user_id: Any, *tags: str) -> int:
+    """
+    Drop a user's cached entries that depend on any of ``tags``
+
+    Without tags every tagged entry of the user is dropped. Returns the number
+    of entries removed.
+    """
+    removed = get_cache_backend().invalidate_tags(str(user_id), tags)
+
+    if removed:
+        logger.debug(f"Invalidated {removed} cache entries for user {user_id} {tags}")
+    return removed
+
+
 def invalidate_cache(cache_type: str = "all", pattern: str | None = None):
     """
     Invalidate cache entries
@@ -145,22 +505,8 @@ def invalidate_cache(cache_type: str = "all", pattern: str | None = None):
         cache_type: Type of cache to invalidate ('all' for all caches)
         pattern: Optional pattern to match keys for selective invalidation
     """
-    if cache_type == "all":
-        target_caches = caches.values()
-    else:
-        target_caches = [caches.get(cache_type, caches["medium"])]
-
-    for cache in target_caches:
-        if pattern:
-            # Selective invalidation
-            keys_to_delete = [k for k in cache.keys() if pattern in str(k)]
-            for key in keys_to_delete:
-                del cache[key]
-                logger.debug(f"Invalidated cache key: {key}")
-        else:
-            # Clear entire cache
-            cache.clear()
-            logger.debug(f"Cleared cache: {cache_type}")
+    get_cache_backend().clear(None if cache_type == "all" else cache_type, pattern)
+    logger.debug(f"Invalidated cache: {cache_type} (pattern={pattern})")
 
 
 def cache_stats() -> dict:
@@ -168,12 +514,23 @@ def cache_stats() -> dict:
     Get cache statistics
     """
     stats = {}
-    for name, cache in caches.items():
+    for name, backend_stats in get_cache_backend().stats().items():
+        counters = _counters.get(name, {})
+        hits, misses = counters.get("hits", 0), counters.get("misses", 0)
+        lookups = hits + misses
+        size, maxsize = backend_stats["size"], backend_stats["maxsize"]
         stats[name] = {
-            "size": len(cache),
-            "maxsize": cache.maxsize,
-            "ttl": cache.ttl,
-            "utilization": f"{(len(cache) / cache.maxsize * 100):.1f}%",
+            "size": size,
+            "maxsize": maxsize,
+            "ttl": backend_stats["ttl"],
+            "utilization": f"{(size / maxsize * 100):.1f}%",
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "coalesced": counters.get("coalesced", 0),
+            "errors": counters.get("errors", 0),
+            "evictions": backend_stats["evictions"],
+            "expirations": backend_stats["expirations"],
         }
     return stats
 
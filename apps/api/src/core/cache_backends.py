@@ -0,0 +1,532 @@
+"""
+Storage backends for core.cache
+
+``InProcessCacheBackend`` keeps entries in this process's TTL caches (the
+default). ``RedisCacheBackend`` stores serialized entries in a shared
+key-value store so that every API instance reuses the same results, and
+adds what sharing needs:
+
+* a short-lived local near cache per tier to avoid a network hop for hot keys,
+* a lock per key so only one instance computes a missing entry while the
+  others wait for it (stampede protection),
+* invalidation messages on a pub/sub channel so other instances drop their
+  near-cache copies when data changes,
+* a generation counter per tag, so a result computed from data that was
+  invalidated meanwhile is not stored.
+
+The networked backend only needs a small, redis-py compatible client surface
+(get/mget/set/incr/delete/exists/sadd/smembers/expire/scan_iter/publish/
+pubsub), so it can be exercised against a local stand-in in tests.
+"""
+
+import importlib
+import json
+import logging
+import threading
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, MutableMapping
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+from cachetools import TTLCache  # type: ignore[import-untyped]
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+# Returned by ``get`` when a key is absent (None is never cached)
+MISSING: Any = object()
+
+# Token handed out by backends that do not coordinate across processes
+LOCAL_TOKEN = "local"
+
+# Generation bumped when all of a namespace's tags are invalidated at once
+ALL_TAGS = "*"
+
+
+# Marks an encoded value that JSON has no native type for
+TYPE_KEY = "__cache_type__"
+
+# Types restored from their ISO form
+_ISO_TYPES: dict[str, Any] = {"datetime": datetime, "date": date, "time": time}
+
+
+def _class_path(cls: type) -> str:
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def _import_class(path: str, base: type) -> Any:
+    module_name, _, qualname = path.partition(":")
+    target: Any = importlib.import_module(module_name)
+    for attribute in qualname.split("."):
+        target = getattr(target, attribute)
+    if not (isinstance(target, type) and issubclass(target, base)):
+        raise TypeError(f"{path} is not a {base.__name__} subclass")
+    return target
+
+
+def _encode(value: Any) -> Any:
+    """Turn a value into JSON-native data, tagging the types JSON would lose"""
+    # Before the primitives: str and int enums are instances of both
+    if isinstance(value, Enum):
+        return {
+            TYPE_KEY: "enum",
+            "class": _class_path(type(value)),
+            "value": _encode(value.value),
+        }
+    if value is None or isinstance(value, bool | int | float | str):
+        return value
+    if isinstance(value, list):
+        return [_encode(item) for item in value]
+    if isinstance(value, tuple):
+        return {TYPE_KEY: "tuple", "items": [_encode(item) for item in value]}
+    if isinstance(value, dict):
+        if TYPE_KEY not in value and all(isinstance(key, str) for key in value):
+            return {key: _encode(item) for key, item in value.items()}
+        # Non-string keys (UUIDs, ints, ...) would become strings in JSON
+        return {
+            TYPE_KEY: "dict",
+            "items": [[_encode(key), _encode(item)] for key, item in value.items()],
+        }
+    # datetime before date: it is a subclass
+    for name in ("datetime", "date", "time"):
+        if isinstance(value, _ISO_TYPES[name]):
+            return {TYPE_KEY: name, "value": value.isoformat()}
+    if isinstance(value, UUID):
+        return {TYPE_KEY: "uuid", "value": str(value)}
+    if isinstance(value, Decimal):
+        return {TYPE_KEY: "decimal", "value": str(value)}
+    if isinstance(value, BaseModel):
+        return {
+            TYPE_KEY: "model",
+            "class": _class_path(type(value)),
+            "value": value.model_dump(mode="json"),
+        }
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _decode(data: Any) -> Any:
+    if isinstance(data, list):
+        return [_decode(item) for item in data]
+    if not isinstance(data, dict):
+        return data
+
+    kind = data.get(TYPE_KEY)
+    if kind is None:
+        return {key: _decode(item) for key, item in data.items()}
+    if kind == "tuple":
+        return tuple(_decode(item) for item in data["items"])
+    if kind == "dict":
+        return {_decode(key): _decode(item) for key, item in data["items"]}
+    if kind in _ISO_TYPES:
+        return _ISO_TYPES[kind].fromisoformat(data["value"])
+    if kind == "uuid":
+        return UUID(data["value"])
+    if kind == "decimal":
+        return Decimal(data["value"])
+    if kind == "enum":
+        return _import_class(data["class"], Enum)(_decode(data["value"]))
+    if kind == "model":
+        return _import_class(data["class"], BaseModel).model_validate(data["value"])
+    raise TypeError(f"Unknown cached type {kind!r}")
+
+
+def serialize_value(value: Any) -> str:
+    """
+    Serialize a cached result as JSON.
+
+    Values come back with the types they were stored with: pydantic models,
+    enums, datetimes, dates, times, UUIDs, Decimals and tuples are tagged, and
+    so are dicts with non-string keys. Any other non-JSON type raises
+    TypeError, so it is not cached rather than cached in a different shape.
+    """
+    if isinstance(value, BaseModel):
+        payload = {
+            "model": _class_path(type(value)),
+            "data": value.model_dump(mode="json"),
+        }
+    else:
+        payload = {"data": _encode(value)}
+    return json.dumps(payload, separators=(",", ":"))
+
+
+def deserialize_value(raw: str | bytes) -> Any:
+    payload = json.loads(raw)
+    model_path = payload.get("model")
+    if not model_path:
+        return _decode(payload["data"])
+    return _import_class(model_path, BaseModel).model_validate(payload["data"])
+
+
+class CacheBackend(ABC):
+    """Storage used by the ``cached`` decorator, organised in named tiers"""
+
+    name = "base"
+    # How long a waiting caller polls for another instance's result
+    lock_timeout_seconds = 0.0
+    poll_interval_seconds = 0.05
+
+    @abstractmethod
+    def get(self, tier: str, key: str) -> Any:
+        """Return the cached value or ``MISSING``"""
+
+    @abstractmethod
+    def set(self, tier: str, key: str, value: Any) -> None:
+        """Store a value with the tier's TTL"""
+
+    @abstractmethod
+    def tag(self, tier: str, key: str, namespace: str, tags: Iterable[str]) -> None:
+        """Index an entry under ``(namespace, tag)`` for targeted invalidation"""
+
+    @abstractmethod
+    def invalidate_tags(self, namespace: str, tags: Iterable[str]) -> int:
+        """Drop entries indexed under the tags (all tags when empty)"""
+
+    @abstractmethod
+    def tag_generation(self, namespace: str, tags: Iterable[str]) -> tuple:
+        """Marker that changes whenever any of the tags is invalidated"""
+
+    @abstractmethod
+    def clear(self, tier: str | None = None, pattern: str | None = None) -> None:
+        """Drop a tier (or all tiers), optionally only keys containing pattern"""
+
+    @abstractmethod
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Per-tier size, limits and eviction counters"""
+
+    def acquire(self, tier: str, key: str) -> str | None:
+        """Claim the right to compute ``key``; None if another holder has it"""
+        return LOCAL_TOKEN
+
+    def release(self, tier: str, key: str, token: str) -> None:
+        """Give up a claim returned by ``acquire``"""
+        return None
+
+    def is_locked(self, tier: str, key: str) -> bool:
+        return False
+
+    def close(self) -> None:
+        """Release connections and background threads"""
+        return None
+
+
+class InProcessCacheBackend(CacheBackend):
+    """Entries live in this process's TTL caches"""
+
+    name = "memory"
+
+    def __init__(self, tiers: MutableMapping[str, TTLCache]):
+        # Held by reference so tiers swapped in at runtime take effect
+        self.tiers = tiers
+        self._tag_index: dict[tuple[str, str], set[tuple[str, str]]] = {}
+        # Invalidation count per (namespace, tag); ALL_TAGS counts full wipes
+        self._generations: dict[tuple[str, str], int] = {}
+        self._lock = threading.RLock()
+
+    def _tier(self, tier: str) -> TTLCache:
+        return self.tiers.get(tier, self.tiers["medium"])
+
+    def get(self, tier: str, key: str) -> Any:
+        return self._tier(tier).get(key, MISSING)
+
+    def set(self, tier: str, key: str, value: Any) -> None:
+        self._tier(tier)[key] = value
+
+    def tag(self, tier: str, key: str, namespace: str, tags: Iterable[str]) -> None:
+        with self._lock:
+            for tag in tags:
+                self._tag_index.setdefault((namespace, tag), set()).add((tier, key))
+
+    def tag_generation(self, namespace: str, tags: Iterable[str]) -> tuple:
+        with self._lock:
+            return tuple(
+                self._generations.get((namespace, tag), 0) for tag in (ALL_TAGS, *tags)
+            )
+
+    def invalidate_tags(self, namespace: str, tags: Iterable[str]) -> int:
+        tags = tuple(tags)
+        with self._lock:
+            for tag in tags or (ALL_TAGS,):
+                key = (namespace, tag)
+                self._generations[key] = self._generations.get(key, 0) + 1
+            index_keys = [
+                index_key
+                for index_key in self._tag_index
+                if index_key[0] == namespace and (not tags or index_key[1] in tags)
+            ]
+            entries: set[tuple[str, str]] = set()
+            for index_key in index_keys:
+                entries |= self._tag_index.pop(index_key)
+
+        removed = 0
+        for tier, key in entries:
+            cache = self.tiers.get(tier)
+            if cache is not None and cache.pop(key, None) is not None:
+                removed += 1
+        return removed
+
+    def clear(self, tier: str | None = None, pattern: str | None = None) -> None:
+        targets = self.tiers.values() if tier is None else [self._tier(tier)]
+        for cache in targets:
+            if pattern:
+                for key in [k for k in cache.keys() if pattern in str(k)]:
+                    del cache[key]
+                    logger.debug(f"Invalidated cache key: {key}")
+            else:
+                cache.clear()
+        if tier is None and not pattern:
+            with self._lock:
+                self._tag_index.clear()
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        return {
+            name: {
+                "size": len(cache),
+                "maxsize": cache.maxsize,
+                "ttl": cache.ttl,
+                "evictions": getattr(cache, "evictions", 0),
+                "expirations": getattr(cache, "expirations", 0),
+            }
+            for name, cache in self.tiers.items()
+        }
+
+
+class RedisCacheBackend(CacheBackend):
+    """Entries live in a shared key-value store, fronted by a near cache"""
+
+    name = "redis"
+
+    def __init__(
+        self,
+        client: Any,
+        tiers: MutableMapping[str, TTLCache],
+        prefix: str = "hc:cache",
+        near_cache_ttl_seconds: float = 5.0,
+        near_cache_size: int = 256,
+        lock_timeout_seconds: float = 30.0,
+        subscribe: bool = True,
+    ):
+        self.client = client
+        # Only the tier names and TTLs are used; values live in the store
+        self.tier_ttls = {name: float(cache.ttl) for name, cache in tiers.items()}
+        self.prefix = prefix
+        self.channel = f"{prefix}:invalidate"
+        self.lock_timeout_seconds = lock_timeout_seconds
+        self.instance_id = uuid.uuid4().hex
+        self._near: dict[str, TTLCache] = {
+            name: TTLCache(
+                maxsize=min(near_cache_size, cache.maxsize),
+                ttl=min(near_cache_ttl_seconds, cache.ttl),
+            )
+            for name, cache in tiers.items()
+        }
+        self._near_lock = threading.Lock()
+        self._pubsub = None
+        self._listener = None
+        if subscribe:
+            self._pubsub = client.pubsub(ignore_subscribe_messages=True)
+            self._pubsub.subscribe(**{self.channel: self._on_message})
+            self._listener = self._pubsub.run_in_thread(sleep_time=1.0, daemon=True)
+
+    @classmethod
+    def from_url(
+        cls, url: str, tiers: MutableMapping[str, TTLCache], **kwargs
+    ) -> "RedisCacheBackend":
+        try:
+            import redis  # type: ignore[import-not-found]
+        except ImportError as e:
+            raise RuntimeError(
+                "The redis cache backend needs the 'redis' package "
+                "(pip install 'humancompiler-api[redis]')"
+            ) from e
+        return cls(redis.Redis.from_url(url, decode_responses=True), tiers, **kwargs)
+
+    def _tier_name(self, tier: str) -> str:
+        return tier if tier in self.tier_ttls else "medium"
+
+    def _data_key(self, tier: str, key: str) -> str:
+        return f"{self.prefix}:{self._tier_name(tier)}:{key}"
+
+    def _lock_key(self, tier: str, key: str) -> str:
+        return f"{self.prefix}:lock:{self._tier_name(tier)}:{key}"
+
+    def _tag_key(self, namespace: str, tag: str) -> str:
+        return f"{self.prefix}:tag:{namespace}:{tag}"
+
+    def _generation_key(self, namespace: str, tag: str) -> str:
+        return f"{self.prefix}:gen:{namespace}:{tag}"
+
+    def _drop_near(self, entries: Iterable[tuple[str, str]]) -> None:
+        with self._near_lock:
+            for tier, key in entries:
+                near = self._near.get(self._tier_name(tier))
+                if near is not None:
+                    near.pop(key, None)
+
+    def _clear_near(self, tier: str | None, pattern: str | None) -> None:
+        with self._near_lock:
+            targets = (
+                self._near.values()
+                if tier is None
+                else [self._near[self._tier_name(tier)]]
+            )
+            for near in targets:
+                if pattern:
+                    for key in [k for k in near.keys() if pattern in str(k)]:
+                        del near[key]
+                else:
+                    near.clear()
+
+    def _publish(self, message: dict[str, Any]) -> None:
+        message["origin"] = self.instance_id
+        try:
+            self.client.publish(self.channel, json.dumps(message))
+        except Exception as e:
+            # Other instances fall back to their near-cache TTL
+            logger.warning(f"Failed to publish cache invalidation: {e}")
+
+    def _on_message(self, message: dict[str, Any]) -> None:
+        try:
+            payload = json.loads(message["data"])
+        except (KeyError, TypeError, ValueError):
+            return
+        if payload.get("origin") == self.instance_id:
+            return
+        if "entries" in payload:
+            self._drop_near(tuple(entry) for entry in payload["entries"])
+        else:
+            self._clear_near(payload.get("tier"), payload.get("pattern"))
+
+    def get(self, tier: str, key: str) -> Any:
+        tier = self._tier_name(tier)
+        with self._near_lock:
+            value = self._near[tier].get(key, MISSING)
+        if value is not MISSING:
+            return value
+
+        raw = self.client.get(self._data_key(tier, key))
+        if raw is None:
+            return MISSING
+        try:
+            value = deserialize_value(raw)
+        except Exception as e:
+            logger.warning(f"Discarding undecodable cache entry {key}: {e}")
+            return MISSING
+        with self._near_lock:
+            self._near[tier][key] = value
+        return value
+
+    def set(self, tier: str, key: str, value: Any) -> None:
+        tier = self._tier_name(tier)
+        try:
+            raw = serialize_value(value)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Not caching {key}: {e}")
+            return
+        self.client.set(
+            self._data_key(tier, key), raw, ex=max(1, int(self.tier_ttls[tier]))
+        )
+        with self._near_lock:
+            self._near[tier][key] = value
+
+    def tag(self, tier: str, key: str, namespace: str, tags: Iterable[str]) -> None:
+        ttl = max(1, int(max(self.tier_ttls.values())))
+        member = json.dumps([self._tier_name(tier), key])
+        for tag in tags:
+            tag_key = self._tag_key(namespace, tag)
+            self.client.sadd(tag_key, member)
+            self.client.expire(tag_key, ttl)
+
+    def tag_generation(self, namespace: str, tags: Iterable[str]) -> tuple:
+        keys = [self._generation_key(namespace, tag) for tag in (ALL_TAGS, *tags)]
+        return tuple(self.client.mget(keys))
+
+    def invalidate_tags(self, namespace: str, tags: Iterable[str]) -> int:
+        tags = tuple(tags)
+        # Bumped first, so computations already running do not store results
+        ttl = max(1, int(max(self.tier_ttls.values())))
+        for tag in tags or (ALL_TAGS,):
+            generation_key = self._generation_key(namespace, tag)
+            self.client.incr(generation_key)
+            self.client.expire(generation_key, ttl)
+
+        if tags:
+            tag_keys = [self._tag_key(namespace, tag) for tag in tags]
+        else:
+            tag_keys = list(self.client.scan_iter(match=self._tag_key(namespace, "*")))
+
+        entries: set[tuple[str, str]] = set()
+        for tag_key in tag_keys:
+            for member in self.client.smembers(tag_key):
+                tier, key = json.loads(member)
+                entries.add((tier, key))
+
+        removed = 0
+        if entries:
+            removed = self.client.delete(
+                *(self._data_key(tier, key) for tier, key in entries)
+            )
+            self._drop_near(entries)
+            self._publish({"entries": sorted(entries)})
+        if tag_keys:
+            self.client.delete(*tag_keys)
+        return int(removed or 0)
+
+    def clear(self, tier: str | None = None, pattern: str | None = None) -> None:
+        tier_part = "*" if tier is None else self._tier_name(tier)
+        data_keys = [
+            data_key
+            for data_key in self.client.scan_iter(match=f"{self.prefix}:{tier_part}:*")
+            if not data_key.startswith(
+                (f"{self.prefix}:lock:", f"{self.prefix}:tag:", f"{self.prefix}:gen:")
+            )
+            and (not pattern or pattern in data_key)
+        ]
+        if data_keys:
+            self.client.delete(*data_keys)
+        self._clear_near(tier, pattern)
+        self._publish({"tier": tier, "pattern": pattern})
+
+    def acquire(self, tier: str, key: str) -> str | None:
+        token = uuid.uuid4().hex
+        acquired = self.client.set(
+            self._lock_key(tier, key),
+            token,
+            nx=True,
+            px=int(self.lock_timeout_seconds * 1000),
+        )
+        return token if acquired else None
+
+    def release(self, tier: str, key: str, token: str) -> None:
+        lock_key = self._lock_key(tier, key)
+        # Only the holder deletes; an expired lock may belong to someone else
+        if self.client.get(lock_key) == token:
+            self.client.delete(lock_key)
+
+    def is_locked(self, tier: str, key: str) -> bool:
+        return bool(self.client.exists(self._lock_key(tier, key)))
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        # Shared entries are not enumerated; report this instance's near cache
+        with self._near_lock:
+            return {
+                name: {
+                    "size": len(near),
+                    "maxsize": near.maxsize,
+                    "ttl": self.tier_ttls[name],
+                    "evictions": 0,
+                    "expirations": 0,
+                }
+                for name, near in self._near.items()
+            }
+
+    def close(self) -> None:
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+        if self._pubsub is not None:
+            self._pubsub.close()
+            self._pubsub = None
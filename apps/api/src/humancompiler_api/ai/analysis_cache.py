@@ -7,14 +7,21 @@ from typing import TYPE_CHECKING, Any
 
 from sqlmodel import Session
 
-from core.cache import cached
+from core.cache import CACHE_TAG_GOALS, CACHE_TAG_PROJECTS, CACHE_TAG_TASKS, cached
+from humancompiler_api.ai.context_loader import load_planning_data
+from humancompiler_api.ai.workload_analysis import compute_workload_metrics
 from humancompiler_api.services import goal_service, project_service, task_service
 
 if TYPE_CHECKING:
     from humancompiler_api.services import GoalService, ProjectService, TaskService
 
 
-@cached(cache_type="extended", key_prefix="workload_analysis")
+@cached(
+    cache_type="extended",
+    key_prefix="workload_analysis",
+    user_arg="user_id",
+    tags=(CACHE_TAG_PROJECTS, CACHE_TAG_GOALS, CACHE_TAG_TASKS),
+)
 def analyze_workload_cached(
     session: Session, user_id: str, project_ids: list[str] | None = None
 ) -> dict[str, Any]:
@@ -22,52 +29,9 @@ def analyze_workload_cached(
     Cached version of workload analysis
     Returns analysis results with 15-minute cache TTL
     """
-    # Get user's data
-    if project_ids:
-        projects = []
-        for project_id in project_ids:
-            project = project_service.get_project(session, project_id, user_id)
-            if project:
-                projects.append(project)
-    else:
-        projects = project_service.get_projects(session, user_id)
-
-    # Collect all goals and tasks
-    all_goals = []
-    all_tasks = []
-
-    for project in projects:
-        goals = goal_service.get_goals_by_project(session, project.id, user_id)
-        all_goals.extend(goals)
-
-        for goal in goals:
-            tasks = task_service.get_tasks_by_goal(session, goal.id, user_id)
-            pending_tasks = [t for t in tasks if t.status in ["pending", "in_progress"]]
-            all_tasks.extend(pending_tasks)
-
-    # Calculate workload metrics
-    total_hours = sum(task.estimate_hours for task in all_tasks)
-    overdue_tasks = []
-    urgent_tasks = []
-
-    today = date.today()
-    for task in all_tasks:
-        if task.due_date:
-            if task.due_date.date() < today:
-                overdue_tasks.append(task)
-            elif (task.due_date.date() - today).days <= 3:
-                urgent_tasks.append(task)
-
-    # Project distribution
-    project_hours = {}
-    for task in all_tasks:
-        goal = next((g for g in all_goals if g.id == task.goal_id), None)
-        if goal:
-            project = next((p for p in projects if p.id == goal.project_id), None)
-            if project:
-                project_hours[project.title] = (
-                    project_hours.get(project.title, 0) + task.estimate_hours
-                )
+    # Totals are aggregated in SQL; no task rows are loaded
+    metrics = compute_workload_metrics(session, user_id, project_ids)
+    total_hours = metrics.total_estimated_hours
 
     # Generate recommendations
     recommendations = []
@@ -77,15 +41,15 @@ def analyze_workload_cached(
             f"Workload is {total_hours:.1f} hours - consider prioritizing or deferring some tasks"
         )
 
-    if len(overdue_tasks) > 0:
+    if metrics.overdue_tasks > 0:
         recommendations.append(
-            f"{len(overdue_tasks)} overdue tasks require immediate attention"
+            f"{metrics.overdue_tasks} overdue tasks require immediate attention"
         )
 
-    if len(urgent_tasks) > 0:
-        recommendations.append(f"{len(urgent_tasks)} tasks are due within 3 days")
+    if metrics.urgent_tasks > 0:
+        recommendations.append(f"{metrics.urgent_tasks} tasks are due within 3 days")
 
-    if len(project_hours) > 3:
+    if len(metrics.project_distribution) > 3:
         recommendations.append(
             "Consider focusing on fewer projects to maintain momentum"
         )
@@ -97,18 +61,23 @@ def analyze_workload_cached(
         "success": True,
         "analysis": {
             "total_estimated_hours": total_hours,
-            "total_tasks": len(all_tasks),
-            "overdue_tasks": len(overdue_tasks),
-            "urgent_tasks": len(urgent_tasks),
-            "projects_involved": len(projects),
-            "project_distribution": project_hours,
+            "total_tasks": metrics.total_tasks,
+            "overdue_tasks": metrics.overdue_tasks,
+            "urgent_tasks": metrics.urgent_tasks,
+            "projects_involved": metrics.projects_involved,
+            "project_distribution": metrics.project_distribution,
         },
         "recommendations": recommendations,
         "generated_at": datetime.now().isoformat(),
     }
 
 
-@cached(cache_type="extended", key_prefix="priority_suggestions")
+@cached(
+    cache_type="extended",
+    key_prefix="priority_suggestions",
+    user_arg="user_id",
+    tags=(CACHE_TAG_PROJECTS, CACHE_TAG_GOALS, CACHE_TAG_TASKS),
+)
 def suggest_priorities_cached(
     session: Session, user_id: str, project_id: str | None = None
 ) -> dict[str, Any]:
@@ -117,29 +86,16 @@ def suggest_priorities_cached(
     Returns priority analysis with 15-minute cache TTL
     """
     # Get tasks for analysis
-    if project_id:
-        project = project_service.get_project(session, project_id, user_id)
-        if not project:
-            return {"success": False, "error": "Project not found"}
-
-        goals = goal_service.get_goals_by_project(session, project_id, user_id)
-        tasks = []
-        for goal in goals:
-            goal_tasks = task_service.get_tasks_by_goal(session, goal.id, user_id)
-            tasks.extend(
-                [t for t in goal_tasks if t.status in ["pending", "in_progress"]]
-            )
-    else:
-        # Get all user tasks
-        projects = project_service.get_projects(session, user_id)
-        tasks = []
-        for project in projects:
-            goals = goal_service.get_goals_by_project(session, project.id, user_id)
-            for goal in goals:
-                goal_tasks = task_service.get_tasks_by_goal(session, goal.id, user_id)
-                tasks.extend(
-                    [t for t in goal_tasks if t.status in ["pending", "in_progress"]]
-                )
+    data = load_planning_data(
+        session,
+        user_id,
+        project_ids=[project_id] if project_id else None,
+        include_actual_hours=False,
+        include_recurring_tasks=False,
+    )
+    if project_id and not data.projects:
+        return {"success": False, "error": "Project not found"}
+    tasks = data.tasks
 
     # Priority scoring algorithm
     task_scores = []
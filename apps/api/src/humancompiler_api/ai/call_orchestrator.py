@@ -0,0 +1,229 @@
+"""
+Concurrent model calls under shared limits.
+
+Chunked prompts (``ai.prompt_budget``) and triage send several independent
+model requests for one user action. The orchestrator runs them concurrently
+while keeping the load on OpenAI bounded:
+
+- a global semaphore caps the calls in flight across all users, and a per-user
+  semaphore keeps one large backlog from taking every slot;
+- every attempt has a time limit;
+- rate-limited calls are retried with jittered exponential backoff, on top of
+  the SDK's own short retries, without holding a slot while they wait;
+- ``gather`` returns None for calls that failed, so callers can merge the
+  results that did arrive instead of failing the whole request.
+"""
+
+import asyncio
+import logging
+import random
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from contextlib import asynccontextmanager
+from typing import Any, TypeVar
+
+from openai import RateLimitError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def _retry_after_seconds(exc: RateLimitError) -> float | None:
+    """The server's Retry-After hint, if it sent one"""
+    headers = getattr(getattr(exc, "response", None), "headers", None) or {}
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+class AICallOrchestrator:
+    """Runs model calls under global and per-user concurrency limits"""
+
+    def __init__(
+        self,
+        max_concurrent: int | None = None,
+        max_concurrent_per_user: int | None = None,
+        timeout_seconds: float | None = None,
+        rate_limit_retries: int | None = None,
+        backoff_base_seconds: float = 1.0,
+        backoff_max_seconds: float = 30.0,
+    ):
+        # Get from settings or use defaults
+        from humancompiler_api.config import settings
+
+        self.max_concurrent = max_concurrent or getattr(
+            settings, "ai_max_concurrent_calls", 16
+        )
+        self.max_concurrent_per_user = max_concurrent_per_user or getattr(
+            settings, "ai_max_concurrent_calls_per_user", 4
+        )
+        self.timeout_seconds = timeout_seconds or getattr(
+            settings, "ai_call_timeout_seconds", 120.0
+        )
+        if rate_limit_retries is None:
+            rate_limit_retries = getattr(settings, "ai_rate_limit_retries", 3)
+        self.rate_limit_retries = rate_limit_retries
+        self.backoff_base_seconds = backoff_base_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+
+        # Semaphores belong to the event loop they were first used on
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._global_slots: asyncio.Semaphore | None = None
+        self._user_slots: dict[str, asyncio.Semaphore] = {}
+        self._user_calls: dict[str, int] = {}
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._counters = {
+            "calls": 0,
+            "succeeded": 0,
+            "failed": 0,
+            "timed_out": 0,
+            "rate_limited": 0,
+            "retries": 0,
+        }
+
+    def _bind_loop(self) -> None:
+        """Start over when called from a different event loop (tests, CLIs)"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._global_slots = asyncio.Semaphore(self.max_concurrent)
+            self._user_slots.clear()
+            self._user_calls.clear()
+            self._in_flight = 0
+
+    @asynccontextmanager
+    async def _slot(self, user_key: str | None) -> AsyncIterator[None]:
+        """Hold a global slot and, for a known user, one of the user's slots"""
+        self._bind_loop()
+        user_slots: asyncio.Semaphore | None = None
+        if user_key is not None:
+            user_slots = self._user_slots.get(user_key)
+            if user_slots is None:
+                user_slots = asyncio.Semaphore(self.max_concurrent_per_user)
+                self._user_slots[user_key] = user_slots
+            self._user_calls[user_key] = self._user_calls.get(user_key, 0) + 1
+
+        try:
+            # A user's queued calls wait on their own limit, not on global slots
+            if user_slots is not None:
+                await user_slots.acquire()
+            try:
+                async with self._global_slots:
+                    self._in_flight += 1
+                    self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+                    try:
+                        yield
+                    finally:
+                        self._in_flight -= 1
+            finally:
+                if user_slots is not None:
+                    user_slots.release()
+        finally:
+            if user_key is not None:
+                remaining = self._user_calls.get(user_key, 0) - 1
+                if remaining > 0:
+                    self._user_calls[user_key] = remaining
+                else:
+                    self._user_calls.pop(user_key, None)
+                    self._user_slots.pop(user_key, None)
+
+    def _backoff_seconds(self, attempt: int, exc: RateLimitError) -> float:
+        """Full-jitter exponential backoff, at least the server's Retry-After"""
+        delay = random.uniform(
+            0, min(self.backoff_max_seconds, self.backoff_base_seconds * 2**attempt)
+        )
+        retry_after = _retry_after_seconds(exc)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return min(delay, self.backoff_max_seconds)
+
+    async def call(
+        self,
+        fn: Callable[[], Awaitable[T]],
+        *,
+        user_id: Any = None,
+        timeout: float | None = None,
+    ) -> T:
+        """
+        Run one model call under the concurrency limits.
+
+        ``fn`` is called again for every attempt. Raises the call's own error,
+        TimeoutError when an attempt runs out of time, or the last
+        RateLimitError once the retries are used up.
+        """
+        user_key = str(user_id) if user_id is not None else None
+        timeout = timeout or self.timeout_seconds
+        self._counters["calls"] += 1
+        attempt = 0
+        while True:
+            try:
+                async with self._slot(user_key):
+                    result = await asyncio.wait_for(fn(), timeout)
+            except RateLimitError as exc:
+                self._counters["rate_limited"] += 1
+                if attempt >= self.rate_limit_retries:
+                    self._counters["failed"] += 1
+                    raise
+                delay = self._backoff_seconds(attempt, exc)
+                attempt += 1
+                self._counters["retries"] += 1
+                logger.warning(
+                    f"Model call rate limited, retry {attempt}/"
+                    f"{self.rate_limit_retries} in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+            except TimeoutError:
+                self._counters["timed_out"] += 1
+                logger.warning(f"Model call timed out after {timeout}s")
+                raise
+            except Exception:
+                self._counters["failed"] += 1
+                raise
+            else:
+                self._counters["succeeded"] += 1
+                return result
+
+    async def gather(
+        self,
+        calls: Sequence[Callable[[], Awaitable[T]]],
+        *,
+        user_id: Any = None,
+        timeout: float | None = None,
+    ) -> list[T | None]:
+        """Run independent calls concurrently; failed calls give None"""
+        results = await asyncio.gather(
+            *(self.call(fn, user_id=user_id, timeout=timeout) for fn in calls),
+            return_exceptions=True,
+        )
+        merged: list[T | None] = []
+        for index, result in enumerate(results):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                logger.warning(
+                    f"Model call {index + 1}/{len(calls)} failed, "
+                    f"continuing with partial results: {type(result).__name__}"
+                )
+                merged.append(None)
+            else:
+                merged.append(result)
+        return merged
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return limits, current load and outcome counters"""
+        return {
+            "max_concurrent": self.max_concurrent,
+            "max_concurrent_per_user": self.max_concurrent_per_user,
+            "timeout_seconds": self.timeout_seconds,
+            "rate_limit_retries": self.rate_limit_retries,
+            "in_flight": self._in_flight,
+            "peak_in_flight": self._peak_in_flight,
+            "active_users": len(self._user_calls),
+            **self._counters,
+        }
+
+
+# Global AI call orchestrator instance
+ai_call_orchestrator = AICallOrchestrator()
@@ -0,0 +1,144 @@
+"""
+Shared async OpenAI clients.
+
+Every AI path used to build a synchronous ``OpenAI`` client per request and
+call it from async code, which blocked the worker for the whole completion and
+paid a fresh TLS handshake each time. The registry hands out ``AsyncOpenAI``
+clients instead: one per API key, kept in an LRU keyed by a SHA-256 hash of the
+key (plaintext keys are never used as keys), all sharing one pooled
+``httpx.AsyncClient``. Clients only hold the key and default options, so an
+evicted client is simply dropped; the connection pool stays open.
+"""
+
+import asyncio
+import hashlib
+import logging
+import threading
+from typing import Any
+
+import httpx
+from cachetools import LRUCache  # type: ignore[import-untyped]
+from openai import AsyncOpenAI
+
+logger = logging.getLogger(__name__)
+
+
+def hash_api_key(api_key: str) -> str:
+    """Stable identifier for an API key that does not reveal it"""
+    return hashlib.sha256(api_key.encode()).hexdigest()
+
+
+class OpenAIClientRegistry:
+    """LRU of ``AsyncOpenAI`` clients sharing one HTTP connection pool"""
+
+    def __init__(
+        self,
+        maxsize: int | None = None,
+        max_connections: int | None = None,
+        max_keepalive_connections: int | None = None,
+        timeout_seconds: float | None = None,
+    ):
+        # Get from settings or use defaults
+        from humancompiler_api.config import settings
+
+        if maxsize is None:
+            maxsize = getattr(settings, "openai_client_cache_size", 128)
+        if max_connections is None:
+            max_connections = getattr(settings, "openai_max_connections", 100)
+        if max_keepalive_connections is None:
+            max_keepalive_connections = getattr(
+                settings, "openai_max_keepalive_connections", 20
+            )
+        if timeout_seconds is None:
+            timeout_seconds = getattr(settings, "openai_timeout_seconds", 60.0)
+
+        self.maxsize = maxsize
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        self.timeout_seconds = timeout_seconds
+        self._clients: LRUCache = LRUCache(maxsize=max(1, maxsize))
+        self._http_client: httpx.AsyncClient | None = None
+        # Pooled connections belong to the event loop that opened them
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def _bind_loop(self) -> None:
+        """Start over when called from a different event loop (tests, CLIs)"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if self._loop is None:
+            self._loop = loop
+        elif self._loop is not loop:
+            logger.debug("Event loop changed; dropping pooled OpenAI clients")
+            self._clients.clear()
+            self._http_client = None
+            self._loop = loop
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(
+                limits=self.limits,
+                timeout=httpx.Timeout(self.timeout_seconds, connect=10.0),
+            )
+        return self._http_client
+
+    def get(self, api_key: str) -> AsyncOpenAI:
+        """Return the shared client for ``api_key``, creating it if needed"""
+        key = hash_api_key(api_key)
+        with self._lock:
+            self._bind_loop()
+            client = self._clients.get(key)
+            if client is not None:
+                self._hits += 1
+                return client
+            self._misses += 1
+            client = AsyncOpenAI(
+                api_key=api_key,
+                timeout=self.timeout_seconds,
+                http_client=self._get_http_client(),
+            )
+            self._clients[key] = client
+            return client
+
+    def discard(self, api_key: str) -> None:
+        """Forget the client for a key, e.g. after the user replaced it"""
+        with self._lock:
+            self._clients.pop(hash_api_key(api_key), None)
+
+    async def aclose(self) -> None:
+        """Drop all clients and close the connection pool"""
+        with self._lock:
+            http_client = self._http_client
+            self._clients.clear()
+            self._http_client = None
+            self._loop = None
+        if http_client is not None and not http_client.is_closed:
+            await http_client.aclose()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return size and hit/miss counters"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._clients),
+                "maxsize": self.maxsize,
+                "max_connections": self.limits.max_connections,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+# Global client registry instance
+openai_client_registry = OpenAIClientRegistry()
+
+
+def get_openai_client(api_key: str) -> AsyncOpenAI:
+    """Shared async client for ``api_key``"""
+    return openai_client_registry.get(api_key)
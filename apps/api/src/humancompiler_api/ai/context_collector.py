@@ -8,6 +8,7 @@ from typing import Any
 
 from sqlmodel import Session
 
+from humancompiler_api.ai.context_loader import load_planning_data
 from humancompiler_api.ai.models import WeeklyPlanContext
 from humancompiler_api.ai.types import WeeklyPlanPreferences
 from humancompiler_api.services import (
@@ -43,53 +44,12 @@ class ContextCollector:
 
         logger.debug(f"Context Collection: Starting for user {user_id}")
 
-        # Get user's projects
-        projects = self.project_service.get_projects(session, user_id)
-        logger.debug(f"Context Collection: Found {len(projects)} projects")
+        # Projects, goals, active tasks, logged hours and recurring tasks in a
+        # fixed number of queries instead of one query per goal
+        data = load_planning_data(session, user_id, project_ids=project_filter)
+        projects, goals, tasks = data.projects, data.goals, data.tasks
+        weekly_recurring_tasks = data.weekly_recurring_tasks
 
-        # Filter projects if specified
-        if project_filter:
-            projects = [p for p in projects if str(p.id) in project_filter]
-            logger.debug(f"Context Collection: Filtered to {len(projects)} projects")
-
-        # Get goals for the projects
-        goals = []
-        for project in projects:
-            project_goals = self.goal_service.get_goals_by_project(
-                session, project.id, user_id
-            )
-            goals.extend(project_goals)
-
-        logger.debug(f"Context Collection: Total {len(goals)} goals found")
-
-        # Get active tasks for the goals
-        tasks = []
-        for goal in goals:
-            goal_tasks = self.task_service.get_tasks_by_goal(session, goal.id, user_id)
-
-            # Include tasks that are not completed or cancelled
-            active_tasks = [
-                t
-                for t in goal_tasks
-                if t.status not in ["completed", "cancelled", "done", "finished"]
-            ]
-
-            # Debug task filtering
-            if len(goal_tasks) > 0:
-                logger.info(
-                    f"Goal {goal.id} ({goal.title}): {len(goal_tasks)} total tasks, {len(active_tasks)} active"
-                )
-                if len(goal_tasks) != len(active_tasks):
-                    filtered_statuses = [
-                        t.status
-                        for t in goal_tasks
-                        if t.status in ["completed", "cancelled", "done", "finished"]
-                    ]
-                    logger.info(f"Filtered out statuses: {set(filtered_statuses)}")
-
-            tasks.extend(active_tasks)
-
-        # Add detailed debugging for production issues
         logger.info(
             f"Context Collection: Collected {len(projects)} projects, {len(goals)} goals, {len(tasks)} active tasks"
         )
@@ -110,13 +70,6 @@ class ContextCollector:
                 "🚨 No active tasks found - this may cause AI to return empty plans"
             )
 
-        # Get weekly recurring tasks for the user
-        weekly_recurring_tasks = (
-            self.weekly_recurring_task_service.get_weekly_recurring_tasks(
-                session, user_id, is_active=True
-            )
-        )
-
         logger.debug(
             f"Context Collection: Found {len(weekly_recurring_tasks)} active weekly recurring tasks"
         )
@@ -134,5 +87,6 @@ class ContextCollector:
             selected_recurring_task_ids=selected_recurring_task_ids,
             capacity_hours=capacity_hours,
             preferences=preferences or {},
+            actual_hours_map=data.actual_hours,
         )
         return context
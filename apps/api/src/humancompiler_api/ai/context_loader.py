@@ -0,0 +1,179 @@
+"""
+Bulk loader for planning data
+
+Weekly planning, the weekly task solver and workload analysis all need the
+same slice of a user's data: projects, their goals, active tasks, hours
+already logged against those tasks and the active weekly recurring tasks.
+Walking projects -> goals -> tasks through the per-entity services costs one
+query per goal; this loader fetches everything in a fixed number of joined
+queries regardless of how many projects or goals the user has.
+"""
+
+import logging
+from collections.abc import Collection
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from sqlalchemy import case
+from sqlmodel import Session, select
+
+from humancompiler_api.common.error_handlers import validate_uuid
+from humancompiler_api.models import (
+    STATUS_PRIORITY,
+    Goal,
+    Project,
+    Task,
+    TaskLogRollup,
+    TaskStatus,
+    WeeklyRecurringTask,
+)
+from humancompiler_api.services import weekly_recurring_task_service
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_TASK_STATUSES: tuple[TaskStatus, ...] = (
+    TaskStatus.PENDING,
+    TaskStatus.IN_PROGRESS,
+)
+
+
+@dataclass
+class PlanningData:
+    """A user's projects, goals and active tasks with lookup indexes"""
+
+    projects: list[Project]
+    goals: list[Goal]
+    tasks: list[Task]
+    actual_hours: dict[str, float] = field(default_factory=dict)
+    weekly_recurring_tasks: list[WeeklyRecurringTask] = field(default_factory=list)
+    projects_by_id: dict[UUID, Project] = field(init=False, repr=False)
+    goals_by_id: dict[UUID, Goal] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.projects_by_id = {project.id: project for project in self.projects}
+        self.goals_by_id = {goal.id: goal for goal in self.goals}
+
+    def project_for_task(self, task: Task) -> Project | None:
+        """Return the task's project without scanning goals or projects"""
+        goal = self.goals_by_id.get(task.goal_id)
+        return self.projects_by_id.get(goal.project_id) if goal else None
+
+
+def parse_project_ids(project_ids: Collection[str | UUID]) -> list[UUID]:
+    """Convert a project filter to UUIDs, skipping malformed IDs"""
+    parsed = []
+    for project_id in project_ids:
+        try:
+            parsed.append(UUID(str(project_id)))
+        except ValueError:
+            logger.warning(f"Ignoring invalid project ID in filter: {project_id}")
+    return parsed
+
+
+def _status_order(model, status_column):
+    """Pending first, then in progress, completed, cancelled (as in the services)"""
+    return case(
+        STATUS_PRIORITY.get(model.__name__.lower(), STATUS_PRIORITY["default"]),
+        value=status_column,
+    )
+
+
+def load_planning_data(
+    session: Session,
+    user_id: str | UUID,
+    project_ids: Collection[str | UUID] | None = None,
+    task_statuses: Collection[TaskStatus] | None = ACTIVE_TASK_STATUSES,
+    include_actual_hours: bool = True,
+    include_recurring_tasks: bool = True,
+) -> PlanningData:
+    """
+    Load planning data for a user in at most five queries.
+
+    Args:
+        session: Database session
+        user_id: Owner of the projects
+        project_ids: Restrict to these projects; invalid IDs are ignored
+        task_statuses: Task statuses to include, None for all
+        include_actual_hours: Look up logged minutes per loaded task
+        include_recurring_tasks: Load active weekly recurring tasks
+
+    Projects, goals and tasks keep the order of the per-entity services:
+    grouped by parent, each group sorted by status priority then ID.
+    """
+    owner_id = validate_uuid(user_id, "user_id")
+    project_filters = [Project.owner_id == owner_id]
+    if project_ids:
+        project_filters.append(Project.id.in_(parse_project_ids(project_ids)))
+
+    projects = list(
+        session.exec(
+            select(Project)
+            .where(*project_filters)
+            .order_by(_status_order(Project, Project.status), Project.id)
+        ).all()
+    )
+
+    goals: list[Goal] = []
+    if projects:
+        goals = list(
+            session.exec(
+                select(Goal)
+                .join(Project, Goal.project_id == Project.id)
+                .where(*project_filters)
+                .order_by(_status_order(Goal, Goal.status), Goal.id)
+            ).all()
+        )
+        project_position = {project.id: index for index, project in enumerate(projects)}
+        goals.sort(key=lambda goal: project_position[goal.project_id])
+
+    task_filters = list(project_filters)
+    if task_statuses is not None:
+        task_filters.append(Task.status.in_(list(task_statuses)))
+
+    tasks: list[Task] = []
+    if goals:
+        tasks = list(
+            session.exec(
+                select(Task)
+                .join(Goal, Task.goal_id == Goal.id)
+                .join(Project, Goal.project_id == Project.id)
+                .where(*task_filters)
+                .order_by(_status_order(Task, Task.status), Task.id)
+            ).all()
+        )
+        goal_position = {goal.id: index for index, goal in enumerate(goals)}
+        tasks.sort(key=lambda task: goal_position[task.goal_id])
+
+    actual_hours: dict[str, float] = {}
+    if include_actual_hours and tasks:
+        rows = session.exec(
+            select(TaskLogRollup.task_id, TaskLogRollup.actual_minutes)
+            .join(Task, TaskLogRollup.task_id == Task.id)
+            .join(Goal, Task.goal_id == Goal.id)
+            .join(Project, Goal.project_id == Project.id)
+            .where(*task_filters)
+        ).all()
+        actual_hours = {
+            str(task_id): float(total_minutes or 0) / 60.0
+            for task_id, total_minutes in rows
+        }
+
+    weekly_recurring_tasks: list[WeeklyRecurringTask] = []
+    if include_recurring_tasks:
+        weekly_recurring_tasks = (
+            weekly_recurring_task_service.get_weekly_recurring_tasks(
+                session, owner_id, is_active=True
+            )
+        )
+
+    logger.debug(
+        f"Loaded planning data for user {owner_id}: {len(projects)} projects, "
+        f"{len(goals)} goals, {len(tasks)} tasks"
+    )
+    return PlanningData(
+        projects=projects,
+        goals=goals,
+        tasks=tasks,
+        actual_hours=actual_hours,
+        weekly_recurring_tasks=weekly_recurring_tasks,
+    )
@@ -24,6 +24,8 @@ class WeeklyPlanContext:
     selected_recurring_task_ids: list[str]
     capacity_hours: float
     preferences: dict[str, Any]
+    # Logged hours per task ID, filled by the bulk loader (None when not loaded)
+    actual_hours_map: dict[str, float] | None = None
 
 
 class WeeklyPlanRequest(BaseModel):
@@ -56,6 +58,34 @@ class TaskPlan(BaseModel):
     rationale: str
 
 
+class TokenUsage(BaseModel):
+    """Token accounting for the model calls behind one response."""
+
+    calls: int = 0
+    chunks: int = 0
+    estimated_prompt_tokens: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    total_tokens: int = 0
+
+    def record(self, estimated_prompt_tokens: int, response: Any = None) -> None:
+        """Add one call; reported counts are taken from ``response.usage``."""
+        self.calls += 1
+        self.estimated_prompt_tokens += estimated_prompt_tokens
+        usage = getattr(response, "usage", None)
+        # Chat Completions reports prompt/completion, Responses input/output
+        for field, aliases in (
+            ("prompt_tokens", ("prompt_tokens", "input_tokens")),
+            ("completion_tokens", ("completion_tokens", "output_tokens")),
+            ("total_tokens", ("total_tokens",)),
+        ):
+            for alias in aliases:
+                value = getattr(usage, alias, None)
+                if isinstance(value, int):
+                    setattr(self, field, getattr(self, field) + value)
+                    break
+
+
 class WeeklyPlanResponse(BaseModel):
     """Response model for weekly plan generation."""
 
@@ -66,6 +96,7 @@ class WeeklyPlanResponse(BaseModel):
     recommendations: list[str]
     insights: list[str]
     generated_at: datetime
+    token_usage: TokenUsage | None = None
 
     model_config = ConfigDict()
 
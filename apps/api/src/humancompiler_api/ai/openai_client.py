@@ -2,9 +2,11 @@
 OpenAI client wrapper for AI services using latest Responses API
 """
 
+import asyncio
 import json
 import logging
 import re
+from dataclasses import replace
 from datetime import datetime
 from uuid import UUID
 
@@ -13,12 +15,29 @@ from openai import (
     AuthenticationError,
     APIConnectionError,
     APIError,
-    OpenAI,
 )
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
-from humancompiler_api.ai.models import WeeklyPlanContext, WeeklyPlanResponse
+from humancompiler_api.ai.call_orchestrator import ai_call_orchestrator
+from humancompiler_api.ai.client_registry import get_openai_client
+from humancompiler_api.ai.models import (
+    TokenUsage,
+    WeeklyPlanContext,
+    WeeklyPlanResponse,
+)
+from humancompiler_api.ai.prompt_budget import (
+    PromptBudget,
+    estimate_tokens,
+    fill_capacity,
+    rank_tasks,
+    split_plan_context,
+)
+from humancompiler_api.ai.response_cache import (
+    llm_cache_key,
+    llm_response_cache,
+    task_state_fingerprint,
+)
 from humancompiler_api.ai.task_utils import filter_valid_tasks
 from humancompiler_api.config import settings
 from humancompiler_api.crypto import get_crypto_service
@@ -26,6 +45,8 @@ from humancompiler_api.models import UserSettings
 
 logger = logging.getLogger(__name__)
 
+PLANNING_SYSTEM_PROMPT = "あなたは週間計画作成の専門家です。与えられたコンテキストに基づいて最適な週間計画を作成してください。"
+
 
 class OpenAIClient:
     """OpenAI client using Responses API and Chat Completions API with GPT-5"""
@@ -39,7 +60,7 @@ class OpenAIClient:
             logger.info(
                 f"Initializing OpenAI client with user API key (model: {model or default_model})"
             )
-            self.client = OpenAI(api_key=api_key)
+            self.client = get_openai_client(api_key)
             self.model = model or default_model
         elif (
             not settings.openai_api_key
@@ -55,9 +76,11 @@ class OpenAIClient:
             logger.info(
                 f"Initializing OpenAI client with system API key (model: {default_model})"
             )
-            self.client = OpenAI(api_key=settings.openai_api_key)
+            self.client = get_openai_client(settings.openai_api_key)
             self.model = default_model
 
+        self.prompt_budget = PromptBudget()
+
     def is_available(self) -> bool:
         """Check if OpenAI client is available"""
         return self.client is not None
@@ -113,12 +136,37 @@ class OpenAIClient:
                 f"Context: {len(context.tasks)} tasks, {len(context.projects)} projects"
             )
 
-            # Create structured input for Chat Completions API
-            planning_context = self._format_planning_context(context)
+            # Backlogs over the prompt budget are planned in concurrent chunks;
+            # a chunk that fails or times out does not sink the others
+            task_chunks = self.prompt_budget.chunk(
+                rank_tasks(context.tasks),
+                lambda task: estimate_tokens(self._format_task(task)),
+                overhead=estimate_tokens(
+                    PLANNING_SYSTEM_PROMPT
+                    + self._format_planning_context(replace(context, tasks=[]))
+                ),
+            )
+            chunk_contexts = (
+                split_plan_context(context, task_chunks)
+                if len(task_chunks) > 1
+                else [context]
+            )
+            token_usage = TokenUsage(chunks=len(chunk_contexts))
 
             # Use Chat Completions API directly (Responses API is experimental/not available)
-            logger.info(f"Using Chat Completions API with model {self.model}")
-            return self._use_chat_completions_api(context, planning_context)
+            logger.info(
+                f"Using Chat Completions API with model {self.model} "
+                f"({len(chunk_contexts)} prompt chunks)"
+            )
+            plans = await asyncio.gather(
+                *(
+                    self._generate_chunk_plan(chunk_context, token_usage)
+                    for chunk_context in chunk_contexts
+                )
+            )
+            plan = plans[0] if len(plans) == 1 else self._merge_plans(context, plans)
+            plan.token_usage = token_usage
+            return plan
 
         except RateLimitError as e:
             logger.warning(f"OpenAI rate limit exceeded: {e}")
@@ -154,6 +202,66 @@ class OpenAIClient:
                 f"予期しないエラーが発生しました: {str(e)}",
             )
 
+    async def _generate_chunk_plan(
+        self, context: WeeklyPlanContext, token_usage: TokenUsage
+    ) -> WeeklyPlanResponse:
+        """Plan one chunk, reusing the previous answer when nothing changed"""
+        planning_context = self._format_planning_context(context)
+        cache_key = llm_cache_key(
+            "weekly_plan",
+            context.user_id,
+            self.model,
+            [{"role": "user", "content": planning_context}],
+            self._get_planning_tools(),
+            task_state_fingerprint([*context.tasks, *context.weekly_recurring_tasks]),
+        )
+        return await llm_response_cache.get_or_compute(
+            cache_key,
+            lambda: self._use_chat_completions_api(
+                context, planning_context, token_usage
+            ),
+            should_cache=lambda plan: plan.success,
+        )
+
+    def _merge_plans(
+        self, context: WeeklyPlanContext, plans: list[WeeklyPlanResponse]
+    ) -> WeeklyPlanResponse:
+        """Combine chunk plans; failed chunks are reported, not fatal
+
+        Plans are merged in rank order, so when the chunks together propose
+        more than the week's capacity the most urgent tasks are kept.
+        """
+        succeeded = [plan for plan in plans if plan.success]
+        if not succeeded:
+            return plans[0]
+
+        insights = [insight for plan in succeeded for insight in plan.insights]
+        failed = len(plans) - len(succeeded)
+        if failed:
+            insights.append(
+                f"{len(plans)} 件中 {failed} 件のタスクグループで計画を作成できませんでした。"
+            )
+        task_plans = fill_capacity(
+            (task_plan for plan in succeeded for task_plan in plan.task_plans),
+            lambda task_plan: task_plan.estimated_hours,
+            context.capacity_hours,
+        )
+        return WeeklyPlanResponse(
+            success=True,
+            week_start_date=context.week_start_date.strftime("%Y-%m-%d"),
+            total_planned_hours=sum(plan.estimated_hours for plan in task_plans),
+            task_plans=task_plans,
+            recommendations=list(
+                dict.fromkeys(
+                    recommendation
+                    for plan in succeeded
+                    for recommendation in plan.recommendations
+                )
+            ),
+            insights=list(dict.fromkeys(insights)),
+            generated_at=datetime.now(),
+        )
+
     def _create_unavailable_response(
         self, context: WeeklyPlanContext
     ) -> WeeklyPlanResponse:
@@ -196,23 +304,21 @@ class OpenAIClient:
 
         projects_section = "\n".join(
             [
-                f"### {p.title}\n- ID: {p.id}\n- 説明: {p.description or '説明なし'}"
+                f"### {p.title}\n- ID: {p.id}\n- 説明: {self.prompt_budget.compact(p.description) or '説明なし'}"
                 for p in context.projects
             ]
         )
 
         goals_section = "\n".join(
             [
-                f"### {g.title}\n- ID: {g.id}\n- 予想時間: {g.estimate_hours}時間\n- 説明: {g.description or '説明なし'}"
+                f"### {g.title}\n- ID: {g.id}\n- 予想時間: {g.estimate_hours}時間\n- 説明: {self.prompt_budget.compact(g.description) or '説明なし'}"
                 for g in context.goals
             ]
         )
 
+        # Most urgent first, each goal's tasks together
         tasks_section = "\n".join(
-            [
-                f"### {t.title}\n- ID: {t.id}\n- ステータス: {t.status}\n- 予想時間: {t.estimate_hours}時間\n- 期限: {t.due_date.strftime('%Y-%m-%d') if t.due_date else '未設定'}\n- 説明: {t.description or '説明なし'}"
-                for t in context.tasks
-            ]
+            [self._format_task(t) for t in rank_tasks(context.tasks)]
         )
 
         # Add weekly recurring tasks section
@@ -233,7 +339,7 @@ class OpenAIClient:
             if selected_recurring_tasks:
                 recurring_tasks_section = "\n".join(
                     [
-                        f"### {rt.title}\n- ID: {rt.id}\n- カテゴリ: {rt.category}\n- 予想時間: {rt.estimate_hours}時間\n- 説明: {rt.description or '説明なし'}"
+                        f"### {rt.title}\n- ID: {rt.id}\n- カテゴリ: {rt.category}\n- 予想時間: {rt.estimate_hours}時間\n- 説明: {self.prompt_budget.compact(rt.description) or '説明なし'}"
                         for rt in selected_recurring_tasks
                     ]
                 )
@@ -295,6 +401,10 @@ class OpenAIClient:
 
         return base_context
 
+    def _format_task(self, t) -> str:
+        """Prompt entry for one pending task"""
+        return f"### {t.title}\n- ID: {t.id}\n- 目標ID: {t.goal_id}\n- ステータス: {t.status}\n- 予想時間: {t.estimate_hours}時間\n- 期限: {t.due_date.strftime('%Y-%m-%d') if t.due_date else '未設定'}\n- 説明: {self.prompt_budget.compact(t.description) or '説明なし'}"
+
     def _get_planning_tools(self) -> list[dict]:
         """Get tools definition for weekly planning"""
         return [
@@ -478,8 +588,11 @@ class OpenAIClient:
                 context, "テキストレスポンスの解析に失敗しました。"
             )
 
-    def _use_chat_completions_api(
-        self, context: WeeklyPlanContext, planning_context: str
+    async def _use_chat_completions_api(
+        self,
+        context: WeeklyPlanContext,
+        planning_context: str,
+        token_usage: TokenUsage | None = None,
     ) -> WeeklyPlanResponse:
         """Use Chat Completions API for GPT-5 weekly planning"""
         try:
@@ -494,10 +607,7 @@ class OpenAIClient:
             api_params = {
                 "model": self.model,
                 "messages": [
-                    {
-                        "role": "system",
-                        "content": "あなたは週間計画作成の専門家です。与えられたコンテキストに基づいて最適な週間計画を作成してください。",
-                    },
+                    {"role": "system", "content": PLANNING_SYSTEM_PROMPT},
                     {"role": "user", "content": planning_context},
                 ],
                 "tools": self._get_planning_tools(),
@@ -512,7 +622,15 @@ class OpenAIClient:
             if not self.model.startswith(("o1", "gpt-5")):
                 api_params["temperature"] = 0.7
 
-            response = self.client.chat.completions.create(**api_params)
+            response = await ai_call_orchestrator.call(
+                lambda: self.client.chat.completions.create(**api_params),
+                user_id=context.user_id,
+            )
+            if token_usage is not None:
+                token_usage.record(
+                    estimate_tokens(PLANNING_SYSTEM_PROMPT + planning_context),
+                    response,
+                )
 
             # Parse Chat Completions response
             return self._parse_chat_completions_response(response, context)
@@ -0,0 +1,204 @@
+"""
+Token budgets for AI prompts.
+
+Heavy users have hundreds of open tasks. Putting all of them into one prompt
+hits model context limits and pays for text that barely changes the answer, so
+the prompt builders:
+
+- estimate tokens with a character heuristic (no tokenizer dependency),
+- shorten free-text descriptions,
+- list tasks most urgent first, keeping each goal's tasks together,
+- split the task list into chunks that each fit the token budget. Callers send
+  the chunks as concurrent requests and merge the answers; capacity goes to the
+  most urgent chunks first.
+
+The counts of every call made for one request are collected in a
+``TokenUsage`` that is returned with the response.
+"""
+
+import math
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import replace
+from typing import Any, TypeVar
+
+from humancompiler_api.ai.models import WeeklyPlanContext
+
+T = TypeVar("T")
+
+# English text averages about four characters per token; Japanese text is
+# close to one token per character
+ASCII_CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count of ``text``"""
+    ascii_chars = len(text.encode("ascii", "ignore"))
+    return math.ceil(ascii_chars / ASCII_CHARS_PER_TOKEN) + len(text) - ascii_chars
+
+
+def rank_tasks(tasks: Iterable[T]) -> list[T]:
+    """Tasks by due date, then user priority, with each goal's tasks adjacent.
+
+    Goals are ordered by their most urgent task.
+    """
+
+    def urgency(task: Any) -> tuple:
+        due_date = getattr(task, "due_date", None)
+        priority = getattr(task, "priority", None)
+        return (
+            due_date is None,
+            due_date.isoformat() if due_date else "",
+            priority if isinstance(priority, int) else 3,
+            str(task.id),
+        )
+
+    by_goal: dict[str, list[T]] = {}
+    for task in sorted(tasks, key=urgency):
+        by_goal.setdefault(str(getattr(task, "goal_id", None)), []).append(task)
+    return [task for goal_tasks in by_goal.values() for task in goal_tasks]
+
+
+class PromptBudget:
+    """Size limits for one model call"""
+
+    def __init__(
+        self, max_tokens: int | None = None, description_chars: int | None = None
+    ):
+        # Get from settings or use defaults
+        from humancompiler_api.config import settings
+
+        if max_tokens is None:
+            max_tokens = getattr(settings, "ai_prompt_token_budget", 12000)
+        if description_chars is None:
+            description_chars = getattr(settings, "ai_prompt_description_chars", 300)
+
+        self.max_tokens = max_tokens
+        self.description_chars = description_chars
+
+    def compact(self, text: str | None) -> str | None:
+        """Collapse whitespace and cut ``text`` to the description limit"""
+        if not text:
+            return text
+        text = " ".join(text.split())
+        if len(text) <= self.description_chars:
+            return text
+        return text[: self.description_chars].rstrip() + "…"
+
+    def chunk(
+        self,
+        items: Sequence[T],
+        cost: Callable[[T], int],
+        overhead: int = 0,
+        max_items: int | None = None,
+    ) -> list[list[T]]:
+        """Split ``items`` in order so each chunk fits the budget.
+
+        ``overhead`` is the cost of the prompt without any items. A single
+        item larger than the remaining budget still gets a chunk of its own.
+        """
+        available = max(self.max_tokens - overhead, 1)
+        chunks: list[list[T]] = []
+        current: list[T] = []
+        used = 0
+        for item in items:
+            item_tokens = cost(item)
+            full = max_items is not None and len(current) >= max_items
+            if current and (full or used + item_tokens > available):
+                chunks.append(current)
+                current, used = [], 0
+            current.append(item)
+            used += item_tokens
+        if current:
+            chunks.append(current)
+        return chunks
+
+
+def split_plan_context(
+    context: WeeklyPlanContext,
+    task_chunks: list[list[Any]],
+    capacity_hours: float | None = None,
+) -> list[WeeklyPlanContext]:
+    """One planning context per task chunk that gets capacity.
+
+    Chunks come in rank order, so capacity fills them in that order: each
+    chunk gets up to the hours of its tasks until the week is full, and chunks
+    left without capacity are not planned. Capacity the tasks do not need stays
+    with the first chunk, which also plans the weekly recurring tasks.
+    ``capacity_hours`` defaults to the context's capacity.
+    """
+    remaining_hours_map = getattr(context, "remaining_hours_map", {})
+    if capacity_hours is None:
+        capacity_hours = context.capacity_hours
+
+    def task_hours(task: Any) -> float:
+        return remaining_hours_map.get(str(task.id), float(task.estimate_hours or 0))
+
+    chunk_hours = [sum(task_hours(task) for task in chunk) for chunk in task_chunks]
+    if chunk_hours:
+        chunk_hours[0] += sum(
+            float(rt.estimate_hours or 0)
+            for rt in context.weekly_recurring_tasks
+            if str(rt.id) in (context.selected_recurring_task_ids or [])
+        )
+
+    remaining = capacity_hours
+    capacities = []
+    for hours in chunk_hours:
+        capacities.append(min(hours, max(remaining, 0.0)))
+        remaining -= hours
+    if capacities and remaining > 0:
+        capacities[0] += remaining
+
+    contexts = []
+    for index, (chunk, hours, capacity) in enumerate(
+        zip(task_chunks, chunk_hours, capacities, strict=True)
+    ):
+        # Tasks without hours cost nothing, so their chunks are kept
+        if index > 0 and capacity <= 0 and hours > 0:
+            continue
+        chunk_context = replace(
+            context,
+            tasks=chunk,
+            capacity_hours=round(capacity, 2),
+            weekly_recurring_tasks=context.weekly_recurring_tasks if index == 0 else [],
+            selected_recurring_task_ids=(
+                context.selected_recurring_task_ids if index == 0 else []
+            ),
+        )
+        # Set by the solver after the dataclass is built; replace() drops it
+        if hasattr(context, "remaining_hours_map"):
+            chunk_context.remaining_hours_map = remaining_hours_map
+        contexts.append(chunk_context)
+    return contexts
+
+
+def fill_capacity(
+    items: Iterable[T],
+    hours: Callable[[T], float],
+    capacity_hours: float,
+    group: Callable[[T], str | None] | None = None,
+    group_limits: dict[str, float] | None = None,
+) -> list[T]:
+    """Keep ``items`` in order while they fit the capacity.
+
+    Merges answers of chunks planned separately: earlier (more urgent) chunks
+    win, and ``group_limits`` (e.g. project maximum hours) hold for the merged
+    selection rather than per chunk.
+    """
+    group_limits = group_limits or {}
+    used = 0.0
+    used_by_group: dict[str, float] = {}
+    kept = []
+    for item in items:
+        item_hours = hours(item)
+        key = group(item) if group else None
+        group_used = used_by_group.get(key, 0.0) if key is not None else 0.0
+        if used + item_hours > capacity_hours:
+            continue
+        if key in group_limits and group_used + item_hours > group_limits[key]:
+            continue
+        kept.append(item)
+        used += item_hours
+        if key is not None:
+            used_by_group[key] = group_used + item_hours
+    return kept
@@ -3,10 +3,11 @@
 import logging
 from datetime import datetime, timedelta
 
-from openai import OpenAI
+from openai import AsyncOpenAI
 from sqlmodel import Session, select, and_
 from sqlalchemy.orm import selectinload
 
+from humancompiler_api.ai.client_registry import get_openai_client
 from humancompiler_api.models import (
     Log,
     Task,
@@ -26,14 +27,11 @@ class WeeklyReportGenerator:
 
     def __init__(self):
         """Initialize the report generator"""
-        self.openai_client = None
         self.logger = logging.getLogger(__name__)
 
-    def _get_openai_client(self, api_key: str) -> OpenAI:
-        """Get or create OpenAI client with provided API key"""
-        if not self.openai_client:
-            self.openai_client = OpenAI(api_key=api_key)
-        return self.openai_client
+    def _get_openai_client(self, api_key: str) -> AsyncOpenAI:
+        """Get the shared OpenAI client for the provided API key"""
+        return get_openai_client(api_key)
 
     def _get_week_dates(self, week_start_date: str) -> tuple[datetime, datetime]:
         """Get start and end datetime for the week"""
@@ -198,7 +196,7 @@ class WeeklyReportGenerator:
             project_breakdown=project_breakdown,
         )
 
-    def _generate_markdown_report_with_ai(
+    async def _generate_markdown_report_with_ai(
         self,
         api_key: str,
         week_start_date: str,
@@ -284,7 +282,7 @@ class WeeklyReportGenerator:
 """
 
         try:
-            response = client.chat.completions.create(
+            response = await client.chat.completions.create(
                 model=model,
                 messages=[
                     {
@@ -394,7 +392,7 @@ class WeeklyReportGenerator:
 
         return report
 
-    def generate_weekly_report(
+    async def generate_weekly_report(
         self,
         session: Session,
         request: WeeklyReportRequest,
@@ -476,7 +474,7 @@ class WeeklyReportGenerator:
         ]
 
         # Generate markdown report with AI
-        markdown_report = self._generate_markdown_report_with_ai(
+        markdown_report = await self._generate_markdown_report_with_ai(
             openai_api_key,
             request.week_start_date,
             work_summary,
@@ -0,0 +1,172 @@
+"""
+Content-addressed cache of parsed LLM responses.
+
+Regenerating a weekly plan or re-running priority extraction on an unchanged
+backlog sends the model the same prompt again. Parsed results are therefore
+cached under a hash of everything the answer depends on: the purpose, the
+model, the prompt with whitespace normalized, the tool schema, and a
+fingerprint of the task state (IDs, status, estimate, due date and last
+update), which also covers fields the prompt does not show. Any edit produces a
+new key, so stale entries are never served and simply age out.
+
+Entries are stored in the "long" tier of the application cache (``core.cache``),
+which bounds their number and age. With the redis backend they survive restarts
+and are shared between API instances.
+"""
+
+import copy
+import logging
+import threading
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any, TypeVar
+
+from core.cache import count_error, count_lookup, get_cache_backend
+from core.cache_backends import MISSING
+from humancompiler_api.solver_cache import solver_fingerprint
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Application cache tier reserved for AI responses
+LLM_CACHE_TIER = "long"
+
+
+def normalize_prompt(text: str) -> str:
+    """Collapse whitespace so formatting-only differences share an entry"""
+    return " ".join(text.split())
+
+
+def task_state_fingerprint(tasks: Iterable[Any]) -> list[tuple]:
+    """The task fields a model answer depends on, in a stable order"""
+    return sorted(
+        (
+            (
+                str(task.id),
+                getattr(task, "status", None),
+                str(getattr(task, "estimate_hours", None)),
+                getattr(task, "due_date", None),
+                getattr(task, "updated_at", None),
+            )
+            for task in tasks
+        ),
+        key=lambda row: row[0],
+    )
+
+
+def llm_cache_key(
+    purpose: str,
+    user_id: Any,
+    model: str,
+    messages: list[dict[str, Any]],
+    tools: Any = None,
+    state: Any = None,
+) -> str:
+    """Key for one model call; identical inputs give identical keys"""
+    normalized = [
+        {**message, "content": normalize_prompt(str(message.get("content", "")))}
+        for message in messages
+    ]
+    return solver_fingerprint(
+        f"llm:{purpose}",
+        user_id=user_id,
+        model=model,
+        messages=normalized,
+        tools=tools,
+        state=state,
+    )
+
+
+class LLMResponseCache:
+    """Parsed model responses keyed by ``llm_cache_key``"""
+
+    def __init__(self, enabled: bool | None = None, tier: str = LLM_CACHE_TIER):
+        # Get from settings or use defaults
+        from humancompiler_api.config import settings
+
+        if enabled is None:
+            enabled = getattr(settings, "ai_response_cache_enabled", True)
+
+        self.enabled = enabled
+        self.tier = tier
+        self._lock = threading.Lock()
+        self._counters: dict[str, dict[str, int]] = {}
+
+    def _count(self, key: str, outcome: str) -> None:
+        purpose = key.split(":", 2)[1] if key.startswith("llm:") else "other"
+        with self._lock:
+            counters = self._counters.setdefault(purpose, {"hits": 0, "misses": 0})
+            counters[outcome] += 1
+        count_lookup(self.tier, outcome == "hits")
+
+    def get(self, key: str) -> Any | None:
+        """Return a copy of the cached result, or None"""
+        if not self.enabled:
+            return None
+        try:
+            value = get_cache_backend().get(self.tier, key)
+        except Exception as e:
+            # An unreachable backend means a miss, not a failed request
+            logger.warning(f"LLM response cache lookup failed for {key}: {e}")
+            count_error(self.tier)
+            value = MISSING
+        if value is MISSING:
+            self._count(key, "misses")
+            return None
+        self._count(key, "hits")
+        logger.debug(f"LLM response cache hit for {key}")
+        # Callers post-process results; never hand out the stored object
+        return copy.deepcopy(value)
+
+    def set(self, key: str, result: Any) -> None:
+        """Store a result; None is never cached"""
+        if not self.enabled or result is None:
+            return
+        try:
+            get_cache_backend().set(self.tier, key, copy.deepcopy(result))
+        except Exception as e:
+            logger.warning(f"LLM response cache store failed for {key}: {e}")
+            count_error(self.tier)
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[T]],
+        should_cache: Callable[[T], bool] | None = None,
+    ) -> T:
+        """Return the cached result for ``key`` or await ``compute`` and store it"""
+        cached_result = self.get(key)
+        if cached_result is not None:
+            return cached_result
+
+        result = await compute()
+        if should_cache is None or should_cache(result):
+            self.set(key, result)
+        return result
+
+    def clear(self) -> None:
+        get_cache_backend().clear(self.tier, "llm:")
+        with self._lock:
+            self._counters.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return hit/miss counters, overall and per purpose"""
+        with self._lock:
+            by_purpose = {
+                purpose: dict(counters) for purpose, counters in self._counters.items()
+            }
+        hits = sum(counters["hits"] for counters in by_purpose.values())
+        misses = sum(counters["misses"] for counters in by_purpose.values())
+        lookups = hits + misses
+        return {
+            "enabled": self.enabled,
+            "tier": self.tier,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "by_purpose": by_purpose,
+        }
+
+
+# Global LLM response cache instance
+llm_response_cache = LLMResponseCache()
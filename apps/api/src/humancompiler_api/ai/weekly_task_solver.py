@@ -5,31 +5,53 @@ This module implements an AI-powered system that goes beyond simple weekly plann
 to provide intelligent task selection, project allocation, and constraint-based optimization.
 """
 
+import asyncio
 import json
 import logging
 import re
+from dataclasses import replace
 from datetime import datetime, timedelta
 from typing import Any
 from uuid import UUID
 
-from openai import OpenAI, APIError, RateLimitError, AuthenticationError
+from openai import AsyncOpenAI, APIError, RateLimitError, AuthenticationError
 from openai.types.chat import ChatCompletion
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from humancompiler_api.ai.types import ConstraintAnalysis, SolverMetrics
 from sqlmodel import Session, select
 
+from humancompiler_api.ai.call_orchestrator import ai_call_orchestrator
+from humancompiler_api.ai.client_registry import get_openai_client
 from humancompiler_api.ai.context_collector import ContextCollector
-from humancompiler_api.ai.models import WeeklyPlanContext, TaskPlan
+from humancompiler_api.ai.models import WeeklyPlanContext, TaskPlan, TokenUsage
+from humancompiler_api.ai.prompt_budget import (
+    PromptBudget,
+    estimate_tokens,
+    fill_capacity,
+    rank_tasks,
+    split_plan_context,
+)
+from humancompiler_api.ai.response_cache import llm_cache_key, llm_response_cache
 from humancompiler_api.ai.task_utils import filter_valid_tasks
 from humancompiler_api.models import (
     Task,
     UserSettings,
-    Log,
     TaskDependency,
 )
 from humancompiler_api.crypto import get_crypto_service
-from sqlmodel import func, select
+from humancompiler_api.solver_cache import solver_fingerprint, solver_result_cache
+from humancompiler_api.solver_executor import (
+    MAX_NO_IMPROVEMENT_TIMEOUT_SECONDS,
+    MAX_RELATIVE_GAP_LIMIT,
+    CancelCheck,
+    SolverCancelledError,
+    SolverExecutorError,
+    resolve_search_settings,
+    solver_executor,
+)
+from humancompiler_api.task_rollups import get_actual_hours_map
+from sqlmodel import select
 from uuid import UUID
 
 logger = logging.getLogger(__name__)
@@ -68,6 +90,28 @@ class WeeklyConstraints(BaseModel):
     )
 
 
+class SolverSearchConfig(BaseModel):
+    """CP-SAT search settings for the weekly optimizer (capped server-side)."""
+
+    num_workers: int | None = Field(
+        None, ge=1, le=64, description="Parallel CP-SAT search workers"
+    )
+    relative_gap_limit: float | None = Field(
+        None,
+        ge=0.0,
+        le=MAX_RELATIVE_GAP_LIMIT,
+        description="Stop once the solution is within this relative gap of the bound",
+    )
+    no_improvement_timeout_seconds: float | None = Field(
+        None,
+        ge=0.0,
+        le=MAX_NO_IMPROVEMENT_TIMEOUT_SECONDS,
+        description="Stop when the best solution has not improved for this long",
+    )
+
+    model_config = ConfigDict(extra="forbid")
+
+
 class TaskSolverRequest(BaseModel):
     """Request for weekly task solver."""
 
@@ -84,6 +128,9 @@ class TaskSolverRequest(BaseModel):
     use_ai_priority: bool = Field(
         default=False, description="Use OpenAI for priority evaluation"
     )
+    solver_search: SolverSearchConfig | None = Field(
+        None, description="Optional CP-SAT search settings"
+    )
 
 
 class TaskSolverResponse(BaseModel):
@@ -98,99 +145,216 @@ class TaskSolverResponse(BaseModel):
     constraint_analysis: ConstraintAnalysis | dict[str, Any]
     solver_metrics: SolverMetrics | dict[str, Any]
     generated_at: datetime
+    token_usage: TokenUsage | None = None
+
+
+# Most new or changed tasks sent to the model per priority extraction call
+PRIORITY_BATCH_SIZE = 40
+
+PRIORITY_SYSTEM_PROMPT = "あなたは週間タスク優先度の専門家です。与えられた情報を基に各タスクの優先度スコア（0-10）を算出してください。"
 
 
 class TaskPriorityExtractor:
     """Extract task priorities using OpenAI API based on user requirements."""
 
-    def __init__(self, openai_client: OpenAI | None = None, model: str = "gpt-4"):
+    def __init__(self, openai_client: AsyncOpenAI | None = None, model: str = "gpt-4"):
         """Initialize priority extractor with OpenAI client."""
         self.openai_client = openai_client
         self.model = model
+        self.prompt_budget = PromptBudget()
 
     async def extract_priorities(
         self,
         context: WeeklyPlanContext,
         user_prompt: str | None,
         project_allocations: list[ProjectAllocation],
+        token_usage: TokenUsage | None = None,
     ) -> dict[str, float]:
         """
         Extract task priorities from user requirements and project context.
 
+        Scores are kept per task between solves. Only tasks whose prompt fields
+        changed since they were scored (or whose shared context did: projects,
+        goals, allocations, week, instructions) are sent to the model. They are
+        split into batches that fit the prompt token budget (at most
+        ``PRIORITY_BATCH_SIZE`` tasks each), which are scored concurrently.
+        Tasks the model does not score get the heuristic score.
+
         Args:
             context: Weekly planning context with tasks and projects
             user_prompt: User instructions for priority adjustment
             project_allocations: Project resource allocation ratios
+            token_usage: Collects the token counts of the model calls
 
         Returns:
             Dictionary mapping task_id to priority score (0.0-10.0)
         """
+        fallback = self._fallback_priority_calculation(context, project_allocations)
         if not self.openai_client:
-            return self._fallback_priority_calculation(context, project_allocations)
+            return fallback
 
-        try:
-            priority_context = self._create_priority_context(
-                context, user_prompt, project_allocations
+        remaining_hours_map = getattr(context, "remaining_hours_map", {})
+        task_hashes = {
+            str(task.id): solver_fingerprint(
+                "task", self._task_prompt_data(task, remaining_hours_map)
             )
+            for task in context.tasks
+        }
+        store_key = self._score_store_key(context, user_prompt, project_allocations)
+        stored = llm_response_cache.get(store_key) or {}
+        priorities = {
+            task_id: stored[task_id]["score"]
+            for task_id, task_hash in task_hashes.items()
+            if task_id in stored and stored[task_id]["hash"] == task_hash
+        }
+        changed = [task for task in context.tasks if str(task.id) not in priorities]
+        logger.info(
+            f"Reusing {len(priorities)} task priorities, "
+            f"scoring {len(changed)} new or changed tasks"
+        )
 
-            logger.info(f"Calling OpenAI API with model: {self.model}")
-            response = self.openai_client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "あなたは週間タスク優先度の専門家です。与えられた情報を基に各タスクの優先度スコア（0-10）を算出してください。",
-                    },
-                    {"role": "user", "content": priority_context},
-                ],
-                tools=[self._get_priority_extraction_tool()],
-                tool_choice="auto",
-                temperature=0.3,
+        base_prompt = self._create_priority_context(
+            context, user_prompt, project_allocations, []
+        )
+        batches = self.prompt_budget.chunk(
+            rank_tasks(changed),
+            lambda task: estimate_tokens(
+                json.dumps(
+                    self._task_prompt_data(task, remaining_hours_map),
+                    indent=2,
+                    ensure_ascii=False,
+                )
+            ),
+            overhead=estimate_tokens(PRIORITY_SYSTEM_PROMPT + base_prompt),
+            max_items=PRIORITY_BATCH_SIZE,
+        )
+        if token_usage is not None:
+            token_usage.chunks += len(batches)
+
+        scored: dict[str, float] = {}
+        for batch_scores in await asyncio.gather(
+            *(
+                self._score_tasks(
+                    context, batch, user_prompt, project_allocations, token_usage
+                )
+                for batch in batches
             )
+        ):
+            scored.update(batch_scores)
+
+        priorities.update(scored)
+        if scored:
+            # Tasks no longer in the backlog drop out of the store
+            llm_response_cache.set(
+                store_key,
+                {
+                    task_id: {"hash": task_hashes[task_id], "score": score}
+                    for task_id, score in priorities.items()
+                },
+            )
+        return {**fallback, **priorities}
 
-            return self._parse_priority_response(response, context)
-
+    async def _score_tasks(
+        self,
+        context: WeeklyPlanContext,
+        tasks: list[Task],
+        user_prompt: str | None,
+        project_allocations: list[ProjectAllocation],
+        token_usage: TokenUsage | None = None,
+    ) -> dict[str, float]:
+        """Ask the model to score ``tasks``; empty when the call fails."""
+        try:
+            priority_context = self._create_priority_context(
+                context, user_prompt, project_allocations, tasks
+            )
+            logger.info(
+                f"Calling OpenAI API with model: {self.model} for {len(tasks)} tasks"
+            )
+            response = await ai_call_orchestrator.call(
+                lambda: self.openai_client.chat.completions.create(
+                    model=self.model,
+                    messages=[
+                        {"role": "system", "content": PRIORITY_SYSTEM_PROMPT},
+                        {"role": "user", "content": priority_context},
+                    ],
+                    tools=[self._get_priority_extraction_tool()],
+                    tool_choice="auto",
+                    temperature=0.3,
+                ),
+                user_id=context.user_id,
+            )
         except Exception as e:
             logger.error(f"Priority extraction failed: {e}")
-            return self._fallback_priority_calculation(context, project_allocations)
+            return {}
+        if token_usage is not None:
+            token_usage.record(
+                estimate_tokens(PRIORITY_SYSTEM_PROMPT + priority_context), response
+            )
 
-    def _create_priority_context(
+        task_ids = {str(task.id) for task in tasks}
+        scores: dict[str, float] = {}
+        for task_id, score in (self._parse_priority_tool_call(response) or {}).items():
+            if task_id not in task_ids:
+                continue
+            try:
+                scores[task_id] = min(10.0, max(0.0, float(score)))
+            except (TypeError, ValueError):
+                continue
+        return scores
+
+    def _score_store_key(
         self,
         context: WeeklyPlanContext,
         user_prompt: str | None,
         project_allocations: list[ProjectAllocation],
     ) -> str:
-        """Create context for priority extraction."""
-        # Get remaining hours map from context
-        remaining_hours_map = getattr(context, "remaining_hours_map", {})
+        """Key of the stored scores; changes whenever every score may change."""
+        return llm_cache_key(
+            "priority_scores",
+            context.user_id,
+            self.model,
+            [{"role": "user", "content": user_prompt or ""}],
+            [self._get_priority_extraction_tool()],
+            {
+                **self._shared_prompt_data(context, project_allocations),
+                "week_start": context.week_start_date,
+            },
+        )
 
-        tasks_data = []
-        for task in context.tasks:
-            # Use remaining_hours for task context
-            task_id = str(task.id)
-            remaining_hours = remaining_hours_map.get(
-                task_id, float(task.estimate_hours or 0)
-            )
-            task_data = {
-                "id": task.id,
-                "title": task.title,
-                "description": task.description,
-                "estimate_hours": remaining_hours,  # Using remaining hours for AI context
-                "due_date": task.due_date.isoformat() if task.due_date else None,
-                "priority": getattr(task, "priority", 3),
-                "goal_id": task.goal_id,
-            }
-            tasks_data.append(task_data)
+    def _task_prompt_data(
+        self, task: Task, remaining_hours_map: dict[str, float]
+    ) -> dict[str, Any]:
+        """The fields of a task that the priority prompt shows."""
+        task_id = str(task.id)
+        # Use remaining_hours for task context
+        remaining_hours = remaining_hours_map.get(
+            task_id, float(task.estimate_hours or 0)
+        )
+        return {
+            "id": task_id,
+            "title": task.title,
+            "description": self.prompt_budget.compact(task.description),
+            "estimate_hours": remaining_hours,  # Using remaining hours for AI context
+            "due_date": task.due_date.isoformat() if task.due_date else None,
+            "priority": getattr(task, "priority", 3),
+            "goal_id": str(task.goal_id),
+        }
 
+    def _shared_prompt_data(
+        self,
+        context: WeeklyPlanContext,
+        project_allocations: list[ProjectAllocation],
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Projects (with allocation ratios) and goals shown with every task."""
         projects_data = []
         for project in context.projects:
             allocation = next(
                 (a for a in project_allocations if a.project_id == project.id), None
             )
             project_data = {
-                "id": project.id,
+                "id": str(project.id),
                 "title": project.title,
-                "description": project.description,
+                "description": self.prompt_budget.compact(project.description),
                 "allocation_ratio": allocation.priority_weight if allocation else 0.0,
             }
             projects_data.append(project_data)
@@ -198,13 +362,34 @@ class TaskPriorityExtractor:
         goals_data = []
         for goal in context.goals:
             goal_data = {
-                "id": goal.id,
-                "project_id": goal.project_id,
+                "id": str(goal.id),
+                "project_id": str(goal.project_id),
                 "title": goal.title,
-                "description": goal.description,
+                "description": self.prompt_budget.compact(goal.description),
             }
             goals_data.append(goal_data)
 
+        return {"projects": projects_data, "goals": goals_data}
+
+    def _create_priority_context(
+        self,
+        context: WeeklyPlanContext,
+        user_prompt: str | None,
+        project_allocations: list[ProjectAllocation],
+        tasks: list[Task] | None = None,
+    ) -> str:
+        """Create context for priority extraction (all tasks unless given)."""
+        # Get remaining hours map from context
+        remaining_hours_map = getattr(context, "remaining_hours_map", {})
+
+        tasks_data = [
+            self._task_prompt_data(task, remaining_hours_map)
+            for task in rank_tasks(context.tasks if tasks is None else tasks)
+        ]
+        shared_data = self._shared_prompt_data(context, project_allocations)
+        projects_data = shared_data["projects"]
+        goals_data = shared_data["goals"]
+
         prompt_section = ""
         if user_prompt:
             prompt_section = f"""
@@ -274,10 +459,10 @@ class TaskPriorityExtractor:
             },
         }
 
-    def _parse_priority_response(
-        self, response: ChatCompletion, context: WeeklyPlanContext
-    ) -> dict[str, float]:
-        """Parse priority extraction response."""
+    def _parse_priority_tool_call(
+        self, response: ChatCompletion
+    ) -> dict[str, float] | None:
+        """Priorities from the extraction tool call; None if the model gave none."""
         try:
             message = response.choices[0].message
             if message.tool_calls:
@@ -285,12 +470,9 @@ class TaskPriorityExtractor:
                 if tool_call.function.name == "extract_task_priorities":
                     function_args = json.loads(tool_call.function.arguments)
                     return function_args.get("task_priorities", {})
-
-            return self._fallback_priority_calculation(context, [])
-
         except Exception as e:
             logger.error(f"Failed to parse priority response: {e}")
-            return self._fallback_priority_calculation(context, [])
+        return None
 
     def _fallback_priority_calculation(
         self, context: WeeklyPlanContext, project_allocations: list[ProjectAllocation]
@@ -359,12 +541,13 @@ class TaskPriorityExtractor:
 class WeeklyTaskSolver:
     """Advanced AI-powered weekly task solver using GPT-5."""
 
-    def __init__(self, openai_client: OpenAI | None = None, model: str = "gpt-5"):
+    def __init__(self, openai_client: AsyncOpenAI | None = None, model: str = "gpt-5"):
         """Initialize solver with OpenAI client."""
         self.openai_client = openai_client
         self.model = model  # Use GPT-5 for advanced task optimization
         self.context_collector = ContextCollector()
         self.priority_extractor = TaskPriorityExtractor(openai_client, "gpt-4")
+        self.prompt_budget = PromptBudget()
 
     @classmethod
     async def create_for_user(
@@ -388,7 +571,7 @@ class WeeklyTaskSolver:
                         user_settings.openai_api_key_encrypted
                     )
                     if api_key:
-                        openai_client = OpenAI(api_key=api_key)
+                        openai_client = get_openai_client(api_key)
                         model = user_settings.openai_model or model
                         logger.info(
                             f"Using user-specific OpenAI API key for user {user_id} with model {model}"
@@ -408,9 +591,19 @@ class WeeklyTaskSolver:
             return cls(openai_client=None, model="gpt-5")
 
     async def solve_weekly_tasks(
-        self, session: Session, user_id: str, request: TaskSolverRequest
+        self,
+        session: Session,
+        user_id: str,
+        request: TaskSolverRequest,
+        cancel_check: CancelCheck | None = None,
     ) -> TaskSolverResponse:
-        """Solve weekly task allocation using AI-powered optimization."""
+        """
+        Solve weekly task allocation using AI-powered optimization.
+
+        ``cancel_check`` is handed to the solver executor; when it reports a
+        disconnected client the solve is abandoned and SolverCancelledError
+        propagates instead of a fallback response being built.
+        """
         try:
             logger.info(f"Starting weekly task solving for user {user_id}")
 
@@ -445,10 +638,11 @@ class WeeklyTaskSolver:
             )
 
             # Stage 1: Extract task priorities
+            token_usage = TokenUsage()
             if request.use_ai_priority:
                 logger.info("Stage 1: Extracting task priorities with OpenAI API")
                 task_priorities = await self.priority_extractor.extract_priorities(
-                    context, request.user_prompt, project_allocations
+                    context, request.user_prompt, project_allocations, token_usage
                 )
             else:
                 logger.info("Stage 1: Using database priorities (OpenAI disabled)")
@@ -467,6 +661,8 @@ class WeeklyTaskSolver:
                 task_priorities,
                 request.user_prompt,
                 remaining_hours_map=getattr(context, "remaining_hours_map", {}),
+                search_config=request.solver_search,
+                cancel_check=cancel_check,
             )
 
             # Calculate solver metrics
@@ -486,8 +682,12 @@ class WeeklyTaskSolver:
                 constraint_analysis=constraint_analysis,
                 solver_metrics=solver_metrics,
                 generated_at=datetime.now(),
+                token_usage=token_usage,
             )
 
+        except SolverCancelledError:
+            raise
+
         except Exception as e:
             logger.error(f"Error in weekly task solving: {e}")
             return TaskSolverResponse(
@@ -506,7 +706,7 @@ class WeeklyTaskSolver:
         self, session: Session, task_ids: list[str]
     ) -> dict[str, float]:
         """
-        Get actual hours logged for each task from the logs table.
+        Get actual hours logged for each task from the task log rollups.
 
         Args:
             session: Database session
@@ -533,20 +733,7 @@ class WeeklyTaskSolver:
             if not task_uuids:
                 return {}
 
-            # Query logs table to get actual hours per task
-            results = session.exec(
-                select(Log.task_id, func.sum(Log.actual_minutes).label("total_minutes"))
-                .where(Log.task_id.in_(task_uuids))
-                .group_by(Log.task_id)
-            ).all()
-
-            # Convert minutes to hours and map by task ID string
-            actual_hours_map = {}
-            for task_id, total_minutes in results:
-                hours = float(total_minutes or 0) / 60.0
-                actual_hours_map[str(task_id)] = hours
-
-            return actual_hours_map
+            return get_actual_hours_map(session, task_uuids)
 
         except Exception as e:
             logger.error(f"Error getting actual hours for tasks: {e}")
@@ -592,9 +779,12 @@ class WeeklyTaskSolver:
             preferences=request.preferences,
         )
 
-        # Get actual hours for all tasks to calculate remaining hours
+        # Get actual hours for all tasks to calculate remaining hours; the
+        # context loader already summed them in the same round of queries
         task_ids = [str(task.id) for task in context.tasks]
-        actual_hours_map = self._get_task_actual_hours(session, task_ids)
+        actual_hours_map = getattr(context, "actual_hours_map", None)
+        if not isinstance(actual_hours_map, dict):
+            actual_hours_map = self._get_task_actual_hours(session, task_ids)
 
         logger.info(f"Retrieved actual hours for {len(actual_hours_map)} tasks")
 
@@ -636,24 +826,19 @@ class WeeklyTaskSolver:
         # Filter out tasks from projects with 0% allocation
         final_tasks = []
         zero_allocation_projects = set()
+        goals_by_id = {g.id: g for g in context.goals}
+        allocations_by_project = {str(a.project_id): a for a in project_allocations}
 
         for task in schedulable_tasks:
             # Find the project for this task
-            goal = next((g for g in context.goals if g.id == task.goal_id), None)
+            goal = goals_by_id.get(task.goal_id)
             if not goal:
                 # If no goal found, include the task (no project allocation to check)
                 final_tasks.append(task)
                 continue
 
             # Find the allocation for this project (convert both to string for comparison)
-            allocation = next(
-                (
-                    a
-                    for a in project_allocations
-                    if str(a.project_id) == str(goal.project_id)
-                ),
-                None,
-            )
+            allocation = allocations_by_project.get(str(goal.project_id))
 
             if allocation and allocation.target_hours <= 0.001:
                 # This project has 0% allocation - exclude all its tasks
@@ -933,8 +1118,105 @@ class WeeklyTaskSolver:
         context: WeeklyPlanContext,
         constraints: WeeklyConstraints,
         project_allocations: list[ProjectAllocation],
+        token_usage: TokenUsage | None = None,
     ) -> dict[str, Any]:
-        """Generate AI-powered task selection using GPT-5 Responses API."""
+        """
+        Generate AI-powered task selection using GPT-5 Responses API.
+
+        Backlogs over the prompt token budget are split into chunks that are
+        solved concurrently within the limits of ``ai_call_orchestrator``.
+        Capacity goes to the most urgent chunks first. The selections are
+        merged in rank order and checked once more against the week's capacity
+        and the project maximums; a chunk whose call fails or times out only
+        loses its own selections.
+        """
+        task_chunks = self.prompt_budget.chunk(
+            rank_tasks(context.tasks),
+            lambda task: estimate_tokens(
+                json.dumps(
+                    self._solver_task_data(task),
+                    indent=2,
+                    ensure_ascii=False,
+                    default=str,
+                )
+            ),
+            overhead=estimate_tokens(
+                self._create_solver_context(
+                    replace(context, tasks=[]), constraints, project_allocations
+                )
+            ),
+        )
+        if len(task_chunks) <= 1:
+            if token_usage is not None:
+                token_usage.chunks += 1
+            return await self._select_chunk_tasks(
+                context, constraints, project_allocations, token_usage
+            )
+
+        available_hours = (
+            constraints.total_capacity_hours - constraints.meeting_buffer_hours
+        )
+        chunk_contexts = split_plan_context(context, task_chunks, available_hours)
+        if token_usage is not None:
+            token_usage.chunks += len(chunk_contexts)
+        results = await asyncio.gather(
+            *(
+                self._select_chunk_tasks(
+                    chunk_context,
+                    self._chunk_constraints(constraints, chunk_context),
+                    project_allocations,
+                    token_usage,
+                )
+                for chunk_context in chunk_contexts
+            )
+        )
+        allocation_analysis: dict[str, Any] = {}
+        for result in results:
+            allocation_analysis.update(result.get("allocation_analysis") or {})
+
+        goal_projects = {str(goal.id): str(goal.project_id) for goal in context.goals}
+        task_projects = {
+            str(task.id): goal_projects.get(str(task.goal_id)) for task in context.tasks
+        }
+        selected_tasks = fill_capacity(
+            (task for result in results for task in result["selected_tasks"]),
+            lambda task: task.estimated_hours,
+            available_hours,
+            group=lambda task: task_projects.get(task.task_id),
+            group_limits={str(a.project_id): a.max_hours for a in project_allocations},
+        )
+        return {
+            "selected_tasks": selected_tasks,
+            "insights": list(
+                dict.fromkeys(
+                    insight for result in results for insight in result["insights"]
+                )
+            ),
+            "allocation_analysis": allocation_analysis,
+        }
+
+    def _chunk_constraints(
+        self, constraints: WeeklyConstraints, chunk_context: WeeklyPlanContext
+    ) -> WeeklyConstraints:
+        """Constraints limited to the capacity given to one chunk.
+
+        The meeting buffer was taken off before the capacity was split.
+        """
+        return constraints.model_copy(
+            update={
+                "total_capacity_hours": chunk_context.capacity_hours,
+                "meeting_buffer_hours": 0.0,
+            }
+        )
+
+    async def _select_chunk_tasks(
+        self,
+        context: WeeklyPlanContext,
+        constraints: WeeklyConstraints,
+        project_allocations: list[ProjectAllocation],
+        token_usage: TokenUsage | None = None,
+    ) -> dict[str, Any]:
+        """Select tasks for one prompt chunk."""
         try:
             solver_context = self._create_solver_context(
                 context, constraints, project_allocations
@@ -944,19 +1226,28 @@ class WeeklyTaskSolver:
             try:
                 # Use new Responses API with GPT-5
                 # Note: GPT-5 Responses API only supports default temperature (1.0)
-                response = self.openai_client.responses.create(
-                    model=self.model,
-                    input=solver_context,
-                    tools=self._get_solver_tools_definitions(),
+                response = await ai_call_orchestrator.call(
+                    lambda: self.openai_client.responses.create(
+                        model=self.model,
+                        input=solver_context,
+                        tools=self._get_solver_tools_definitions(),
+                    ),
+                    user_id=context.user_id,
                 )
             except (AttributeError, APIError) as e:
                 # Responses API not available, fallback to Chat Completions
                 logger.warning(
                     f"Responses API not available: {e}, falling back to Chat Completions"
                 )
-                return self._fallback_to_chat_completions(
-                    context, solver_context, constraints, project_allocations
+                return await self._fallback_to_chat_completions(
+                    context,
+                    solver_context,
+                    constraints,
+                    project_allocations,
+                    token_usage,
                 )
+            if token_usage is not None:
+                token_usage.record(estimate_tokens(solver_context), response)
 
             # Parse Responses API output
             return self._parse_responses_solver_output(response, context)
@@ -965,6 +1256,10 @@ class WeeklyTaskSolver:
             logger.error(f"OpenAI API error in task solver: {e}")
             # Fallback to heuristic selection
             return {"selected_tasks": [], "insights": [f"AI unavailable: {str(e)}"]}
+        except TimeoutError:
+            logger.error("OpenAI call timed out in task solver")
+            # Other chunks keep their selections
+            return {"selected_tasks": [], "insights": ["AI unavailable: timed out"]}
 
     def _heuristic_task_selection(
         self,
@@ -1088,25 +1383,13 @@ class WeeklyTaskSolver:
             {
                 "id": p.id,
                 "title": p.title,
-                "description": p.description,
+                "description": self.prompt_budget.compact(p.description),
             }
             for p in context.projects
         ]
 
-        tasks_data = [
-            {
-                "id": t.id,
-                "title": t.title,
-                "description": t.description,
-                "estimate_hours": getattr(
-                    t, "remaining_hours", float(t.estimate_hours or 0)
-                ),
-                "due_date": t.due_date.isoformat() if t.due_date else None,
-                "status": t.status,
-                "goal_id": t.goal_id,
-            }
-            for t in context.tasks
-        ]
+        # Most urgent first, each goal's tasks together
+        tasks_data = [self._solver_task_data(t) for t in rank_tasks(context.tasks)]
 
         # Add selected weekly recurring tasks to the available tasks
         selected_recurring_tasks_data = []
@@ -1117,7 +1400,7 @@ class WeeklyTaskSolver:
                         {
                             "id": rt.id,
                             "title": f"[週課] {rt.title}",
-                            "description": rt.description,
+                            "description": self.prompt_budget.compact(rt.description),
                             "estimate_hours": rt.estimate_hours,
                             "due_date": None,  # Weekly recurring tasks don't have specific due dates
                             "status": "weekly_recurring",
@@ -1187,6 +1470,20 @@ class WeeklyTaskSolver:
 
 solve_weekly_tasks関数を使用して構造化された結果を返してください。"""
 
+    def _solver_task_data(self, t: Task) -> dict[str, Any]:
+        """Task entry of the solver prompt."""
+        return {
+            "id": t.id,
+            "title": t.title,
+            "description": self.prompt_budget.compact(t.description),
+            "estimate_hours": getattr(
+                t, "remaining_hours", float(t.estimate_hours or 0)
+            ),
+            "due_date": t.due_date.isoformat() if t.due_date else None,
+            "status": t.status,
+            "goal_id": t.goal_id,
+        }
+
     def _get_solver_tools_definitions(self) -> list[dict[str, Any]]:
         """Get tools definitions for AI task solver."""
         return [
@@ -1401,12 +1698,13 @@ solve_weekly_tasks関数を使用して構造化された結果を返してく
             "project_distribution": project_hours,
         }
 
-    def _fallback_to_chat_completions(
+    async def _fallback_to_chat_completions(
         self,
         context: WeeklyPlanContext,
         solver_context: str,
         constraints: WeeklyConstraints,
         project_allocations: list[ProjectAllocation],
+        token_usage: TokenUsage | None = None,
     ) -> dict[str, Any]:
         """Fallback to Chat Completions API when Responses API is not available"""
         try:
@@ -1435,7 +1733,17 @@ solve_weekly_tasks関数を使用して構造化された結果を返してく
                     0.3  # Lower temperature for consistent optimization
                 )
 
-            response = self.openai_client.chat.completions.create(**api_params)
+            response = await ai_call_orchestrator.call(
+                lambda: self.openai_client.chat.completions.create(**api_params),
+                user_id=context.user_id,
+            )
+            if token_usage is not None:
+                token_usage.record(
+                    estimate_tokens(
+                        api_params["messages"][0]["content"] + solver_context
+                    ),
+                    response,
+                )
 
             # Parse Chat Completions response
             return self._parse_chat_completions_solver_response(response, context)
@@ -1492,6 +1800,8 @@ solve_weekly_tasks関数を使用して構造化された結果を返してく
         task_priorities: dict[str, float],
         user_prompt: str | None,
         remaining_hours_map: dict[str, float] | None = None,
+        search_config: SolverSearchConfig | None = None,
+        cancel_check: CancelCheck | None = None,
     ) -> tuple[list[TaskPlan], list[str]]:
         """
         Apply OR-Tools constraint optimization with extracted priorities.
@@ -1580,12 +1890,34 @@ solve_weekly_tasks関数を使用して構造化された結果を返してく
                 for a in project_allocations
             ]
 
-            solve_result = optimize_weekly_selection(
-                tasks=solver_tasks,
-                recurring_tasks=recurring_solver_tasks,
-                project_allocations=allocation_specs,
-                total_capacity_hours=float(constraints.total_capacity_hours),
-                config=WeeklySolverConfig(max_time_in_seconds=30.0),
+            solver_inputs = {
+                "tasks": solver_tasks,
+                "recurring_tasks": recurring_solver_tasks,
+                "project_allocations": allocation_specs,
+                "total_capacity_hours": float(constraints.total_capacity_hours),
+                "config": WeeklySolverConfig(
+                    max_time_in_seconds=30.0,
+                    **resolve_search_settings(
+                        **(search_config.model_dump() if search_config else {})
+                    ),
+                ),
+            }
+
+            async def solve():
+                # CP-SAT runs in the solver pool so the event loop stays responsive
+                return await solver_executor.run(
+                    optimize_weekly_selection,
+                    **solver_inputs,
+                    user_id=context.user_id,
+                    cancel_check=cancel_check,
+                )
+
+            # Identical specs (same tasks, hours, priorities, allocations and
+            # config) give the same selection; failed solves are not cached.
+            solve_result = await solver_result_cache.get_or_compute(
+                solver_fingerprint("weekly", **solver_inputs),
+                solve,
+                should_cache=lambda result: result.success,
             )
 
             if not solve_result.success:
@@ -1707,6 +2039,24 @@ solve_weekly_tasks関数を使用して構造化された結果を返してく
             )
             return selected_tasks, insights + fallback_insights
 
+        except SolverCancelledError:
+            # Nobody is waiting for a fallback selection
+            raise
+
+        except SolverExecutorError as e:
+            logger.warning(f"OR-Tools solve rejected by solver executor: {e}")
+            insights = [
+                "⚠️ 最適化ソルバーが混雑しているため、OR-Tools最適化をスキップしました",
+                "🔄 ヒューリスティック手法を使用しています",
+            ]
+            selected_tasks, fallback_insights = self._heuristic_task_selection(
+                context,
+                constraints,
+                project_allocations,
+                remaining_hours_map=getattr(context, "remaining_hours_map", {}),
+            )
+            return selected_tasks, insights + fallback_insights
+
         except Exception as e:
             logger.error(f"OR-Tools optimization failed: {e}")
             insights = [
@@ -0,0 +1,108 @@
+"""
+Set-based workload metrics
+
+Workload analysis only needs totals: estimated hours per project and how many
+active tasks are overdue or due soon. Those are computed with conditional
+aggregates in the database, so the cost does not grow with the number of
+goals and no task rows are loaded into Python.
+
+Two details differ from the former per-task loop:
+
+- Due dates are compared in SQL against UTC midnight of ``today``. Due dates
+  are stored in UTC, so this gives the same windows as comparing each task's
+  UTC due day with ``today`` in Python.
+- Hours are returned as floats instead of Decimal sums. The API already sent
+  them as JSON numbers, and cached results are stored as JSON as well.
+"""
+
+from collections.abc import Collection
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime, time, timedelta
+from uuid import UUID
+
+from sqlalchemy import and_, case
+from sqlmodel import Session, func, select
+
+from humancompiler_api.ai.context_loader import ACTIVE_TASK_STATUSES, parse_project_ids
+from humancompiler_api.common.error_handlers import validate_uuid
+from humancompiler_api.models import Goal, Project, Task, TaskStatus
+
+# Tasks due within this many days (and not overdue) count as urgent
+URGENT_WINDOW_DAYS = 3
+
+
+@dataclass
+class WorkloadMetrics:
+    """Aggregated workload of a user's active tasks"""
+
+    # Sums of Decimal estimates, converted to float
+    total_estimated_hours: float = 0.0
+    total_tasks: int = 0
+    overdue_tasks: int = 0
+    urgent_tasks: int = 0
+    projects_involved: int = 0
+    # Estimated hours keyed by project title (projects without tasks omitted)
+    project_distribution: dict[str, float] = field(default_factory=dict)
+
+
+def compute_workload_metrics(
+    session: Session,
+    user_id: str | UUID,
+    project_ids: Collection[str | UUID] | None = None,
+    today: date | None = None,
+    task_statuses: Collection[TaskStatus] = ACTIVE_TASK_STATUSES,
+) -> WorkloadMetrics:
+    """
+    Aggregate active-task workload per project in two queries.
+
+    A task is overdue when its due date falls before ``today`` and urgent when
+    it falls on ``today`` or within the next ``URGENT_WINDOW_DAYS`` days.
+    """
+    owner_id = validate_uuid(user_id, "user_id")
+    today = today or date.today()
+    # Due dates are stored in UTC, so day boundaries are UTC midnights
+    day_start = datetime.combine(today, time.min, tzinfo=UTC)
+    urgent_end = day_start + timedelta(days=URGENT_WINDOW_DAYS + 1)
+
+    project_filters = [Project.owner_id == owner_id]
+    if project_ids:
+        project_filters.append(Project.id.in_(parse_project_ids(project_ids)))
+
+    projects_involved = session.exec(
+        select(func.count(Project.id)).where(*project_filters)
+    ).one()
+
+    overdue = case((Task.due_date < day_start, 1), else_=0)
+    urgent = case(
+        (and_(Task.due_date >= day_start, Task.due_date < urgent_end), 1), else_=0
+    )
+    rows = session.exec(
+        select(
+            Project.id,
+            Project.title,
+            func.count(Task.id),
+            func.coalesce(func.sum(Task.estimate_hours), 0),
+            func.coalesce(func.sum(overdue), 0),
+            func.coalesce(func.sum(urgent), 0),
+        )
+        .select_from(Task)
+        .join(Goal, Task.goal_id == Goal.id)
+        .join(Project, Goal.project_id == Project.id)
+        .where(*project_filters, Task.status.in_(list(task_statuses)))
+        .group_by(Project.id, Project.title)
+        .order_by(Project.title, Project.id)
+    ).all()
+
+    metrics = WorkloadMetrics(projects_involved=int(projects_involved or 0))
+    for _, title, task_count, hours, overdue_count, urgent_count in rows:
+        hours = float(hours)
+        metrics.total_tasks += int(task_count)
+        metrics.total_estimated_hours += hours
+        metrics.overdue_tasks += int(overdue_count)
+        metrics.urgent_tasks += int(urgent_count)
+        # Same-titled projects share a bucket, as the report is keyed by title
+        metrics.project_distribution[title] = (
+            metrics.project_distribution.get(title, 0.0) + hours
+        )
+
+    return metrics
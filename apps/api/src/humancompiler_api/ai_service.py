@@ -8,12 +8,12 @@ from dataclasses import dataclass
 from datetime import date, datetime
 from typing import Any
 
-from openai import OpenAI
 from pydantic import BaseModel, Field, ConfigDict, field_serializer
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import Session, select
 from uuid import UUID
 
+from humancompiler_api.ai.client_registry import get_openai_client
 from humancompiler_api.config import settings
 from humancompiler_api.crypto import get_crypto_service
 from humancompiler_api.models import Goal, Project, Task, UserSettings
@@ -81,7 +81,7 @@ class OpenAIService:
     def __init__(self, api_key: str | None = None, model: str | None = None):
         """Initialize OpenAI client with optional user-specific API key."""
         if api_key:
-            self.client = OpenAI(api_key=api_key)
+            self.client = get_openai_client(api_key)
             self.model = model or "gpt-5"  # Default to GPT-5
         elif (
             not settings.openai_api_key
@@ -93,7 +93,7 @@ class OpenAIService:
             self.client = None
             self.model = "gpt-5"  # GPT-5 flagship model
         else:
-            self.client = OpenAI(api_key=settings.openai_api_key)
+            self.client = get_openai_client(settings.openai_api_key)
             self.model = "gpt-5"  # GPT-5 flagship model
 
     @classmethod
@@ -406,7 +406,7 @@ Use the create_week_plan function to structure your response."""
             if not self.model.startswith("gpt-5"):
                 api_params["temperature"] = 0.7
 
-            response = self.client.chat.completions.create(**api_params)
+            response = await self.client.chat.completions.create(**api_params)
 
             # Debug: Log OpenAI response structure
             logger.info(f"🔍 OpenAI Response: {len(response.choices)} choices")
@@ -9,6 +9,7 @@ from uuid import UUID, uuid4
 
 from sqlmodel import Session, SQLModel, select
 
+from core.cache import invalidate_user_cache
 from humancompiler_api.common.error_handlers import (
     ResourceNotFoundError,
     safe_execute,
@@ -24,9 +25,27 @@ UpdateT = TypeVar("UpdateT")
 class BaseService(ABC, Generic[T, CreateT, UpdateT]):
     """Base service class with common CRUD operations"""
 
+    # Cached data that writes through this service make stale (see core.cache)
+    cache_tags: tuple[str, ...] = ()
+
     def __init__(self, model: type[T]):
         self.model = model
 
+    def _invalidate_cache(self, user_id: str | UUID, *extra_tags: str) -> None:
+        """Drop the user's cached results that depend on this service's data"""
+        tags = (*self.cache_tags, *extra_tags)
+        if tags:
+            invalidate_user_cache(user_id, *tags)
+
+    def _after_create(self, session: Session, instance: T) -> None:
+        """Hook run in the create transaction after the insert is flushed"""
+
+    def _after_update(self, session: Session, entity: T, previous: dict) -> None:
+        """Hook run in the update transaction; ``previous`` holds old values"""
+
+    def _before_delete(self, session: Session, entity: T) -> None:
+        """Hook run in the delete transaction before the row is deleted"""
+
     @abstractmethod
     def _create_instance(self, data: CreateT, **kwargs) -> T:
         """Create a new model instance. Must be implemented by subclasses."""
@@ -48,9 +67,12 @@ class BaseService(ABC, Generic[T, CreateT, UpdateT]):
             instance.id = uuid4()
             session.add(instance)
             session.flush()  # Get ID without committing
+            self._after_create(session, instance)
             return instance
 
-        return safe_execute(session, create_operation)
+        instance = safe_execute(session, create_operation)
+        self._invalidate_cache(user_id_validated)
+        return instance
 
     def get_by_id(
         self, session: Session, entity_id: str | UUID, user_id: str | UUID
@@ -160,8 +182,10 @@ class BaseService(ABC, Generic[T, CreateT, UpdateT]):
 
         def update_operation():
             update_data = data.model_dump(exclude_unset=True)
+            previous = {}
             for field, value in update_data.items():
                 if hasattr(entity, field):
+                    previous[field] = getattr(entity, field)
                     setattr(entity, field, value)
 
             if hasattr(entity, "updated_at"):
@@ -169,9 +193,12 @@ class BaseService(ABC, Generic[T, CreateT, UpdateT]):
 
             session.add(entity)
             session.flush()
+            self._after_update(session, entity, previous)
             return entity
 
-        return safe_execute(session, update_operation)
+        entity = safe_execute(session, update_operation)
+        self._invalidate_cache(user_id_validated)
+        return entity
 
     def delete(
         self, session: Session, entity_id: str | UUID, user_id: str | UUID
@@ -184,7 +211,10 @@ class BaseService(ABC, Generic[T, CreateT, UpdateT]):
         entity = self.get_by_id(session, entity_id, user_id_validated)
 
         def delete_operation():
+            self._before_delete(session, entity)
             session.delete(entity)
             return True
 
-        return safe_execute(session, delete_operation)
+        deleted = safe_execute(session, delete_operation)
+        self._invalidate_cache(user_id_validated)
+        return deleted
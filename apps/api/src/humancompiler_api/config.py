@@ -25,6 +25,91 @@ class Settings(BaseSettings):
         default=1000, description="Maximum number of query statistics to keep in memory"
     )
 
+    # Solver Execution
+    solver_executor_backend: str = Field(
+        default="process",
+        pattern="^(process|thread)$",
+        description="Pool type used to run scheduling solvers off the event loop",
+    )
+    solver_max_workers: int = Field(
+        default=2, ge=1, description="Number of solver worker processes/threads"
+    )
+    solver_max_queue_size: int = Field(
+        default=16,
+        ge=1,
+        description="Maximum number of solves waiting or running before rejecting",
+    )
+    solver_max_concurrent_per_user: int = Field(
+        default=1, ge=1, description="Maximum concurrent solves for a single user"
+    )
+    solver_max_search_workers: int = Field(
+        default=4,
+        ge=1,
+        description="Maximum CP-SAT search threads a single solve may use",
+    )
+    solver_result_cache_size: int = Field(
+        default=256,
+        ge=0,
+        description="Number of solver results kept for identical re-requests (0 disables)",
+    )
+    solver_result_cache_ttl_seconds: int = Field(
+        default=600, ge=1, description="How long a cached solver result stays valid"
+    )
+
+    # Shared result cache (core.cache); "redis" shares entries across instances
+    cache_backend: str = Field(
+        default="memory",
+        pattern="^(memory|redis)$",
+        description="Where cached results are stored",
+    )
+    cache_redis_url: str | None = Field(
+        default=None, description="Redis URL used when cache_backend is 'redis'"
+    )
+
+    # Shared async OpenAI clients (ai.client_registry)
+    openai_client_cache_size: int = Field(
+        default=128, ge=1, description="Number of per-key OpenAI clients kept"
+    )
+    openai_max_connections: int = Field(
+        default=100, ge=1, description="Connection pool size shared by AI requests"
+    )
+    openai_max_keepalive_connections: int = Field(
+        default=20, ge=0, description="Idle connections kept open for reuse"
+    )
+    openai_timeout_seconds: float = Field(
+        default=60.0, gt=0, description="Default timeout for OpenAI requests"
+    )
+
+    # Cached model answers (ai.response_cache)
+    ai_response_cache_enabled: bool = Field(
+        default=True,
+        description="Reuse parsed model answers for identical prompts and task state",
+    )
+
+    # Prompt size limits (ai.prompt_budget)
+    ai_prompt_token_budget: int = Field(
+        default=12000,
+        ge=1000,
+        description="Estimated prompt tokens per model call; larger backlogs are split",
+    )
+    ai_prompt_description_chars: int = Field(
+        default=300, ge=0, description="Description length kept in AI prompts"
+    )
+
+    # Concurrent model calls (ai.call_orchestrator)
+    ai_max_concurrent_calls: int = Field(
+        default=16, ge=1, description="Model calls in flight across all users"
+    )
+    ai_max_concurrent_calls_per_user: int = Field(
+        default=4, ge=1, description="Model calls in flight for a single user"
+    )
+    ai_call_timeout_seconds: float = Field(
+        default=120.0, gt=0, description="Time limit for one model call attempt"
+    )
+    ai_rate_limit_retries: int = Field(
+        default=3, ge=0, description="Retries of a model call that was rate limited"
+    )
+
     # Admin Configuration (temporary until User model has is_admin field)
     admin_user_ids: list[str] = Field(
         default_factory=list,
@@ -274,6 +359,26 @@ except Exception as e:
     # Performance monitoring settings
     settings.slow_query_threshold_ms = 100
     settings.max_query_stats = 1000
+    settings.solver_executor_backend = "process"
+    settings.solver_max_workers = 2
+    settings.solver_max_queue_size = 16
+    settings.solver_max_concurrent_per_user = 1
+    settings.solver_max_search_workers = 4
+    settings.solver_result_cache_size = 256
+    settings.solver_result_cache_ttl_seconds = 600
+    settings.cache_backend = "memory"
+    settings.cache_redis_url = None
+    settings.openai_client_cache_size = 128
+    settings.openai_max_connections = 100
+    settings.openai_max_keepalive_connections = 20
+    settings.openai_timeout_seconds = 60.0
+    settings.ai_response_cache_enabled = True
+    settings.ai_prompt_token_budget = 12000
+    settings.ai_prompt_description_chars = 300
+    settings.ai_max_concurrent_calls = 16
+    settings.ai_max_concurrent_calls_per_user = 4
+    settings.ai_call_timeout_seconds = 120.0
+    settings.ai_rate_limit_retries = 3
     settings.admin_user_ids = []
     # Email settings
     settings.resend_api_key = None
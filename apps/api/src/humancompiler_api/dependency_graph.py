@@ -0,0 +1,77 @@
+"""
+Per-user dependency graphs for cycle detection.
+
+Adding a task or goal dependency must reject edges that would close a cycle.
+Walking the graph with one SELECT per visited node costs a round trip per hop,
+so deep chains get slow against a remote database. Instead the user's whole
+edge set for a kind ("task" or "goal") is loaded with a single joined query
+into an adjacency map and reachability is checked in memory.
+
+The graph is loaded in the session that inserts the new edge rather than kept
+between requests: an edge committed by another API instance must be visible
+to the check, or two instances could each accept half of a cycle.
+"""
+
+from collections import deque
+from typing import Literal
+from uuid import UUID
+
+from sqlmodel import Session, select
+
+from humancompiler_api.models import Goal, GoalDependency, Project, Task, TaskDependency
+
+DependencyKind = Literal["task", "goal"]
+DependencyGraph = dict[UUID, set[UUID]]
+
+
+def _as_uuid(value: str | UUID) -> UUID:
+    return value if isinstance(value, UUID) else UUID(str(value))
+
+
+def path_exists(
+    graph: DependencyGraph, from_node_id: str | UUID, to_node_id: str | UUID
+) -> bool:
+    """Return True when from_node_id already (transitively) depends on to_node_id"""
+    start_id = _as_uuid(from_node_id)
+    target_id = _as_uuid(to_node_id)
+    queue: deque[UUID] = deque([start_id])
+    visited = {start_id}
+
+    while queue:
+        current_id = queue.popleft()
+        if current_id == target_id:
+            return True
+        for next_id in graph.get(current_id, ()):
+            if next_id not in visited:
+                visited.add(next_id)
+                queue.append(next_id)
+
+    return False
+
+
+def load_dependency_graph(
+    session: Session, kind: DependencyKind, owner_id: str | UUID
+) -> DependencyGraph:
+    """Load every dependency edge of ``kind`` owned by the user in one query"""
+    if kind == "task":
+        statement = (
+            select(TaskDependency.task_id, TaskDependency.depends_on_task_id)
+            .join(Task, TaskDependency.task_id == Task.id)
+            .join(Goal, Task.goal_id == Goal.id)
+            .join(Project, Goal.project_id == Project.id)
+            .where(Project.owner_id == owner_id)
+        )
+    elif kind == "goal":
+        statement = (
+            select(GoalDependency.goal_id, GoalDependency.depends_on_goal_id)
+            .join(Goal, GoalDependency.goal_id == Goal.id)
+            .join(Project, Goal.project_id == Project.id)
+            .where(Project.owner_id == owner_id)
+        )
+    else:
+        raise ValueError(f"Unknown dependency kind: {kind}")
+
+    graph: DependencyGraph = {}
+    for node_id, depends_on_id in session.exec(statement).all():
+        graph.setdefault(_as_uuid(node_id), set()).add(_as_uuid(depends_on_id))
+    return graph
@@ -46,6 +46,7 @@ from humancompiler_api.routers import (
     scheduler,
     simple_backup_api,
     slot_templates,
+    solver_jobs,
     task_dependencies,
     tasks,
     timeline,
@@ -76,6 +77,16 @@ async def lifespan(app: FastAPI):
     logger.info(f"Host: {settings.host}, Port: {settings.port}")
     logger.info(f"Debug mode: {settings.debug}")
 
+    # Shared result cache; falls back to the in-process cache on failure
+    if settings.cache_backend != "memory":
+        try:
+            from core.cache import configure_cache_backend
+
+            configure_cache_backend(settings.cache_backend, settings.cache_redis_url)
+            logger.info(f"✅ Cache backend: {settings.cache_backend}")
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to configure cache backend, using memory: {e}")
+
     # Test database connection (non-blocking)
     try:
         if await db.health_check():
@@ -106,6 +117,18 @@ async def lifespan(app: FastAPI):
                 "💡 バックアップ設定は docs/dev/local-backup-guide.md を参照してください"
             )
 
+            # Background solver tasks do not survive a restart
+            try:
+                from humancompiler_api.solver_job_service import solver_job_service
+
+                interrupted = solver_job_service.fail_interrupted_jobs()
+                if interrupted:
+                    logger.info(
+                        f"⚠️ Marked {interrupted} interrupted solver jobs as failed"
+                    )
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to clean up interrupted solver jobs: {e}")
+
             # Start notification scheduler (Issue #228)
             try:
                 from humancompiler_api.scheduler.notification_scheduler import (
@@ -139,6 +162,31 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"⚠️ Failed to stop notification scheduler: {e}")
 
+    # Stop solver worker pool
+    try:
+        from humancompiler_api.solver_executor import solver_executor
+
+        solver_executor.shutdown(wait=False)
+        logger.info("✅ Solver executor stopped")
+    except Exception as e:
+        logger.warning(f"⚠️ Failed to stop solver executor: {e}")
+
+    # Close the shared OpenAI connection pool
+    try:
+        from humancompiler_api.ai.client_registry import openai_client_registry
+
+        await openai_client_registry.aclose()
+    except Exception as e:
+        logger.warning(f"⚠️ Failed to close OpenAI clients: {e}")
+
+    # Close shared cache connections and invalidation listener
+    try:
+        from core.cache import get_cache_backend
+
+        get_cache_backend().close()
+    except Exception as e:
+        logger.warning(f"⚠️ Failed to close cache backend: {e}")
+
     # Simple backup system - no scheduler to stop
     logger.info("✅ Server shutdown complete")
 
@@ -328,6 +376,8 @@ app.include_router(notes.router, prefix="/api")
 app.include_router(slot_templates.router, prefix="/api")
 # Capacity triage router
 app.include_router(triage.router, prefix="/api")
+# Background solver jobs router
+app.include_router(solver_jobs.router, prefix="/api")
 
 
 # Health check endpoint
@@ -184,6 +184,22 @@ class TriageTaskType(StrEnum):
     QUICK_TASK = "quick_task"
 
 
+class SolverJobType(StrEnum):
+    """Kinds of solver work that can run as background jobs"""
+
+    WEEKLY_TASK_SOLVER = "weekly_task_solver"
+    DAILY_SCHEDULE = "daily_schedule"
+
+
+class SolverJobStatus(StrEnum):
+    """Lifecycle status for a background solver job"""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
 # Model-specific allowed sort fields for validation
 ALLOWED_SORT_FIELDS = {
     "Project": {"status", "title", "created_at", "updated_at"},
@@ -269,6 +285,10 @@ class Project(ProjectBase, table=True):  # type: ignore[call-arg]
         back_populates="project",
         sa_relationship_kwargs={"cascade": "all, delete-orphan"},
     )
+    progress_rollup: "ProjectProgressRollup" = Relationship(
+        back_populates="project",
+        sa_relationship_kwargs={"uselist": False, "cascade": "all, delete-orphan"},
+    )
 
 
 class GoalBase(SQLModel):
@@ -315,6 +335,10 @@ class Goal(GoalBase, table=True):  # type: ignore[call-arg]
             "cascade": "all, delete-orphan",
         },
     )
+    progress_rollup: "GoalProgressRollup" = Relationship(
+        back_populates="goal",
+        sa_relationship_kwargs={"uselist": False, "cascade": "all, delete-orphan"},
+    )
 
 
 class TaskBase(SQLModel):
@@ -384,6 +408,10 @@ class Task(TaskBase, table=True):  # type: ignore[call-arg]
         back_populates="task",
         sa_relationship_kwargs={"cascade": "all, delete-orphan"},
     )
+    log_rollup: "TaskLogRollup" = Relationship(
+        back_populates="task",
+        sa_relationship_kwargs={"uselist": False, "cascade": "all, delete-orphan"},
+    )
 
 
 class QuickTaskBase(SQLModel):
@@ -607,6 +635,67 @@ class Log(LogBase, table=True):  # type: ignore[call-arg]
     task: Task = Relationship(back_populates="logs")
 
 
+class TaskLogRollup(SQLModel, table=True):  # type: ignore[call-arg]
+    """Running totals of a task's logs, maintained by log writes"""
+
+    __tablename__ = "task_log_rollups"
+
+    task_id: UUID = SQLField(
+        foreign_key="tasks.id", ondelete="CASCADE", primary_key=True
+    )
+    actual_minutes: int = SQLField(default=0)
+    log_count: int = SQLField(default=0)
+    updated_at: datetime | None = SQLField(default_factory=lambda: datetime.now(UTC))
+
+    # Relationships
+    task: Task = Relationship(back_populates="log_rollup")
+
+
+class TaskTotalsBase(SQLModel):
+    """Task counters shared by goal and project progress rollups"""
+
+    task_count: int = SQLField(default=0)
+    pending_tasks: int = SQLField(default=0)
+    in_progress_tasks: int = SQLField(default=0)
+    completed_tasks: int = SQLField(default=0)
+    cancelled_tasks: int = SQLField(default=0)
+    task_estimate_hours: Decimal = SQLField(
+        default=Decimal("0"), max_digits=10, decimal_places=2
+    )
+    actual_minutes: int = SQLField(default=0)
+    updated_at: datetime | None = SQLField(default_factory=lambda: datetime.now(UTC))
+
+
+class GoalProgressRollup(TaskTotalsBase, table=True):  # type: ignore[call-arg]
+    """Totals of a goal's tasks, maintained by task and log writes"""
+
+    __tablename__ = "goal_progress_rollups"
+
+    goal_id: UUID = SQLField(
+        foreign_key="goals.id", ondelete="CASCADE", primary_key=True
+    )
+
+    # Relationships
+    goal: Goal = Relationship(back_populates="progress_rollup")
+
+
+class ProjectProgressRollup(TaskTotalsBase, table=True):  # type: ignore[call-arg]
+    """Totals of a project's goals and tasks, maintained by their writes"""
+
+    __tablename__ = "project_progress_rollups"
+
+    project_id: UUID = SQLField(
+        foreign_key="projects.id", ondelete="CASCADE", primary_key=True
+    )
+    goal_count: int = SQLField(default=0)
+    goal_estimate_hours: Decimal = SQLField(
+        default=Decimal("0"), max_digits=10, decimal_places=2
+    )
+
+    # Relationships
+    project: Project = Relationship(back_populates="progress_rollup")
+
+
 class WorkSessionBase(SQLModel):
     """Base work session model"""
 
@@ -1571,6 +1660,19 @@ class TaskDependencyResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class TaskDependencyBulkItem(BaseModel):
+    """Single edge of a bulk task dependency request"""
+
+    task_id: UUID
+    depends_on_task_id: UUID
+
+
+class TaskDependencyBulkCreate(BaseModel):
+    """Bulk task dependency creation request (all-or-nothing)"""
+
+    dependencies: list[TaskDependencyBulkItem] = Field(min_length=1, max_length=500)
+
+
 class GoalDependencyCreate(BaseModel):
     """Goal dependency creation request"""
 
@@ -2118,6 +2220,41 @@ class TaskTriageItem(SQLModel, table=True):  # type: ignore[call-arg]
     run: TaskTriageRun = Relationship(back_populates="items")
 
 
+class SolverJob(SQLModel, table=True):  # type: ignore[call-arg]
+    """A background solver run whose request and result are persisted."""
+
+    __tablename__ = "solver_jobs"
+
+    id: UUID | None = SQLField(default_factory=uuid4, primary_key=True)
+    user_id: UUID = SQLField(foreign_key="users.id", index=True)
+    job_type: SolverJobType = SQLField(
+        sa_column=Column(
+            SQLEnum(SolverJobType, values_callable=lambda x: [e.value for e in x]),
+            nullable=False,
+        ),
+    )
+    status: SolverJobStatus = SQLField(
+        default=SolverJobStatus.QUEUED,
+        sa_column=Column(
+            SQLEnum(SolverJobStatus, values_callable=lambda x: [e.value for e in x]),
+            nullable=False,
+        ),
+    )
+    progress: int = SQLField(default=0, ge=0, le=100)
+    progress_message: str | None = SQLField(default=None, max_length=200)
+    request_json: dict[str, Any] = SQLField(
+        sa_column=Column(JSON), default_factory=dict
+    )
+    result_json: dict[str, Any] | None = SQLField(
+        default=None, sa_column=Column(JSON, nullable=True)
+    )
+    error_message: str | None = SQLField(default=None, max_length=1000)
+    started_at: datetime | None = SQLField(default=None)
+    completed_at: datetime | None = SQLField(default=None)
+    created_at: datetime | None = SQLField(default_factory=lambda: datetime.now(UTC))
+    updated_at: datetime | None = SQLField(default_factory=lambda: datetime.now(UTC))
+
+
 class ContextNoteBase(SQLModel):
     """Base context note model"""
 
@@ -2341,3 +2478,54 @@ class DayOfWeekTemplatesResponse(BaseModel):
     day_name: str
     templates: list[SlotTemplateResponse]
     default_template: SlotTemplateResponse | None = None
+
+
+# Solver Job API Models
+
+
+class SolverJobResponse(BaseModel):
+    """Status, progress and (once finished) result of a solver job."""
+
+    id: UUID
+    job_type: SolverJobType
+    status: SolverJobStatus
+    progress: int
+    progress_message: str | None = None
+    result: dict[str, Any] | None = None
+    error_message: str | None = None
+    started_at: datetime | None = None
+    completed_at: datetime | None = None
+    created_at: datetime
+    updated_at: datetime
+
+    @field_serializer("started_at", "completed_at", "created_at", "updated_at")
+    def serialize_solver_job_datetimes(self, value: datetime | None) -> str | None:
+        if value is None:
+            return None
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=UTC)
+        return value.isoformat()
+
+    @classmethod
+    def from_db_model(cls, job: "SolverJob") -> "SolverJobResponse":
+        """Create response from database model"""
+        return cls(
+            id=job.id,
+            job_type=job.job_type,
+            status=job.status,
+            progress=job.progress,
+            progress_message=job.progress_message,
+            result=job.result_json,
+            error_message=job.error_message,
+            started_at=job.started_at,
+            completed_at=job.completed_at,
+            created_at=job.created_at,
+            updated_at=job.updated_at,
+        )
+
+
+class SolverJobListResponse(BaseModel):
+    """Response for listing recent solver jobs"""
+
+    jobs: list[SolverJobResponse]
+    total: int
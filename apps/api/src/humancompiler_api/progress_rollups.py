@@ -0,0 +1,360 @@
+"""
+Goal and project progress rollups
+
+Progress pages need per-goal and per-project totals: estimated hours, logged
+minutes and task counts by status. ``goal_progress_rollups`` and
+``project_progress_rollups`` keep those totals, and the task, goal and log
+services apply the change of every write in the same transaction, so reads do
+not walk every task.
+
+Each ``record_*`` function takes the entity as it is (or was) and adds or
+removes its contribution; none of them commit. ``reconcile_progress_rollups``
+recomputes all rows from goals, tasks and task log rollups; it backfills the
+tables and repairs drift.
+"""
+
+import logging
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import case
+from sqlmodel import Session, SQLModel, delete, func, select
+
+from humancompiler_api.models import (
+    Goal,
+    GoalProgressRollup,
+    Project,
+    ProjectProgressRollup,
+    Task,
+    TaskLogRollup,
+    TaskStatus,
+)
+from humancompiler_api.task_rollups import (
+    RollupReconciliation,
+    get_task_rollups,
+    increment_rollup,
+)
+
+logger = logging.getLogger(__name__)
+
+# Counter column per task status
+STATUS_COLUMNS = {
+    TaskStatus.PENDING: "pending_tasks",
+    TaskStatus.IN_PROGRESS: "in_progress_tasks",
+    TaskStatus.COMPLETED: "completed_tasks",
+    TaskStatus.CANCELLED: "cancelled_tasks",
+}
+
+# Counters that goal and project rollups share
+TASK_TOTAL_COLUMNS = (
+    "task_count",
+    *STATUS_COLUMNS.values(),
+    "task_estimate_hours",
+    "actual_minutes",
+)
+
+
+def _hours(value: Any) -> Decimal:
+    return Decimal(str(value or 0))
+
+
+def _task_deltas(
+    status: TaskStatus, estimate_hours: Decimal, actual_minutes: int, sign: int
+) -> dict[str, Any]:
+    return {
+        "task_count": sign,
+        STATUS_COLUMNS[TaskStatus(status)]: sign,
+        "task_estimate_hours": _hours(estimate_hours) * sign,
+        "actual_minutes": actual_minutes * sign,
+    }
+
+
+def _merge(*deltas: dict[str, Any]) -> dict[str, Any]:
+    merged: dict[str, Any] = {}
+    for delta in deltas:
+        for column, value in delta.items():
+            merged[column] = merged.get(column, 0) + value
+    return merged
+
+
+def _apply_to_goal(session: Session, goal_id: UUID, deltas: dict[str, Any]) -> None:
+    """Apply task-level deltas to a goal and its project"""
+    goal = session.get(Goal, goal_id)
+    if goal is None:
+        return
+    increment_rollup(session, GoalProgressRollup, "goal_id", goal_id, deltas)
+    increment_rollup(
+        session, ProjectProgressRollup, "project_id", goal.project_id, deltas
+    )
+
+
+def _actual_minutes(session: Session, task_id: UUID) -> int:
+    minutes, _ = get_task_rollups(session, [task_id]).get(task_id, (0, 0))
+    return minutes
+
+
+def record_task_created(session: Session, task: Task) -> None:
+    _apply_to_goal(
+        session, task.goal_id, _task_deltas(task.status, task.estimate_hours, 0, 1)
+    )
+
+
+def record_task_updated(session: Session, task: Task, previous: dict) -> None:
+    """Apply a change of status or estimate; ``previous`` holds old values"""
+    old_status = previous.get("status", task.status)
+    old_estimate = previous.get("estimate_hours", task.estimate_hours)
+    if old_status == task.status and old_estimate == task.estimate_hours:
+        return
+    _apply_to_goal(
+        session,
+        task.goal_id,
+        _merge(
+            _task_deltas(old_status, old_estimate, 0, -1),
+            _task_deltas(task.status, task.estimate_hours, 0, 1),
+        ),
+    )
+
+
+def record_task_deleted(session: Session, task: Task) -> None:
+    """Remove a task; call before its log rollup is deleted"""
+    _apply_to_goal(
+        session,
+        task.goal_id,
+        _task_deltas(
+            task.status, task.estimate_hours, _actual_minutes(session, task.id), -1
+        ),
+    )
+
+
+def record_log_minutes(session: Session, task_id: UUID, minutes: int) -> None:
+    """Apply a change of a task's logged minutes"""
+    if not minutes:
+        return
+    task = session.get(Task, task_id)
+    if task is not None:
+        _apply_to_goal(session, task.goal_id, {"actual_minutes": minutes})
+
+
+def record_goal_created(session: Session, goal: Goal) -> None:
+    increment_rollup(
+        session,
+        ProjectProgressRollup,
+        "project_id",
+        goal.project_id,
+        {"goal_count": 1, "goal_estimate_hours": _hours(goal.estimate_hours)},
+    )
+
+
+def record_goal_updated(session: Session, goal: Goal, previous: dict) -> None:
+    """Apply a change of the goal's estimate; ``previous`` holds old values"""
+    if "estimate_hours" not in previous:
+        return
+    increment_rollup(
+        session,
+        ProjectProgressRollup,
+        "project_id",
+        goal.project_id,
+        {
+            "goal_estimate_hours": _hours(goal.estimate_hours)
+            - _hours(previous["estimate_hours"])
+        },
+    )
+
+
+def record_goal_deleted(session: Session, goal: Goal) -> None:
+    """Remove a goal and all of its tasks from its project"""
+    deltas: dict[str, Any] = {
+        "goal_count": -1,
+        "goal_estimate_hours": -_hours(goal.estimate_hours),
+    }
+    rollup = session.get(GoalProgressRollup, goal.id)
+    if rollup is not None:
+        for column in TASK_TOTAL_COLUMNS:
+            deltas[column] = -getattr(rollup, column)
+    increment_rollup(
+        session, ProjectProgressRollup, "project_id", goal.project_id, deltas
+    )
+
+
+def get_goal_rollups(
+    session: Session, goal_ids: Iterable[UUID]
+) -> dict[UUID, GoalProgressRollup]:
+    """Rollups keyed by goal ID; goals that never had tasks are omitted"""
+    goal_ids = list(goal_ids)
+    if not goal_ids:
+        return {}
+    return {
+        rollup.goal_id: rollup
+        for rollup in session.exec(
+            select(GoalProgressRollup).where(GoalProgressRollup.goal_id.in_(goal_ids))
+        ).all()
+    }
+
+
+def _expected_task_totals(session: Session, owner_id: UUID | None):
+    status_sums = [
+        func.coalesce(func.sum(case((Task.status == status, 1), else_=0)), 0)
+        for status in STATUS_COLUMNS
+    ]
+    statement = (
+        select(
+            Goal.id,
+            Goal.project_id,
+            func.count(Task.id),
+            *status_sums,
+            func.coalesce(func.sum(Task.estimate_hours), 0),
+            func.coalesce(func.sum(TaskLogRollup.actual_minutes), 0),
+        )
+        .select_from(Goal)
+        .join(Project, Goal.project_id == Project.id)
+        .outerjoin(Task, Task.goal_id == Goal.id)
+        .outerjoin(TaskLogRollup, TaskLogRollup.task_id == Task.id)
+        .group_by(Goal.id, Goal.project_id)
+    )
+    if owner_id is not None:
+        statement = statement.where(Project.owner_id == owner_id)
+    for goal_id, project_id, *totals in session.exec(statement).all():
+        yield goal_id, project_id, dict(zip(TASK_TOTAL_COLUMNS, totals, strict=True))
+
+
+def _normalize(values: dict[str, Any]) -> dict[str, Any]:
+    return {
+        column: (
+            _hours(value).quantize(Decimal("0.01"))
+            if column.endswith("_hours")
+            else int(value)
+        )
+        for column, value in values.items()
+    }
+
+
+def _sync_rows(
+    session: Session,
+    model: type[SQLModel],
+    key_column: str,
+    expected: dict[UUID, dict[str, Any]],
+    existing: dict[UUID, SQLModel],
+    result: RollupReconciliation,
+    dry_run: bool,
+) -> None:
+    now = datetime.now(UTC)
+    for key, values in expected.items():
+        row = existing.get(key)
+        if row is None:
+            # A missing row reads as all zeros
+            if not any(values.values()):
+                continue
+            result.created += 1
+            if not dry_run:
+                session.add(model(**{key_column: key, **values, "updated_at": now}))
+            continue
+        current = _normalize({column: getattr(row, column) for column in values})
+        if current != values:
+            result.updated += 1
+            if not dry_run:
+                for column, value in values.items():
+                    setattr(row, column, value)
+                row.updated_at = now
+                session.add(row)
+
+    stale = [key for key in existing if key not in expected]
+    result.removed += len(stale)
+    if stale and not dry_run:
+        key_attr = getattr(model, key_column)
+        session.exec(delete(model).where(key_attr.in_(stale)))
+
+
+def reconcile_progress_rollups(
+    session: Session,
+    owner_id: UUID | None = None,
+    dry_run: bool = False,
+) -> RollupReconciliation:
+    """
+    Recompute goal and project rollups and fix rows that differ
+
+    Actual minutes come from the task log rollups, so reconcile those first.
+    Limited to one user's projects when ``owner_id`` is given. Commits unless
+    ``dry_run`` is set.
+    """
+    projects = select(Project.id)
+    if owner_id is not None:
+        projects = projects.where(Project.owner_id == owner_id)
+    project_ids = list(session.exec(projects).all())
+
+    expected_projects: dict[UUID, dict[str, Any]] = {
+        project_id: {
+            "goal_count": 0,
+            "goal_estimate_hours": Decimal("0"),
+            **dict.fromkeys(TASK_TOTAL_COLUMNS, 0),
+        }
+        for project_id in project_ids
+    }
+    for project_id, goal_count, goal_estimate in session.exec(
+        select(Goal.project_id, func.count(Goal.id), func.sum(Goal.estimate_hours))
+        .where(Goal.project_id.in_(project_ids))
+        .group_by(Goal.project_id)
+    ).all():
+        expected_projects[project_id]["goal_count"] = goal_count
+        expected_projects[project_id]["goal_estimate_hours"] = goal_estimate or 0
+
+    expected_goals: dict[UUID, dict[str, Any]] = {}
+    for goal_id, project_id, totals in _expected_task_totals(session, owner_id):
+        expected_goals[goal_id] = _normalize(totals)
+        project_totals = expected_projects[project_id]
+        for column, value in totals.items():
+            project_totals[column] += value
+    expected_projects = {
+        project_id: _normalize(values)
+        for project_id, values in expected_projects.items()
+    }
+
+    goal_rollups = select(GoalProgressRollup)
+    project_rollups = select(ProjectProgressRollup)
+    if owner_id is not None:
+        goal_rollups = goal_rollups.where(
+            GoalProgressRollup.goal_id.in_(
+                select(Goal.id).where(Goal.project_id.in_(project_ids))
+            )
+        )
+        project_rollups = project_rollups.where(
+            ProjectProgressRollup.project_id.in_(project_ids)
+        )
+
+    result = RollupReconciliation()
+    existing_goals = {r.goal_id: r for r in session.exec(goal_rollups).all()}
+    existing_projects = {r.project_id: r for r in session.exec(project_rollups).all()}
+    result.checked = len(expected_goals.keys() | existing_goals.keys()) + len(
+        expected_projects.keys() | existing_projects.keys()
+    )
+    _sync_rows(
+        session,
+        GoalProgressRollup,
+        "goal_id",
+        expected_goals,
+        existing_goals,
+        result,
+        dry_run,
+    )
+    _sync_rows(
+        session,
+        ProjectProgressRollup,
+        "project_id",
+        expected_projects,
+        existing_projects,
+        result,
+        dry_run,
+    )
+
+    if not dry_run:
+        session.commit()
+
+    if result.changed:
+        logger.info(
+            f"Progress rollups {'to fix' if dry_run else 'fixed'}: "
+            f"{result.created} created, {result.updated} updated, "
+            f"{result.removed} removed of {result.checked}"
+        )
+    return result
@@ -8,6 +8,7 @@ from . import (
     projects,
     scheduler,
     slot_templates,
+    solver_jobs,
     tasks,
     triage,
     user_settings,
@@ -25,6 +26,7 @@ __all__ = [
     "projects",
     "scheduler",
     "slot_templates",
+    "solver_jobs",
     "tasks",
     "triage",
     "user_settings",
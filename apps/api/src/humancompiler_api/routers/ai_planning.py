@@ -5,7 +5,7 @@ AI-powered planning API endpoints using OpenAI Assistants API.
 import logging
 from datetime import date, datetime
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlmodel import Session
 from uuid import UUID
 
@@ -18,7 +18,9 @@ from humancompiler_api.ai.weekly_task_solver import (
 )
 from humancompiler_api.auth import get_current_user_id
 from humancompiler_api.database import get_session
-from humancompiler_api.models import ErrorResponse
+from humancompiler_api.models import ErrorResponse, SolverJobResponse, SolverJobType
+from humancompiler_api.solver_executor import SolverExecutorError
+from humancompiler_api.solver_job_service import solver_job_service
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/ai", tags=["ai-planning"])
@@ -145,6 +147,37 @@ async def generate_weekly_plan(
         )
 
 
+def _validate_solver_week_start(week_start_date: str) -> date:
+    """Validate the solver week start date, raising 400 on bad input."""
+    try:
+        week_start = datetime.strptime(week_start_date, "%Y-%m-%d").date()
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=ErrorResponse.create(
+                code="INVALID_DATE_FORMAT",
+                message="Invalid date format. Use YYYY-MM-DD",
+                details={"provided_date": week_start_date},
+            ).model_dump(),
+        ) from e
+
+    # Check if date is in the past (allow current week)
+    today = date.today()
+    if week_start < today and (today - week_start).days > 7:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=ErrorResponse.create(
+                code="INVALID_DATE_RANGE",
+                message="Cannot create plans for weeks more than 7 days in the past",
+                details={
+                    "provided_date": str(week_start),
+                    "current_date": str(today),
+                },
+            ).model_dump(),
+        )
+    return week_start
+
+
 @router.post(
     "/weekly-task-solver",
     response_model=TaskSolverResponse,
@@ -155,6 +188,7 @@ async def generate_weekly_plan(
 )
 async def solve_weekly_tasks(
     request: TaskSolverRequest,
+    http_request: Request,
     user_id: str = Depends(get_current_user_id),
     session: Session = Depends(get_session),
 ):
@@ -179,40 +213,17 @@ async def solve_weekly_tasks(
             f"Starting weekly task solving for user {user_id} starting {request.week_start_date}"
         )
 
-        # Validate week start date
-        try:
-            week_start = datetime.strptime(request.week_start_date, "%Y-%m-%d").date()
-        except ValueError as e:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=ErrorResponse.create(
-                    code="INVALID_DATE_FORMAT",
-                    message="Invalid date format. Use YYYY-MM-DD",
-                    details={"provided_date": request.week_start_date},
-                ).model_dump(),
-            ) from e
-
-        # Check if date is in the past (allow current week)
-        today = date.today()
-        if week_start < today and (today - week_start).days > 7:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=ErrorResponse.create(
-                    code="INVALID_DATE_RANGE",
-                    message="Cannot create plans for weeks more than 7 days in the past",
-                    details={
-                        "provided_date": str(week_start),
-                        "current_date": str(today),
-                    },
-                ).model_dump(),
-            )
+        _validate_solver_week_start(request.week_start_date)
 
         # Create user-specific task solver
         task_solver = await WeeklyTaskSolver.create_for_user(UUID(user_id), session)
 
         # Solve weekly tasks
         solver_response = await task_solver.solve_weekly_tasks(
-            session=session, user_id=user_id, request=request
+            session=session,
+            user_id=user_id,
+            request=request,
+            cancel_check=http_request.is_disconnected,
         )
 
         logger.info(
@@ -222,6 +233,16 @@ async def solve_weekly_tasks(
 
     except HTTPException:
         raise
+    except SolverExecutorError as e:
+        logger.warning(f"Weekly task solve not completed for user {user_id}: {e}")
+        raise HTTPException(
+            status_code=e.status_code,
+            detail=ErrorResponse.create(
+                code=e.error_code,
+                message=e.message,
+                details={"week_start_date": request.week_start_date},
+            ).model_dump(),
+        )
     except Exception as e:
         logger.error(f"Unexpected error in weekly task solver: {e}")
         raise HTTPException(
@@ -234,6 +255,50 @@ async def solve_weekly_tasks(
         )
 
 
+@router.post(
+    "/weekly-task-solver/jobs",
+    response_model=SolverJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    responses={
+        400: {"model": ErrorResponse, "description": "Bad request"},
+    },
+)
+async def submit_weekly_task_solver_job(
+    request: TaskSolverRequest,
+    user_id: str = Depends(get_current_user_id),
+    session: Session = Depends(get_session),
+) -> SolverJobResponse:
+    """
+    Submit the weekly task solver as a background job.
+
+    Returns immediately with a job id instead of holding the connection for
+    the whole solve. Poll ``GET /api/solver-jobs/{job_id}`` for progress and
+    the final ``TaskSolverResponse``, or listen for the
+    ``solver_job_completed`` WebSocket event.
+    """
+    _validate_solver_week_start(request.week_start_date)
+
+    job = solver_job_service.create_job(
+        session,
+        user_id,
+        SolverJobType.WEEKLY_TASK_SOLVER,
+        request.model_dump(mode="json"),
+    )
+
+    async def run(job_session: Session, report_progress) -> dict:
+        report_progress(10, "ソルバー準備中")
+        task_solver = await WeeklyTaskSolver.create_for_user(UUID(user_id), job_session)
+        report_progress(20, "タスク選択を最適化中")
+        solver_response = await task_solver.solve_weekly_tasks(
+            session=job_session, user_id=user_id, request=request
+        )
+        return solver_response.model_dump(mode="json")
+
+    solver_job_service.start(job, run)
+    logger.info(f"Queued weekly task solver job {job.id} for user {user_id}")
+    return SolverJobResponse.from_db_model(job)
+
+
 @router.get("/weekly-plan/test")
 async def test_ai_integration():
     """Test endpoint to verify OpenAI integration."""
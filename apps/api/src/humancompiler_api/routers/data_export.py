@@ -10,30 +10,51 @@ import os
 import tempfile
 from pathlib import Path
 
-from fastapi import APIRouter, HTTPException, Request, Depends, UploadFile, File
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi import APIRouter, HTTPException, Request, Depends, UploadFile, File, Query
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlmodel import Session, col
 
 from humancompiler_api.auth import get_current_user, AuthUser
 from humancompiler_api.database import db
 from humancompiler_api.rate_limiter import limiter
-from humancompiler_api.safe_migration import DataBackupManager, SafeMigrationError
+from humancompiler_api.safe_migration import (
+    DataBackupManager,
+    SafeMigrationError,
+    USER_BACKUP_SECTIONS,
+    gzip_chunks,
+)
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
+# Media type and file extension per export format
+EXPORT_FORMATS = {
+    "json": ("application/json", "json"),
+    "ndjson": ("application/x-ndjson", "ndjson"),
+}
+
+
 @router.get("/api/export/user-data")
 @limiter.limit("5 per minute")
 async def export_user_data(
     request: Request,
+    export_format: str = Query(
+        "json",
+        alias="format",
+        pattern="^(json|ndjson)$",
+        description="json (single document) or ndjson (one record per line)",
+    ),
+    compress: bool = Query(False, description="Gzip the export on the fly"),
     current_user: AuthUser = Depends(get_current_user),
     db_session: Session = Depends(db.get_session),
-) -> FileResponse:
+) -> StreamingResponse:
     """
-    Export all user data as a JSON file for backup purposes
-    認証ユーザーの全データをJSONファイルとしてエクスポート
+    Export all user data as a backup file, streamed table by table
+    認証ユーザーの全データをテーブル単位でストリーミングしてエクスポート
+
+    Nothing is written to disk and only one chunk of rows is held in memory.
     """
     try:
         logger.info(f"Starting data export for user: {current_user.user_id}")
@@ -41,27 +62,26 @@ async def export_user_data(
         # Create backup manager
         backup_manager = DataBackupManager()
 
-        # Create user-specific backup
-        backup_path = backup_manager.create_user_backup(
-            user_id=current_user.user_id,
-            backup_name=f"user_export_{current_user.user_id}",
+        # Raises before streaming starts when the user does not exist
+        chunks = backup_manager.stream_user_backup(
+            user_id=current_user.user_id, export_format=export_format
         )
 
-        # Prepare file for download
-        file_path = Path(backup_path)
-        if not file_path.exists():
-            raise HTTPException(status_code=500, detail="Failed to create export file")
+        media_type, extension = EXPORT_FORMATS[export_format]
+        download_filename = f"taskagent_data_export_{current_user.user_id}.{extension}"
+        if compress:
+            chunks = gzip_chunks(chunks)
+            media_type = "application/gzip"
+            download_filename += ".gz"
 
-        # Generate download filename
-        download_filename = f"taskagent_data_export_{current_user.user_id}.json"
-
-        logger.info(f"Export successful for user {current_user.user_id}: {backup_path}")
+        logger.info(
+            f"Streaming {export_format} export for user {current_user.user_id}"
+            f"{' (gzip)' if compress else ''}"
+        )
 
-        # Return file as download
-        return FileResponse(
-            path=backup_path,
-            filename=download_filename,
-            media_type="application/json",
+        return StreamingResponse(
+            chunks,
+            media_type=media_type,
             headers={
                 "Content-Disposition": f"attachment; filename={download_filename}",
                 "Cache-Control": "no-cache, no-store, must-revalidate",
@@ -84,25 +104,42 @@ async def export_user_data(
         )
 
 
+# Accepted upload names: the export formats, optionally gzipped
+IMPORT_SUFFIXES = (".json", ".ndjson", ".json.gz", ".ndjson.gz")
+
+# Sections reported in the import response
+IMPORTED_SECTIONS = [
+    section for section, _ in USER_BACKUP_SECTIONS if section != "users"
+]
+
+
 @router.post("/api/import/user-data")
 @limiter.limit("3 per minute")
 async def import_user_data(
     request: Request,
     file: UploadFile = File(...),
+    dry_run: bool = Query(False, description="Validate and count without saving"),
     current_user: AuthUser = Depends(get_current_user),
     db_session: Session = Depends(db.get_session),
 ) -> JSONResponse:
     """
     Import user data from a JSON backup file
     JSONバックアップファイルからユーザーデータをインポート
+
+    The file is read twice: once to validate every record, then to insert.
+    NDJSON backups (``format=ndjson`` on export) are read one line at a time.
+    JSON backups, the default export format, are loaded whole on each pass,
+    so their memory use grows with the file size up to the 10MB upload limit.
     """
     try:
         logger.info(f"Starting data import for user: {current_user.user_id}")
 
         # Validate file type
-        if not file.filename or not file.filename.endswith(".json"):
+        if not file.filename or not file.filename.endswith(IMPORT_SUFFIXES):
             raise HTTPException(
-                status_code=400, detail="Only JSON files are allowed for import"
+                status_code=400,
+                detail="Only JSON or NDJSON files (optionally gzipped) are allowed "
+                "for import",
             )
 
         # Check file size (limit to 10MB)
@@ -119,78 +156,44 @@ async def import_user_data(
 
         # Create temporary file
         with tempfile.NamedTemporaryFile(
-            mode="wb", suffix=".json", delete=False
+            mode="wb", suffix=Path(file.filename).suffix, delete=False
         ) as temp_file:
             temp_file.write(file_content)
             temp_file_path = temp_file.name
 
         try:
-            # Validate JSON content
-            import json
-
-            try:
-                with open(temp_file_path, encoding="utf-8") as f:
-                    json_data = json.load(f)
-            except json.JSONDecodeError as e:
-                raise HTTPException(
-                    status_code=400, detail=f"Invalid JSON format: {str(e)}"
-                )
-
-            # Basic validation of backup structure
-            metadata = json_data.get("metadata", {})
-            if metadata.get("backup_type") != "user_specific":
-                raise HTTPException(
-                    status_code=400,
-                    detail="Invalid backup file format. Only user-specific backups are supported for import.",
-                )
-
-            # Check required sections
-            required_sections = ["users", "projects", "goals", "tasks", "metadata"]
-            missing_sections = [
-                section for section in required_sections if section not in json_data
-            ]
-            if missing_sections:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Invalid backup file. Missing sections: {', '.join(missing_sections)}",
-                )
-
-            # Create backup manager and restore data
+            # Validate the whole file first, then bulk insert in one transaction
             backup_manager = DataBackupManager()
-            backup_manager.restore_user_data(
-                backup_path=temp_file_path, target_user_id=current_user.user_id
+            report = backup_manager.restore_user_data(
+                backup_path=temp_file_path,
+                target_user_id=current_user.user_id,
+                dry_run=dry_run,
             )
+            metadata = report.metadata
 
             # Count imported records
-            total_records = metadata.get("total_records", {})
             imported_counts = {
-                "projects": total_records.get("projects", 0),
-                "goals": total_records.get("goals", 0),
-                "tasks": total_records.get("tasks", 0),
-                "quick_tasks": total_records.get("quick_tasks", 0),
-                "schedules": total_records.get("schedules", 0),
-                "weekly_schedules": total_records.get("weekly_schedules", 0),
-                "weekly_recurring_tasks": total_records.get(
-                    "weekly_recurring_tasks", 0
-                ),
-                "logs": total_records.get("logs", 0),
-                "user_settings": total_records.get("user_settings", 0),
-                "triage_capacity_settings": total_records.get(
-                    "triage_capacity_settings", 0
-                ),
-                "task_triage_runs": total_records.get("task_triage_runs", 0),
-                "task_triage_items": total_records.get("task_triage_items", 0),
-                "goal_dependencies": total_records.get("goal_dependencies", 0),
-                "task_dependencies": total_records.get("task_dependencies", 0),
+                section: report.imported.get(section, 0)
+                for section in IMPORTED_SECTIONS
             }
 
-            logger.info(f"Import successful for user {current_user.user_id}")
+            logger.info(
+                f"Import {'dry run ' if dry_run else ''}successful for user "
+                f"{current_user.user_id}: {report.total_rows} rows "
+                f"({report.rows_per_second} rows/s)"
+            )
             logger.info(f"Imported records: {imported_counts}")
 
             return JSONResponse(
                 content={
-                    "message": "Data import completed successfully",
+                    "message": "Data import validated successfully (dry run)"
+                    if dry_run
+                    else "Data import completed successfully",
+                    "dry_run": dry_run,
                     "imported_records": imported_counts,
+                    "skipped_records": report.skipped,
+                    "elapsed_seconds": round(report.elapsed_seconds, 3),
+                    "rows_per_second": report.rows_per_second,
                     "import_date": metadata.get("created_at"),
                     "source_user_id": metadata.get("user_id"),
                 },
@@ -358,7 +361,7 @@ async def get_export_info(
                     "User settings",
                     "API usage history",
                 ],
-                "format": "JSON",
+                "format": "JSON or NDJSON, optionally gzip-compressed",
                 "rate_limit": "5 exports per minute",
             },
             "import_feature": {
@@ -5,19 +5,29 @@ import hmac
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlmodel import Session
 
+from core.cache import cache_stats
+from humancompiler_api.ai.call_orchestrator import ai_call_orchestrator
+from humancompiler_api.ai.response_cache import llm_response_cache
 from humancompiler_api.auth import get_current_user_id
 from humancompiler_api.database import get_db
 from humancompiler_api.models import User
 from humancompiler_api.performance_monitor import performance_monitor
+from humancompiler_api.solver_cache import solver_result_cache
+from humancompiler_api.solver_executor import solver_executor
 from humancompiler_api.routers.schemas.monitoring import (
+    AICallStatsResponse,
+    ApplicationCacheStatsResponse,
     ConnectionPoolStatsResponse,
     IndexAnalysisResponse,
     IndexUsageEntry,
+    LLMResponseCacheStatsResponse,
     MissingIndexEntry,
     PerformanceReportResponse,
     QueryStatEntry,
     QueryStatistics,
     QueryStatisticsResponse,
+    SolverExecutorStatsResponse,
+    SolverResultCacheStatsResponse,
     TableStatisticsEntry,
     TableStatisticsResponse,
 )
@@ -155,6 +165,46 @@ async def get_table_statistics(
     )
 
 
+@router.get("/solver", response_model=SolverExecutorStatsResponse)
+async def get_solver_executor_stats(
+    current_user: User = Depends(get_current_admin_user),
+) -> SolverExecutorStatsResponse:
+    """Get solver pool queue depth, concurrency and outcome counters"""
+    return SolverExecutorStatsResponse(**solver_executor.get_stats())
+
+
+@router.get("/solver/cache", response_model=SolverResultCacheStatsResponse)
+async def get_solver_result_cache_stats(
+    current_user: User = Depends(get_current_admin_user),
+) -> SolverResultCacheStatsResponse:
+    """Get solver result cache size and hit rate"""
+    return SolverResultCacheStatsResponse(**solver_result_cache.get_stats())
+
+
+@router.get("/cache", response_model=ApplicationCacheStatsResponse)
+async def get_application_cache_stats(
+    current_user: User = Depends(get_current_admin_user),
+) -> ApplicationCacheStatsResponse:
+    """Get hit, miss and eviction counters of the application caches"""
+    return ApplicationCacheStatsResponse(caches=cache_stats())
+
+
+@router.get("/ai/cache", response_model=LLMResponseCacheStatsResponse)
+async def get_llm_response_cache_stats(
+    current_user: User = Depends(get_current_admin_user),
+) -> LLMResponseCacheStatsResponse:
+    """Get how often AI answers were served from the response cache"""
+    return LLMResponseCacheStatsResponse(**llm_response_cache.get_stats())
+
+
+@router.get("/ai/calls", response_model=AICallStatsResponse)
+async def get_ai_call_stats(
+    current_user: User = Depends(get_current_admin_user),
+) -> AICallStatsResponse:
+    """Get concurrency, timeout and rate limit counters of model calls"""
+    return AICallStatsResponse(**ai_call_orchestrator.get_stats())
+
+
 @router.post("/performance/reset")
 async def reset_performance_metrics(
     current_admin: User = Depends(get_current_admin_user),
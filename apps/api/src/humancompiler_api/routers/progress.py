@@ -1,14 +1,17 @@
 from collections.abc import Generator
 from decimal import Decimal, ROUND_HALF_UP
 from typing import Annotated
+from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, field_serializer
-from sqlmodel import Session, select, func
+from sqlmodel import Session, select
 
 from humancompiler_api.auth import AuthUser, get_current_user
 from humancompiler_api.database import db
-from humancompiler_api.models import Goal, Log, Project, Task
+from humancompiler_api.models import Goal, Project, ProjectProgressRollup, Task
+from humancompiler_api.progress_rollups import get_goal_rollups
+from humancompiler_api.task_rollups import get_actual_minutes_map
 
 router = APIRouter(prefix="/progress", tags=["progress"])
 
@@ -61,12 +64,117 @@ class ProjectProgress(BaseModel):
         return float(value)
 
 
+class ProjectProgressSummary(BaseModel):
+    """Project totals without the per-goal and per-task breakdown"""
+
+    project_id: str
+    title: str
+    estimate_hours: Decimal
+    actual_minutes: int
+    progress_percentage: float
+    goal_count: int
+    task_count: int
+    pending_tasks: int
+    in_progress_tasks: int
+    completed_tasks: int
+    cancelled_tasks: int
+
+    @field_serializer("estimate_hours")
+    def serialize_estimate_hours(self, value: Decimal) -> float:
+        """Convert Decimal to float for JSON serialization"""
+        return float(value)
+
+
 def get_session() -> Generator[Session, None, None]:
     """Database session dependency"""
     with Session(db.get_engine()) as session:
         yield session
 
 
+def _progress_percentage(actual_minutes: int, estimate_hours: Decimal | float) -> float:
+    """Logged share of the estimate in percent, one decimal, capped at 100"""
+    estimate_minutes = int(Decimal(str(estimate_hours or 0)) * 60)
+
+    # Use Decimal for precise progress calculation
+    if estimate_minutes <= 0:
+        return 0.0
+    progress_decimal = (
+        Decimal(actual_minutes) / Decimal(estimate_minutes) * 100
+    ).quantize(Decimal("0.1"), rounding=ROUND_HALF_UP)
+    return min(float(progress_decimal), 100.0)
+
+
+def _task_progresses(session: Session, tasks: list[Task]) -> list[TaskProgress]:
+    """Per-task progress, with actual minutes from the maintained log rollups"""
+    log_map = get_actual_minutes_map(session, [task.id for task in tasks])
+    task_progresses = []
+    for task in tasks:
+        task_actual_minutes = log_map.get(str(task.id), 0)
+        task_progresses.append(
+            TaskProgress(
+                task_id=str(task.id),
+                title=task.title,
+                estimate_hours=task.estimate_hours,
+                actual_minutes=task_actual_minutes,
+                progress_percentage=_progress_percentage(
+                    task_actual_minutes, task.estimate_hours
+                ),
+                status=task.status.value,
+            )
+        )
+    return task_progresses
+
+
+@router.get(
+    "/projects",
+    response_model=list[ProjectProgressSummary],
+)
+async def get_projects_progress(
+    session: Annotated[Session, Depends(get_session)],
+    current_user: Annotated[AuthUser, Depends(get_current_user)],
+) -> list[ProjectProgressSummary]:
+    """Get progress totals for all of the user's projects in one call"""
+
+    user_id = current_user.user_id
+    if isinstance(user_id, str):
+        user_id = UUID(user_id)
+
+    # Totals are maintained per project; projects without goals have no row
+    rows = session.exec(
+        select(Project, ProjectProgressRollup)
+        .outerjoin(
+            ProjectProgressRollup,
+            ProjectProgressRollup.project_id == Project.id,
+        )
+        .where(Project.owner_id == user_id)
+        .order_by(Project.created_at.desc())
+    ).all()
+
+    summaries = []
+    for project, rollup in rows:
+        rollup = rollup or ProjectProgressRollup(project_id=project.id)
+        estimate_hours = Decimal(str(rollup.goal_estimate_hours))
+
+        summaries.append(
+            ProjectProgressSummary(
+                project_id=str(project.id),
+                title=project.title,
+                estimate_hours=estimate_hours,
+                actual_minutes=rollup.actual_minutes,
+                progress_percentage=_progress_percentage(
+                    rollup.actual_minutes, estimate_hours
+                ),
+                goal_count=rollup.goal_count,
+                task_count=rollup.task_count,
+                pending_tasks=rollup.pending_tasks,
+                in_progress_tasks=rollup.in_progress_tasks,
+                completed_tasks=rollup.completed_tasks,
+                cancelled_tasks=rollup.cancelled_tasks,
+            )
+        )
+    return summaries
+
+
 @router.get(
     "/project/{project_id}",
     response_model=ProjectProgress,
@@ -93,110 +201,48 @@ async def get_project_progress(
     # Get goals for this project
     goals = session.exec(select(Goal).where(Goal.project_id == project_id)).all()
 
-    project_total_estimate = Decimal(0)
-    project_total_actual = 0
-    goal_progresses = []
-
     # Get all tasks for all goals in a single query
     all_tasks = session.exec(
         select(Task).where(Task.goal_id.in_([goal.id for goal in goals]))
     ).all()
+    task_progresses = _task_progresses(session, list(all_tasks))
 
-    # Group tasks by goal_id
-    tasks_by_goal = {}
-    for task in all_tasks:
-        if task.goal_id not in tasks_by_goal:
-            tasks_by_goal[task.goal_id] = []
-        tasks_by_goal[task.goal_id].append(task)
-
-    # Get all log sums for all tasks in a single query
-    task_ids = [task.id for task in all_tasks]
-    log_sums = (
-        session.exec(
-            select(Log.task_id, func.sum(Log.actual_minutes))
-            .where(Log.task_id.in_(task_ids))
-            .group_by(Log.task_id)
-        ).all()
-        if task_ids
-        else []
-    )
-
-    # Create a map of task_id to actual_minutes
-    log_map = {str(task_id): int(total or 0) for task_id, total in log_sums}
+    # Group task progress by goal_id
+    tasks_by_goal: dict[UUID, list[TaskProgress]] = {}
+    for task, task_progress in zip(all_tasks, task_progresses, strict=True):
+        tasks_by_goal.setdefault(task.goal_id, []).append(task_progress)
 
+    # Goal and project totals are maintained by the services; no row means zero
+    goal_rollups = get_goal_rollups(session, [goal.id for goal in goals])
+    goal_progresses = []
     for goal in goals:
-        # Get tasks for this goal from the grouped data
-        tasks = tasks_by_goal.get(goal.id, [])
-
-        goal_total_estimate = goal.estimate_hours
-        goal_total_actual = 0
-        task_progresses = []
-
-        for task in tasks:
-            # Get total actual minutes from the map
-            task_actual_minutes = log_map.get(str(task.id), 0)
-            task_estimate_minutes = int(task.estimate_hours * 60)
-            # Use Decimal for precise progress calculation
-            if task_estimate_minutes > 0:
-                progress_decimal = (
-                    Decimal(task_actual_minutes) / Decimal(task_estimate_minutes) * 100
-                ).quantize(Decimal("0.1"), rounding=ROUND_HALF_UP)
-                task_progress = float(progress_decimal)
-            else:
-                task_progress = 0.0
-
-            task_progress_info = TaskProgress(
-                task_id=str(task.id),
-                title=task.title,
-                estimate_hours=task.estimate_hours,
-                actual_minutes=task_actual_minutes,
-                progress_percentage=min(task_progress, 100.0),
-                status=task.status.value,
+        rollup = goal_rollups.get(goal.id)
+        goal_actual_minutes = rollup.actual_minutes if rollup else 0
+        goal_progresses.append(
+            GoalProgress(
+                goal_id=str(goal.id),
+                title=goal.title,
+                estimate_hours=goal.estimate_hours,
+                actual_minutes=goal_actual_minutes,
+                progress_percentage=_progress_percentage(
+                    goal_actual_minutes, goal.estimate_hours
+                ),
+                tasks=tasks_by_goal.get(goal.id, []),
             )
-            task_progresses.append(task_progress_info)
-            goal_total_actual += task_actual_minutes
-
-        goal_estimate_minutes = int(goal_total_estimate * 60)
-
-        # Use Decimal for precise goal progress calculation
-        if goal_estimate_minutes > 0:
-            goal_progress_decimal = (
-                Decimal(goal_total_actual) / Decimal(goal_estimate_minutes) * 100
-            ).quantize(Decimal("0.1"), rounding=ROUND_HALF_UP)
-            goal_progress = float(goal_progress_decimal)
-        else:
-            goal_progress = 0.0
-
-        goal_progress_info = GoalProgress(
-            goal_id=str(goal.id),
-            title=goal.title,
-            estimate_hours=goal_total_estimate,
-            actual_minutes=goal_total_actual,
-            progress_percentage=min(goal_progress, 100.0),
-            tasks=task_progresses,
         )
-        goal_progresses.append(goal_progress_info)
-
-        project_total_estimate += goal_total_estimate
-        project_total_actual += goal_total_actual
 
-    project_estimate_minutes = int(project_total_estimate * 60)
-
-    # Use Decimal for precise project progress calculation
-    if project_estimate_minutes > 0:
-        project_progress_decimal = (
-            Decimal(project_total_actual) / Decimal(project_estimate_minutes) * 100
-        ).quantize(Decimal("0.1"), rounding=ROUND_HALF_UP)
-        project_progress = float(project_progress_decimal)
-    else:
-        project_progress = 0.0
+    project_rollup = session.get(ProjectProgressRollup, project.id)
+    project_rollup = project_rollup or ProjectProgressRollup(project_id=project.id)
+    project_estimate_hours = Decimal(str(project_rollup.goal_estimate_hours))
 
     return ProjectProgress(
         project_id=str(project.id),
         title=project.title,
-        estimate_hours=project_total_estimate,
-        actual_minutes=project_total_actual,
-        progress_percentage=min(project_progress, 100.0),
+        estimate_hours=project_estimate_hours,
+        actual_minutes=project_rollup.actual_minutes,
+        progress_percentage=_progress_percentage(
+            project_rollup.actual_minutes, project_estimate_hours
+        ),
         goals=goal_progresses,
     )
 
@@ -228,66 +274,19 @@ async def get_goal_progress(
     # Get tasks for this goal
     tasks = session.exec(select(Task).where(Task.goal_id == goal_id)).all()
 
-    # Get all log sums for all tasks in a single query
-    task_ids = [task.id for task in tasks]
-    log_sums = (
-        session.exec(
-            select(Log.task_id, func.sum(Log.actual_minutes))
-            .where(Log.task_id.in_(task_ids))
-            .group_by(Log.task_id)
-        ).all()
-        if task_ids
-        else []
-    )
-
-    # Create a map of task_id to actual_minutes
-    log_map = {str(task_id): int(total or 0) for task_id, total in log_sums}
-
-    goal_total_actual = 0
-    task_progresses = []
-
-    for task in tasks:
-        # Get total actual minutes from the map
-        task_actual_minutes = log_map.get(str(task.id), 0)
-        task_estimate_minutes = int(task.estimate_hours * 60)
-        # Use Decimal for precise progress calculation
-        if task_estimate_minutes > 0:
-            progress_decimal = (
-                Decimal(task_actual_minutes) / Decimal(task_estimate_minutes) * 100
-            ).quantize(Decimal("0.1"), rounding=ROUND_HALF_UP)
-            task_progress = float(progress_decimal)
-        else:
-            task_progress = 0.0
-
-        task_progress_info = TaskProgress(
-            task_id=str(task.id),
-            title=task.title,
-            estimate_hours=task.estimate_hours,
-            actual_minutes=task_actual_minutes,
-            progress_percentage=min(task_progress, 100.0),
-            status=task.status.value,
-        )
-        task_progresses.append(task_progress_info)
-        goal_total_actual += task_actual_minutes
-
-    goal_estimate_minutes = int(goal.estimate_hours * 60)
-
-    # Use Decimal for precise goal progress calculation
-    if goal_estimate_minutes > 0:
-        goal_progress_decimal = (
-            Decimal(goal_total_actual) / Decimal(goal_estimate_minutes) * 100
-        ).quantize(Decimal("0.1"), rounding=ROUND_HALF_UP)
-        goal_progress = float(goal_progress_decimal)
-    else:
-        goal_progress = 0.0
+    # The goal's total is maintained by the services; no row means zero
+    rollup = get_goal_rollups(session, [goal.id]).get(goal.id)
+    goal_actual_minutes = rollup.actual_minutes if rollup else 0
 
     return GoalProgress(
         goal_id=str(goal.id),
         title=goal.title,
         estimate_hours=goal.estimate_hours,
-        actual_minutes=goal_total_actual,
-        progress_percentage=min(goal_progress, 100.0),
-        tasks=task_progresses,
+        actual_minutes=goal_actual_minutes,
+        progress_percentage=_progress_percentage(
+            goal_actual_minutes, goal.estimate_hours
+        ),
+        tasks=_task_progresses(session, list(tasks)),
     )
 
 
@@ -316,30 +315,17 @@ async def get_task_progress(
             status_code=status.HTTP_404_NOT_FOUND, detail="Task not found"
         )
 
-    # Get total actual minutes for this task using GROUP BY for consistency
-    log_sums = session.exec(
-        select(Log.task_id, func.sum(Log.actual_minutes))
-        .where(Log.task_id == task_id)
-        .group_by(Log.task_id)
-    ).first()
-
-    task_actual_minutes = int(log_sums[1]) if log_sums else 0
-    task_estimate_minutes = int(task.estimate_hours * 60)
-
-    # Use Decimal for precise progress calculation
-    if task_estimate_minutes > 0:
-        progress_decimal = (
-            Decimal(task_actual_minutes) / Decimal(task_estimate_minutes) * 100
-        ).quantize(Decimal("0.1"), rounding=ROUND_HALF_UP)
-        task_progress = float(progress_decimal)
-    else:
-        task_progress = 0.0
-
+    # Get total actual minutes for this task from its log rollup
+    task_actual_minutes = get_actual_minutes_map(session, [task.id]).get(
+        str(task.id), 0
+    )
     return TaskProgress(
         task_id=str(task.id),
         title=task.title,
         estimate_hours=task.estimate_hours,
         actual_minutes=task_actual_minutes,
-        progress_percentage=min(task_progress, 100.0),
+        progress_percentage=_progress_percentage(
+            task_actual_minutes, task.estimate_hours
+        ),
         status=task.status.value,
     )
@@ -97,7 +97,7 @@ async def generate_weekly_report(
 
         # Generate the report
         report_generator = WeeklyReportGenerator()
-        report = report_generator.generate_weekly_report(
+        report = await report_generator.generate_weekly_report(
             session=session,
             request=request,
             user_id=str(current_user.user_id),
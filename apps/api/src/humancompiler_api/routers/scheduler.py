@@ -4,7 +4,8 @@ Scheduler API endpoints for task scheduling optimization.
 
 import logging
 import math
-from dataclasses import fields
+import time as time_module
+from dataclasses import dataclass, field, fields
 from datetime import UTC, date, datetime, time, timedelta
 from enum import Enum
 from importlib.metadata import PackageNotFoundError, version
@@ -58,9 +59,20 @@ from humancompiler_api.models import (
     TaskStatus,
     GoalStatus,
     SlotKind,
+    SolverJobResponse,
+    SolverJobType,
     WorkType,
 )
 from humancompiler_api.services import goal_service, task_service, quick_task_service
+from humancompiler_api.solver_cache import solver_fingerprint, solver_result_cache
+from humancompiler_api.solver_job_service import solver_job_service
+from humancompiler_api.solver_executor import (
+    CancelCheck,
+    SolverExecutorError,
+    search_settings_limits,
+    solver_executor,
+)
+from humancompiler_api.task_rollups import get_actual_hours_map
 from humancompiler_api.models import QuickTask
 from uuid import UUID
 from sqlalchemy.exc import SQLAlchemyError, DatabaseError
@@ -291,13 +303,16 @@ class SchedulerTuningConfigResponse(BaseModel):
     backend_version: str
     defaults: dict[str, int]
     config_schema: list[SchedulerConfigControl] = Field(alias="schema")
+    # CP-SAT search settings accepted by the weekly solver (solver_search)
+    search_defaults: dict[str, float] = Field(default_factory=dict)
+    search_limits: dict[str, float] = Field(default_factory=dict)
 
     model_config = ConfigDict(populate_by_name=True)
 
 
 def _get_task_actual_hours(session: Session, task_ids: list[str]) -> dict[str, float]:
     """
-    Get actual hours logged for each task from the logs table.
+    Get actual hours logged for each task from the task log rollups.
 
     Args:
         session: Database session
@@ -310,10 +325,6 @@ def _get_task_actual_hours(session: Session, task_ids: list[str]) -> dict[str, f
         return {}
 
     try:
-        from humancompiler_api.models import Log
-        from sqlmodel import func
-        from uuid import UUID
-
         # Convert string IDs to UUIDs
         task_uuids = []
         for task_id in task_ids:
@@ -328,25 +339,7 @@ def _get_task_actual_hours(session: Session, task_ids: list[str]) -> dict[str, f
         if not task_uuids:
             return {}
 
-        # Query sum of actual_minutes for each task and convert to hours
-        task_uuid_strs = [str(uuid) for uuid in task_uuids]
-        query = (
-            select(
-                cast(Log.task_id, String),
-                func.sum(Log.actual_minutes).label("total_minutes"),
-            )
-            .where(cast(Log.task_id, String).in_(task_uuid_strs))
-            .group_by(cast(Log.task_id, String))
-        )
-
-        results = session.exec(query).all()
-
-        # Convert results to dict with task_id as string and minutes as hours
-        actual_hours_map = {}
-        for task_uuid, total_minutes in results:
-            task_id = str(task_uuid)
-            actual_hours = float(total_minutes or 0) / 60.0  # Convert minutes to hours
-            actual_hours_map[task_id] = actual_hours
+        actual_hours_map = get_actual_hours_map(session, task_uuids)
 
         logger.debug(f"Retrieved actual hours for {len(actual_hours_map)} tasks")
         return actual_hours_map
@@ -1128,43 +1121,179 @@ def _check_goal_dependencies_satisfied(
         return False  # Assume not satisfied on error
 
 
-def optimize_schedule(
+# When scheduling from the whole backlog, only this many days' worth of the
+# best-scoring work is handed to the solver.
+DAILY_CANDIDATE_CAPACITY_FACTOR = 3
+
+
+def _candidate_score(
+    task: SchedulerTask,
+    slot_kinds: set[HumanWorkKind],
+    schedule_date: date,
+    config: HumanDailySolverConfig,
+) -> int:
+    """Approximate the solver's per-task reward from priority, deadline and kind."""
+    score = config.priority_score_base * (6 - _clamp_priority(task.priority))
+
+    if _to_human_work_kind(task.kind) in slot_kinds:
+        score += config.kind_match_score
+    else:
+        score += config.kind_mismatch_score
+
+    if task.due_date is not None:
+        days_until_due = (task.due_date.date() - schedule_date).days
+        if days_until_due < 0:
+            score += config.overdue_score
+        elif days_until_due <= config.deadline_soon_days:
+            score += config.deadline_score
+
+    return score
+
+
+def _prune_daily_candidates(
+    tasks: list[SchedulerTask],
+    time_slots: list[TimeSlot],
+    schedule_date: date,
+    task_dependencies: dict[str, list[str]],
+    goal_dependencies: dict[str, list[str]],
+    fixed_task_ids: set[str],
+    solver_config: SchedulerSolverConfigInput
+    | HumanDailySolverConfig
+    | dict[str, Any]
+    | None,
+    capacity_factor: int = DAILY_CANDIDATE_CAPACITY_FACTOR,
+) -> tuple[list[SchedulerTask], list[str]]:
+    """
+    Reduce a backlog to the tasks worth handing to the daily solver.
+
+    Tasks that cannot use any slot (project-locked elsewhere, nothing left to
+    do) are dropped outright. The rest are ranked by an approximation of the
+    solver's reward and kept until their remaining work covers
+    ``capacity_factor`` times the day's capacity. Fixed assignments, weekly
+    recurring tasks and the prerequisites of every kept task are always kept,
+    so pruning never loosens a dependency the solver would have enforced.
+
+    Returns (kept tasks in input order, pruned task IDs).
+    """
+    slot_capacity = [_time_slot_capacity_minutes(slot) for slot in time_slots]
+    usable_slots = [
+        slot
+        for slot, capacity in zip(time_slots, slot_capacity, strict=True)
+        if capacity > 0
+    ]
+    day_capacity_minutes = sum(slot_capacity)
+    budget_minutes = day_capacity_minutes * capacity_factor
+
+    remaining_minutes = {
+        task.id: _hours_to_minutes(task.remaining_hours) or 0 for task in tasks
+    }
+    if sum(remaining_minutes.values()) <= budget_minutes:
+        return tasks, []
+
+    unlocked_kinds = {
+        _to_human_work_kind(slot.kind)
+        for slot in usable_slots
+        if not slot.assigned_project_id
+    }
+    kinds_by_project: dict[str, set[HumanWorkKind]] = {}
+    for slot in usable_slots:
+        if slot.assigned_project_id:
+            kinds_by_project.setdefault(slot.assigned_project_id, set()).add(
+                _to_human_work_kind(slot.kind)
+            )
+
+    config = _coerce_human_solver_config(solver_config)
+    keep: set[str] = {
+        task.id
+        for task in tasks
+        if task.id in fixed_task_ids or task.is_weekly_recurring
+    }
+
+    ranked: list[tuple[int, date, str]] = []
+    for task in tasks:
+        if task.id in keep:
+            continue
+        slot_kinds = unlocked_kinds | kinds_by_project.get(task.project_id or "", set())
+        if not slot_kinds or remaining_minutes[task.id] <= 0:
+            continue
+        score = _candidate_score(task, slot_kinds, schedule_date, config)
+        due = task.due_date.date() if task.due_date else date.max
+        ranked.append((-score, due, task.id))
+    ranked.sort()
+
+    used_minutes = sum(remaining_minutes[task_id] for task_id in keep)
+    for _, _, task_id in ranked:
+        if used_minutes >= budget_minutes:
+            break
+        keep.add(task_id)
+        used_minutes += remaining_minutes[task_id]
+
+    # Pull in prerequisites transitively; dropping one would silently remove
+    # the ordering constraint from the fixture.
+    prerequisites = _build_scheduler_task_dependencies(
+        tasks, task_dependencies, goal_dependencies
+    )
+    pending = list(keep)
+    while pending:
+        for prerequisite_id in prerequisites.get(pending.pop(), []):
+            if prerequisite_id not in keep:
+                keep.add(prerequisite_id)
+                pending.append(prerequisite_id)
+
+    kept_tasks = [task for task in tasks if task.id in keep]
+    pruned_task_ids = [task.id for task in tasks if task.id not in keep]
+    logger.info(
+        f"Candidate pruning kept {len(kept_tasks)} of {len(tasks)} tasks "
+        f"({used_minutes} min for {day_capacity_minutes} min of capacity)"
+    )
+    return kept_tasks, pruned_task_ids
+
+
+@dataclass
+class _DailySolvePlan:
+    """Solver input prepared from DB state, or the result when no solve is needed."""
+
+    started_at: float
+    fixture: HumanDailyFixture | None = None
+    schedulable_task_ids: list[str] = field(default_factory=list)
+    unscheduled_due_to_dependencies: list[str] = field(default_factory=list)
+    pruned_task_ids: list[str] = field(default_factory=list)
+    early_result: ScheduleResult | None = None
+
+
+def _prepare_daily_solve(
     tasks: list[SchedulerTask],
     time_slots: list[TimeSlot],
     date: datetime | None = None,
     session: Session | None = None,
-    user_id: str | UUID | None = None,
     fixed_assignments: list[FixedAssignment] | None = None,
     solver_config: SchedulerSolverConfigInput
     | HumanDailySolverConfig
     | dict[str, Any]
     | None = None,
-) -> ScheduleResult:
+    prune_candidates: bool = False,
+) -> _DailySolvePlan:
     """
-    humancompiler-scheduler implementation for task scheduling optimization.
-
-    Optimizes task assignment considering:
-    - Time constraints: Task duration fits in time slots
-    - Deadline constraints: Due dates are respected
-    - Task type constraints: Matching task kinds with slot kinds
-    - Capacity constraints: Maximum hours per slot
-    - Priority constraints: Higher priority tasks get better slots
-    - Fixed assignments: User-defined task-to-slot assignments that solver must respect
+    Filter tasks by dependency state and build the solver fixture.
 
-    Returns optimized schedule with constraint satisfaction guarantees.
+    All database access for a daily solve happens here so that the planning
+    call itself is a pure function of the fixture and can run in a worker.
+    With ``prune_candidates`` the task list is first cut down to roughly what
+    the day can hold (see _prune_daily_candidates).
     """
-    import time as time_module
-
     start_time = time_module.time()
 
     if not tasks or not time_slots:
-        return ScheduleResult(
-            success=True,
-            assignments=[],
-            unscheduled_tasks=[task.id for task in tasks] if tasks else [],
-            total_scheduled_hours=0.0,
-            optimization_status="NO_TASKS_OR_SLOTS",
-            solve_time_seconds=time_module.time() - start_time,
+        return _DailySolvePlan(
+            started_at=start_time,
+            early_result=ScheduleResult(
+                success=True,
+                assignments=[],
+                unscheduled_tasks=[task.id for task in tasks] if tasks else [],
+                total_scheduled_hours=0.0,
+                optimization_status="NO_TASKS_OR_SLOTS",
+                solve_time_seconds=time_module.time() - start_time,
+            ),
         )
 
     # Build set of task IDs that have fixed assignments (user explicitly wants to schedule these)
@@ -1272,13 +1401,16 @@ def optimize_schedule(
     tasks = schedulable_tasks
 
     if not tasks:
-        return ScheduleResult(
-            success=True,
-            assignments=[],
-            unscheduled_tasks=unscheduled_due_to_dependencies,
-            total_scheduled_hours=0.0,
-            optimization_status="NO_SCHEDULABLE_TASKS_DUE_TO_DEPENDENCIES",
-            solve_time_seconds=time_module.time() - start_time,
+        return _DailySolvePlan(
+            started_at=start_time,
+            early_result=ScheduleResult(
+                success=True,
+                assignments=[],
+                unscheduled_tasks=unscheduled_due_to_dependencies,
+                total_scheduled_hours=0.0,
+                optimization_status="NO_SCHEDULABLE_TASKS_DUE_TO_DEPENDENCIES",
+                solve_time_seconds=time_module.time() - start_time,
+            ),
         )
 
     schedule_date = None
@@ -1292,8 +1424,26 @@ def optimize_schedule(
     if schedule_date is None:
         schedule_date = datetime.now()
 
+    pruned_task_ids: list[str] = []
+    if prune_candidates:
+        tasks, pruned_task_ids = _prune_daily_candidates(
+            tasks,
+            time_slots,
+            schedule_date.date(),
+            task_dependencies,
+            goal_dependencies,
+            fixed_assignment_task_ids,
+            solver_config,
+        )
+
+    prepared = _DailySolvePlan(
+        started_at=start_time,
+        schedulable_task_ids=[task.id for task in tasks],
+        unscheduled_due_to_dependencies=unscheduled_due_to_dependencies,
+        pruned_task_ids=pruned_task_ids,
+    )
     try:
-        fixture = _build_human_daily_fixture(
+        prepared.fixture = _build_human_daily_fixture(
             tasks=tasks,
             time_slots=time_slots,
             schedule_date=schedule_date.date(),
@@ -1302,23 +1452,33 @@ def optimize_schedule(
             fixed_assignments=fixed_assignments,
             solver_config=solver_config,
         )
-        report = plan_daily_schedule(fixture)
     except Exception as e:
-        logger.error(f"humancompiler-scheduler failed with exception: {e}")
-        return ScheduleResult(
-            success=False,
-            assignments=[],
-            unscheduled_tasks=[task.id for task in tasks]
-            + unscheduled_due_to_dependencies,
-            total_scheduled_hours=0.0,
-            optimization_status="SOLVER_ERROR",
-            solve_time_seconds=time_module.time() - start_time,
-            objective_value=0.0,
-        )
+        logger.error(f"Failed to build humancompiler-scheduler fixture: {e}")
+        prepared.early_result = _solver_error_result(prepared)
+    return prepared
+
+
+def _solver_error_result(prepared: _DailySolvePlan) -> ScheduleResult:
+    return ScheduleResult(
+        success=False,
+        assignments=[],
+        unscheduled_tasks=prepared.schedulable_task_ids
+        + prepared.pruned_task_ids
+        + prepared.unscheduled_due_to_dependencies,
+        total_scheduled_hours=0.0,
+        optimization_status="SOLVER_ERROR",
+        solve_time_seconds=time_module.time() - prepared.started_at,
+        objective_value=0.0,
+    )
+
 
+def _schedule_result_from_report(
+    prepared: _DailySolvePlan, report: Any
+) -> ScheduleResult:
+    """Convert a humancompiler-scheduler report into a ScheduleResult."""
     unscheduled_tasks = list(report.plan.unscheduled_task_ids)
-    if session and unscheduled_due_to_dependencies:
-        unscheduled_tasks.extend(unscheduled_due_to_dependencies)
+    unscheduled_tasks.extend(prepared.pruned_task_ids)
+    unscheduled_tasks.extend(prepared.unscheduled_due_to_dependencies)
 
     # Reuse the legacy response dataclass so the rest of the API can stay stable
     # while the backend moves to humancompiler-scheduler.
@@ -1345,11 +1505,122 @@ def optimize_schedule(
         )
         / 60.0,
         optimization_status=report.plan.status.upper(),
-        solve_time_seconds=time_module.time() - start_time,
+        solve_time_seconds=time_module.time() - prepared.started_at,
         objective_value=objective_value,
     )
 
 
+def _daily_solver_cache_key(fixture: HumanDailyFixture) -> str:
+    # The package version is part of the key so an upgraded planner never
+    # serves results computed by the previous one.
+    return solver_fingerprint("daily", _scheduler_package_version(), fixture)
+
+
+def optimize_schedule(
+    tasks: list[SchedulerTask],
+    time_slots: list[TimeSlot],
+    date: datetime | None = None,
+    session: Session | None = None,
+    user_id: str | UUID | None = None,
+    fixed_assignments: list[FixedAssignment] | None = None,
+    solver_config: SchedulerSolverConfigInput
+    | HumanDailySolverConfig
+    | dict[str, Any]
+    | None = None,
+    prune_candidates: bool = False,
+) -> ScheduleResult:
+    """
+    humancompiler-scheduler implementation for task scheduling optimization.
+
+    Optimizes task assignment considering:
+    - Time constraints: Task duration fits in time slots
+    - Deadline constraints: Due dates are respected
+    - Task type constraints: Matching task kinds with slot kinds
+    - Capacity constraints: Maximum hours per slot
+    - Priority constraints: Higher priority tasks get better slots
+    - Fixed assignments: User-defined task-to-slot assignments that solver must respect
+
+    Returns optimized schedule with constraint satisfaction guarantees.
+    """
+    prepared = _prepare_daily_solve(
+        tasks,
+        time_slots,
+        date,
+        session,
+        fixed_assignments,
+        solver_config,
+        prune_candidates=prune_candidates,
+    )
+    if prepared.early_result is not None:
+        return prepared.early_result
+
+    cache_key = _daily_solver_cache_key(prepared.fixture)
+    report = solver_result_cache.get(cache_key)
+    if report is None:
+        try:
+            report = plan_daily_schedule(prepared.fixture)
+        except Exception as e:
+            logger.error(f"humancompiler-scheduler failed with exception: {e}")
+            return _solver_error_result(prepared)
+        solver_result_cache.set(cache_key, report)
+
+    return _schedule_result_from_report(prepared, report)
+
+
+async def optimize_schedule_async(
+    tasks: list[SchedulerTask],
+    time_slots: list[TimeSlot],
+    date: datetime | None = None,
+    session: Session | None = None,
+    user_id: str | UUID | None = None,
+    fixed_assignments: list[FixedAssignment] | None = None,
+    solver_config: SchedulerSolverConfigInput
+    | HumanDailySolverConfig
+    | dict[str, Any]
+    | None = None,
+    cancel_check: CancelCheck | None = None,
+    prune_candidates: bool = False,
+) -> ScheduleResult:
+    """
+    Same as optimize_schedule, but runs the planner in the solver executor.
+
+    Dependency filtering still uses the caller's session; only the pure
+    planning call is shipped to the pool. Executor errors (queue full,
+    per-user limit, client disconnect) propagate to the caller.
+    """
+    prepared = _prepare_daily_solve(
+        tasks,
+        time_slots,
+        date,
+        session,
+        fixed_assignments,
+        solver_config,
+        prune_candidates=prune_candidates,
+    )
+    if prepared.early_result is not None:
+        return prepared.early_result
+
+    async def solve() -> Any:
+        return await solver_executor.run(
+            plan_daily_schedule,
+            prepared.fixture,
+            user_id=user_id,
+            cancel_check=cancel_check,
+        )
+
+    try:
+        report = await solver_result_cache.get_or_compute(
+            _daily_solver_cache_key(prepared.fixture), solve
+        )
+    except SolverExecutorError:
+        raise
+    except Exception as e:
+        logger.error(f"humancompiler-scheduler failed with exception: {e}")
+        return _solver_error_result(prepared)
+
+    return _schedule_result_from_report(prepared, report)
+
+
 # Note: Helper functions removed - using optimize_schedule directly
 
 
@@ -1368,6 +1639,7 @@ async def get_scheduler_tuning_config():
         if field.name in control_by_key
     ]
     schema_keys = {control.key for control in schema}
+    search_settings = search_settings_limits()
     return SchedulerTuningConfigResponse(
         backend_package="humancompiler-scheduler",
         backend_version=_scheduler_package_version(),
@@ -1377,6 +1649,8 @@ async def get_scheduler_tuning_config():
             if key in schema_keys
         },
         schema=schema,
+        search_defaults=search_settings["defaults"],
+        search_limits=search_settings["limits"],
     )
 
 
@@ -1635,6 +1909,7 @@ def quick_task_to_scheduler_task(quick_task: QuickTask) -> SchedulerTask:
 @router.post("/daily", response_model=DailyScheduleResponse)
 async def create_daily_schedule(
     request: DailyScheduleRequest,
+    http_request: Request,
     user_id: str = Depends(get_current_user_id),
     session: Session = Depends(db.get_session),
 ):
@@ -1647,6 +1922,50 @@ async def create_daily_schedule(
     3. Runs humancompiler-scheduler daily planning
     4. Returns optimized schedule with assignments
     """
+    return await _create_daily_schedule(
+        request, user_id, session, cancel_check=http_request.is_disconnected
+    )
+
+
+@router.post(
+    "/daily/jobs",
+    response_model=SolverJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def submit_daily_schedule_job(
+    request: DailyScheduleRequest,
+    user_id: str = Depends(get_current_user_id),
+    session: Session = Depends(db.get_session),
+) -> SolverJobResponse:
+    """
+    Submit daily schedule optimization as a background job.
+
+    Returns immediately with a job id. Poll ``GET /api/solver-jobs/{job_id}``
+    for progress and the final ``DailyScheduleResponse``, or listen for the
+    ``solver_job_completed`` WebSocket event.
+    """
+    job = solver_job_service.create_job(
+        session,
+        user_id,
+        SolverJobType.DAILY_SCHEDULE,
+        request.model_dump(mode="json"),
+    )
+
+    async def run(job_session: Session, report_progress) -> dict[str, Any]:
+        report_progress(10, "スケジュール最適化中")
+        response = await _create_daily_schedule(request, user_id, job_session)
+        return response.model_dump(mode="json")
+
+    solver_job_service.start(job, run)
+    return SolverJobResponse.from_db_model(job)
+
+
+async def _create_daily_schedule(
+    request: DailyScheduleRequest,
+    user_id: str,
+    session: Session,
+    cancel_check: CancelCheck | None = None,
+) -> DailyScheduleResponse:
     try:
         logger.info(f"Creating daily schedule for user {user_id} on {request.date}")
         logger.info(
@@ -1892,7 +2211,7 @@ async def create_daily_schedule(
             f"Running optimization with {len(scheduler_tasks)} tasks, {len(scheduler_slots)} slots, "
             f"and {len(scheduler_fixed_assignments)} fixed assignments"
         )
-        optimization_result = optimize_schedule(
+        optimization_result = await optimize_schedule_async(
             scheduler_tasks,
             scheduler_slots,
             datetime.strptime(request.date, "%Y-%m-%d"),
@@ -1900,6 +2219,10 @@ async def create_daily_schedule(
             user_id,
             fixed_assignments=scheduler_fixed_assignments,
             solver_config=request.solver_config,
+            cancel_check=cancel_check,
+            # A full backlog can be far larger than one day; let the solver
+            # work on the candidates that could actually fit.
+            prune_candidates=task_source.type == "all_tasks",
         )
 
         # Process results
@@ -1949,6 +2272,15 @@ async def create_daily_schedule(
     except HTTPException:
         raise
 
+    except SolverExecutorError as e:
+        logger.warning(f"Daily schedule solve not completed for user {user_id}: {e}")
+        raise HTTPException(
+            status_code=e.status_code,
+            detail=ErrorResponse.create(
+                code=e.error_code, message=e.message, details={"date": request.date}
+            ).model_dump(),
+        )
+
     except ValidationError as e:
         logger.error(f"Validation error in schedule creation: {e}")
         raise HTTPException(
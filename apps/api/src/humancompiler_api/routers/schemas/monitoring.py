@@ -144,3 +144,90 @@ class TableStatisticsResponse(BaseModel):
     """Table statistics response."""
 
     tables: list[TableStatisticsEntry]
+
+
+class SolverExecutorStatsResponse(BaseModel):
+    """Solver executor queue and concurrency statistics."""
+
+    backend: str
+    max_workers: int
+    max_queue_size: int
+    max_concurrent_per_user: int
+    in_flight: int
+    queue_depth: int
+    peak_queue_depth: int
+    active_users: int
+    submitted: int
+    completed: int
+    failed: int
+    cancelled: int
+    rejected_queue_full: int
+    rejected_user_limit: int
+    avg_duration_ms: float
+    max_duration_ms: float
+
+
+class SolverResultCacheStatsResponse(BaseModel):
+    """Solver result cache size and hit rate."""
+
+    enabled: bool
+    size: int
+    maxsize: int
+    ttl_seconds: int
+    hits: int
+    misses: int
+    hit_rate: float
+
+
+class LLMResponseCacheStatsResponse(BaseModel):
+    """LLM response cache hit rate, overall and per purpose."""
+
+    enabled: bool
+    # Application cache tier holding the entries (see /monitoring/cache)
+    tier: str
+    hits: int
+    misses: int
+    hit_rate: float
+    by_purpose: dict[str, dict[str, int]]
+
+
+class AICallStatsResponse(BaseModel):
+    """Concurrency limits, load and outcomes of model calls."""
+
+    max_concurrent: int
+    max_concurrent_per_user: int
+    timeout_seconds: float
+    rate_limit_retries: int
+    in_flight: int
+    peak_in_flight: int
+    active_users: int
+    calls: int
+    succeeded: int
+    failed: int
+    timed_out: int
+    rate_limited: int
+    retries: int
+
+
+class ApplicationCacheEntry(BaseModel):
+    """Counters of one application cache tier."""
+
+    size: int
+    maxsize: int
+    ttl: float
+    utilization: str
+    hits: int
+    misses: int
+    hit_rate: float
+    # Concurrent misses that reused another caller's computation
+    coalesced: int
+    # Backend calls that failed; those requests were computed uncached
+    errors: int = 0
+    evictions: int
+    expirations: int
+
+
+class ApplicationCacheStatsResponse(BaseModel):
+    """Application cache counters keyed by tier (short, medium, long, extended)."""
+
+    caches: dict[str, ApplicationCacheEntry]
@@ -0,0 +1,41 @@
+"""Background solver job status endpoints."""
+
+from fastapi import APIRouter, Depends, Query
+from sqlmodel import Session
+
+from humancompiler_api.auth import get_current_user_id
+from humancompiler_api.database import get_session
+from humancompiler_api.models import (
+    SolverJobListResponse,
+    SolverJobResponse,
+    SolverJobType,
+)
+from humancompiler_api.solver_job_service import solver_job_service
+
+router = APIRouter(prefix="/solver-jobs", tags=["solver-jobs"])
+
+
+@router.get("", response_model=SolverJobListResponse)
+async def list_solver_jobs(
+    job_type: SolverJobType | None = None,
+    limit: int = Query(20, ge=1, le=100),
+    user_id: str = Depends(get_current_user_id),
+    session: Session = Depends(get_session),
+) -> SolverJobListResponse:
+    """List the current user's most recent solver jobs."""
+    jobs = solver_job_service.list_jobs(session, user_id, job_type, limit)
+    return SolverJobListResponse(
+        jobs=[SolverJobResponse.from_db_model(job) for job in jobs],
+        total=len(jobs),
+    )
+
+
+@router.get("/{job_id}", response_model=SolverJobResponse)
+async def get_solver_job(
+    job_id: str,
+    user_id: str = Depends(get_current_user_id),
+    session: Session = Depends(get_session),
+) -> SolverJobResponse:
+    """Get progress and, once finished, the result of a solver job."""
+    job = solver_job_service.get_job(session, user_id, job_id)
+    return SolverJobResponse.from_db_model(job)
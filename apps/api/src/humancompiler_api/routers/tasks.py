@@ -13,6 +13,7 @@ from humancompiler_api.models import (
     TaskCreate,
     TaskResponse,
     TaskUpdate,
+    TaskDependencyBulkCreate,
     TaskDependencyCreate,
     TaskDependencyResponse,
     TaskDependencyTaskInfo,
@@ -196,6 +197,31 @@ async def delete_task(
     task_service.delete_task(session, task_id, current_user.user_id)
 
 
+@router.post(
+    "/dependencies/bulk",
+    response_model=list[TaskDependencyResponse],
+    status_code=status.HTTP_201_CREATED,
+    responses={
+        400: {"model": ErrorResponse, "description": "One or more invalid edges"},
+    },
+)
+async def add_task_dependencies_bulk(
+    bulk_data: TaskDependencyBulkCreate,
+    session: Annotated[Session, Depends(get_session)],
+    current_user: Annotated[AuthUser, Depends(get_current_user)],
+) -> list[TaskDependencyResponse]:
+    """Add many task dependencies; nothing is saved if any edge is invalid"""
+    dependencies = task_service.add_task_dependencies_bulk(
+        session, bulk_data.dependencies, current_user.user_id
+    )
+    logger.info(
+        "Added %d task dependencies for user %s",
+        len(dependencies),
+        current_user.user_id,
+    )
+    return [TaskDependencyResponse.model_validate(dep) for dep in dependencies]
+
+
 @router.post(
     "/{task_id}/dependencies",
     response_model=TaskDependencyResponse,
@@ -1,13 +1,15 @@
 """Timeline visualization API endpoints for project progress tracking"""
 
+import hashlib
 import logging
 from collections.abc import Awaitable, Callable
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 from typing import Any, TypeVar
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlmodel import Session, select
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import case
+from sqlmodel import Session, func, select
 from sqlalchemy.orm import selectinload
 
 from ..auth import get_current_user, AuthUser
@@ -17,7 +19,9 @@ from ..config import settings
 from ..models import (
     Project,
     Goal,
+    GoalDependency,
     Task,
+    TaskLogRollup,
     TaskStatus,
     GoalStatus,
     SortBy,
@@ -60,8 +64,100 @@ def conditional_rate_limit(rate: str) -> Callable[[F], F]:
     return decorator
 
 
+def _as_utc(value: datetime | None) -> datetime | None:
+    """Treat naive query datetimes as UTC for comparison with stored values"""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
+
+
+def _active_in_range(model, range_start: datetime | None, range_end: datetime | None):
+    """
+    Filter goals or tasks to those that overlap the requested range
+
+    Items created after the range, or finished (completed or cancelled) before
+    it, are left out. Missing bounds do not filter.
+    """
+    conditions = []
+    if range_end is not None:
+        conditions.append(model.created_at <= range_end)
+    if range_start is not None:
+        finished = model.status.in_(["completed", "cancelled"])
+        conditions.append(~(finished & (model.updated_at < range_start)))
+    return conditions
+
+
+def _timeline_etag(
+    session: Session,
+    project_ids,
+    request: Request,
+    start_date: datetime,
+    end_date: datetime,
+) -> str:
+    """
+    Fingerprint the rows a timeline response is built from
+
+    One aggregate query over row counts and latest modification times of the
+    projects, goals, goal dependencies, tasks and task log rollups involved,
+    hashed together with the query string and the resolved date range (the
+    defaults move with the current day). Any create, update or delete changes
+    a count or a timestamp, so equal tags mean an unchanged response.
+    """
+    goal_ids = select(Goal.id).where(Goal.project_id.in_(project_ids))
+    task_ids = select(Task.id).where(Task.goal_id.in_(goal_ids))
+    aggregates = [
+        (Project, Project.id.in_(project_ids), Project.updated_at),
+        (Goal, Goal.id.in_(goal_ids), Goal.updated_at),
+        (
+            GoalDependency,
+            GoalDependency.goal_id.in_(goal_ids),
+            GoalDependency.created_at,
+        ),
+        (Task, Task.id.in_(task_ids), Task.updated_at),
+        (TaskLogRollup, TaskLogRollup.task_id.in_(task_ids), TaskLogRollup.updated_at),
+    ]
+    columns = []
+    for model, condition, modified_at in aggregates:
+        columns.append(
+            select(func.count()).select_from(model).where(condition).scalar_subquery()
+        )
+        columns.append(select(func.max(modified_at)).where(condition).scalar_subquery())
+    columns.append(
+        select(func.sum(TaskLogRollup.actual_minutes))
+        .where(TaskLogRollup.task_id.in_(task_ids))
+        .scalar_subquery()
+    )
+    fingerprint = session.exec(select(*columns)).one()
+
+    digest = hashlib.sha256()
+    digest.update(request.url.path.encode())
+    digest.update(str(sorted(request.query_params.multi_items())).encode())
+    digest.update(f"{start_date.isoformat()}/{end_date.isoformat()}".encode())
+    digest.update(repr(tuple(str(value) for value in fingerprint)).encode())
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match header covers ``etag``"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    tags = [tag.strip().removeprefix("W/") for tag in header.split(",")]
+    return "*" in tags or etag in tags
+
+
+def _not_modified(etag: str) -> Response:
+    return Response(
+        status_code=304, headers={"ETag": etag, "Cache-Control": "private, no-cache"}
+    )
+
+
 @router.get("/projects/{project_id}", response_model=ProjectTimelineResponse)
 async def get_project_timeline(
+    request: Request,
+    response: Response,
     project_id: UUID,
     start_date: datetime = Query(None, description="Timeline start date"),
     end_date: datetime = Query(None, description="Timeline end date"),
@@ -123,6 +219,10 @@ async def get_project_timeline(
         raise HTTPException(status_code=500, detail=detail)
 
     try:
+        # Filter only by the bounds the caller asked for
+        range_start = _as_utc(start_date)
+        range_end = _as_utc(end_date)
+
         # Set default date range if not provided
         if not start_date:
             start_date = project.created_at.replace(
@@ -133,33 +233,48 @@ async def get_project_timeline(
                 hour=23, minute=59, second=59, microsecond=999999
             )
 
-        # Get all goals for the project with tasks, logs, and dependencies in a single query (fix N+1 problem)
+        # Unchanged timelines are answered before any goal or task is loaded
+        etag = _timeline_etag(session, [project_id], request, start_date, end_date)
+        if _etag_matches(request, etag):
+            return _not_modified(etag)
+
+        # Goals in range with their dependency edges
         goals_statement = (
             select(Goal)
-            .options(
-                selectinload(Goal.tasks).selectinload(Task.logs),
-                selectinload(Goal.dependencies),
-                selectinload(Goal.dependent_goals),
-            )
+            .options(selectinload(Goal.dependencies))
             .where(Goal.project_id == project_id)
+            .where(*_active_in_range(Goal, range_start, range_end))
         )
         goals = session.exec(goals_statement).all()
 
+        # Tasks in range with their log totals in one query; logs are not loaded
+        tasks_by_goal: dict[UUID, list[tuple[Task, int, int]]] = {}
+        if goals:
+            tasks_statement = (
+                select(
+                    Task,
+                    func.coalesce(TaskLogRollup.actual_minutes, 0),
+                    func.coalesce(TaskLogRollup.log_count, 0),
+                )
+                .outerjoin(TaskLogRollup, TaskLogRollup.task_id == Task.id)
+                .where(Task.goal_id.in_([goal.id for goal in goals]))
+                .where(*_active_in_range(Task, range_start, range_end))
+            )
+            for task, actual_minutes, logs_count in session.exec(tasks_statement):
+                tasks_by_goal.setdefault(task.goal_id, []).append(
+                    (task, actual_minutes, logs_count)
+                )
+
         goals_data: list[GoalTimelineData] = []
 
         for goal in goals:
-            # Use preloaded tasks from the relationship (N+1 problem fixed)
-            tasks = goal.tasks
-
             # Get dependency goal IDs
             dependency_ids = [str(dep.depends_on_goal_id) for dep in goal.dependencies]
 
             tasks_data: list[TaskTimelineData] = []
-            for task in tasks:
-                # Use preloaded logs from the relationship (N+1 problem fixed)
-                logs = task.logs
-
-                total_actual_minutes = sum(log.actual_minutes for log in logs)
+            for task, total_actual_minutes, logs_count in tasks_by_goal.get(
+                goal.id, []
+            ):
                 estimate_minutes = float(task.estimate_hours) * 60
                 progress_percentage = (
                     min((total_actual_minutes / estimate_minutes) * 100, 100)
@@ -183,7 +298,7 @@ async def get_project_timeline(
                         progress_percentage=round(progress_percentage, 1),
                         status_color=status_color,
                         actual_hours=round(total_actual_minutes / 60, 2),
-                        logs_count=len(logs),
+                        logs_count=logs_count,
                     )
                 )
 
@@ -209,6 +324,8 @@ async def get_project_timeline(
         # Sort goals by created_at for timeline display
         goals_data.sort(key=lambda x: x.created_at)
 
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = "private, no-cache"
         return ProjectTimelineResponse(
             project=ProjectInfo(
                 id=str(project.id),
@@ -243,6 +360,8 @@ async def get_project_timeline(
 
 @router.get("/overview", response_model=TimelineOverviewResponse)
 async def get_timeline_overview(
+    request: Request,
+    response: Response,
     start_date: datetime = Query(None, description="Timeline start date"),
     end_date: datetime = Query(None, description="Timeline end date"),
     current_user: AuthUser = Depends(get_current_user),
@@ -257,6 +376,10 @@ async def get_timeline_overview(
         logger.info(
             f"Getting timeline overview for user {current_user.user_id} ({current_user.email})"
         )
+        # Filter only by the bounds the caller asked for
+        range_start = _as_utc(start_date)
+        range_end = _as_utc(end_date)
+
         # Set default date range if not provided
         if not start_date:
             # Default to last 3 months
@@ -268,51 +391,62 @@ async def get_timeline_overview(
                 hour=23, minute=59, second=59, microsecond=999999
             )
 
-        # Get all projects for the user with goals and tasks preloaded (fix N+1 problem)
         # Convert user_id to UUID for proper comparison
         user_id = current_user.user_id
         if isinstance(user_id, str):
-            from uuid import UUID
-
             user_id = UUID(user_id)
 
-        projects_statement = (
-            select(Project)
-            .options(selectinload(Project.goals).selectinload(Goal.tasks))
-            .where(Project.owner_id == user_id)
-        )
-        projects = session.exec(projects_statement).all()
+        owned_projects = select(Project.id).where(Project.owner_id == user_id)
+        etag = _timeline_etag(session, owned_projects, request, start_date, end_date)
+        if _etag_matches(request, etag):
+            return _not_modified(etag)
+
+        projects = session.exec(
+            select(Project).where(Project.owner_id == user_id)
+        ).all()
 
         logger.info(f"Found {len(projects)} projects for user {current_user.user_id}")
 
         if len(projects) == 0:
             logger.warning(f"No projects found for user {current_user.user_id}")
 
-        projects_data: list[ProjectOverviewData] = []
-
-        for project in projects:
-            # Use preloaded goals from the relationship (N+1 problem fixed)
-            goals = project.goals
-
-            total_goals = len(goals)
-            completed_goals = len(
-                [g for g in goals if g.status == GoalStatus.COMPLETED]
+        # Goal and task counts per project, grouped in SQL
+        goal_counts = {
+            project_id: (total, completed, in_progress)
+            for project_id, total, completed, in_progress in session.exec(
+                select(
+                    Goal.project_id,
+                    func.count(Goal.id),
+                    *_status_counts(Goal, GoalStatus.COMPLETED, GoalStatus.IN_PROGRESS),
+                )
+                .where(Goal.project_id.in_(owned_projects))
+                .where(*_active_in_range(Goal, range_start, range_end))
+                .group_by(Goal.project_id)
             )
-            in_progress_goals = len(
-                [g for g in goals if g.status == GoalStatus.IN_PROGRESS]
+        }
+        task_counts = {
+            project_id: (total, completed, in_progress)
+            for project_id, total, completed, in_progress in session.exec(
+                select(
+                    Goal.project_id,
+                    func.count(Task.id),
+                    *_status_counts(Task, TaskStatus.COMPLETED, TaskStatus.IN_PROGRESS),
+                )
+                .join(Goal, Task.goal_id == Goal.id)
+                .where(Goal.project_id.in_(owned_projects))
+                .where(*_active_in_range(Task, range_start, range_end))
+                .group_by(Goal.project_id)
             )
+        }
 
-            # Get all tasks for this project from preloaded relationships (N+1 problem fixed)
-            all_tasks = []
-            for goal in goals:
-                all_tasks.extend(goal.tasks)
+        projects_data: list[ProjectOverviewData] = []
 
-            total_tasks = len(all_tasks)
-            completed_tasks = len(
-                [t for t in all_tasks if t.status == TaskStatus.COMPLETED]
+        for project in projects:
+            total_goals, completed_goals, in_progress_goals = goal_counts.get(
+                project.id, (0, 0, 0)
             )
-            in_progress_tasks = len(
-                [t for t in all_tasks if t.status == TaskStatus.IN_PROGRESS]
+            total_tasks, completed_tasks, in_progress_tasks = task_counts.get(
+                project.id, (0, 0, 0)
             )
 
             projects_data.append(
@@ -347,6 +481,9 @@ async def get_timeline_overview(
         # Sort projects by updated_at (most recent first)
         projects_data.sort(key=lambda x: x.updated_at, reverse=True)
 
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = "private, no-cache"
+
         return TimelineOverviewResponse(
             timeline=TimelineOverviewInfo(
                 start_date=start_date.isoformat(),
@@ -369,6 +506,14 @@ async def get_timeline_overview(
         raise HTTPException(status_code=500, detail=detail)
 
 
+def _status_counts(model, *statuses) -> list:
+    """COUNT of rows per status, as columns for a grouped query"""
+    return [
+        func.coalesce(func.sum(case((model.status == value, 1), else_=0)), 0)
+        for value in statuses
+    ]
+
+
 def _get_status_color(status: TaskStatus, progress_percentage: float) -> str:
     """
     Get color code for task status visualization
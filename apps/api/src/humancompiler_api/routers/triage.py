@@ -49,7 +49,7 @@ async def create_triage_run(
 ) -> TriageRunResponse:
     """Generate a manual triage run."""
     request = request or TriageRunCreateRequest()
-    return triage_service.create_run(
+    return await triage_service.create_run(
         session,
         user_id,
         source=TriageRunSource.MANUAL,
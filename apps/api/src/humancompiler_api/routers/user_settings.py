@@ -76,20 +76,22 @@ async def validate_openai_api_key(api_key: str) -> bool:
     logging.getLogger("httpx").setLevel(logging.WARNING)
     logging.getLogger("openai").setLevel(logging.WARNING)
 
+    from humancompiler_api.ai.client_registry import openai_client_registry
+
     try:
-        client = openai.OpenAI(
-            api_key=api_key,
+        client = openai_client_registry.get(api_key).with_options(
             timeout=10.0,  # Add timeout to prevent hanging
         )
         # Make a lightweight API call to validate the key
-        client.chat.completions.create(
+        await client.chat.completions.create(
             model="gpt-3.5-turbo",  # Use a lightweight model for validation
             messages=[{"role": "system", "content": "ping"}],  # Minimal input
             max_completion_tokens=1,  # Limit response size
         )
         return True
     except openai.AuthenticationError:
-        # Invalid API key
+        # Invalid API key; don't keep a client around for it
+        openai_client_registry.discard(api_key)
         return False
     except openai.RateLimitError:
         # API key is valid but rate limited - still consider valid
@@ -7,15 +7,28 @@ during the work_type feature implementation.
 """
 
 import logging
+import time
+import uuid
+import zlib
+from dataclasses import dataclass, field
 from datetime import datetime, UTC
 from typing import Any
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
 from pathlib import Path
+import gzip
 import json
 
-from sqlmodel import Session, select, text
-from sqlalchemy import inspect
+from pydantic import ValidationError
+from sqlmodel import Session, SQLModel, select, text
+from sqlalchemy import insert, inspect
 
+from core.cache import (
+    CACHE_TAG_GOALS,
+    CACHE_TAG_LOGS,
+    CACHE_TAG_PROJECTS,
+    CACHE_TAG_TASKS,
+    invalidate_user_cache,
+)
 from humancompiler_api.database import db
 from humancompiler_api.models import (
     User,
@@ -44,6 +57,202 @@ class SafeMigrationError(Exception):
     pass
 
 
+# Format version written for each user backup format
+USER_BACKUP_FORMATS = {"json": "2.0", "ndjson": "3.0"}
+
+# Backup sections and their models, parents before children
+USER_BACKUP_SECTIONS: list[tuple[str, type[SQLModel]]] = [
+    ("users", User),
+    ("projects", Project),
+    ("goals", Goal),
+    ("tasks", Task),
+    ("quick_tasks", QuickTask),
+    ("schedules", Schedule),
+    ("weekly_schedules", WeeklySchedule),
+    ("weekly_recurring_tasks", WeeklyRecurringTask),
+    ("logs", Log),
+    ("user_settings", UserSettings),
+    ("triage_capacity_settings", TriageCapacitySettings),
+    ("task_triage_runs", TaskTriageRun),
+    ("task_triage_items", TaskTriageItem),
+    ("goal_dependencies", GoalDependency),
+    ("task_dependencies", TaskDependency),
+]
+
+
+def _user_backup_queries(owner_id: uuid.UUID) -> list[tuple[str, Any]]:
+    """Backup sections and the queries selecting the user's rows, parents first"""
+    project_ids = select(Project.id).where(Project.owner_id == owner_id)
+    goal_ids = select(Goal.id).where(Goal.project_id.in_(project_ids))
+    task_ids = select(Task.id).where(Task.goal_id.in_(goal_ids))
+    triage_run_ids = select(TaskTriageRun.id).where(TaskTriageRun.user_id == owner_id)
+
+    return [
+        ("users", select(User).where(User.id == owner_id)),
+        ("projects", select(Project).where(Project.owner_id == owner_id)),
+        ("goals", select(Goal).where(Goal.project_id.in_(project_ids))),
+        ("tasks", select(Task).where(Task.goal_id.in_(goal_ids))),
+        ("quick_tasks", select(QuickTask).where(QuickTask.owner_id == owner_id)),
+        ("schedules", select(Schedule).where(Schedule.user_id == owner_id)),
+        (
+            "weekly_schedules",
+            select(WeeklySchedule).where(WeeklySchedule.user_id == owner_id),
+        ),
+        (
+            "weekly_recurring_tasks",
+            select(WeeklyRecurringTask).where(WeeklyRecurringTask.user_id == owner_id),
+        ),
+        ("logs", select(Log).where(Log.task_id.in_(task_ids))),
+        ("user_settings", select(UserSettings).where(UserSettings.user_id == owner_id)),
+        (
+            "triage_capacity_settings",
+            select(TriageCapacitySettings).where(
+                TriageCapacitySettings.user_id == owner_id
+            ),
+        ),
+        (
+            "task_triage_runs",
+            select(TaskTriageRun).where(TaskTriageRun.user_id == owner_id),
+        ),
+        (
+            "task_triage_items",
+            select(TaskTriageItem).where(TaskTriageItem.run_id.in_(triage_run_ids)),
+        ),
+        (
+            "goal_dependencies",
+            select(GoalDependency).where(
+                GoalDependency.goal_id.in_(goal_ids)
+                | GoalDependency.depends_on_goal_id.in_(goal_ids)
+            ),
+        ),
+        (
+            "task_dependencies",
+            select(TaskDependency).where(
+                TaskDependency.task_id.in_(task_ids)
+                | TaskDependency.depends_on_task_id.in_(task_ids)
+            ),
+        ),
+    ]
+
+
+def gzip_chunks(chunks: Iterable[str | bytes]) -> Iterator[bytes]:
+    """Compress a stream of chunks into gzip data as it is produced"""
+    compressor = zlib.compressobj(wbits=31)  # gzip container
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode("utf-8")
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+# Sections a JSON backup document must contain
+REQUIRED_BACKUP_SECTIONS = ("users", "projects", "goals", "tasks", "metadata")
+
+
+def iter_user_backup(backup_file: Path) -> Iterator[tuple[str, Any]]:
+    """
+    Read a user backup entry by entry, in any supported format
+
+    Yields ``("metadata", dict)`` first and then ``(section, row)`` for every
+    record. NDJSON files (plain or gzip-compressed) are read one line at a
+    time and end with ``("summary", dict)``; a missing summary line means a
+    truncated file and raises. JSON documents have no streaming parser here
+    and are loaded whole; their known sections come out parents first.
+    """
+    with open(backup_file, "rb") as f:
+        compressed = f.read(2) == b"\x1f\x8b"
+    opener = gzip.open if compressed else open
+    with opener(backup_file, "rt", encoding="utf-8") as f:
+        first_line = f.readline()
+        try:
+            header = json.loads(first_line)
+        except json.JSONDecodeError:
+            header = None
+
+        if not (isinstance(header, dict) and header.get("type") == "metadata"):
+            document = json.loads(first_line + f.read())
+            metadata = document.get("metadata", {})
+            if metadata.get("backup_type") != "user_specific":
+                raise SafeMigrationError(
+                    "This backup file is not a user-specific backup"
+                )
+            missing = [key for key in REQUIRED_BACKUP_SECTIONS if key not in document]
+            if missing:
+                raise SafeMigrationError(
+                    f"Invalid backup file. Missing sections: {', '.join(missing)}"
+                )
+            yield "metadata", metadata
+            known = [section for section, _ in USER_BACKUP_SECTIONS]
+            other = [key for key in document if key not in known and key != "metadata"]
+            for section in known + other:
+                for row in document.get(section) or []:
+                    yield section, row
+            return
+
+        if header.get("backup_type") != "user_specific":
+            raise SafeMigrationError("This backup file is not a user-specific backup")
+        yield "metadata", {key: value for key, value in header.items() if key != "type"}
+
+        summary = None
+        for line_number, line in enumerate(f, start=2):
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            if summary is not None:
+                raise SafeMigrationError(
+                    f"Unexpected entry after the summary on line {line_number}"
+                )
+            if entry.get("type") == "record":
+                yield entry.get("section"), entry.get("data")
+            elif entry.get("type") == "summary":
+                summary = entry
+            else:
+                raise SafeMigrationError(
+                    f"Unexpected entry on line {line_number} of the backup"
+                )
+        if summary is None:
+            raise SafeMigrationError("Backup is incomplete: summary line missing")
+        yield "summary", summary
+
+
+def load_user_backup(backup_file: Path) -> dict[str, Any]:
+    """Read a user backup in any supported format into one document"""
+    backup_data: dict[str, Any] = {section: [] for section, _ in USER_BACKUP_SECTIONS}
+    metadata: dict[str, Any] = {}
+    for section, entry in iter_user_backup(backup_file):
+        if section == "metadata":
+            metadata = entry
+        elif section == "summary":
+            metadata["total_records"] = entry.get("total_records", {})
+        else:
+            backup_data.setdefault(section, []).append(entry)
+    backup_data["metadata"] = metadata
+    return backup_data
+
+
+@dataclass
+class ImportReport:
+    """Outcome of importing a user backup"""
+
+    dry_run: bool
+    metadata: dict[str, Any] = field(default_factory=dict)
+    imported: dict[str, int] = field(default_factory=dict)
+    skipped: dict[str, int] = field(default_factory=dict)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def total_rows(self) -> int:
+        return sum(self.imported.values())
+
+    @property
+    def rows_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return round(self.total_rows / self.elapsed_seconds, 1)
+
+
 class DataBackupManager:
     """Manages database backups before schema changes"""
 
@@ -239,7 +448,7 @@ class DataBackupManager:
             raise SafeMigrationError(f"Backup restoration failed: {e}")
 
     def create_user_backup(self, user_id: str, backup_name: str | None = None) -> str:
-        """Create a backup of all data for a specific user"""
+        """Create a backup file of all data for a specific user"""
         if not backup_name:
             timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
             backup_name = f"user_{user_id}_backup_{timestamp}"
@@ -247,188 +456,16 @@ class DataBackupManager:
         backup_path = self.backup_dir / f"{backup_name}.json"
 
         try:
-            engine = db.get_engine()
-            backup_data = {}
-
-            with Session(engine) as session:
-                # Backup user data
-                user = session.exec(select(User).where(User.id == user_id)).first()
-                if not user:
-                    raise SafeMigrationError(f"User not found: {user_id}")
-                backup_data["users"] = [user.model_dump()]
-
-                # Backup user's projects
-                projects = session.exec(
-                    select(Project).where(Project.owner_id == user_id)
-                ).all()
-                backup_data["projects"] = [project.model_dump() for project in projects]
-
-                # Get project IDs for related data
-                project_ids = [p.id for p in projects]
-
-                # Backup goals related to user's projects
-                goals = []
-                if project_ids:
-                    goals = session.exec(
-                        select(Goal).where(Goal.project_id.in_(project_ids))
-                    ).all()
-                backup_data["goals"] = [goal.model_dump() for goal in goals]
-
-                # Get goal IDs for related data
-                goal_ids = [g.id for g in goals]
-
-                # Backup tasks related to user's goals
-                tasks = []
-                if goal_ids:
-                    tasks = session.exec(
-                        select(Task).where(Task.goal_id.in_(goal_ids))
-                    ).all()
-                backup_data["tasks"] = [task.model_dump() for task in tasks]
-
-                # Get task IDs for related data
-                task_ids = [t.id for t in tasks]
-
-                # Backup user's quick tasks
-                quick_tasks = session.exec(
-                    select(QuickTask).where(QuickTask.owner_id == user_id)
-                ).all()
-                backup_data["quick_tasks"] = [
-                    quick_task.model_dump() for quick_task in quick_tasks
-                ]
-
-                # Backup user's schedules
-                schedules = session.exec(
-                    select(Schedule).where(Schedule.user_id == user_id)
-                ).all()
-                backup_data["schedules"] = [
-                    schedule.model_dump() for schedule in schedules
-                ]
-
-                # Backup user's weekly schedules
-                weekly_schedules = session.exec(
-                    select(WeeklySchedule).where(WeeklySchedule.user_id == user_id)
-                ).all()
-                backup_data["weekly_schedules"] = [
-                    ws.model_dump() for ws in weekly_schedules
-                ]
-
-                # Backup user's weekly recurring tasks
-                weekly_recurring_tasks = session.exec(
-                    select(WeeklyRecurringTask).where(
-                        WeeklyRecurringTask.user_id == user_id
-                    )
-                ).all()
-                backup_data["weekly_recurring_tasks"] = [
-                    wrt.model_dump() for wrt in weekly_recurring_tasks
-                ]
-
-                # Backup logs for user's tasks
-                logs = []
-                if task_ids:
-                    logs = session.exec(
-                        select(Log).where(Log.task_id.in_(task_ids))
-                    ).all()
-                backup_data["logs"] = [log.model_dump() for log in logs]
-
-                # Backup user settings
-                user_settings = session.exec(
-                    select(UserSettings).where(UserSettings.user_id == user_id)
-                ).all()
-                backup_data["user_settings"] = [us.model_dump() for us in user_settings]
-
-                # Backup user's capacity triage data
-                triage_settings = session.exec(
-                    select(TriageCapacitySettings).where(
-                        TriageCapacitySettings.user_id == user_id
-                    )
-                ).all()
-                backup_data["triage_capacity_settings"] = [
-                    row.model_dump() for row in triage_settings
-                ]
-                triage_runs = session.exec(
-                    select(TaskTriageRun).where(TaskTriageRun.user_id == user_id)
-                ).all()
-                backup_data["task_triage_runs"] = [
-                    row.model_dump() for row in triage_runs
-                ]
-                triage_run_ids = [row.id for row in triage_runs]
-                triage_items = []
-                if triage_run_ids:
-                    triage_items = session.exec(
-                        select(TaskTriageItem).where(
-                            TaskTriageItem.run_id.in_(triage_run_ids)
-                        )
-                    ).all()
-                backup_data["task_triage_items"] = [
-                    row.model_dump() for row in triage_items
-                ]
-
-                # Backup user's API usage logs
-
-                # Backup goal dependencies for user's goals
-                goal_dependencies = []
-                if goal_ids:
-                    goal_dependencies = session.exec(
-                        select(GoalDependency).where(
-                            (GoalDependency.goal_id.in_(goal_ids))
-                            | (GoalDependency.depends_on_goal_id.in_(goal_ids))
-                        )
-                    ).all()
-                backup_data["goal_dependencies"] = [
-                    gd.model_dump() for gd in goal_dependencies
-                ]
-
-                # Backup task dependencies for user's tasks
-                task_dependencies = []
-                if task_ids:
-                    task_dependencies = session.exec(
-                        select(TaskDependency).where(
-                            (TaskDependency.task_id.in_(task_ids))
-                            | (TaskDependency.depends_on_task_id.in_(task_ids))
-                        )
-                    ).all()
-                backup_data["task_dependencies"] = [
-                    td.model_dump() for td in task_dependencies
-                ]
-
-                # Add metadata
-                backup_data["metadata"] = {
-                    "created_at": datetime.now(UTC).isoformat(),
-                    "version": "2.0",
-                    "backup_type": "user_specific",
-                    "user_id": user_id,
-                    "total_records": {
-                        "users": len(backup_data["users"]),
-                        "projects": len(backup_data["projects"]),
-                        "goals": len(backup_data["goals"]),
-                        "tasks": len(backup_data["tasks"]),
-                        "quick_tasks": len(backup_data["quick_tasks"]),
-                        "schedules": len(backup_data["schedules"]),
-                        "weekly_schedules": len(backup_data["weekly_schedules"]),
-                        "weekly_recurring_tasks": len(
-                            backup_data["weekly_recurring_tasks"]
-                        ),
-                        "logs": len(backup_data["logs"]),
-                        "user_settings": len(backup_data["user_settings"]),
-                        "triage_capacity_settings": len(
-                            backup_data["triage_capacity_settings"]
-                        ),
-                        "task_triage_runs": len(backup_data["task_triage_runs"]),
-                        "task_triage_items": len(backup_data["task_triage_items"]),
-                        "goal_dependencies": len(backup_data["goal_dependencies"]),
-                        "task_dependencies": len(backup_data["task_dependencies"]),
-                    },
-                }
-
-            # Write backup file
+            total_records: dict[str, int] = {}
+            chunks = self.stream_user_backup(user_id, total_records=total_records)
             with open(backup_path, "w", encoding="utf-8") as f:
-                json.dump(backup_data, f, indent=2, default=str, ensure_ascii=False)
+                f.writelines(chunks)
 
             logger.info(f"✅ User backup created: {backup_path}")
             logger.info(f"   User ID: {user_id}")
-            logger.info(f"   Projects: {len(backup_data['projects'])}")
-            logger.info(f"   Goals: {len(backup_data['goals'])}")
-            logger.info(f"   Tasks: {len(backup_data['tasks'])}")
+            logger.info(f"   Projects: {total_records['projects']}")
+            logger.info(f"   Goals: {total_records['goals']}")
+            logger.info(f"   Tasks: {total_records['tasks']}")
 
             return str(backup_path)
 
@@ -436,229 +473,359 @@ class DataBackupManager:
             logger.error(f"❌ Failed to create user backup: {e}")
             raise SafeMigrationError(f"User backup creation failed: {e}")
 
-    def restore_user_data(self, backup_path: str, target_user_id: str) -> None:
-        """Restore user data from a backup file, merging with existing data"""
+    def stream_user_backup(
+        self,
+        user_id: str,
+        export_format: str = "json",
+        chunk_size: int = 500,
+        total_records: dict[str, int] | None = None,
+    ) -> Iterator[str]:
+        """
+        Stream all data of a user as backup text, table by table
+
+        ``json`` produces the same document as earlier backups, with the
+        metadata section last; ``ndjson`` writes one record per line between
+        a metadata line and a summary line with the record counts. Rows are
+        fetched ``chunk_size`` at a time with a server-side cursor, so memory
+        use does not grow with the user's data.
+
+        The user is checked before the first chunk is produced, so callers
+        can still report a missing user as an error. ``total_records`` is
+        filled in as the sections are written.
+        """
+        if export_format not in USER_BACKUP_FORMATS:
+            raise SafeMigrationError(f"Unsupported backup format: {export_format}")
+
+        try:
+            owner_id = uuid.UUID(str(user_id))
+        except ValueError:
+            raise SafeMigrationError(f"User not found: {user_id}")
+
+        with Session(db.get_engine()) as session:
+            if session.get(User, owner_id) is None:
+                raise SafeMigrationError(f"User not found: {user_id}")
+
+        return self._iter_user_backup(
+            owner_id,
+            export_format,
+            chunk_size,
+            total_records if total_records is not None else {},
+        )
+
+    def _iter_user_backup(
+        self,
+        owner_id: uuid.UUID,
+        export_format: str,
+        chunk_size: int,
+        total_records: dict[str, int],
+    ) -> Iterator[str]:
+        metadata = {
+            "created_at": datetime.now(UTC).isoformat(),
+            "version": USER_BACKUP_FORMATS[export_format],
+            "backup_type": "user_specific",
+            "user_id": str(owner_id),
+        }
+        ndjson = export_format == "ndjson"
+
+        def dump(value: Any) -> str:
+            return json.dumps(value, default=str, ensure_ascii=False)
+
+        if ndjson:
+            yield dump({"type": "metadata", **metadata}) + "\n"
+        else:
+            yield "{"
+
+        with Session(db.get_engine()) as session:
+            for index, (section, statement) in enumerate(
+                _user_backup_queries(owner_id)
+            ):
+                if not ndjson:
+                    yield f"{',' if index else ''}\n{dump(section)}: ["
+
+                count = 0
+                buffer: list[str] = []
+                rows = session.exec(statement.execution_options(yield_per=chunk_size))
+                for row in rows:
+                    data = row.model_dump()
+                    # Rows already written are not needed again
+                    session.expunge(row)
+                    if ndjson:
+                        record = {"type": "record", "section": section, "data": data}
+                        buffer.append(dump(record) + "\n")
+                    else:
+                        buffer.append(f"{',' if count else ''}\n  {dump(data)}")
+                    count += 1
+                    if len(buffer) >= chunk_size:
+                        yield "".join(buffer)
+                        buffer.clear()
+                if buffer:
+                    yield "".join(buffer)
+
+                total_records[section] = count
+                if not ndjson:
+                    yield "\n]"
+
+        if ndjson:
+            yield dump({"type": "summary", "total_records": total_records}) + "\n"
+        else:
+            metadata["total_records"] = total_records
+            yield f',\n"metadata": {dump(metadata)}\n}}\n'
+
+    def restore_user_data(
+        self,
+        backup_path: str,
+        target_user_id: str,
+        dry_run: bool = False,
+        batch_size: int = 1000,
+    ) -> ImportReport:
+        """
+        Import a user backup into ``target_user_id``'s account as new rows
+
+        The file is read twice. The first pass validates every record against
+        its model without touching the database, so a bad file is rejected
+        before anything is written. The second pass gives every row a new ID,
+        rewrites references to the new IDs, and inserts each section, parents
+        first, in executemany batches of ``batch_size`` within one
+        transaction. With ``dry_run`` the second pass runs and is rolled back,
+        which reports what would be imported.
+
+        Only NDJSON files are streamed; a JSON document is loaded whole on
+        each pass (see ``iter_user_backup``).
+        """
         backup_file = Path(backup_path)
         if not backup_file.exists():
             raise SafeMigrationError(f"Backup file not found: {backup_path}")
 
         try:
-            import uuid
-
-            with open(backup_file, encoding="utf-8") as f:
-                backup_data = json.load(f)
-
-            # Validate backup data structure
-            metadata = backup_data.get("metadata", {})
-            if metadata.get("backup_type") != "user_specific":
-                raise SafeMigrationError(
-                    "This backup file is not a user-specific backup"
+            started = time.perf_counter()
+            metadata = self._validate_user_backup(backup_file)
+            report = ImportReport(dry_run=dry_run, metadata=metadata)
+
+            owner_id = uuid.UUID(str(target_user_id))
+            with Session(db.get_engine()) as session:
+                self._insert_user_backup(
+                    session, backup_file, owner_id, report, batch_size
+                )
+                if dry_run:
+                    session.rollback()
+                else:
+                    # Imported rows bypass the services; rebuild their totals.
+                    # The first reconcile commits the import with its rollups.
+                    from humancompiler_api.progress_rollups import (
+                        reconcile_progress_rollups,
+                    )
+                    from humancompiler_api.task_rollups import reconcile_task_rollups
+
+                    reconcile_task_rollups(session, owner_id=owner_id)
+                    reconcile_progress_rollups(session, owner_id=owner_id)
+            if not dry_run:
+                invalidate_user_cache(
+                    owner_id,
+                    CACHE_TAG_PROJECTS,
+                    CACHE_TAG_GOALS,
+                    CACHE_TAG_TASKS,
+                    CACHE_TAG_LOGS,
                 )
+            report.elapsed_seconds = time.perf_counter() - started
 
-            engine = db.get_engine()
+            action = "validated (dry run)" if dry_run else "restored"
+            logger.info(f"✅ User data {action} from: {backup_path}")
+            logger.info(f"   Target user: {target_user_id}")
+            logger.info(
+                f"   Rows: {report.total_rows} in {report.elapsed_seconds:.2f}s "
+                f"({report.rows_per_second} rows/s)"
+            )
+            logger.info(f"   Imported: {report.imported}")
+            if report.skipped:
+                logger.info(f"   Skipped: {report.skipped}")
 
-            with Session(engine) as session:
-                # Maps to track ID conversions
-                project_id_map = {}
-                goal_id_map = {}
-                task_id_map = {}
-                quick_task_id_map = {}
-                triage_run_id_map = {}
-
-                # Import projects with new IDs
-                for project_data in backup_data.get("projects", []):
-                    old_project_id = project_data["id"]
-                    new_project_id = str(uuid.uuid4())
-                    project_id_map[old_project_id] = new_project_id
-
-                    project_data["id"] = new_project_id
-                    project_data["owner_id"] = target_user_id
+            return report
 
-                    project = Project(**project_data)
-                    session.add(project)
+        except SafeMigrationError:
+            raise
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            raise SafeMigrationError(f"Invalid JSON format: {e}")
+        except Exception as e:
+            logger.error(f"❌ Failed to restore user data: {e}")
+            raise SafeMigrationError(f"User data restoration failed: {e}")
 
-                # Import goals with new IDs and updated project references
-                for goal_data in backup_data.get("goals", []):
-                    old_goal_id = goal_data["id"]
-                    new_goal_id = str(uuid.uuid4())
-                    goal_id_map[old_goal_id] = new_goal_id
+    def _validate_user_backup(self, backup_file: Path) -> dict[str, Any]:
+        """Check every record of a backup in one streaming pass"""
+        models = dict(USER_BACKUP_SECTIONS)
+        order = {
+            section: index for index, (section, _) in enumerate(USER_BACKUP_SECTIONS)
+        }
+        counts: dict[str, int] = {}
+        metadata: dict[str, Any] = {}
+        last_index = 0
 
-                    goal_data["id"] = new_goal_id
-                    goal_data["project_id"] = project_id_map.get(
-                        goal_data["project_id"]
+        for section, entry in iter_user_backup(backup_file):
+            if section == "metadata":
+                metadata = entry
+                continue
+            if section == "summary":
+                expected = entry.get("total_records", {})
+                mismatched = [
+                    name
+                    for name in set(expected) | set(counts)
+                    if expected.get(name, 0) != counts.get(name, 0)
+                ]
+                if mismatched:
+                    raise SafeMigrationError(
+                        "Backup record counts do not match its summary: "
+                        f"{', '.join(sorted(mismatched))}"
                     )
+                continue
 
-                    if goal_data["project_id"]:  # Only add if project exists
-                        goal = Goal(**goal_data)
-                        session.add(goal)
-
-                # Import tasks with new IDs and updated goal references
-                for task_data in backup_data.get("tasks", []):
-                    old_task_id = task_data["id"]
-                    new_task_id = str(uuid.uuid4())
-                    task_id_map[old_task_id] = new_task_id
-
-                    task_data["id"] = new_task_id
-                    task_data["goal_id"] = goal_id_map.get(task_data["goal_id"])
-
-                    if task_data["goal_id"]:  # Only add if goal exists
-                        task = Task(**task_data)
-                        session.add(task)
-
-                # Import quick tasks with new IDs and updated user reference
-                for quick_task_data in backup_data.get("quick_tasks", []):
-                    old_quick_task_id = quick_task_data["id"]
-                    new_quick_task_id = str(uuid.uuid4())
-                    quick_task_id_map[old_quick_task_id] = new_quick_task_id
-
-                    quick_task_data["id"] = new_quick_task_id
-                    quick_task_data["owner_id"] = target_user_id
-
-                    quick_task = QuickTask(**quick_task_data)
-                    session.add(quick_task)
-
-                # Import schedules with new IDs and updated user reference
-                for schedule_data in backup_data.get("schedules", []):
-                    schedule_data["id"] = str(uuid.uuid4())
-                    schedule_data["user_id"] = target_user_id
-
-                    schedule = Schedule(**schedule_data)
-                    session.add(schedule)
-
-                # Import weekly schedules with new IDs and updated user reference
-                for ws_data in backup_data.get("weekly_schedules", []):
-                    ws_data["id"] = str(uuid.uuid4())
-                    ws_data["user_id"] = target_user_id
-
-                    weekly_schedule = WeeklySchedule(**ws_data)
-                    session.add(weekly_schedule)
-
-                # Import weekly recurring tasks with new IDs and updated user reference
-                for wrt_data in backup_data.get("weekly_recurring_tasks", []):
-                    wrt_data["id"] = str(uuid.uuid4())
-                    wrt_data["user_id"] = target_user_id
-
-                    weekly_recurring_task = WeeklyRecurringTask(**wrt_data)
-                    session.add(weekly_recurring_task)
-
-                # Import logs with new IDs and updated task references
-                for log_data in backup_data.get("logs", []):
-                    log_data["id"] = str(uuid.uuid4())
-                    log_data["task_id"] = task_id_map.get(log_data["task_id"])
-
-                    if log_data["task_id"]:  # Only add if task exists
-                        log = Log(**log_data)
-                        session.add(log)
-
-                # Import user settings (skip if already exists)
-                for us_data in backup_data.get("user_settings", []):
-                    us_data["id"] = str(uuid.uuid4())
-                    us_data["user_id"] = target_user_id
-
-                    # Check if user settings already exist
-                    existing_us = session.exec(
-                        select(UserSettings).where(
-                            UserSettings.user_id == target_user_id
-                        )
-                    ).first()
-
-                    if not existing_us:
-                        user_settings = UserSettings(**us_data)
-                        session.add(user_settings)
-
-                # Import triage capacity settings (skip if already exists)
-                for triage_settings_data in backup_data.get(
-                    "triage_capacity_settings", []
-                ):
-                    triage_settings_data["id"] = str(uuid.uuid4())
-                    triage_settings_data["user_id"] = target_user_id
-
-                    existing_triage_settings = session.exec(
-                        select(TriageCapacitySettings).where(
-                            TriageCapacitySettings.user_id == target_user_id
-                        )
-                    ).first()
-                    if not existing_triage_settings:
-                        triage_settings = TriageCapacitySettings(**triage_settings_data)
-                        session.add(triage_settings)
-
-                # Import triage runs and items with updated references
-                for run_data in backup_data.get("task_triage_runs", []):
-                    old_run_id = run_data["id"]
-                    new_run_id = str(uuid.uuid4())
-                    triage_run_id_map[old_run_id] = new_run_id
-                    run_data["id"] = new_run_id
-                    run_data["user_id"] = target_user_id
-                    triage_run = TaskTriageRun(**run_data)
-                    session.add(triage_run)
-
-                for item_data in backup_data.get("task_triage_items", []):
-                    item_data["id"] = str(uuid.uuid4())
-                    item_data["run_id"] = triage_run_id_map.get(item_data["run_id"])
-                    if not item_data["run_id"]:
-                        continue
-
-                    if item_data.get("task_id"):
-                        item_data["task_id"] = task_id_map.get(item_data["task_id"])
-                    if item_data.get("quick_task_id"):
-                        item_data["quick_task_id"] = quick_task_id_map.get(
-                            item_data["quick_task_id"]
-                        )
-
-                    if item_data.get("item_type") == "task" and not item_data.get(
-                        "task_id"
-                    ):
-                        continue
-                    if item_data.get("item_type") == "quick_task" and not item_data.get(
-                        "quick_task_id"
-                    ):
-                        continue
-
-                    if item_data.get("project_id"):
-                        item_data["project_id"] = project_id_map.get(
-                            item_data["project_id"]
-                        )
-                    if item_data.get("goal_id"):
-                        item_data["goal_id"] = goal_id_map.get(item_data["goal_id"])
-
-                    triage_item = TaskTriageItem(**item_data)
-                    session.add(triage_item)
-
-                # Import goal dependencies with updated references
-                for gd_data in backup_data.get("goal_dependencies", []):
-                    gd_data["id"] = str(uuid.uuid4())
-                    gd_data["goal_id"] = goal_id_map.get(gd_data["goal_id"])
-                    gd_data["depends_on_goal_id"] = goal_id_map.get(
-                        gd_data["depends_on_goal_id"]
-                    )
+            counts[section] = counts.get(section, 0) + 1
+            model = models.get(section)
+            if model is None:
+                # Sections of older backups that are no longer imported
+                continue
+            if order[section] < last_index:
+                raise SafeMigrationError(
+                    f"Section {section} appears after the sections that depend on it"
+                )
+            last_index = order[section]
 
-                    if gd_data["goal_id"] and gd_data["depends_on_goal_id"]:
-                        goal_dependency = GoalDependency(**gd_data)
-                        session.add(goal_dependency)
+            if not isinstance(entry, dict) or not entry.get("id"):
+                raise SafeMigrationError(
+                    f"Invalid {section} record #{counts[section]}: missing id"
+                )
+            try:
+                model.model_validate(entry)
+            except ValidationError as e:
+                raise SafeMigrationError(
+                    f"Invalid {section} record #{counts[section]}: "
+                    f"{e.error_count()} validation error(s), "
+                    f"first: {e.errors()[0]['loc']} {e.errors()[0]['msg']}"
+                )
 
-                # Import task dependencies with updated references
-                for td_data in backup_data.get("task_dependencies", []):
-                    td_data["id"] = str(uuid.uuid4())
-                    td_data["task_id"] = task_id_map.get(td_data["task_id"])
-                    td_data["depends_on_task_id"] = task_id_map.get(
-                        td_data["depends_on_task_id"]
-                    )
+        return metadata
 
-                    if td_data["task_id"] and td_data["depends_on_task_id"]:
-                        task_dependency = TaskDependency(**td_data)
-                        session.add(task_dependency)
+    def _insert_user_backup(
+        self,
+        session: Session,
+        backup_file: Path,
+        owner_id: uuid.UUID,
+        report: ImportReport,
+        batch_size: int,
+    ) -> None:
+        """Remap and insert all records of a validated backup without committing"""
+        models = dict(USER_BACKUP_SECTIONS)
+        # Old ID -> new ID for the sections other rows refer to
+        id_maps: dict[str, dict[str, uuid.UUID]] = {
+            "projects": {},
+            "goals": {},
+            "tasks": {},
+            "quick_tasks": {},
+            "task_triage_runs": {},
+        }
+        # One settings row per user; existing settings are kept
+        singletons = {
+            "user_settings": session.exec(
+                select(UserSettings.id).where(UserSettings.user_id == owner_id)
+            ).first()
+            is not None,
+            "triage_capacity_settings": session.exec(
+                select(TriageCapacitySettings.id).where(
+                    TriageCapacitySettings.user_id == owner_id
+                )
+            ).first()
+            is not None,
+        }
 
-                session.commit()
+        def mapped(section: str, old_id: Any) -> uuid.UUID | None:
+            if old_id is None:
+                return None
+            return id_maps[section].get(str(old_id))
+
+        def remap(section: str, data: dict[str, Any]) -> dict[str, Any] | None:
+            """Point a row at the target user and the new IDs; None skips it"""
+            new_id = uuid.uuid4()
+            if section in id_maps:
+                id_maps[section][str(data["id"])] = new_id
+            data["id"] = new_id
+
+            if section in ("projects", "quick_tasks"):
+                data["owner_id"] = owner_id
+            elif section == "goals":
+                data["project_id"] = mapped("projects", data.get("project_id"))
+                return data if data["project_id"] else None
+            elif section in ("tasks", "logs"):
+                parent = "goals" if section == "tasks" else "tasks"
+                key = "goal_id" if section == "tasks" else "task_id"
+                data[key] = mapped(parent, data.get(key))
+                return data if data[key] else None
+            elif section in singletons:
+                if singletons[section]:
+                    return None
+                singletons[section] = True
+                data["user_id"] = owner_id
+            elif section == "task_triage_items":
+                data["run_id"] = mapped("task_triage_runs", data.get("run_id"))
+                if not data["run_id"]:
+                    return None
+                for key, parent in (
+                    ("task_id", "tasks"),
+                    ("quick_task_id", "quick_tasks"),
+                    ("project_id", "projects"),
+                    ("goal_id", "goals"),
+                ):
+                    if data.get(key):
+                        data[key] = mapped(parent, data[key])
+                item_type = data.get("item_type")
+                if item_type == "task" and not data.get("task_id"):
+                    return None
+                if item_type == "quick_task" and not data.get("quick_task_id"):
+                    return None
+            elif section in ("goal_dependencies", "task_dependencies"):
+                parent = "goals" if section == "goal_dependencies" else "tasks"
+                key = "goal_id" if section == "goal_dependencies" else "task_id"
+                depends_on_key = f"depends_on_{key}"
+                data[key] = mapped(parent, data.get(key))
+                data[depends_on_key] = mapped(parent, data.get(depends_on_key))
+                if not (data[key] and data[depends_on_key]):
+                    return None
+            else:
+                # schedules, weekly schedules, recurring tasks, triage runs
+                data["user_id"] = owner_id
+            return data
+
+        batch: list[dict[str, Any]] = []
+        batch_section: str | None = None
+
+        def flush() -> None:
+            if batch:
+                table = models[batch_section].__table__
+                session.execute(insert(table), batch)
+                batch.clear()
+
+        for section, entry in iter_user_backup(backup_file):
+            model = models.get(section)
+            if model is None or section == "users":
+                # The target user already exists; unknown sections are ignored
+                if section not in ("metadata", "summary"):
+                    report.skipped[section] = report.skipped.get(section, 0) + 1
+                continue
 
-            logger.info(f"✅ User data restored from: {backup_path}")
-            logger.info(f"   Target user: {target_user_id}")
-            logger.info(f"   Projects imported: {len(project_id_map)}")
-            logger.info(f"   Goals imported: {len(goal_id_map)}")
-            logger.info(f"   Tasks imported: {len(task_id_map)}")
+            row = remap(section, dict(entry))
+            if row is None:
+                report.skipped[section] = report.skipped.get(section, 0) + 1
+                continue
 
-        except Exception as e:
-            logger.error(f"❌ Failed to restore user data: {e}")
-            raise SafeMigrationError(f"User data restoration failed: {e}")
+            if section != batch_section:
+                flush()
+                batch_section = section
+            columns = model.__table__.c
+            values = model.model_validate(row).model_dump()
+            batch.append(
+                {key: value for key, value in values.items() if key in columns}
+            )
+            report.imported[section] = report.imported.get(section, 0) + 1
+            if len(batch) >= batch_size:
+                flush()
+        flush()
 
 
 class SchemaValidator:
@@ -183,7 +183,7 @@ async def generate_due_triage_suggestions():
         from humancompiler_api.triage import triage_service
 
         with Session(db.get_engine()) as session:
-            generated_count = triage_service.generate_due_scheduled_runs(session)
+            generated_count = await triage_service.generate_due_scheduled_runs(session)
             if generated_count:
                 logger.info("Generated %s scheduled triage runs", generated_count)
     except Exception as e:
@@ -2,34 +2,46 @@
 Refactored services using base service class
 """
 
-from collections import deque
 from datetime import datetime, UTC
 from decimal import Decimal, ROUND_HALF_UP
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from fastapi import HTTPException, status
 from sqlalchemy.orm import selectinload
 from sqlmodel import Session, and_, delete, func, select
 
+from core.cache import (
+    CACHE_TAG_GOALS,
+    CACHE_TAG_LOGS,
+    CACHE_TAG_PROJECTS,
+    CACHE_TAG_TASKS,
+    invalidate_user_cache,
+)
 from humancompiler_api.base_service import BaseService
 from humancompiler_api.common.error_handlers import validate_uuid
+from humancompiler_api.dependency_graph import load_dependency_graph, path_exists
 from humancompiler_api.models import (
+    ErrorResponse,
     Goal,
     GoalCreate,
     GoalUpdate,
     GoalStatus,
     GoalDependency,
+    GoalProgressRollup,
     Log,
     LogCreate,
     LogUpdate,
     Project,
     ProjectCreate,
     ProjectUpdate,
+    ProjectProgressRollup,
     Task,
     TaskCreate,
     TaskUpdate,
     TaskCategory,
     TaskDependency,
+    TaskDependencyBulkItem,
+    TaskLogRollup,
     User,
     UserCreate,
     UserUpdate,
@@ -55,35 +67,8 @@ from humancompiler_api.models import (
     SlotTemplateCreate,
     SlotTemplateUpdate,
 )
-
-
-def _dependency_path_exists(
-    session: Session,
-    node_id_column,
-    depends_on_id_column,
-    from_node_id: str | UUID,
-    to_node_id: str | UUID,
-) -> bool:
-    """Return True when from_node_id already depends on to_node_id."""
-    start_id = UUID(str(from_node_id))
-    target_id = UUID(str(to_node_id))
-    queue: deque[UUID] = deque([start_id])
-    visited = {start_id}
-
-    while queue:
-        current_id = queue.popleft()
-        if current_id == target_id:
-            return True
-
-        next_ids = session.exec(
-            select(depends_on_id_column).where(node_id_column == current_id)
-        ).all()
-        for next_id in next_ids:
-            if next_id not in visited:
-                visited.add(next_id)
-                queue.append(next_id)
-
-    return False
+from humancompiler_api import progress_rollups
+from humancompiler_api.task_rollups import apply_log_delta, get_task_rollups
 
 
 class UserService:
@@ -138,6 +123,8 @@ class UserService:
 class ProjectService(BaseService[Project, ProjectCreate, ProjectUpdate]):
     """Project service using base service"""
 
+    cache_tags = (CACHE_TAG_PROJECTS,)
+
     def __init__(self):
         super().__init__(Project)
 
@@ -219,12 +206,16 @@ class ProjectService(BaseService[Project, ProjectCreate, ProjectUpdate]):
                 # Simply deleting the project will cascade to all related records
                 session.delete(project)
                 session.commit()
-                return True
+                deleted = True
             else:
                 # BATCH DELETION OPTIMIZATION (eliminates N+1 queries)
-                return self._delete_project_with_batch_queries(
+                deleted = self._delete_project_with_batch_queries(
                     session, project, project_id
                 )
+            self._invalidate_cache(
+                owner_id, CACHE_TAG_GOALS, CACHE_TAG_TASKS, CACHE_TAG_LOGS
+            )
+            return deleted
 
         except Exception as e:
             session.rollback()
@@ -261,6 +252,14 @@ class ProjectService(BaseService[Project, ProjectCreate, ProjectUpdate]):
                 # Step 3: Batch delete all logs for these tasks in a single query
                 logs_delete = delete(Log).where(Log.task_id.in_(task_ids))
                 session.exec(logs_delete)
+                session.exec(
+                    delete(TaskLogRollup).where(TaskLogRollup.task_id.in_(task_ids))
+                )
+                session.exec(
+                    delete(GoalProgressRollup).where(
+                        GoalProgressRollup.goal_id.in_(goal_ids)
+                    )
+                )
 
                 # Step 4: Batch delete all tasks in a single query
                 tasks_delete = delete(Task).where(Task.id.in_(task_ids))
@@ -271,6 +270,11 @@ class ProjectService(BaseService[Project, ProjectCreate, ProjectUpdate]):
             session.exec(goals_delete)
 
         # Step 6: Delete the project
+        session.exec(
+            delete(ProjectProgressRollup).where(
+                ProjectProgressRollup.project_id == project_id
+            )
+        )
         session.delete(project)
         session.commit()
 
@@ -280,6 +284,8 @@ class ProjectService(BaseService[Project, ProjectCreate, ProjectUpdate]):
 class GoalService(BaseService[Goal, GoalCreate, GoalUpdate]):
     """Goal service using base service"""
 
+    cache_tags = (CACHE_TAG_GOALS,)
+
     def __init__(self):
         super().__init__(Goal)
         self.project_service = ProjectService()
@@ -293,6 +299,15 @@ class GoalService(BaseService[Goal, GoalCreate, GoalUpdate]):
             estimate_hours=data.estimate_hours,
         )
 
+    def _after_create(self, session: Session, goal: Goal) -> None:
+        progress_rollups.record_goal_created(session, goal)
+
+    def _after_update(self, session: Session, goal: Goal, previous: dict) -> None:
+        progress_rollups.record_goal_updated(session, goal, previous)
+
+    def _before_delete(self, session: Session, goal: Goal) -> None:
+        progress_rollups.record_goal_deleted(session, goal)
+
     def _get_user_filter(self, user_id: str | UUID):
         """Get filter for goal ownership through project"""
         return Goal.project_id.in_(
@@ -399,7 +414,9 @@ class GoalService(BaseService[Goal, GoalCreate, GoalUpdate]):
         self, session: Session, goal_id: str | UUID, owner_id: str | UUID
     ) -> bool:
         """Delete goal"""
-        return self.delete(session, goal_id, owner_id)
+        deleted = self.delete(session, goal_id, owner_id)
+        self._invalidate_cache(owner_id, CACHE_TAG_TASKS, CACHE_TAG_LOGS)
+        return deleted
 
     def add_goal_dependency(
         self,
@@ -429,13 +446,8 @@ class GoalService(BaseService[Goal, GoalCreate, GoalUpdate]):
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Goal cannot depend on itself",
             )
-        if _dependency_path_exists(
-            session,
-            GoalDependency.goal_id,
-            GoalDependency.depends_on_goal_id,
-            depends_on_goal_id,
-            goal_id,
-        ):
+        graph = load_dependency_graph(session, "goal", owner_id)
+        if path_exists(graph, depends_on_goal_id, goal_id):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Creating this dependency would create a circular dependency",
@@ -519,6 +531,8 @@ class GoalService(BaseService[Goal, GoalCreate, GoalUpdate]):
 class TaskService(BaseService[Task, TaskCreate, TaskUpdate]):
     """Task service using base service"""
 
+    cache_tags = (CACHE_TAG_TASKS,)
+
     def __init__(
         self, goal_service: GoalService = None, project_service: ProjectService = None
     ):
@@ -539,6 +553,12 @@ class TaskService(BaseService[Task, TaskCreate, TaskUpdate]):
             work_type=data.work_type,
         )
 
+    def _after_create(self, session: Session, task: Task) -> None:
+        progress_rollups.record_task_created(session, task)
+
+    def _after_update(self, session: Session, task: Task, previous: dict) -> None:
+        progress_rollups.record_task_updated(session, task, previous)
+
     def _get_user_filter(self, user_id: str | UUID):
         """Get filter for task ownership through goal and project using JOIN"""
         return Task.goal_id.in_(
@@ -672,8 +692,10 @@ class TaskService(BaseService[Task, TaskCreate, TaskUpdate]):
                 session.delete(log)
 
             # Finally delete the task itself
+            progress_rollups.record_task_deleted(session, task)
             session.delete(task)
             session.commit()
+            self._invalidate_cache(owner_id, CACHE_TAG_LOGS)
 
             return True
 
@@ -712,13 +734,8 @@ class TaskService(BaseService[Task, TaskCreate, TaskUpdate]):
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Task cannot depend on itself",
             )
-        if _dependency_path_exists(
-            session,
-            TaskDependency.task_id,
-            TaskDependency.depends_on_task_id,
-            depends_on_task_id,
-            task_id,
-        ):
+        graph = load_dependency_graph(session, "task", owner_id)
+        if path_exists(graph, depends_on_task_id, task_id):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Creating this dependency would create a circular dependency",
@@ -738,8 +755,6 @@ class TaskService(BaseService[Task, TaskCreate, TaskUpdate]):
             )
 
         # Create dependency
-        from uuid import uuid4
-
         dependency = TaskDependency(
             id=uuid4(), task_id=task_id, depends_on_task_id=depends_on_task_id
         )
@@ -749,6 +764,81 @@ class TaskService(BaseService[Task, TaskCreate, TaskUpdate]):
 
         return dependency
 
+    def add_task_dependencies_bulk(
+        self,
+        session: Session,
+        edges: list[TaskDependencyBulkItem],
+        owner_id: str | UUID,
+    ) -> list[TaskDependency]:
+        """Add many task dependencies at once, all or nothing.
+
+        Ownership is checked with one query and every edge is validated against
+        the user's dependency graph, loaded once for the batch, plus the edges
+        accepted earlier in the same batch, so a batch cannot introduce a cycle
+        or a duplicate either.
+        """
+        requested_ids = {edge.task_id for edge in edges} | {
+            edge.depends_on_task_id for edge in edges
+        }
+        owned_tasks = session.exec(
+            select(Task).where(
+                Task.id.in_(requested_ids), self._get_user_filter(owner_id)
+            )
+        ).all()
+        task_map = {UUID(str(task.id)): task for task in owned_tasks}
+
+        graph = load_dependency_graph(session, "task", owner_id)
+        errors: list[dict[str, str | int]] = []
+        for index, edge in enumerate(edges):
+            if edge.task_id not in task_map:
+                reason = "Task not found"
+            elif edge.depends_on_task_id not in task_map:
+                reason = "Dependency task not found"
+            elif edge.task_id == edge.depends_on_task_id:
+                reason = "Task cannot depend on itself"
+            elif edge.depends_on_task_id in graph.get(edge.task_id, ()):
+                reason = "Dependency already exists"
+            elif path_exists(graph, edge.depends_on_task_id, edge.task_id):
+                reason = "Creating this dependency would create a circular dependency"
+            else:
+                graph.setdefault(edge.task_id, set()).add(edge.depends_on_task_id)
+                continue
+            errors.append(
+                {
+                    "index": index,
+                    "task_id": str(edge.task_id),
+                    "depends_on_task_id": str(edge.depends_on_task_id),
+                    "reason": reason,
+                }
+            )
+
+        if errors:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=ErrorResponse.create(
+                    code="INVALID_DEPENDENCIES",
+                    message=f"{len(errors)} of {len(edges)} dependencies are invalid",
+                    details={"errors": errors},
+                ).model_dump(),
+            )
+
+        dependencies = [
+            TaskDependency(
+                id=uuid4(),
+                task_id=edge.task_id,
+                depends_on_task_id=edge.depends_on_task_id,
+            )
+            for edge in edges
+        ]
+        session.add_all(dependencies)
+        session.commit()
+
+        for dependency in dependencies:
+            session.refresh(dependency)
+            dependency.depends_on_task = task_map.get(dependency.depends_on_task_id)
+
+        return dependencies
+
     def get_task_dependencies(
         self, session: Session, task_id: str | UUID, owner_id: str | UUID
     ) -> list[TaskDependency]:
@@ -834,6 +924,8 @@ class TaskService(BaseService[Task, TaskCreate, TaskUpdate]):
 class LogService(BaseService[Log, LogCreate, LogUpdate]):
     """Log service using base service"""
 
+    cache_tags = (CACHE_TAG_LOGS,)
+
     def __init__(self, task_service: TaskService = None):
         super().__init__(Log)
         self.task_service = task_service or TaskService()
@@ -846,6 +938,20 @@ class LogService(BaseService[Log, LogCreate, LogUpdate]):
             comment=data.comment,
         )
 
+    def _after_create(self, session: Session, log: Log) -> None:
+        apply_log_delta(session, log.task_id, log.actual_minutes, 1)
+        progress_rollups.record_log_minutes(session, log.task_id, log.actual_minutes)
+
+    def _after_update(self, session: Session, log: Log, previous: dict) -> None:
+        if "actual_minutes" in previous:
+            minutes = log.actual_minutes - previous["actual_minutes"]
+            apply_log_delta(session, log.task_id, minutes)
+            progress_rollups.record_log_minutes(session, log.task_id, minutes)
+
+    def _before_delete(self, session: Session, log: Log) -> None:
+        apply_log_delta(session, log.task_id, -log.actual_minutes, -1)
+        progress_rollups.record_log_minutes(session, log.task_id, -log.actual_minutes)
+
     def _get_user_filter(self, user_id: str | UUID):
         """Get filter for log ownership through task, goal and project using JOINs"""
         return Log.task_id.in_(
@@ -1260,12 +1366,10 @@ class WorkSessionService(
         # If remaining estimate is provided, update task.estimate_hours so that
         # (estimate_hours - actual_hours) ~= remaining_estimate_hours.
         if checkout_data.remaining_estimate_hours is not None:
-            total_minutes = session.exec(
-                select(func.coalesce(func.sum(Log.actual_minutes), 0)).where(
-                    Log.task_id == current_session.task_id
-                )
-            ).one()
-            total_minutes_int = int(total_minutes or 0)
+            # Includes the log just created
+            total_minutes_int, _ = get_task_rollups(
+                session, [current_session.task_id]
+            ).get(current_session.task_id, (0, 0))
 
             remaining_hours = checkout_data.remaining_estimate_hours.quantize(
                 Decimal("0.01"), rounding=ROUND_HALF_UP
@@ -1299,13 +1403,17 @@ class WorkSessionService(
                     detail="Task not found",
                 )
 
+            previous = {"estimate_hours": task.estimate_hours}
             task.estimate_hours = new_estimate_hours
             task.updated_at = ended_at
+            progress_rollups.record_task_updated(session, task, previous)
             session.add(task)
             session.flush()
 
         session.commit()
         session.refresh(current_session)
+        if checkout_data.remaining_estimate_hours is not None:
+            invalidate_user_cache(user_id_validated, CACHE_TAG_TASKS)
 
         return current_session, new_log
 
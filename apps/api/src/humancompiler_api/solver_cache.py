@@ -0,0 +1,152 @@
+"""
+Result cache for scheduling solvers.
+
+Users often press "generate" several times without changing anything. Solver
+inputs (the daily ``HumanDailyFixture``, the weekly task specs) already carry
+every value the solve depends on: remaining minutes derived from estimates and
+logs, priorities, due dates, dependencies, fixed assignments and solver config.
+Results are therefore keyed by a canonical hash of those inputs. Any change to
+a task, log or dependency produces a different fixture and thus a different
+key, so stale entries are never served and simply age out of the TTL cache.
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import threading
+from collections.abc import Awaitable, Callable
+from dataclasses import fields, is_dataclass
+from datetime import date, datetime, time
+from enum import Enum
+from typing import Any, TypeVar
+from uuid import UUID
+
+from cachetools import TTLCache  # type: ignore[import-untyped]
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def _canonical(value: Any) -> Any:
+    """Convert solver inputs into JSON-serialisable data with a stable layout"""
+    if is_dataclass(value) and not isinstance(value, type):
+        return {
+            "__type__": type(value).__name__,
+            **{f.name: _canonical(getattr(value, f.name)) for f in fields(value)},
+        }
+    if isinstance(value, Enum):
+        return _canonical(value.value)
+    if isinstance(value, dict):
+        return {str(key): _canonical(item) for key, item in value.items()}
+    if isinstance(value, list | tuple):
+        return [_canonical(item) for item in value]
+    if isinstance(value, set | frozenset):
+        return sorted(
+            (_canonical(item) for item in value),
+            key=lambda item: json.dumps(item, sort_keys=True),
+        )
+    if isinstance(value, datetime | date | time):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    if value is None or isinstance(value, str | int | float | bool):
+        return value
+    return str(value)
+
+
+def solver_fingerprint(solver: str, *parts: Any, **named: Any) -> str:
+    """
+    Build a cache key from a solver name and its complete input.
+
+    Dict key order does not matter; list order does, because solvers may
+    break ties by input position.
+    """
+    payload = json.dumps(
+        {"solver": solver, "parts": _canonical(parts), "named": _canonical(named)},
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return f"{solver}:{hashlib.sha256(payload.encode()).hexdigest()}"
+
+
+class SolverResultCache:
+    """Bounded TTL cache of solver results keyed by input fingerprint"""
+
+    def __init__(self, maxsize: int | None = None, ttl_seconds: int | None = None):
+        # Get from settings or use defaults
+        from humancompiler_api.config import settings
+
+        if maxsize is None:
+            maxsize = getattr(settings, "solver_result_cache_size", 256)
+        if ttl_seconds is None:
+            ttl_seconds = getattr(settings, "solver_result_cache_ttl_seconds", 600)
+
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self.enabled = maxsize > 0
+        self._cache: TTLCache = TTLCache(maxsize=max(1, maxsize), ttl=ttl_seconds)
+        # The sync daily path may run on a worker thread
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: str) -> Any | None:
+        """Return a copy of the cached result, or None"""
+        if not self.enabled:
+            return None
+        with self._lock:
+            result = self._cache.get(key)
+            if result is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+        logger.debug(f"Solver cache hit for {key}")
+        # Callers post-process results; never hand out the stored object
+        return copy.deepcopy(result)
+
+    def set(self, key: str, result: Any) -> None:
+        """Store a result; None is never cached"""
+        if not self.enabled or result is None:
+            return
+        with self._lock:
+            self._cache[key] = copy.deepcopy(result)
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[T]],
+        should_cache: Callable[[T], bool] | None = None,
+    ) -> T:
+        """Return the cached result for ``key`` or await ``compute`` and store it"""
+        cached_result = self.get(key)
+        if cached_result is not None:
+            return cached_result
+
+        result = await compute()
+        if should_cache is None or should_cache(result):
+            self.set(key, result)
+        return result
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return size and hit/miss counters"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "enabled": self.enabled,
+                "size": len(self._cache),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+# Global solver result cache instance
+solver_result_cache = SolverResultCache()
@@ -0,0 +1,335 @@
+"""
+Off-event-loop execution of scheduling solvers.
+
+Daily planning (humancompiler-scheduler) and weekly task selection (OR-Tools
+CP-SAT) are CPU bound and may run for several seconds. Calling them inline
+from an ``async def`` endpoint blocks the event loop for every other request,
+so solves are submitted to a bounded worker pool instead. The executor also
+enforces a global queue limit and a per-user concurrency cap, and gives up on
+work whose client has disconnected.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from concurrent.futures import (
+    BrokenExecutor,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from typing import Any, TypeVar
+
+from humancompiler_api.exceptions import HumanCompilerException
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+CancelCheck = Callable[[], Awaitable[bool]]
+
+# Upper bounds for client-requested CP-SAT search settings
+MAX_RELATIVE_GAP_LIMIT = 0.5
+MAX_NO_IMPROVEMENT_TIMEOUT_SECONDS = 30.0
+
+
+class SolverExecutorError(HumanCompilerException):
+    """Base error for solver submissions that could not be completed"""
+
+    status_code = 503
+
+    def __init__(self, message: str, error_code: str = "SOLVER_UNAVAILABLE"):
+        super().__init__(message, error_code)
+
+
+class SolverQueueFullError(SolverExecutorError):
+    """Raised when the solver queue is at capacity"""
+
+    status_code = 503
+
+    def __init__(self, max_queue_size: int):
+        super().__init__(
+            f"Solver queue is full ({max_queue_size} solves in flight). "
+            "Please retry shortly.",
+            "SOLVER_QUEUE_FULL",
+        )
+
+
+class SolverUserLimitError(SolverExecutorError):
+    """Raised when a user already has the maximum number of solves running"""
+
+    status_code = 429
+
+    def __init__(self, max_concurrent: int):
+        super().__init__(
+            f"Too many concurrent schedule optimizations (limit: {max_concurrent}). "
+            "Wait for the current one to finish.",
+            "SOLVER_USER_LIMIT",
+        )
+
+
+class SolverCancelledError(SolverExecutorError):
+    """Raised when a solve is abandoned because the client went away"""
+
+    status_code = 499
+
+    def __init__(self):
+        super().__init__(
+            "Solver run cancelled because the client disconnected",
+            "SOLVER_CANCELLED",
+        )
+
+
+class SolverExecutor:
+    """Bounded pool for running solver callables off the event loop"""
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        max_queue_size: int | None = None,
+        max_concurrent_per_user: int | None = None,
+        backend: str | None = None,
+        max_duration_stats: int = 200,
+    ):
+        # Get from settings or use defaults
+        from humancompiler_api.config import settings
+
+        self.max_workers = max_workers or getattr(settings, "solver_max_workers", 2)
+        self.max_queue_size = max_queue_size or getattr(
+            settings, "solver_max_queue_size", 16
+        )
+        self.max_concurrent_per_user = max_concurrent_per_user or getattr(
+            settings, "solver_max_concurrent_per_user", 1
+        )
+        self.backend = backend or getattr(
+            settings, "solver_executor_backend", "process"
+        )
+        if self.backend not in ("process", "thread"):
+            raise ValueError(f"Unknown solver executor backend: {self.backend}")
+
+        self._pool: Executor | None = None
+        # Pool futures complete on executor-managed threads, so all bookkeeping
+        # goes through this lock rather than relying on the event loop.
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._per_user: dict[str, int] = {}
+        self._peak_queue_depth = 0
+        self._durations_ms: deque[float] = deque(maxlen=max_duration_stats)
+        self._counters = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "cancelled": 0,
+            "rejected_queue_full": 0,
+            "rejected_user_limit": 0,
+        }
+
+    def _get_pool(self) -> Executor:
+        if self._pool is None:
+            if self.backend == "thread":
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="solver"
+                )
+            else:
+                # spawn keeps workers independent of the parent's threads,
+                # DB connections and event loop.
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            logger.info(
+                f"Solver executor started ({self.backend}, {self.max_workers} workers, "
+                f"queue limit {self.max_queue_size})"
+            )
+        return self._pool
+
+    def _acquire(self, user_key: str | None) -> None:
+        with self._lock:
+            if self._in_flight >= self.max_queue_size:
+                self._counters["rejected_queue_full"] += 1
+                raise SolverQueueFullError(self.max_queue_size)
+            if (
+                user_key is not None
+                and self._per_user.get(user_key, 0) >= self.max_concurrent_per_user
+            ):
+                self._counters["rejected_user_limit"] += 1
+                raise SolverUserLimitError(self.max_concurrent_per_user)
+
+            self._in_flight += 1
+            if user_key is not None:
+                self._per_user[user_key] = self._per_user.get(user_key, 0) + 1
+            self._counters["submitted"] += 1
+            self._peak_queue_depth = max(
+                self._peak_queue_depth, self._in_flight - self.max_workers
+            )
+
+    def _release(self, user_key: str | None) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            if user_key is not None:
+                remaining = self._per_user.get(user_key, 0) - 1
+                if remaining > 0:
+                    self._per_user[user_key] = remaining
+                else:
+                    self._per_user.pop(user_key, None)
+
+    def _on_done(self, future: Future, user_key: str | None, started: float) -> None:
+        # Slots are released when the worker actually finishes, not when the
+        # caller stops waiting, so abandoned solves still count against limits.
+        self._release(user_key)
+        with self._lock:
+            if future.cancelled():
+                return
+            if future.exception() is not None:
+                self._counters["failed"] += 1
+            else:
+                self._counters["completed"] += 1
+                self._durations_ms.append((time.perf_counter() - started) * 1000)
+
+    async def run(
+        self,
+        fn: Callable[..., T],
+        /,
+        *args: Any,
+        user_id: Any = None,
+        cancel_check: CancelCheck | None = None,
+        poll_interval: float = 0.25,
+        **kwargs: Any,
+    ) -> T:
+        """
+        Run ``fn(*args, **kwargs)`` in the solver pool and await its result.
+
+        ``fn`` and its arguments must be picklable when the process backend is
+        used. ``cancel_check`` (typically ``Request.is_disconnected``) is polled
+        while waiting; when it returns True the solve is cancelled if still
+        queued, or its result discarded if already running.
+
+        Raises:
+            SolverQueueFullError: Too many solves are in flight
+            SolverUserLimitError: The user already has the maximum running
+            SolverCancelledError: The client disconnected before completion
+        """
+        user_key = str(user_id) if user_id is not None else None
+        self._acquire(user_key)
+        started = time.perf_counter()
+
+        try:
+            future = self._get_pool().submit(fn, *args, **kwargs)
+        except BrokenExecutor as e:
+            # A crashed worker poisons a ProcessPoolExecutor; start a fresh one
+            # on the next submission.
+            self._release(user_key)
+            logger.error(f"Solver pool is broken, recreating: {e}")
+            self._pool = None
+            raise SolverExecutorError("Solver workers are restarting") from e
+        except BaseException:
+            self._release(user_key)
+            raise
+
+        future.add_done_callback(lambda f: self._on_done(f, user_key, started))
+        wrapped = asyncio.wrap_future(future)
+
+        try:
+            while True:
+                done, _ = await asyncio.wait(
+                    {wrapped}, timeout=poll_interval if cancel_check else None
+                )
+                if done:
+                    break
+                if cancel_check is not None and await cancel_check():
+                    logger.info(f"Client disconnected, cancelling solve for {user_key}")
+                    self._cancel(wrapped)
+                    raise SolverCancelledError()
+        except asyncio.CancelledError:
+            self._cancel(wrapped)
+            raise
+
+        return wrapped.result()
+
+    def _cancel(self, wrapped: asyncio.Future) -> None:
+        # Cancelling the asyncio wrapper also cancels the pool future if it
+        # has not started yet; a running solve ends at its own time limit.
+        wrapped.cancel()
+        with self._lock:
+            self._counters["cancelled"] += 1
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return queue depth, concurrency and outcome counters"""
+        with self._lock:
+            durations = list(self._durations_ms)
+            stats: dict[str, Any] = {
+                "backend": self.backend,
+                "max_workers": self.max_workers,
+                "max_queue_size": self.max_queue_size,
+                "max_concurrent_per_user": self.max_concurrent_per_user,
+                "in_flight": self._in_flight,
+                "queue_depth": max(0, self._in_flight - self.max_workers),
+                "peak_queue_depth": max(0, self._peak_queue_depth),
+                "active_users": len(self._per_user),
+                **self._counters,
+            }
+
+        stats["avg_duration_ms"] = (
+            round(sum(durations) / len(durations), 2) if durations else 0.0
+        )
+        stats["max_duration_ms"] = round(max(durations), 2) if durations else 0.0
+        return stats
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker pool, dropping solves that have not started"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait, cancel_futures=True)
+            self._pool = None
+            logger.info("Solver executor stopped")
+
+
+def max_search_workers() -> int:
+    """
+    CP-SAT threads a single solve may use.
+
+    Every executor worker runs one solve at a time, so total solver threads
+    stay around ``solver_max_workers * solver_max_search_workers``.
+    """
+    from humancompiler_api.config import settings
+
+    configured = getattr(settings, "solver_max_search_workers", 4)
+    return max(1, min(configured, os.cpu_count() or 1))
+
+
+def resolve_search_settings(
+    num_workers: int | None = None,
+    relative_gap_limit: float | None = None,
+    no_improvement_timeout_seconds: float | None = None,
+) -> dict[str, Any]:
+    """Clamp requested CP-SAT search settings to the server limits"""
+    worker_cap = max_search_workers()
+    return {
+        "num_workers": min(num_workers or worker_cap, worker_cap),
+        "relative_gap_limit": min(relative_gap_limit or 0.0, MAX_RELATIVE_GAP_LIMIT),
+        "no_improvement_timeout_seconds": min(
+            no_improvement_timeout_seconds or 0.0,
+            MAX_NO_IMPROVEMENT_TIMEOUT_SECONDS,
+        ),
+    }
+
+
+def search_settings_limits() -> dict[str, Any]:
+    """Defaults and upper bounds for CP-SAT search settings, for clients"""
+    return {
+        "defaults": resolve_search_settings(),
+        "limits": {
+            "num_workers": max_search_workers(),
+            "relative_gap_limit": MAX_RELATIVE_GAP_LIMIT,
+            "no_improvement_timeout_seconds": MAX_NO_IMPROVEMENT_TIMEOUT_SECONDS,
+        },
+    }
+
+
+# Global solver executor instance
+solver_executor = SolverExecutor()
@@ -0,0 +1,256 @@
+"""
+Background solver jobs.
+
+Long solves (weekly task solver, daily schedule) can be submitted as jobs:
+the request returns a job id immediately, the solve runs as a background task
+on the API's event loop (the CPU-bound part goes through the solver executor),
+and progress/result are persisted in ``solver_jobs`` so clients can poll by id
+and results survive a restart. Completion is also pushed over WebSocket.
+
+Running jobs refresh ``updated_at`` periodically. Several API instances share
+the table, so at startup only jobs whose heartbeat has gone stale are treated
+as lost; jobs another instance is still solving are left alone.
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlmodel import Session, col, select
+
+from humancompiler_api.common.error_handlers import validate_uuid
+from humancompiler_api.database import db
+from humancompiler_api.models import SolverJob, SolverJobStatus, SolverJobType
+from humancompiler_api.notification_service import connection_manager
+
+logger = logging.getLogger(__name__)
+
+ProgressReporter = Callable[[int, str], None]
+JobRunner = Callable[[Session, ProgressReporter], Awaitable[dict[str, Any]]]
+
+ACTIVE_JOB_STATUSES = [SolverJobStatus.QUEUED, SolverJobStatus.RUNNING]
+
+# Running jobs touch updated_at this often
+JOB_HEARTBEAT_SECONDS = 30.0
+# Active jobs not touched for this long have lost their process
+JOB_STALE_AFTER_SECONDS = 180.0
+
+
+class SolverJobService:
+    """Create, run and look up persisted solver jobs"""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] | None = None,
+        heartbeat_seconds: float = JOB_HEARTBEAT_SECONDS,
+        stale_after_seconds: float = JOB_STALE_AFTER_SECONDS,
+    ):
+        # Jobs outlive the request that created them, so they open their own
+        # sessions instead of reusing the request-scoped one.
+        self.session_factory = session_factory or (lambda: Session(db.get_engine()))
+        self.heartbeat_seconds = heartbeat_seconds
+        self.stale_after_seconds = stale_after_seconds
+        self._tasks: set[asyncio.Task] = set()
+
+    def create_job(
+        self,
+        session: Session,
+        user_id: str | UUID,
+        job_type: SolverJobType,
+        request_data: dict[str, Any],
+    ) -> SolverJob:
+        """Persist a new queued job"""
+        job = SolverJob(
+            user_id=validate_uuid(user_id, "user ID"),
+            job_type=job_type,
+            status=SolverJobStatus.QUEUED,
+            request_json=request_data,
+            progress_message="キュー待ち",
+        )
+        session.add(job)
+        session.commit()
+        session.refresh(job)
+        return job
+
+    def get_job(
+        self, session: Session, user_id: str | UUID, job_id: str | UUID
+    ) -> SolverJob:
+        """Get a job owned by the user, or raise 404"""
+        job = session.get(SolverJob, validate_uuid(job_id, "solver job ID"))
+        if not job or job.user_id != validate_uuid(user_id, "user ID"):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Solver job not found",
+            )
+        return job
+
+    def list_jobs(
+        self,
+        session: Session,
+        user_id: str | UUID,
+        job_type: SolverJobType | None = None,
+        limit: int = 20,
+    ) -> list[SolverJob]:
+        """List the user's most recent jobs"""
+        statement = select(SolverJob).where(
+            SolverJob.user_id == validate_uuid(user_id, "user ID")
+        )
+        if job_type is not None:
+            statement = statement.where(SolverJob.job_type == job_type)
+        statement = statement.order_by(col(SolverJob.created_at).desc()).limit(limit)
+        return list(session.exec(statement).all())
+
+    def start(self, job: SolverJob, runner: JobRunner) -> asyncio.Task:
+        """Run a queued job in the background"""
+        task = asyncio.create_task(
+            self._execute(job.id, str(job.user_id), job.job_type, runner)
+        )
+        # Keep a reference so the task is not garbage collected mid-run
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _execute(
+        self,
+        job_id: UUID,
+        user_id: str,
+        job_type: SolverJobType,
+        runner: JobRunner,
+    ) -> None:
+        self._update(
+            job_id,
+            status=SolverJobStatus.RUNNING,
+            progress=5,
+            progress_message="実行中",
+            started_at=datetime.now(UTC),
+        )
+
+        def report_progress(progress: int, message: str) -> None:
+            self._update(
+                job_id,
+                progress=max(0, min(99, progress)),
+                progress_message=message[:200],
+            )
+
+        heartbeat = asyncio.create_task(self._heartbeat(job_id))
+        try:
+            with self.session_factory() as session:
+                result = await runner(session, report_progress)
+            job = self._update(
+                job_id,
+                status=SolverJobStatus.COMPLETED,
+                progress=100,
+                progress_message="完了",
+                result_json=result,
+                completed_at=datetime.now(UTC),
+            )
+            logger.info(f"Solver job {job_id} ({job_type}) completed")
+        except asyncio.CancelledError:
+            self._update(
+                job_id,
+                status=SolverJobStatus.FAILED,
+                progress_message="中断",
+                error_message="Job was cancelled",
+                completed_at=datetime.now(UTC),
+            )
+            raise
+        except Exception as e:
+            logger.error(f"Solver job {job_id} ({job_type}) failed: {e}")
+            job = self._update(
+                job_id,
+                status=SolverJobStatus.FAILED,
+                progress_message="失敗",
+                error_message=_error_message(e),
+                completed_at=datetime.now(UTC),
+            )
+        finally:
+            heartbeat.cancel()
+
+        await self._notify(user_id, job)
+
+    async def _heartbeat(self, job_id: UUID) -> None:
+        """Keep updated_at fresh while the job runs"""
+        while True:
+            await asyncio.sleep(self.heartbeat_seconds)
+            try:
+                self._update(job_id)
+            except Exception as e:
+                logger.warning(f"Solver job {job_id} heartbeat failed: {e}")
+
+    def _update(self, job_id: UUID, **values: Any) -> SolverJob | None:
+        with self.session_factory() as session:
+            job = session.get(SolverJob, job_id)
+            if not job:
+                logger.warning(f"Solver job {job_id} disappeared while running")
+                return None
+            for key, value in values.items():
+                setattr(job, key, value)
+            job.updated_at = datetime.now(UTC)
+            session.add(job)
+            session.commit()
+            session.refresh(job)
+            session.expunge(job)
+            return job
+
+    async def _notify(self, user_id: str, job: SolverJob | None) -> None:
+        if job is None:
+            return
+        try:
+            await connection_manager.send_to_user(
+                user_id,
+                {
+                    "type": "solver_job_completed",
+                    "job_id": str(job.id),
+                    "job_type": job.job_type.value,
+                    "status": job.status.value,
+                    "error_message": job.error_message,
+                },
+            )
+        except Exception as e:
+            logger.warning(f"Failed to push solver job {job.id} completion: {e}")
+
+    def fail_interrupted_jobs(self) -> int:
+        """
+        Mark jobs left queued/running by a stopped process as failed.
+
+        Background tasks do not survive a restart; without this their rows
+        would report "running" forever. Only jobs without a heartbeat for
+        ``stale_after_seconds`` are failed, so jobs still running on other
+        instances are not affected.
+        """
+        now = datetime.now(UTC)
+        cutoff = now - timedelta(seconds=self.stale_after_seconds)
+        with self.session_factory() as session:
+            jobs = session.exec(
+                select(SolverJob).where(
+                    col(SolverJob.status).in_(ACTIVE_JOB_STATUSES),
+                    col(SolverJob.updated_at) < cutoff,
+                )
+            ).all()
+            for job in jobs:
+                job.status = SolverJobStatus.FAILED
+                job.progress_message = "中断"
+                job.error_message = "Job was interrupted by a server restart"
+                job.completed_at = now
+                job.updated_at = now
+                session.add(job)
+            session.commit()
+            return len(jobs)
+
+
+def _error_message(error: Exception) -> str:
+    if isinstance(error, HTTPException):
+        detail = error.detail
+        if isinstance(detail, dict):
+            # ErrorResponse.model_dump() shape: {"error": {"code", "message", ...}}
+            detail = (detail.get("error") or {}).get("message") or detail
+        return str(detail)[:1000]
+    return f"{type(error).__name__}: {error}"[:1000]
+
+
+# Global solver job service instance
+solver_job_service = SolverJobService()
@@ -0,0 +1,210 @@
+"""
+Per-task totals of work logs
+
+Actual time per task is read by progress, timeline, scheduling and triage on
+almost every request, while logs change rarely. ``task_log_rollups`` keeps the
+sum of ``logs.actual_minutes`` and the number of logs for each task. Log writes
+apply a delta in the same transaction (``apply_log_delta``), so reads are a
+primary-key lookup instead of an aggregate over every log.
+
+``reconcile_task_rollups`` recomputes rows from the logs; it backfills the
+table and repairs drift from writes that bypass the services (restores, manual
+SQL). Run it with ``python rollups.py reconcile``.
+"""
+
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlmodel import Session, SQLModel, delete, func, select
+
+from humancompiler_api.models import Goal, Log, Project, Task, TaskLogRollup
+
+logger = logging.getLogger(__name__)
+
+_UPSERT_DIALECTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+def increment_rollup(
+    session: Session,
+    model: type[SQLModel],
+    key_column: str,
+    key: UUID,
+    deltas: dict[str, Any],
+) -> None:
+    """
+    Add ``deltas`` to the counters of one rollup row without committing
+
+    The row is created when missing. The increment happens in SQL, so
+    concurrent writes to the same row do not overwrite each other.
+    """
+    deltas = {column: value for column, value in deltas.items() if value}
+    if not deltas:
+        return
+
+    table = model.__table__
+    now = datetime.now(UTC)
+    increments = {column: table.c[column] + value for column, value in deltas.items()}
+    increments["updated_at"] = now
+
+    insert = _UPSERT_DIALECTS.get(session.get_bind().dialect.name)
+    if insert is not None:
+        session.execute(
+            insert(table)
+            .values({key_column: key, **deltas, "updated_at": now})
+            .on_conflict_do_update(
+                index_elements=[table.c[key_column]], set_=increments
+            )
+        )
+    else:
+        result = session.execute(
+            update(table).where(table.c[key_column] == key).values(**increments)
+        )
+        if not result.rowcount:
+            session.add(model(**{key_column: key, **deltas, "updated_at": now}))
+
+    # A row loaded earlier in this session would now be stale
+    loaded = session.identity_map.get(session.identity_key(model, key))
+    if loaded is not None:
+        session.expire(loaded)
+
+
+def apply_log_delta(
+    session: Session, task_id: UUID, minutes: int, count: int = 0
+) -> None:
+    """Add ``minutes`` and ``count`` to a task's totals without committing"""
+    increment_rollup(
+        session,
+        TaskLogRollup,
+        "task_id",
+        task_id,
+        {"actual_minutes": minutes, "log_count": count},
+    )
+
+
+def get_task_rollups(
+    session: Session, task_ids: Iterable[UUID]
+) -> dict[UUID, tuple[int, int]]:
+    """(actual minutes, log count) per task; tasks without logs are omitted"""
+    task_ids = list(task_ids)
+    if not task_ids:
+        return {}
+    rows = session.exec(
+        select(
+            TaskLogRollup.task_id,
+            TaskLogRollup.actual_minutes,
+            TaskLogRollup.log_count,
+        ).where(TaskLogRollup.task_id.in_(task_ids))
+    ).all()
+    return {task_id: (minutes, count) for task_id, minutes, count in rows}
+
+
+def get_actual_minutes_map(
+    session: Session, task_ids: Iterable[UUID]
+) -> dict[str, int]:
+    """Actual minutes keyed by task ID string; tasks without logs are omitted"""
+    return {
+        str(task_id): minutes
+        for task_id, (minutes, _) in get_task_rollups(session, task_ids).items()
+    }
+
+
+def get_actual_hours_map(
+    session: Session, task_ids: Iterable[UUID]
+) -> dict[str, float]:
+    """Actual hours keyed by task ID string; tasks without logs are omitted"""
+    return {
+        task_id: minutes / 60.0
+        for task_id, minutes in get_actual_minutes_map(session, task_ids).items()
+    }
+
+
+@dataclass
+class RollupReconciliation:
+    """Outcome of comparing rollups with the logs they summarize"""
+
+    checked: int = 0
+    created: int = 0
+    updated: int = 0
+    removed: int = 0
+
+    @property
+    def changed(self) -> int:
+        return self.created + self.updated + self.removed
+
+
+def reconcile_task_rollups(
+    session: Session,
+    owner_id: UUID | None = None,
+    dry_run: bool = False,
+) -> RollupReconciliation:
+    """
+    Recompute rollups from the logs and fix rows that differ
+
+    Limited to one user's tasks when ``owner_id`` is given. Rows for tasks
+    without logs are removed. Commits unless ``dry_run`` is set.
+    """
+    owned_tasks = (
+        select(Task.id)
+        .join(Goal, Task.goal_id == Goal.id)
+        .join(Project, Goal.project_id == Project.id)
+        .where(Project.owner_id == owner_id)
+    )
+
+    log_totals = select(Log.task_id, func.sum(Log.actual_minutes), func.count(Log.id))
+    rollups = select(TaskLogRollup)
+    if owner_id is not None:
+        log_totals = log_totals.where(Log.task_id.in_(owned_tasks))
+        rollups = rollups.where(TaskLogRollup.task_id.in_(owned_tasks))
+
+    expected = {
+        task_id: (int(minutes or 0), int(count))
+        for task_id, minutes, count in session.exec(
+            log_totals.group_by(Log.task_id)
+        ).all()
+    }
+    existing = {rollup.task_id: rollup for rollup in session.exec(rollups).all()}
+
+    result = RollupReconciliation(checked=len(expected.keys() | existing.keys()))
+    now = datetime.now(UTC)
+    for task_id, (minutes, count) in expected.items():
+        rollup = existing.get(task_id)
+        if rollup is None:
+            result.created += 1
+            if not dry_run:
+                session.add(
+                    TaskLogRollup(
+                        task_id=task_id,
+                        actual_minutes=minutes,
+                        log_count=count,
+                        updated_at=now,
+                    )
+                )
+        elif (rollup.actual_minutes, rollup.log_count) != (minutes, count):
+            result.updated += 1
+            if not dry_run:
+                rollup.actual_minutes = minutes
+                rollup.log_count = count
+                rollup.updated_at = now
+                session.add(rollup)
+
+    stale = [task_id for task_id in existing if task_id not in expected]
+    result.removed = len(stale)
+    if stale and not dry_run:
+        session.exec(delete(TaskLogRollup).where(TaskLogRollup.task_id.in_(stale)))
+
+    if not dry_run:
+        session.commit()
+
+    if result.changed:
+        logger.info(
+            f"Task rollups {'to fix' if dry_run else 'fixed'}: "
+            f"{result.created} created, {result.updated} updated, "
+            f"{result.removed} removed of {result.checked}"
+        )
+    return result
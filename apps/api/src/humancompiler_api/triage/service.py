@@ -16,16 +16,19 @@ from typing import Any
 from uuid import UUID
 
 from fastapi import HTTPException, status
-from openai import OpenAI
-from sqlmodel import Session, col, func, select
+from sqlmodel import Session, col, select
 
+from core.cache import CACHE_TAG_TASKS, invalidate_user_cache
+from humancompiler_api import progress_rollups
+from humancompiler_api.ai.call_orchestrator import ai_call_orchestrator
+from humancompiler_api.ai.client_registry import get_openai_client
 from humancompiler_api.crypto import get_crypto_service
 from humancompiler_api.models import (
     Goal,
-    Log,
     Project,
     QuickTask,
     Task,
+    TaskLogRollup,
     TaskStatus,
     TaskTriageItem,
     TaskTriageRun,
@@ -51,6 +54,10 @@ AI_DELTA_MIN = Decimal("-15.00")
 AI_DELTA_MAX = Decimal("15.00")
 ACTIVE_STATUSES = [TaskStatus.PENDING, TaskStatus.IN_PROGRESS]
 TRIAGE_CAPACITY_HORIZON_WEEKS = 12
+# Top-scored candidates shown to the model, in concurrent requests of this size
+AI_MAX_CANDIDATES = 120
+AI_CHUNK_SIZE = 40
+AI_TIMEOUT_SECONDS = 20.0
 
 
 @dataclass
@@ -149,7 +156,7 @@ class TriageService:
         session.refresh(settings)
         return self._settings_response(settings)
 
-    def create_run(
+    async def create_run(
         self,
         session: Session,
         user_id: str | UUID,
@@ -165,7 +172,9 @@ class TriageService:
             else use_ai_rank_adjustment
         )
         ai_adjustments = (
-            self._get_ai_adjustments(session, user_uuid, candidates) if use_ai else {}
+            await self._get_ai_adjustments(session, user_uuid, candidates)
+            if use_ai
+            else {}
         )
 
         selected_items = self._select_with_capacity(
@@ -418,8 +427,10 @@ class TriageService:
                     session.add(item)
                     continue
 
+                previous = {"status": target.status}
                 target.status = TaskStatus.CANCELLED
                 target.updated_at = now
+                progress_rollups.record_task_updated(session, target, previous)
                 item.applied_action = TriageRecommendation.CANCEL
                 item.applied_at = now
                 item.apply_error = None
@@ -442,6 +453,8 @@ class TriageService:
         run.updated_at = now
         session.add(run)
         session.commit()
+        if applied:
+            invalidate_user_cache(user_id, CACHE_TAG_TASKS)
 
         return TriageApplyResponse(
             success=failed == 0,
@@ -452,7 +465,7 @@ class TriageService:
             errors=errors,
         )
 
-    def generate_due_scheduled_runs(self, session: Session) -> int:
+    async def generate_due_scheduled_runs(self, session: Session) -> int:
         """Generate due scheduled suggestions without applying actions."""
         now = datetime.now(UTC)
         settings_rows = session.exec(
@@ -471,7 +484,7 @@ class TriageService:
             ):
                 continue
             try:
-                self.create_run(
+                await self.create_run(
                     session,
                     settings.user_id,
                     source=TriageRunSource.SCHEDULED,
@@ -542,20 +555,13 @@ class TriageService:
     def _get_actual_hours_map(
         self, session: Session, user_id: UUID
     ) -> dict[UUID, Decimal]:
-        task_ids = session.exec(
-            select(Task.id)
+        rows = session.exec(
+            select(TaskLogRollup.task_id, TaskLogRollup.actual_minutes)
+            .join(Task, TaskLogRollup.task_id == Task.id)
             .join(Goal, Task.goal_id == Goal.id)
             .join(Project, Goal.project_id == Project.id)
             .where(Project.owner_id == user_id)
         ).all()
-        if not task_ids:
-            return {}
-
-        rows = session.exec(
-            select(Log.task_id, func.sum(Log.actual_minutes))
-            .where(col(Log.task_id).in_(task_ids))
-            .group_by(Log.task_id)
-        ).all()
         return {
             UUID(str(task_id)): self._decimal(Decimal(int(total_minutes or 0)) / 60)
             for task_id, total_minutes in rows
@@ -612,7 +618,7 @@ class TriageService:
 
         return self._decimal(score), reasons
 
-    def _get_ai_adjustments(
+    async def _get_ai_adjustments(
         self,
         session: Session,
         user_id: UUID,
@@ -631,84 +637,119 @@ class TriageService:
             if not api_key:
                 return {}
 
-            client = OpenAI(api_key=api_key, timeout=20.0)
-            candidate_payload = [
-                {
-                    "id": candidate.identifier,
-                    "title": candidate.title,
-                    "project": candidate.project_title or INBOX_BUCKET_TITLE,
-                    "priority": candidate.priority,
-                    "remaining_hours": float(candidate.remaining_hours),
-                    "capacity_load_hours": float(candidate.capacity_load_hours),
-                    "due_date": candidate.due_date.isoformat()
-                    if candidate.due_date
-                    else None,
-                    "deterministic_score": float(candidate.deterministic_score),
-                    "reasons": candidate.reason_codes,
-                }
-                for candidate in sorted(
-                    candidates, key=lambda item: item.deterministic_score, reverse=True
-                )[:120]
+            client = get_openai_client(api_key).with_options(timeout=AI_TIMEOUT_SECONDS)
+            model = user_settings.openai_model or "gpt-5"
+            ranked = sorted(
+                candidates, key=lambda item: item.deterministic_score, reverse=True
+            )[:AI_MAX_CANDIDATES]
+            chunks = [
+                ranked[start : start + AI_CHUNK_SIZE]
+                for start in range(0, len(ranked), AI_CHUNK_SIZE)
             ]
-            response = client.chat.completions.create(
-                model=user_settings.openai_model or "gpt-5",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": (
-                            "Return compact JSON only. You may adjust task rank, "
-                            "but you cannot choose actions. Use IDs exactly as provided."
-                        ),
-                    },
-                    {
-                        "role": "user",
-                        "content": json.dumps(
-                            {
-                                "instruction": (
-                                    "For each task that materially deserves a rank "
-                                    "change, return delta between -15 and 15 and a "
-                                    "short reason. Omit tasks with no meaningful change."
-                                ),
-                                "schema": {
-                                    "adjustments": [
-                                        {
-                                            "id": "task:<uuid> or quick_task:<uuid>",
-                                            "delta": "number -15..15",
-                                            "reason": "short string",
-                                        }
-                                    ]
-                                },
-                                "tasks": candidate_payload,
-                            },
-                            ensure_ascii=False,
-                        ),
-                    },
+            # A failed or slow chunk only loses its own adjustments
+            responses = await ai_call_orchestrator.gather(
+                [
+                    lambda chunk=chunk: client.chat.completions.create(
+                        model=model,
+                        messages=self._ai_adjustment_messages(chunk),
+                        response_format={"type": "json_object"},
+                        max_completion_tokens=900,
+                    )
+                    for chunk in chunks
                 ],
-                response_format={"type": "json_object"},
-                max_completion_tokens=900,
+                user_id=user_id,
+                timeout=AI_TIMEOUT_SECONDS,
             )
-            content = response.choices[0].message.content or "{}"
-            payload = json.loads(content)
-            valid_ids = {candidate.identifier for candidate in candidates}
-            adjustments: dict[str, AiAdjustment] = {}
-            for raw_adjustment in payload.get("adjustments", []):
-                identifier = raw_adjustment.get("id")
-                if identifier not in valid_ids:
-                    continue
-                raw_delta = raw_adjustment.get("delta", 0)
-                delta = self._clip_ai_delta(self._decimal(Decimal(str(raw_delta))))
-                reason = raw_adjustment.get("reason")
-                adjustments[identifier] = AiAdjustment(
-                    delta=delta,
-                    reason=str(reason)[:1000] if reason else None,
-                )
-            return adjustments
         except Exception as exc:
             logger.warning(
                 "AI triage adjustment failed; using deterministic scores: %s", exc
             )
             return {}
 
+        valid_ids = {candidate.identifier for candidate in candidates}
+        adjustments: dict[str, AiAdjustment] = {}
+        for response in responses:
+            if response is None:
+                continue
+            try:
+                adjustments.update(self._parse_ai_adjustments(response, valid_ids))
+            except Exception as exc:
+                logger.warning(
+                    "AI triage adjustment response could not be parsed: %s", exc
+                )
+        return adjustments
+
+    def _ai_adjustment_messages(
+        self, candidates: list[TriageCandidate]
+    ) -> list[dict[str, str]]:
+        candidate_payload = [
+            {
+                "id": candidate.identifier,
+                "title": candidate.title,
+                "project": candidate.project_title or INBOX_BUCKET_TITLE,
+                "priority": candidate.priority,
+                "remaining_hours": float(candidate.remaining_hours),
+                "capacity_load_hours": float(candidate.capacity_load_hours),
+                "due_date": candidate.due_date.isoformat()
+                if candidate.due_date
+                else None,
+                "deterministic_score": float(candidate.deterministic_score),
+                "reasons": candidate.reason_codes,
+            }
+            for candidate in candidates
+        ]
+        return [
+            {
+                "role": "system",
+                "content": (
+                    "Return compact JSON only. You may adjust task rank, "
+                    "but you cannot choose actions. Use IDs exactly as provided."
+                ),
+            },
+            {
+                "role": "user",
+                "content": json.dumps(
+                    {
+                        "instruction": (
+                            "For each task that materially deserves a rank "
+                            "change, return delta between -15 and 15 and a "
+                            "short reason. Omit tasks with no meaningful change."
+                        ),
+                        "schema": {
+                            "adjustments": [
+                                {
+                                    "id": "task:<uuid> or quick_task:<uuid>",
+                                    "delta": "number -15..15",
+                                    "reason": "short string",
+                                }
+                            ]
+                        },
+                        "tasks": candidate_payload,
+                    },
+                    ensure_ascii=False,
+                ),
+            },
+        ]
+
+    def _parse_ai_adjustments(
+        self, response: Any, valid_ids: set[str]
+    ) -> dict[str, AiAdjustment]:
+        content = response.choices[0].message.content or "{}"
+        payload = json.loads(content)
+        adjustments: dict[str, AiAdjustment] = {}
+        for raw_adjustment in payload.get("adjustments", []):
+            identifier = raw_adjustment.get("id")
+            if identifier not in valid_ids:
+                continue
+            raw_delta = raw_adjustment.get("delta", 0)
+            delta = self._clip_ai_delta(self._decimal(Decimal(str(raw_delta))))
+            reason = raw_adjustment.get("reason")
+            adjustments[identifier] = AiAdjustment(
+                delta=delta,
+                reason=str(reason)[:1000] if reason else None,
+            )
+        return adjustments
+
     def _select_with_capacity(
         self,
         settings: TriageCapacitySettings,
@@ -15,7 +15,9 @@ from .daily import (
     TimeSlot,
     WorkKind,
     optimize_daily_schedule,
+    previous_assignments_from_plan,
 )
+from .search import configure_cp_solver, solve_with_early_stop
 from .weekly import (
     ProjectAllocationSpec,
     WeeklySelectionResult,
@@ -29,12 +31,15 @@ __all__ = [
     "DailySolverConfig",
     "FixedAssignment",
     "optimize_daily_schedule",
+    "previous_assignments_from_plan",
     "ScheduleResult",
     "SchedulerTask",
     "SlotKind",
     "TaskKind",
     "TimeSlot",
     "WorkKind",
+    "configure_cp_solver",
+    "solve_with_early_stop",
     "ProjectAllocationSpec",
     "optimize_weekly_selection",
     "WeeklySelectionResult",
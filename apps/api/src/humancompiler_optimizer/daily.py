@@ -10,6 +10,8 @@ from typing import Any
 
 from ortools.sat.python import cp_model
 
+from .search import configure_cp_solver, solve_with_early_stop
+
 
 class WorkKind(Enum):
     """Common enum for task and slot work types.
@@ -82,7 +84,21 @@ class ScheduleResult:
     total_scheduled_hours: float = 0.0
     optimization_status: str = "UNKNOWN"
     solve_time_seconds: float = 0.0
+    # Placement score only, comparable between warm and cold runs; the
+    # stability reward for kept placements is reported as stability_bonus
     objective_value: float = 0.0
+    stability_bonus: float = 0.0
+    # CP-SAT wall time of the solve that produced this result (excludes model build)
+    solver_wall_time_seconds: float = 0.0
+    # Model size, to keep an eye on how constraint formulations scale
+    model_variables: int = 0
+    model_constraints: int = 0
+    # Warm start: number of previous assignments fed as hints, the un-hinted
+    # solver wall time when measured (not part of solve_time_seconds), and how
+    # many tasks moved vs. the previous plan
+    warm_start_hints: int = 0
+    cold_solve_time_seconds: float | None = None
+    changed_assignments: int | None = None
 
 
 @dataclass(frozen=True)
@@ -94,6 +110,42 @@ class DailySolverConfig:
     priority_score_base: int = 10
     deadline_score_base: int = 10
     min_score: int = 1
+    # Objective bonus per minute for keeping a task in its previous slot (0 = off)
+    stability_weight: int = 0
+    # Also solve once without hints to report cold_solve_time_seconds
+    measure_cold_start: bool = False
+    # CP-SAT search settings; 0 keeps the solver default (see search.py)
+    num_workers: int = 0
+    relative_gap_limit: float = 0.0
+    max_deterministic_time: float = 0.0
+    no_improvement_timeout_seconds: float = 0.0
+
+
+def previous_assignments_from_plan(plan: Mapping[str, Any] | None) -> list[Assignment]:
+    """Build warm-start assignments from a saved schedule ``plan_json``.
+
+    Entries that cannot be parsed are skipped; a warm start is only a hint.
+    """
+    if not plan:
+        return []
+
+    assignments: list[Assignment] = []
+    for entry in plan.get("assignments") or []:
+        try:
+            start = entry.get("start_time") or entry.get("slot_start") or "00:00"
+            hours, minutes = (int(part) for part in str(start).split(":")[:2])
+            assignments.append(
+                Assignment(
+                    task_id=str(entry["task_id"]),
+                    slot_index=int(entry["slot_index"]),
+                    start_time=time(hours, minutes),
+                    duration_hours=float(entry.get("duration_hours") or 0.0),
+                    is_fixed=bool(entry.get("is_fixed", False)),
+                )
+            )
+        except (KeyError, TypeError, ValueError):
+            continue
+    return assignments
 
 
 def optimize_daily_schedule(
@@ -105,7 +157,15 @@ def optimize_daily_schedule(
     goal_dependencies: Mapping[str, Sequence[str]] | None = None,
     config: DailySolverConfig | None = None,
     fixed_assignments: Sequence[FixedAssignment] | None = None,
+    previous_assignments: Sequence[Assignment] | None = None,
 ) -> ScheduleResult:
+    """Assign tasks to time slots with CP-SAT.
+
+    ``previous_assignments`` (e.g. the last saved schedule for the date) warm
+    start the solver: they are added as solution hints, and when
+    ``config.stability_weight`` is set, keeping a task in its previous slot is
+    rewarded so re-plans churn as little as possible.
+    """
     start_time = time_module.time()
     if config is None:
         config = DailySolverConfig()
@@ -173,17 +233,41 @@ def optimize_daily_schedule(
     # Convert task remaining hours to minutes for optimization
     task_durations = [math.ceil(task.remaining_hours * 60) for task in tasks]
 
-    # Decision variables: x[i][j] = 1 if task i is assigned to slot j
-    x: dict[tuple[int, int], Any] = {}
-    for i, _task in enumerate(tasks):
-        for j, _slot in enumerate(time_slots):
-            x[i, j] = model.NewBoolVar(f"task_{i}_slot_{j}")
+    # Candidate (task, slot) pairs. Structurally impossible pairs never get
+    # variables: tasks with nothing left to do, slots without capacity, slots
+    # locked to another project, and every slot but the fixed one for fixed tasks.
+    candidate_slots: dict[int, list[int]] = {}
+    for i, task in enumerate(tasks):
+        fixed_slot = fixed_task_slot_map.get(i)
+        if fixed_slot is not None:
+            candidate_slots[i] = [fixed_slot]
+            continue
+        if task_durations[i] <= 0:
+            candidate_slots[i] = []
+            continue
+        candidate_slots[i] = [
+            j
+            for j, slot in enumerate(time_slots)
+            if int(slot_capacities[j]) >= 1
+            and (
+                not slot.assigned_project_id
+                or task.is_weekly_recurring
+                or task.project_id == slot.assigned_project_id
+            )
+        ]
 
+    # Decision variables: x[i, j] = 1 if task i is assigned to slot j
+    x: dict[tuple[int, int], Any] = {}
     # Variable for actual assigned duration (in minutes)
     assigned_durations: dict[tuple[int, int], Any] = {}
-    for i, _task in enumerate(tasks):
-        for j, _slot in enumerate(time_slots):
-            max_duration = min(task_durations[i], int(slot_capacities[j]))
+    tasks_by_slot: dict[int, list[int]] = {j: [] for j in range(len(time_slots))}
+    for i, slot_indices in candidate_slots.items():
+        for j in slot_indices:
+            x[i, j] = model.NewBoolVar(f"task_{i}_slot_{j}")
+            max_duration = min(
+                max(task_durations[i], int(fixed_durations.get(i, 0))),
+                int(slot_capacities[j]),
+            )
             assigned_durations[i, j] = model.NewIntVar(
                 0, max_duration, f"duration_{i}_{j}"
             )
@@ -191,133 +275,190 @@ def optimize_daily_schedule(
             if max_duration >= 1:
                 model.Add(assigned_durations[i, j] >= 1).OnlyEnforceIf(x[i, j])
             model.Add(assigned_durations[i, j] == 0).OnlyEnforceIf(x[i, j].Not())
+            tasks_by_slot[j].append(i)
 
     # Constraint 0: Fixed assignments - these tasks MUST be assigned to their specified slots
+    # (their other slots were never materialized)
     for task_idx, slot_idx in fixed_task_slot_map.items():
-        # Force assignment to the specified slot
         model.Add(x[task_idx, slot_idx] == 1)
-        # Prevent assignment to other slots
-        for other_slot in range(len(time_slots)):
-            if other_slot != slot_idx:
-                model.Add(x[task_idx, other_slot] == 0)
-        # Set the fixed duration
         fixed_duration = int(fixed_durations[task_idx])
         model.Add(assigned_durations[task_idx, slot_idx] == fixed_duration)
 
     # Constraint 1: Each task is assigned to at most one slot
-    for i, _task in enumerate(tasks):
-        model.Add(sum(x[i, j] for j in range(len(time_slots))) <= 1)
+    for i, slot_indices in candidate_slots.items():
+        if len(slot_indices) > 1:
+            model.Add(sum(x[i, j] for j in slot_indices) <= 1)
 
     # Constraint 2: Slot capacity constraints
-    for j, _slot in enumerate(time_slots):
-        model.Add(
-            sum(assigned_durations[i, j] for i in range(len(tasks)))
-            <= int(slot_capacities[j])
-        )
+    for j, task_indices in tasks_by_slot.items():
+        if task_indices:
+            model.Add(
+                sum(assigned_durations[i, j] for i in task_indices)
+                <= int(slot_capacities[j])
+            )
 
     # Constraint 3: Dependency ordering constraints (soft requirement; only if both are scheduled)
-    if task_dependencies:
-        task_id_to_index = {task.id: i for i, task in enumerate(tasks)}
+    # Each task's slot index is a linear expression over its x[i, j] row, so an
+    # ordering is a single enforced inequality: O(deps x slots) rather than one
+    # clause per (slot j, slot k > j) pair.
+    scheduled: dict[int, Any] = {}
+    slot_position: dict[int, Any] = {}
+
+    def _ordering_terms(i: int) -> tuple[Any, Any]:
+        if i not in scheduled:
+            row = [x[i, j] for j in candidate_slots[i]]
+            scheduled[i] = model.NewBoolVar(f"scheduled_{i}")
+            model.Add(cp_model.LinearExpr.Sum(row) == scheduled[i])
+            slot_position[i] = cp_model.LinearExpr.WeightedSum(row, candidate_slots[i])
+        return scheduled[i], slot_position[i]
+
+    # With a single slot every scheduled task shares it, so ordering is moot
+    has_ordering = len(time_slots) > 1
+
+    if task_dependencies and has_ordering:
         for task_id, prerequisite_task_ids in task_dependencies.items():
             task_idx = task_id_to_index.get(task_id)
             if task_idx is None:
                 continue
             for prerequisite_id in prerequisite_task_ids:
                 prerequisite_idx = task_id_to_index.get(prerequisite_id)
-                if prerequisite_idx is None:
+                if (
+                    prerequisite_idx is None
+                    or prerequisite_idx == task_idx
+                    or not candidate_slots[task_idx]
+                    or not candidate_slots[prerequisite_idx]
+                ):
                     continue
-                for j in range(len(time_slots)):
-                    for k in range(j + 1, len(time_slots)):
-                        model.Add(x[task_idx, j] + x[prerequisite_idx, k] <= 1)
+                task_scheduled, task_slot = _ordering_terms(task_idx)
+                prereq_scheduled, prereq_slot = _ordering_terms(prerequisite_idx)
+                model.Add(prereq_slot <= task_slot).OnlyEnforceIf(
+                    [task_scheduled, prereq_scheduled]
+                )
 
-    if goal_dependencies:
+    if goal_dependencies and has_ordering:
         goal_to_task_indices: dict[str, list[int]] = {}
         for i, task in enumerate(tasks):
-            if task.goal_id and not task.is_weekly_recurring:
+            if task.goal_id and not task.is_weekly_recurring and candidate_slots[i]:
                 goal_to_task_indices.setdefault(task.goal_id, []).append(i)
 
+        # Per-goal bounds on the slots its scheduled tasks occupy; a goal
+        # dependency then only compares two bounds instead of every task pair.
+        last_slot: dict[str, Any] = {}
+        first_slot: dict[str, Any] = {}
+        max_slot_index = len(time_slots) - 1
+
+        def _goal_last_slot(goal_id: str) -> Any:
+            if goal_id not in last_slot:
+                last_slot[goal_id] = model.NewIntVar(
+                    0, max_slot_index, f"goal_last_slot_{goal_id}"
+                )
+                for i in goal_to_task_indices[goal_id]:
+                    is_scheduled, position = _ordering_terms(i)
+                    model.Add(last_slot[goal_id] >= position).OnlyEnforceIf(
+                        is_scheduled
+                    )
+            return last_slot[goal_id]
+
+        def _goal_first_slot(goal_id: str) -> Any:
+            if goal_id not in first_slot:
+                first_slot[goal_id] = model.NewIntVar(
+                    0, max_slot_index, f"goal_first_slot_{goal_id}"
+                )
+                for i in goal_to_task_indices[goal_id]:
+                    is_scheduled, position = _ordering_terms(i)
+                    model.Add(first_slot[goal_id] <= position).OnlyEnforceIf(
+                        is_scheduled
+                    )
+            return first_slot[goal_id]
+
         for goal_id, prerequisite_goal_ids in goal_dependencies.items():
-            dependent_task_indices = goal_to_task_indices.get(goal_id)
-            if not dependent_task_indices:
+            if not goal_to_task_indices.get(goal_id):
                 continue
             for prerequisite_goal_id in prerequisite_goal_ids:
-                prerequisite_task_indices = goal_to_task_indices.get(
+                if prerequisite_goal_id == goal_id or not goal_to_task_indices.get(
                     prerequisite_goal_id
-                )
-                if not prerequisite_task_indices:
+                ):
                     continue
-                for dependent_task_idx in dependent_task_indices:
-                    for prerequisite_task_idx in prerequisite_task_indices:
-                        for j in range(len(time_slots)):
-                            for k in range(j + 1, len(time_slots)):
-                                model.Add(
-                                    x[dependent_task_idx, j]
-                                    + x[prerequisite_task_idx, k]
-                                    <= 1
-                                )
-
-    # Constraint 4.5: Slot-specific project assignment constraints
-    for j, slot in enumerate(time_slots):
-        if not slot.assigned_project_id:
-            continue
-        for i, task in enumerate(tasks):
-            if task.is_weekly_recurring:
-                continue
-            if task.project_id != slot.assigned_project_id:
-                model.Add(x[i, j] == 0)
+                model.Add(
+                    _goal_last_slot(prerequisite_goal_id) <= _goal_first_slot(goal_id)
+                )
 
     # Soft constraints / objective components
-    kind_match_bonus: dict[tuple[int, int], int] = {}
-    for i, task in enumerate(tasks):
-        for j, slot in enumerate(time_slots):
-            kind_match_bonus[i, j] = (
-                config.kind_match_score
-                if task.kind.value == slot.kind.value
-                else config.kind_mismatch_score
-            )
-
     priority_weights: dict[int, int] = {}
+    deadline_bonus: dict[int, int] = {}
     for i, task in enumerate(tasks):
         priority_weights[i] = max(
             config.min_score, config.priority_score_base - task.priority
         )
-
-    deadline_bonus: dict[tuple[int, int], int] = {}
-    if date:
-        schedule_date = date
-        for i, task in enumerate(tasks):
-            for j, _slot in enumerate(time_slots):
-                if task.due_date:
-                    days_until_due = (task.due_date.date() - schedule_date.date()).days
-                    deadline_bonus[i, j] = (
-                        max(
-                            config.min_score,
-                            config.deadline_score_base - days_until_due,
-                        )
-                        if days_until_due >= 0
-                        else config.min_score
-                    )
-                else:
-                    deadline_bonus[i, j] = config.min_score
-    else:
-        for i, _task in enumerate(tasks):
-            for j, _slot in enumerate(time_slots):
-                deadline_bonus[i, j] = config.min_score
+        # The deadline bonus depends only on the task, not the slot
+        deadline_bonus[i] = config.min_score
+        if date and task.due_date:
+            days_until_due = (task.due_date.date() - date.date()).days
+            if days_until_due >= 0:
+                deadline_bonus[i] = max(
+                    config.min_score, config.deadline_score_base - days_until_due
+                )
 
     objective_terms = []
-    for i, _task in enumerate(tasks):
-        for j, _slot in enumerate(time_slots):
-            weight = priority_weights[i] * kind_match_bonus[i, j] * deadline_bonus[i, j]
-            objective_terms.append(assigned_durations[i, j] * weight)
+    for (i, j), duration in assigned_durations.items():
+        kind_match_bonus = (
+            config.kind_match_score
+            if tasks[i].kind.value == time_slots[j].kind.value
+            else config.kind_mismatch_score
+        )
+        weight = priority_weights[i] * kind_match_bonus * deadline_bonus[i]
+        objective_terms.append(duration * weight)
+
+    # Warm start: previous placements of tasks that still exist in valid slots
+    previous_slot_by_task: dict[int, int] = {}
+    previous_minutes_by_task: dict[int, int] = {}
+    for previous in previous_assignments or []:
+        task_idx = task_id_to_index.get(previous.task_id)
+        if task_idx is None or (task_idx, previous.slot_index) not in x:
+            continue
+        previous_slot_by_task[task_idx] = previous.slot_index
+        previous_minutes_by_task[task_idx] = round(previous.duration_hours * 60)
+
+    if config.stability_weight > 0:
+        for task_idx, slot_idx in previous_slot_by_task.items():
+            objective_terms.append(
+                assigned_durations[task_idx, slot_idx] * config.stability_weight
+            )
 
     model.Maximize(sum(objective_terms))
 
     solver = cp_model.CpSolver()
-    solver.parameters.max_time_in_seconds = float(config.max_time_in_seconds)
-    solver.parameters.log_search_progress = bool(config.log_search_progress)
+    configure_cp_solver(
+        solver,
+        max_time_in_seconds=config.max_time_in_seconds,
+        num_workers=config.num_workers,
+        relative_gap_limit=config.relative_gap_limit,
+        max_deterministic_time=config.max_deterministic_time,
+        log_search_progress=config.log_search_progress,
+    )
 
-    status = solver.Solve(model)
-    solve_time = time_module.time() - start_time
+    cold_solve_time: float | None = None
+    cold_elapsed = 0.0
+    if previous_slot_by_task:
+        if config.measure_cold_start:
+            cold_started = time_module.time()
+            solve_with_early_stop(solver, model, config.no_improvement_timeout_seconds)
+            cold_solve_time = solver.WallTime()
+            cold_elapsed = time_module.time() - cold_started
+
+        for (i, j), assigned in x.items():
+            kept = previous_slot_by_task.get(i) == j
+            model.AddHint(assigned, kept)
+            if kept:
+                upper = min(task_durations[i], int(slot_capacities[j]))
+                minutes = max(0, min(previous_minutes_by_task[i], upper))
+                model.AddHint(assigned_durations[i, j], minutes)
+            else:
+                model.AddHint(assigned_durations[i, j], 0)
+
+    status = solve_with_early_stop(solver, model, config.no_improvement_timeout_seconds)
+    solve_time = time_module.time() - start_time - cold_elapsed
+    model_proto = model.Proto()
 
     assignments: list[Assignment] = []
     unscheduled_tasks: list[str] = []
@@ -326,7 +467,8 @@ def optimize_daily_schedule(
     if status in [cp_model.OPTIMAL, cp_model.FEASIBLE]:
         for i, task in enumerate(tasks):
             assigned = False
-            for j, slot in enumerate(time_slots):
+            for j in candidate_slots[i]:
+                slot = time_slots[j]
                 if solver.Value(x[i, j]) == 1:
                     duration_minutes = solver.Value(assigned_durations[i, j])
                     # Check if this was a fixed assignment
@@ -348,7 +490,17 @@ def optimize_daily_schedule(
 
         optimization_status = "OPTIMAL" if status == cp_model.OPTIMAL else "FEASIBLE"
         success = True
-        objective_value = float(solver.ObjectiveValue())
+        if config.stability_weight > 0:
+            stability_bonus = float(
+                sum(
+                    solver.Value(assigned_durations[task_idx, slot_idx])
+                    for task_idx, slot_idx in previous_slot_by_task.items()
+                )
+                * config.stability_weight
+            )
+        else:
+            stability_bonus = 0.0
+        objective_value = float(solver.ObjectiveValue()) - stability_bonus
     else:
         unscheduled_tasks = [task.id for task in tasks]
         optimization_status = (
@@ -356,6 +508,17 @@ def optimize_daily_schedule(
         )
         success = False
         objective_value = 0.0
+        stability_bonus = 0.0
+
+    changed_assignments: int | None = None
+    if previous_assignments is not None:
+        previous_slots = {a.task_id: a.slot_index for a in previous_assignments}
+        new_slots = {a.task_id: a.slot_index for a in assignments}
+        changed_assignments = sum(
+            1
+            for task_id in previous_slots.keys() | new_slots.keys()
+            if previous_slots.get(task_id) != new_slots.get(task_id)
+        )
 
     return ScheduleResult(
         success=success,
@@ -365,4 +528,11 @@ def optimize_daily_schedule(
         optimization_status=optimization_status,
         solve_time_seconds=solve_time,
         objective_value=objective_value,
+        stability_bonus=stability_bonus,
+        solver_wall_time_seconds=solver.WallTime(),
+        model_variables=len(model_proto.variables),
+        model_constraints=len(model_proto.constraints),
+        warm_start_hints=len(previous_slot_by_task),
+        cold_solve_time_seconds=cold_solve_time,
+        changed_assignments=changed_assignments,
     )
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import threading
+import time as time_module
+from typing import Any
+
+
+def _import_cp_model():
+    from ortools.sat.python import cp_model
+
+    return cp_model
+
+
+def configure_cp_solver(
+    solver: Any,
+    *,
+    max_time_in_seconds: float,
+    num_workers: int = 0,
+    relative_gap_limit: float = 0.0,
+    max_deterministic_time: float = 0.0,
+    log_search_progress: bool = False,
+) -> None:
+    """Apply search settings to a ``cp_model.CpSolver``.
+
+    Zero leaves the CP-SAT default in place: all cores for ``num_workers``,
+    a proven optimum for ``relative_gap_limit`` and no deterministic limit.
+    """
+    solver.parameters.max_time_in_seconds = float(max_time_in_seconds)
+    solver.parameters.log_search_progress = bool(log_search_progress)
+    if num_workers > 0:
+        solver.parameters.num_workers = int(num_workers)
+    if relative_gap_limit > 0:
+        solver.parameters.relative_gap_limit = float(relative_gap_limit)
+    if max_deterministic_time > 0:
+        solver.parameters.max_deterministic_time = float(max_deterministic_time)
+
+
+def solve_with_early_stop(
+    solver: Any, model: Any, no_improvement_timeout_seconds: float = 0.0
+) -> int:
+    """Solve ``model``, stopping once no better solution appeared for a while.
+
+    CP-SAT has no built-in "stop when stalled" limit. A solution callback
+    records when the incumbent last improved and a watchdog thread stops the
+    search once it is older than ``no_improvement_timeout_seconds``. The
+    watchdog only fires after a first solution, so an infeasible or hard model
+    still runs to its normal time limit.
+    """
+    if no_improvement_timeout_seconds <= 0:
+        return solver.Solve(model)
+
+    cp_model = _import_cp_model()
+    last_improvement: list[float] = []
+
+    class _ImprovementTracker(cp_model.CpSolverSolutionCallback):
+        def on_solution_callback(self) -> None:
+            last_improvement[:] = [time_module.monotonic()]
+
+    finished = threading.Event()
+
+    def watchdog() -> None:
+        poll_seconds = min(0.05, no_improvement_timeout_seconds)
+        while not finished.wait(poll_seconds):
+            if (
+                last_improvement
+                and time_module.monotonic() - last_improvement[0]
+                >= no_improvement_timeout_seconds
+            ):
+                solver.StopSearch()
+                return
+
+    thread = threading.Thread(target=watchdog, name="cp-sat-early-stop", daemon=True)
+    thread.start()
+    try:
+        return solver.Solve(model, _ImprovementTracker())
+    finally:
+        finished.set()
+        thread.join()
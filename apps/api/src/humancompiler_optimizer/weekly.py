@@ -4,6 +4,8 @@ import time as time_module
 from dataclasses import dataclass, field
 from collections.abc import Sequence
 
+from .search import configure_cp_solver, solve_with_early_stop
+
 
 @dataclass(frozen=True)
 class WeeklyTaskSpec:
@@ -32,6 +34,11 @@ class WeeklySolverConfig:
     zero_allocation_epsilon: float = 0.001
     ideal_min_factor: float = 0.95
     ideal_max_factor: float = 1.05
+    # CP-SAT search settings; 0 keeps the solver default (see search.py)
+    num_workers: int = 0
+    relative_gap_limit: float = 0.0
+    max_deterministic_time: float = 0.0
+    no_improvement_timeout_seconds: float = 0.0
 
 
 @dataclass
@@ -44,6 +51,10 @@ class WeeklySelectionResult:
     selected_hours_by_project: dict[str, float] = field(default_factory=dict)
     solve_time_seconds: float = 0.0
     objective_value: float = 0.0
+    # CP-SAT wall time (excludes model build) and model size
+    solver_wall_time_seconds: float = 0.0
+    model_variables: int = 0
+    model_constraints: int = 0
 
 
 def _import_cp_model():
@@ -98,7 +109,9 @@ def optimize_weekly_selection(
         project_terms = [
             task_vars[t.id] * int(t.hours * hours_scale) for t in project_tasks
         ]
-        available_task_hours = sum(t.hours for t in project_tasks)
+        # Bounds must use the same truncated per-task hours as the terms;
+        # scaling the unrounded sum can exceed what the tasks can reach.
+        available_scaled_hours = sum(int(t.hours * hours_scale) for t in project_tasks)
 
         if allocation.target_hours <= config.zero_allocation_epsilon:
             model.Add(sum(project_terms) <= 0)
@@ -111,12 +124,12 @@ def optimize_weekly_selection(
             allocation.target_hours * config.ideal_max_factor * hours_scale
         )
 
-        if available_task_hours * hours_scale < ideal_min_hours:
-            hard_min_hours = int(available_task_hours * hours_scale)
-            max_hours = int(available_task_hours * hours_scale)
+        if available_scaled_hours < ideal_min_hours:
+            hard_min_hours = available_scaled_hours
+            max_hours = available_scaled_hours
         else:
             hard_min_hours = ideal_min_hours
-            max_hours = min(ideal_max_hours, int(available_task_hours * hours_scale))
+            max_hours = min(ideal_max_hours, available_scaled_hours)
 
         if max_hours > 0:
             model.Add(sum(project_terms) >= hard_min_hours)
@@ -142,10 +155,22 @@ def optimize_weekly_selection(
 
     model.Maximize(sum(priority_expr))
 
-    solver.parameters.max_time_in_seconds = float(config.max_time_in_seconds)
+    configure_cp_solver(
+        solver,
+        max_time_in_seconds=config.max_time_in_seconds,
+        num_workers=config.num_workers,
+        relative_gap_limit=config.relative_gap_limit,
+        max_deterministic_time=config.max_deterministic_time,
+    )
 
-    status = solver.Solve(model)
+    status = solve_with_early_stop(solver, model, config.no_improvement_timeout_seconds)
     solve_time = time_module.time() - start_time
+    model_proto = model.Proto()
+    solve_stats = {
+        "solver_wall_time_seconds": solver.WallTime(),
+        "model_variables": len(model_proto.variables),
+        "model_constraints": len(model_proto.constraints),
+    }
 
     if status not in [cp_model.OPTIMAL, cp_model.FEASIBLE]:
         return WeeklySelectionResult(
@@ -157,6 +182,7 @@ def optimize_weekly_selection(
             selected_hours_by_project={},
             solve_time_seconds=solve_time,
             objective_value=0.0,
+            **solve_stats,
         )
 
     selected_task_ids = [t.id for t in tasks if solver.Value(task_vars[t.id]) == 1]
@@ -190,4 +216,5 @@ def optimize_weekly_selection(
         selected_hours_by_project=selected_hours_by_project,
         solve_time_seconds=solve_time,
         objective_value=float(solver.ObjectiveValue()),
+        **solve_stats,
     )
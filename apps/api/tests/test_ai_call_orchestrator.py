@@ -0,0 +1,123 @@
+"""
+Tests for concurrent, rate-limit aware model calls.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from openai import RateLimitError
+
+from humancompiler_api.ai.call_orchestrator import AICallOrchestrator
+
+
+def rate_limit_error(retry_after: str | None = None) -> RateLimitError:
+    headers = {"retry-after": retry_after} if retry_after else {}
+    response = httpx.Response(
+        429,
+        headers=headers,
+        request=httpx.Request("POST", "https://api.openai.com/v1/chat/completions"),
+    )
+    return RateLimitError("Rate limit reached", response=response, body=None)
+
+
+@pytest.fixture
+def orchestrator():
+    return AICallOrchestrator(
+        max_concurrent=3,
+        max_concurrent_per_user=2,
+        timeout_seconds=1.0,
+        rate_limit_retries=2,
+        backoff_base_seconds=0.001,
+        backoff_max_seconds=0.01,
+    )
+
+
+@pytest.mark.asyncio
+async def test_calls_respect_global_and_per_user_limits(orchestrator):
+    running = {"user-a": 0, "user-b": 0}
+    peaks = {"user-a": 0, "user-b": 0, "total": 0}
+
+    def model_call(user_id: str, value: int):
+        async def call():
+            running[user_id] += 1
+            peaks[user_id] = max(peaks[user_id], running[user_id])
+            peaks["total"] = max(peaks["total"], sum(running.values()))
+            await asyncio.sleep(0.01)
+            running[user_id] -= 1
+            return value
+
+        return call
+
+    results = await asyncio.gather(
+        orchestrator.gather(
+            [model_call("user-a", value) for value in range(6)], user_id="user-a"
+        ),
+        orchestrator.gather(
+            [model_call("user-b", value) for value in range(4)], user_id="user-b"
+        ),
+    )
+
+    assert results == [list(range(6)), list(range(4))]
+    assert peaks == {"user-a": 2, "user-b": 2, "total": 3}
+    stats = orchestrator.get_stats()
+    assert (stats["calls"], stats["succeeded"], stats["in_flight"]) == (10, 10, 0)
+    assert stats["peak_in_flight"] == 3
+    # Per-user slots are dropped once a user has nothing in flight
+    assert stats["active_users"] == 0
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_calls_are_retried_with_backoff(orchestrator):
+    attempts = 0
+
+    async def flaky_call():
+        nonlocal attempts
+        attempts += 1
+        if attempts < 3:
+            raise rate_limit_error()
+        return "ok"
+
+    async def always_limited():
+        raise rate_limit_error()
+
+    assert await orchestrator.call(flaky_call, user_id="user-a") == "ok"
+    assert attempts == 3
+
+    with pytest.raises(RateLimitError):
+        await orchestrator.call(always_limited, user_id="user-a")
+
+    stats = orchestrator.get_stats()
+    assert (stats["rate_limited"], stats["retries"]) == (5, 4)
+    assert (stats["succeeded"], stats["failed"]) == (1, 1)
+
+
+def test_backoff_is_jittered_and_honours_retry_after(orchestrator):
+    delays = {orchestrator._backoff_seconds(3, rate_limit_error()) for _ in range(20)}
+    assert len(delays) > 1
+    assert all(0 <= delay <= 0.008 for delay in delays)
+
+    orchestrator.backoff_max_seconds = 5.0
+    assert orchestrator._backoff_seconds(0, rate_limit_error("2")) == 2.0
+    assert orchestrator._backoff_seconds(0, rate_limit_error("60")) == 5.0
+
+
+@pytest.mark.asyncio
+async def test_slow_or_failing_calls_leave_partial_results(orchestrator):
+    async def fast():
+        return "fast"
+
+    async def slow():
+        await asyncio.sleep(5)
+        return "slow"
+
+    async def broken():
+        raise ValueError("bad response")
+
+    results = await orchestrator.gather(
+        [fast, slow, broken, fast], user_id="user-a", timeout=0.05
+    )
+
+    assert results == ["fast", None, None, "fast"]
+    stats = orchestrator.get_stats()
+    assert (stats["timed_out"], stats["failed"], stats["succeeded"]) == (1, 1, 2)
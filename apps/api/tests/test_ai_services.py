@@ -93,18 +93,18 @@ def test_openai_service_initialization_no_api_key():
 def test_openai_service_initialization_with_api_key():
     """Test OpenAI service initialization with API key"""
     with patch("humancompiler_api.ai_service.settings.openai_api_key", "sk-test-key"):
-        with patch("humancompiler_api.ai_service.OpenAI") as mock_openai:
+        with patch("humancompiler_api.ai_service.get_openai_client") as mock_openai:
             service = OpenAIService()
             assert service.client is not None
-            mock_openai.assert_called_once_with(api_key="sk-test-key")
+            mock_openai.assert_called_once_with("sk-test-key")
 
 
 def test_openai_service_initialization_with_user_api_key():
     """Test OpenAI service initialization with user-provided API key"""
-    with patch("humancompiler_api.ai_service.OpenAI") as mock_openai:
+    with patch("humancompiler_api.ai_service.get_openai_client") as mock_openai:
         service = OpenAIService(api_key="user-key", model="gpt-3.5-turbo")
         assert service.model == "gpt-3.5-turbo"
-        mock_openai.assert_called_once_with(api_key="user-key")
+        mock_openai.assert_called_once_with("user-key")
 
 
 @pytest.mark.asyncio
@@ -123,9 +123,9 @@ async def test_create_for_user_with_encrypted_key():
 
     with patch("humancompiler_api.ai_service.get_crypto_service") as mock_crypto:
         mock_crypto.return_value.decrypt.return_value = "decrypted-key"
-        with patch("humancompiler_api.ai_service.OpenAI") as mock_openai:
+        with patch("humancompiler_api.ai_service.get_openai_client") as mock_openai:
             service = await OpenAIService.create_for_user(user_id, mock_session)
-            mock_openai.assert_called_once_with(api_key="decrypted-key")
+            mock_openai.assert_called_once_with("decrypted-key")
 
 
 @pytest.mark.asyncio
@@ -139,9 +139,9 @@ async def test_create_for_user_no_settings():
     mock_session.execute.return_value = mock_result
 
     with patch("humancompiler_api.ai_service.settings.openai_api_key", "system-key"):
-        with patch("humancompiler_api.ai_service.OpenAI") as mock_openai:
+        with patch("humancompiler_api.ai_service.get_openai_client") as mock_openai:
             service = await OpenAIService.create_for_user(user_id, mock_session)
-            mock_openai.assert_called_once_with(api_key="system-key")
+            mock_openai.assert_called_once_with("system-key")
 
 
 def test_create_for_user_sync():
@@ -157,9 +157,9 @@ def test_create_for_user_sync():
 
     with patch("humancompiler_api.ai_service.get_crypto_service") as mock_crypto:
         mock_crypto.return_value.decrypt.return_value = "decrypted-key"
-        with patch("humancompiler_api.ai_service.OpenAI") as mock_openai:
+        with patch("humancompiler_api.ai_service.get_openai_client") as mock_openai:
             service = OpenAIService.create_for_user_sync(user_id, mock_session)
-            mock_openai.assert_called_once_with(api_key="decrypted-key")
+            mock_openai.assert_called_once_with("decrypted-key")
 
 
 def test_get_function_definitions():
@@ -241,7 +241,7 @@ async def test_generate_weekly_plan_success(mock_context):
     mock_openai_response.usage.total_tokens = 500
 
     mock_client = Mock()
-    mock_client.chat.completions.create.return_value = mock_openai_response
+    mock_client.chat.completions.create = AsyncMock(return_value=mock_openai_response)
 
     service = OpenAIService()
     service.client = mock_client
@@ -259,7 +259,9 @@ async def test_generate_weekly_plan_success(mock_context):
 async def test_generate_weekly_plan_openai_error(mock_context):
     """Test weekly plan generation with OpenAI API error"""
     mock_client = Mock()
-    mock_client.chat.completions.create.side_effect = Exception("OpenAI API error")
+    mock_client.chat.completions.create = AsyncMock(
+        side_effect=Exception("OpenAI API error")
+    )
 
     service = OpenAIService()
     service.client = mock_client
@@ -2,12 +2,20 @@
 Tests for caching functionality
 """
 
+import asyncio
+import threading
 import time
 import pytest
 
+from sqlmodel import Session
+
 from core.cache import (
+    CACHE_TAG_GOALS,
+    CACHE_TAG_TASKS,
+    CountingTTLCache,
     cached,
     invalidate_cache,
+    invalidate_user_cache,
     cache_stats,
     get_cache_key,
     caches,
@@ -329,3 +337,172 @@ def test_different_cache_types():
     assert caches["medium"].maxsize == 200
     assert caches["long"].maxsize == 100
     assert caches["extended"].maxsize == 50
+
+
+def test_cache_key_ignores_sessions():
+    """Sessions differ per request and must not end up in the key"""
+    key = get_cache_key("test", Session(), "user-1", db=Session())
+    assert key == "test:user-1"
+
+
+def test_user_namespace_and_tag_invalidation():
+    """Tag invalidation only drops the matching user's dependent entries"""
+    calls = []
+
+    @cached(
+        cache_type="short",
+        key_prefix="test_user_tags",
+        user_arg="user_id",
+        tags=(CACHE_TAG_TASKS,),
+    )
+    def per_user(session, user_id):
+        calls.append(user_id)
+        return len(calls)
+
+    per_user(Session(), "user-a")
+    per_user(Session(), "user-b")
+    per_user(Session(), "user-a")
+    assert calls == ["user-a", "user-b"]
+
+    # Unrelated tag: nothing dropped
+    assert invalidate_user_cache("user-a", CACHE_TAG_GOALS) == 0
+    assert invalidate_user_cache("user-a", CACHE_TAG_TASKS) == 1
+
+    per_user(Session(), "user-a")
+    per_user(Session(), "user-b")
+    assert calls == ["user-a", "user-b", "user-a"]
+
+
+def test_result_invalidated_while_computing_is_not_stored():
+    """A write that lands during a computation keeps its stale result out"""
+    calls = []
+
+    @cached(
+        cache_type="short",
+        key_prefix="test_invalidated_while_computing",
+        user_arg="user_id",
+        tags=(CACHE_TAG_TASKS,),
+    )
+    def per_user(user_id):
+        calls.append(user_id)
+        if len(calls) == 1:
+            # A task write commits while the first computation runs
+            invalidate_user_cache(user_id, CACHE_TAG_TASKS)
+        return len(calls)
+
+    assert per_user("user-a") == 1
+    assert per_user("user-a") == 2
+    # The second result was computed after the write, so it is kept
+    assert per_user("user-a") == 2
+
+
+def test_cache_stats_counts_hits_misses_and_evictions():
+    """cache_stats reports lookup counters and size evictions"""
+    original_cache = caches["short"]
+    caches["short"] = CountingTTLCache(maxsize=2, ttl=60)
+    before = cache_stats()["short"]
+
+    try:
+
+        @cached(cache_type="short", key_prefix="test_counters")
+        def test_func(x):
+            return x
+
+        for value in (1, 1, 2, 3):
+            test_func(value)
+
+        stats = cache_stats()["short"]
+        assert stats["hits"] - before["hits"] == 1
+        assert stats["misses"] - before["misses"] == 3
+        assert stats["evictions"] == 1
+        assert stats["size"] == 2
+    finally:
+        caches["short"] = original_cache
+
+
+async def test_concurrent_async_misses_share_one_computation():
+    """Identical concurrent misses run the function once"""
+    calls = []
+    before = cache_stats()["short"]
+
+    @cached(cache_type="short", key_prefix="test_coalesce_async")
+    async def slow(x):
+        calls.append(x)
+        await asyncio.sleep(0.05)
+        return x * 2
+
+    results = await asyncio.gather(*(slow(4) for _ in range(5)))
+
+    assert results == [8] * 5
+    assert calls == [4]
+    stats = cache_stats()["short"]
+    assert stats["misses"] - before["misses"] == 1
+    assert stats["coalesced"] - before["coalesced"] == 4
+
+
+async def test_cancelled_caller_does_not_cancel_shared_computation():
+    """Other waiters still get the result when one caller is cancelled"""
+    release = asyncio.Event()
+
+    @cached(cache_type="short", key_prefix="test_coalesce_cancel")
+    async def slow(x):
+        await release.wait()
+        return x
+
+    first = asyncio.ensure_future(slow(1))
+    second = asyncio.ensure_future(slow(1))
+    await asyncio.sleep(0)
+    first.cancel()
+    release.set()
+
+    assert await second == 1
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+
+def test_concurrent_sync_misses_share_one_computation():
+    """Threads missing the same key wait for the first computation"""
+    calls = []
+    barrier = threading.Barrier(4)
+    before = cache_stats()["short"]
+
+    @cached(cache_type="short", key_prefix="test_coalesce_sync")
+    def slow(x):
+        calls.append(x)
+        time.sleep(0.1)
+        return x + 1
+
+    results = []
+
+    def worker():
+        barrier.wait()
+        results.append(slow(1))
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert results == [2] * 4
+    assert calls == [1]
+    assert cache_stats()["short"]["coalesced"] - before["coalesced"] == 3
+
+
+async def test_coalesced_errors_reach_every_caller_and_are_not_cached():
+    """A failing computation fails all waiters and is retried afterwards"""
+    calls = []
+
+    @cached(cache_type="short", key_prefix="test_coalesce_error")
+    async def failing(x):
+        calls.append(x)
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(failing(1), failing(1), return_exceptions=True)
+    assert all(isinstance(result, ValueError) for result in results)
+    assert calls == [1]
+
+    with pytest.raises(ValueError):
+        await failing(1)
+    assert calls == [1, 1]
@@ -0,0 +1,376 @@
+"""
+Tests for the shared cache backend
+"""
+
+import asyncio
+import fnmatch
+import threading
+import time
+from datetime import UTC, date, datetime
+from datetime import time as dt_time
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from cachetools import TTLCache
+from pydantic import BaseModel
+
+from core.cache import (
+    CACHE_TAG_TASKS,
+    cache_stats,
+    cached,
+    caches,
+    configure_cache_backend,
+    invalidate_cache,
+    invalidate_user_cache,
+    set_cache_backend,
+)
+from core.cache_backends import (
+    MISSING,
+    InProcessCacheBackend,
+    RedisCacheBackend,
+    deserialize_value,
+    serialize_value,
+)
+from humancompiler_api.models import TaskStatus
+
+
+class LocalRedis:
+    """In-memory stand-in for the subset of the redis client the backend uses"""
+
+    def __init__(self):
+        self.values: dict[str, tuple[str, float | None]] = {}
+        self.sets: dict[str, set[str]] = {}
+        self.subscribers: dict[str, list] = {}
+        self.lock = threading.Lock()
+
+    def _alive(self, key):
+        entry = self.values.get(key)
+        if entry and entry[1] is not None and entry[1] <= time.monotonic():
+            del self.values[key]
+            return None
+        return entry
+
+    def get(self, key):
+        with self.lock:
+            entry = self._alive(key)
+            return entry[0] if entry else None
+
+    def set(self, key, value, ex=None, px=None, nx=False):
+        with self.lock:
+            if nx and self._alive(key):
+                return None
+            ttl = ex if ex is not None else (px / 1000 if px is not None else None)
+            expires = time.monotonic() + ttl if ttl is not None else None
+            self.values[key] = (value, expires)
+            return True
+
+    def mget(self, keys):
+        return [self.get(key) for key in keys]
+
+    def incr(self, key):
+        with self.lock:
+            entry = self._alive(key)
+            value = int(entry[0]) + 1 if entry else 1
+            self.values[key] = (str(value), entry[1] if entry else None)
+            return value
+
+    def delete(self, *keys):
+        with self.lock:
+            removed = 0
+            for key in keys:
+                removed += self.values.pop(key, None) is not None
+                removed += self.sets.pop(key, None) is not None
+            return removed
+
+    def exists(self, key):
+        with self.lock:
+            return int(self._alive(key) is not None or key in self.sets)
+
+    def sadd(self, key, *members):
+        self.sets.setdefault(key, set()).update(members)
+
+    def smembers(self, key):
+        return set(self.sets.get(key, set()))
+
+    def expire(self, key, seconds):
+        return True
+
+    def scan_iter(self, match="*"):
+        keys = [*self.values, *self.sets]
+        return [key for key in keys if fnmatch.fnmatchcase(key, match)]
+
+    def publish(self, channel, message):
+        handlers = self.subscribers.get(channel, [])
+        for handler in handlers:
+            handler({"type": "message", "channel": channel, "data": message})
+        return len(handlers)
+
+    def pubsub(self, ignore_subscribe_messages=False):
+        return LocalPubSub(self)
+
+
+class LocalPubSub:
+    def __init__(self, server: LocalRedis):
+        self.server = server
+
+    def subscribe(self, **handlers):
+        for channel, handler in handlers.items():
+            self.server.subscribers.setdefault(channel, []).append(handler)
+
+    def run_in_thread(self, sleep_time=0, daemon=False):
+        # Messages are delivered synchronously by publish
+        return self
+
+    def stop(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class UnreachableRedis(LocalRedis):
+    """A store that refuses every command, as during an outage"""
+
+    def _refuse(self, *args, **kwargs):
+        raise ConnectionError("Connection refused")
+
+    get = mget = set = incr = delete = exists = sadd = expire = _refuse
+
+
+class Report(BaseModel):
+    title: str
+    created_at: datetime
+
+
+@pytest.fixture
+def server():
+    return LocalRedis()
+
+
+@pytest.fixture
+def instances(server):
+    """Two API instances sharing one store"""
+    first = RedisCacheBackend(server, caches, lock_timeout_seconds=2.0)
+    second = RedisCacheBackend(server, caches, lock_timeout_seconds=2.0)
+    first.poll_interval_seconds = second.poll_interval_seconds = 0.01
+    previous = set_cache_backend(first)
+    yield first, second
+    set_cache_backend(previous)
+
+
+def test_serialization_round_trip():
+    report = Report(title="Weekly", created_at=datetime(2025, 6, 23, tzinfo=UTC))
+    assert deserialize_value(serialize_value(report)) == report
+
+    task_id = uuid4()
+    value = {"task_id": task_id, "hours": [1.5, 2]}
+    assert deserialize_value(serialize_value(value)) == value
+
+    with pytest.raises(TypeError):
+        serialize_value(object())
+
+
+def test_backends_return_the_same_value(server):
+    """A shared store hands back the types the in-process cache would"""
+    task_id = uuid4()
+    value = {
+        "due": datetime(2025, 6, 23, 9, 30, tzinfo=UTC),
+        "day": date(2025, 6, 23),
+        "start": dt_time(9, 30),
+        "task_id": task_id,
+        "hours": Decimal("2.50"),
+        "window": (1, "2"),
+        "status": TaskStatus.PENDING,
+        "by_task": {task_id: [Decimal("1.25")]},
+        "report": Report(title="Weekly", created_at=datetime(2025, 6, 23)),
+        "plain": {"__cache_type__": "uuid", "n": None},
+    }
+    writer = RedisCacheBackend(server, caches)
+    reader = RedisCacheBackend(server, caches)
+    local = InProcessCacheBackend({"medium": TTLCache(maxsize=10, ttl=60)})
+
+    for backend in (writer, local):
+        backend.set("medium", "key", value)
+
+    from_local = local.get("medium", "key")
+    from_shared = reader.get("medium", "key")
+    assert from_shared == from_local == value
+    assert type(from_shared["window"]) is tuple
+    assert type(from_shared["status"]) is TaskStatus
+    assert type(from_shared["hours"]) is Decimal
+
+
+def test_instances_share_results(instances):
+    first, second = instances
+    calls = []
+
+    @cached(cache_type="short", key_prefix="test_shared")
+    def compute(x):
+        calls.append(x)
+        return {"value": x}
+
+    assert compute(1) == {"value": 1}
+    set_cache_backend(second)
+    assert compute(1) == {"value": 1}
+    assert calls == [1]
+
+
+def test_unserializable_results_are_not_cached(instances):
+    calls = []
+
+    @cached(cache_type="short", key_prefix="test_unserializable")
+    def compute():
+        calls.append(1)
+        return object()
+
+    compute()
+    compute()
+    assert len(calls) == 2
+
+
+def test_waits_for_result_computed_elsewhere(instances):
+    first, second = instances
+    calls = []
+
+    @cached(cache_type="short", key_prefix="test_single_flight")
+    def compute(x):
+        calls.append(x)
+        return x * 10
+
+    key = "test_single_flight:3"
+    token = first.acquire("short", key)
+    assert token is not None
+    assert second.acquire("short", key) is None
+
+    set_cache_backend(second)
+    results = []
+    waiter = threading.Thread(target=lambda: results.append(compute(3)))
+    waiter.start()
+    time.sleep(0.05)
+    first.set("short", key, 30)
+    first.release("short", key, token)
+    waiter.join(timeout=2)
+
+    assert results == [30]
+    assert calls == []
+
+
+async def test_async_waiter_computes_when_lock_is_released_empty(instances):
+    first, second = instances
+    calls = []
+
+    @cached(cache_type="short", key_prefix="test_async_single_flight")
+    async def compute(x):
+        calls.append(x)
+        return x + 1
+
+    key = "test_async_single_flight:1"
+    token = first.acquire("short", key)
+    set_cache_backend(second)
+
+    async def release_without_result():
+        await asyncio.sleep(0.05)
+        first.release("short", key, token)
+
+    result, _ = await asyncio.gather(compute(1), release_without_result())
+
+    assert result == 2
+    assert calls == [1]
+    assert not second.is_locked("short", key)
+
+
+async def test_unreachable_store_computes_results_uncached():
+    backend = RedisCacheBackend(UnreachableRedis(), caches, subscribe=False)
+    previous = set_cache_backend(backend)
+    calls = []
+
+    @cached(cache_type="short", key_prefix="test_outage_sync")
+    def compute(x):
+        calls.append(x)
+        return x * 2
+
+    @cached(cache_type="short", key_prefix="test_outage_async")
+    async def compute_async(x):
+        calls.append(x)
+        return x * 3
+
+    errors_before = cache_stats()["short"]["errors"]
+    try:
+        assert compute(2) == 4
+        assert compute(2) == 4
+        assert await compute_async(2) == 6
+    finally:
+        set_cache_backend(previous)
+
+    # Nothing was stored, so every call ran the function
+    assert calls == [2, 2, 2]
+    # One failed lookup and one failed lock per call
+    assert cache_stats()["short"]["errors"] - errors_before == 6
+
+
+def test_tag_invalidation_reaches_other_instances(instances):
+    first, second = instances
+
+    @cached(
+        cache_type="short",
+        key_prefix="test_shared_tags",
+        user_arg="user_id",
+        tags=(CACHE_TAG_TASKS,),
+    )
+    def per_user(user_id):
+        return {"user": user_id}
+
+    per_user("user-a")
+    key = "user:user-a:test_shared_tags:user-a"
+    # Both instances now hold a near-cache copy
+    assert second.get("short", key) == {"user": "user-a"}
+
+    assert invalidate_user_cache("user-a", CACHE_TAG_TASKS) == 1
+
+    assert first.get("short", key) is MISSING
+    assert second.get("short", key) is MISSING
+
+
+def test_invalidation_on_other_instance_discards_running_computation(instances):
+    first, second = instances
+    calls = []
+
+    @cached(
+        cache_type="short",
+        key_prefix="test_shared_generation",
+        user_arg="user_id",
+        tags=(CACHE_TAG_TASKS,),
+    )
+    def per_user(user_id):
+        calls.append(user_id)
+        if len(calls) == 1:
+            # Another instance handles a task write meanwhile
+            set_cache_backend(second)
+            invalidate_user_cache(user_id, CACHE_TAG_TASKS)
+            set_cache_backend(first)
+        return len(calls)
+
+    assert per_user("user-a") == 1
+    assert first.get("short", "user:user-a:test_shared_generation:user-a") is MISSING
+    assert per_user("user-a") == 2
+    assert per_user("user-a") == 2
+
+
+def test_pattern_invalidation_reaches_other_instances(instances):
+    first, second = instances
+    first.set("short", "report:1", 1)
+    first.set("short", "other:1", 2)
+    assert second.get("short", "report:1") == 1
+
+    invalidate_cache("short", pattern="report")
+
+    assert second.get("short", "report:1") is MISSING
+    assert second.get("short", "other:1") == 2
+
+
+def test_configure_rejects_unknown_backends():
+    with pytest.raises(ValueError):
+        configure_cache_backend("memcached")
+    with pytest.raises(ValueError):
+        configure_cache_backend("redis")
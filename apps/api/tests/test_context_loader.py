@@ -0,0 +1,159 @@
+"""
+Tests for the bulk planning data loader.
+"""
+
+from datetime import date
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+from sqlmodel import Session
+
+from humancompiler_api.ai.context_collector import ContextCollector
+from humancompiler_api.ai.context_loader import load_planning_data
+from humancompiler_api.models import (
+    Goal,
+    Log,
+    Project,
+    Task,
+    TaskStatus,
+    User,
+    WeeklyRecurringTask,
+)
+from humancompiler_api.task_rollups import reconcile_task_rollups
+
+
+@pytest.fixture
+def planning_data(session: Session):
+    user = User(id=uuid4(), email="planner@example.com")
+    other_user = User(id=uuid4(), email="other@example.com")
+    session.add_all([user, other_user])
+
+    projects = [
+        Project(id=uuid4(), owner_id=user.id, title=f"Project {index}")
+        for index in range(3)
+    ]
+    foreign_project = Project(id=uuid4(), owner_id=other_user.id, title="Foreign")
+    session.add_all([*projects, foreign_project])
+
+    goals = []
+    tasks = []
+    for project in [*projects, foreign_project]:
+        for goal_index in range(4):
+            goal = Goal(
+                id=uuid4(),
+                project_id=project.id,
+                title=f"{project.title} goal {goal_index}",
+                estimate_hours=10,
+            )
+            goals.append(goal)
+            for status in TaskStatus:
+                tasks.append(
+                    Task(
+                        id=uuid4(),
+                        goal_id=goal.id,
+                        title=f"{goal.title} {status.value}",
+                        estimate_hours=2,
+                        status=status,
+                    )
+                )
+    session.add_all(goals)
+    session.add_all(tasks)
+    session.add(
+        WeeklyRecurringTask(
+            id=uuid4(), user_id=user.id, title="Weekly review", estimate_hours=1
+        )
+    )
+    session.commit()
+
+    logged_task = next(
+        t
+        for t in tasks
+        if t.goal_id == goals[0].id and t.status == TaskStatus.IN_PROGRESS
+    )
+    session.add_all(
+        [
+            Log(id=uuid4(), task_id=logged_task.id, actual_minutes=30),
+            Log(id=uuid4(), task_id=logged_task.id, actual_minutes=60),
+        ]
+    )
+    session.commit()
+    # Logs added directly bypass the log service
+    reconcile_task_rollups(session)
+    return user, projects, logged_task
+
+
+def _count_queries(session: Session):
+    statements: list[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    return statements, lambda: event.remove(
+        engine, "before_cursor_execute", before_cursor_execute
+    )
+
+
+def test_loads_owned_active_data_in_fixed_number_of_queries(
+    session: Session, planning_data
+):
+    user, projects, logged_task = planning_data
+    user_id = user.id
+
+    statements, stop = _count_queries(session)
+    try:
+        data = load_planning_data(session, user_id)
+    finally:
+        stop()
+
+    assert len(statements) == 5
+    assert {p.id for p in data.projects} == {p.id for p in projects}
+    assert len(data.goals) == 12
+    assert len(data.tasks) == 24
+    assert {t.status for t in data.tasks} == {
+        TaskStatus.PENDING,
+        TaskStatus.IN_PROGRESS,
+    }
+    assert data.actual_hours == {str(logged_task.id): 1.5}
+    assert [r.title for r in data.weekly_recurring_tasks] == ["Weekly review"]
+    assert data.project_for_task(logged_task).id == projects[0].id
+
+
+def test_keeps_parent_grouping_order(session: Session, planning_data):
+    user, _, _ = planning_data
+
+    data = load_planning_data(session, user.id)
+
+    goal_position = {goal.id: index for index, goal in enumerate(data.goals)}
+    positions = [goal_position[task.goal_id] for task in data.tasks]
+    assert positions == sorted(positions)
+    project_position = {p.id: index for index, p in enumerate(data.projects)}
+    positions = [project_position[goal.project_id] for goal in data.goals]
+    assert positions == sorted(positions)
+
+
+def test_project_filter_ignores_invalid_ids(session: Session, planning_data):
+    user, projects, _ = planning_data
+
+    data = load_planning_data(
+        session, user.id, project_ids=[str(projects[1].id), "not-a-uuid"]
+    )
+
+    assert [p.id for p in data.projects] == [projects[1].id]
+    assert {data.goals_by_id[t.goal_id].project_id for t in data.tasks} == {
+        projects[1].id
+    }
+
+
+async def test_context_collector_uses_bulk_loader(session: Session, planning_data):
+    user, _, logged_task = planning_data
+
+    context = await ContextCollector().collect_weekly_plan_context(
+        session, str(user.id), date(2025, 6, 23)
+    )
+
+    assert len(context.tasks) == 24
+    assert context.actual_hours_map == {str(logged_task.id): 1.5}
+    assert len(context.weekly_recurring_tasks) == 1
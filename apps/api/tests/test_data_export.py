@@ -5,17 +5,25 @@ Tests for data export/import functionality
 Issue #131: JSONデータのエクスポート機能
 """
 
+import gzip
 import json
 import tempfile
 import uuid
 from datetime import datetime, UTC
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlmodel import select
 
 from humancompiler_api.main import app
-from humancompiler_api.safe_migration import DataBackupManager, SafeMigrationError
+from humancompiler_api.safe_migration import (
+    DataBackupManager,
+    SafeMigrationError,
+    gzip_chunks,
+    load_user_backup,
+)
 
 
 @pytest.fixture
@@ -349,3 +357,237 @@ class TestSecurityAspects:
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+class TestStreamingExport:
+    """Test the streamed user data export"""
+
+    @pytest.fixture
+    def populated(self, session, test_user_id):
+        from conftest import create_test_data
+        from humancompiler_api.models import LogCreate, TaskCreate
+        from humancompiler_api.services import LogService, TaskService
+
+        test_data = create_test_data(session, test_user_id)
+        for index in range(3):
+            task = TaskService().create_task(
+                session,
+                TaskCreate(
+                    goal_id=test_data["goal"].id, title=f"T{index}", estimate_hours=1
+                ),
+                test_user_id,
+            )
+            LogService().create_log(
+                session, LogCreate(task_id=task.id, actual_minutes=15), test_user_id
+            )
+
+        with patch(
+            "humancompiler_api.safe_migration.db.get_engine",
+            return_value=session.get_bind(),
+        ):
+            yield test_data
+
+    def test_json_stream_matches_backup_document(self, populated, test_user_id):
+        total_records = {}
+        chunks = DataBackupManager().stream_user_backup(
+            str(test_user_id), chunk_size=2, total_records=total_records
+        )
+        backup_data = json.loads("".join(chunks))
+
+        assert backup_data["metadata"]["backup_type"] == "user_specific"
+        assert backup_data["metadata"]["version"] == "2.0"
+        assert len(backup_data["users"]) == 1
+        assert len(backup_data["tasks"]) == 3
+        assert len(backup_data["logs"]) == 3
+        assert backup_data["metadata"]["total_records"] == total_records
+        assert total_records["projects"] == 1
+
+    def test_ndjson_stream_round_trips_through_loader(
+        self, populated, test_user_id, tmp_path
+    ):
+        chunks = DataBackupManager().stream_user_backup(
+            str(test_user_id), export_format="ndjson", chunk_size=2
+        )
+        backup_file = tmp_path / "export.ndjson.gz"
+        backup_file.write_bytes(b"".join(gzip_chunks(chunks)))
+
+        lines = gzip.decompress(backup_file.read_bytes()).decode().splitlines()
+        assert json.loads(lines[0])["type"] == "metadata"
+        assert json.loads(lines[-1])["total_records"]["tasks"] == 3
+
+        backup_data = load_user_backup(backup_file)
+        assert backup_data["metadata"]["version"] == "3.0"
+        assert len(backup_data["tasks"]) == 3
+        assert backup_data["goals"][0]["id"] == str(populated["goal"].id)
+
+    def test_truncated_ndjson_is_rejected(self, populated, test_user_id, tmp_path):
+        chunks = DataBackupManager().stream_user_backup(
+            str(test_user_id), export_format="ndjson"
+        )
+        lines = "".join(chunks).splitlines(keepends=True)
+        backup_file = tmp_path / "export.ndjson"
+        backup_file.write_text("".join(lines[:-1]))
+
+        with pytest.raises(SafeMigrationError, match="incomplete"):
+            load_user_backup(backup_file)
+
+    def test_unknown_user_fails_before_streaming(self, populated):
+        with pytest.raises(SafeMigrationError, match="User not found"):
+            DataBackupManager().stream_user_backup(str(uuid.uuid4()))
+
+    def test_export_endpoint_streams_gzip(
+        self, populated, test_user_id, session, test_client
+    ):
+        from humancompiler_api.auth import AuthUser, get_current_user
+        from humancompiler_api.database import db
+
+        app.dependency_overrides[get_current_user] = lambda: AuthUser(
+            user_id=str(test_user_id), email="test@example.com"
+        )
+        app.dependency_overrides[db.get_session] = lambda: session
+        try:
+            response = test_client.get(
+                "/api/export/user-data", params={"format": "ndjson", "compress": True}
+            )
+        finally:
+            app.dependency_overrides.clear()
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/gzip"
+        assert ".ndjson.gz" in response.headers["content-disposition"]
+        lines = gzip.decompress(response.content).decode().splitlines()
+        assert json.loads(lines[-1])["type"] == "summary"
+
+
+class TestBulkImport:
+    """Test the validated, batched user data import"""
+
+    @pytest.fixture
+    def export_file(self, session, test_user_id, tmp_path):
+        from conftest import create_test_data
+        from humancompiler_api.models import LogCreate, TaskCreate, UserCreate
+        from humancompiler_api.services import LogService, TaskService, UserService
+
+        test_data = create_test_data(session, test_user_id)
+        first = None
+        for index in range(3):
+            task = TaskService().create_task(
+                session,
+                TaskCreate(
+                    goal_id=test_data["goal"].id, title=f"T{index}", estimate_hours=1
+                ),
+                test_user_id,
+            )
+            first = first or task
+            LogService().create_log(
+                session, LogCreate(task_id=task.id, actual_minutes=20), test_user_id
+            )
+        TaskService().add_task_dependency(session, task.id, first.id, test_user_id)
+
+        target_id = uuid.uuid4()
+        UserService().create_user(
+            session, UserCreate(email="target@example.com"), target_id
+        )
+
+        with patch(
+            "humancompiler_api.safe_migration.db.get_engine",
+            return_value=session.get_bind(),
+        ):
+            chunks = DataBackupManager().stream_user_backup(
+                str(test_user_id), export_format="ndjson"
+            )
+            backup_file = tmp_path / "export.ndjson"
+            backup_file.write_text("".join(chunks))
+            yield backup_file, target_id
+
+    @staticmethod
+    def owned_tasks(session, owner_id):
+        from humancompiler_api.models import Goal, Project, Task
+
+        return session.exec(
+            select(Task)
+            .join(Goal, Task.goal_id == Goal.id)
+            .join(Project, Goal.project_id == Project.id)
+            .where(Project.owner_id == owner_id)
+        ).all()
+
+    def test_dry_run_reports_without_writing(self, session, export_file):
+        backup_file, target_id = export_file
+
+        report = DataBackupManager().restore_user_data(
+            str(backup_file), str(target_id), dry_run=True, batch_size=2
+        )
+
+        assert report.dry_run
+        assert report.imported["tasks"] == 3
+        assert report.imported["logs"] == 3
+        assert report.skipped == {"users": 1}
+        assert self.owned_tasks(session, target_id) == []
+
+    def test_import_inserts_remapped_rows(self, session, test_user_id, export_file):
+        from humancompiler_api.models import TaskDependency
+        from humancompiler_api.task_rollups import get_task_rollups
+
+        backup_file, target_id = export_file
+
+        report = DataBackupManager().restore_user_data(
+            str(backup_file), str(target_id), batch_size=2
+        )
+
+        assert report.imported["task_dependencies"] == 1
+        assert report.rows_per_second > 0
+        tasks = self.owned_tasks(session, target_id)
+        assert len(tasks) == 3
+        source_ids = {task.id for task in self.owned_tasks(session, test_user_id)}
+        assert not source_ids & {task.id for task in tasks}
+
+        # Rollups are rebuilt for the imported logs
+        rollups = get_task_rollups(session, [task.id for task in tasks])
+        assert sorted(rollups.values()) == [(20, 1)] * 3
+        dependency = session.exec(
+            select(TaskDependency).where(
+                TaskDependency.task_id.in_([task.id for task in tasks])
+            )
+        ).one()
+        assert dependency.depends_on_task_id in {task.id for task in tasks}
+
+    def test_invalid_record_rejects_whole_file(self, session, export_file):
+        backup_file, target_id = export_file
+        lines = backup_file.read_text().splitlines()
+        for index, line in enumerate(lines):
+            entry = json.loads(line)
+            if entry.get("section") == "logs":
+                entry["data"]["actual_minutes"] = "many"
+                lines[index] = json.dumps(entry)
+                break
+        backup_file.write_text("\n".join(lines) + "\n")
+
+        with pytest.raises(SafeMigrationError, match="Invalid logs record #1"):
+            DataBackupManager().restore_user_data(str(backup_file), str(target_id))
+        assert self.owned_tasks(session, target_id) == []
+
+    def test_import_endpoint_dry_run(self, session, export_file, test_client):
+        from humancompiler_api.auth import AuthUser, get_current_user
+        from humancompiler_api.database import db
+
+        backup_file, target_id = export_file
+        app.dependency_overrides[get_current_user] = lambda: AuthUser(
+            user_id=str(target_id), email="target@example.com"
+        )
+        app.dependency_overrides[db.get_session] = lambda: session
+        try:
+            with backup_file.open("rb") as f:
+                response = test_client.post(
+                    "/api/import/user-data",
+                    params={"dry_run": True},
+                    files={"file": ("export.ndjson", f, "application/x-ndjson")},
+                )
+        finally:
+            app.dependency_overrides.clear()
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["dry_run"] is True
+        assert data["imported_records"]["tasks"] == 3
+        assert "rows_per_second" in data
+        assert self.owned_tasks(session, target_id) == []
@@ -2,7 +2,7 @@ from uuid import uuid4
 
 import pytest
 from fastapi import HTTPException
-from sqlmodel import Session
+from sqlmodel import Session, select
 
 from humancompiler_api.models import (
     Goal,
@@ -10,6 +10,7 @@ from humancompiler_api.models import (
     Project,
     Task,
     TaskDependency,
+    TaskDependencyBulkItem,
     User,
 )
 from humancompiler_api.services import GoalService, TaskService
@@ -189,3 +190,114 @@ class TestGoalDependencyCycleDetection:
             )
 
         _assert_circular_dependency_rejected(exc_info)
+
+
+class TestDependencyGraphFreshness:
+    def test_cycle_check_sees_edges_written_outside_the_service(
+        self, session: Session, dependency_graph_data
+    ):
+        user, _, tasks = dependency_graph_data
+        task_a, task_b, task_c = tasks
+        service = TaskService()
+
+        # Prime any state the check might keep between calls
+        service.add_task_dependency(session, task_a.id, task_b.id, user.id)
+
+        # Another API instance commits B -> C directly
+        session.add(
+            TaskDependency(id=uuid4(), task_id=task_b.id, depends_on_task_id=task_c.id)
+        )
+        session.commit()
+
+        with pytest.raises(HTTPException) as exc_info:
+            service.add_task_dependency(session, task_c.id, task_a.id, user.id)
+
+        _assert_circular_dependency_rejected(exc_info)
+
+        # Deleting an edge lets the reverse edge through again
+        dependency = session.exec(
+            select(TaskDependency).where(TaskDependency.task_id == task_a.id)
+        ).one()
+        service.delete_task_dependency(session, task_a.id, dependency.id, user.id)
+        service.add_task_dependency(session, task_c.id, task_a.id, user.id)
+
+
+class TestBulkTaskDependencies:
+    def test_adds_all_edges(self, session: Session, dependency_graph_data):
+        user, _, tasks = dependency_graph_data
+        task_a, task_b, task_c = tasks
+
+        created = TaskService().add_task_dependencies_bulk(
+            session,
+            [
+                TaskDependencyBulkItem(task_id=task_a.id, depends_on_task_id=task_b.id),
+                TaskDependencyBulkItem(task_id=task_b.id, depends_on_task_id=task_c.id),
+            ],
+            user.id,
+        )
+
+        assert [(d.task_id, d.depends_on_task_id) for d in created] == [
+            (task_a.id, task_b.id),
+            (task_b.id, task_c.id),
+        ]
+        assert created[0].depends_on_task.id == task_b.id
+
+    def test_rejects_whole_batch_and_reports_each_invalid_edge(
+        self, session: Session, dependency_graph_data
+    ):
+        user, _, tasks = dependency_graph_data
+        task_a, task_b, task_c = tasks
+        service = TaskService()
+        service.add_task_dependency(session, task_a.id, task_b.id, user.id)
+
+        with pytest.raises(HTTPException) as exc_info:
+            service.add_task_dependencies_bulk(
+                session,
+                [
+                    TaskDependencyBulkItem(
+                        task_id=task_b.id, depends_on_task_id=task_c.id
+                    ),
+                    # Cycle only through the edge accepted just above
+                    TaskDependencyBulkItem(
+                        task_id=task_c.id, depends_on_task_id=task_a.id
+                    ),
+                    TaskDependencyBulkItem(
+                        task_id=task_a.id, depends_on_task_id=task_b.id
+                    ),
+                    TaskDependencyBulkItem(
+                        task_id=task_a.id, depends_on_task_id=uuid4()
+                    ),
+                ],
+                user.id,
+            )
+
+        assert exc_info.value.status_code == 400
+        errors = exc_info.value.detail["error"]["details"]["errors"]
+        assert [(e["index"], e["reason"]) for e in errors] == [
+            (1, "Creating this dependency would create a circular dependency"),
+            (2, "Dependency already exists"),
+            (3, "Dependency task not found"),
+        ]
+        assert len(session.exec(select(TaskDependency)).all()) == 1
+
+    def test_rejects_tasks_of_other_users(
+        self, session: Session, dependency_graph_data
+    ):
+        _, _, tasks = dependency_graph_data
+        other_user = User(id=uuid4(), email="someone-else@example.com")
+        session.add(other_user)
+        session.commit()
+
+        with pytest.raises(HTTPException) as exc_info:
+            TaskService().add_task_dependencies_bulk(
+                session,
+                [
+                    TaskDependencyBulkItem(
+                        task_id=tasks[0].id, depends_on_task_id=tasks[1].id
+                    )
+                ],
+                other_user.id,
+            )
+
+        errors = exc_info.value.detail["error"]["details"]["errors"]
+        assert errors[0]["reason"] == "Task not found"
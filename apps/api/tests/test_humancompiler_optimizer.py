@@ -10,13 +10,16 @@ import pytest
 from humancompiler_optimizer import (
     Assignment,
     DailySolverConfig,
+    FixedAssignment,
     ScheduleResult,
     SchedulerTask,
     SlotKind,
     TaskKind,
     TimeSlot,
     optimize_daily_schedule,
+    previous_assignments_from_plan,
 )
+from humancompiler_optimizer.search import configure_cp_solver, solve_with_early_stop
 from humancompiler_optimizer.weekly import (
     ProjectAllocationSpec,
     WeeklySelectionResult,
@@ -209,6 +212,74 @@ class TestDailySolverDependencies:
         if prereq_slot is not None and dependent_slot is not None:
             assert prereq_slot <= dependent_slot
 
+    def test_goal_dependency_ordering(self):
+        """Tasks of a dependent goal should not precede prerequisite goal tasks."""
+        tasks = [
+            SchedulerTask(
+                id="dependent",
+                title="Dependent",
+                estimate_hours=1.0,
+                priority=1,
+                goal_id="goal_b",
+            ),
+            SchedulerTask(
+                id="prereq",
+                title="Prerequisite",
+                estimate_hours=1.0,
+                priority=5,
+                goal_id="goal_a",
+            ),
+        ]
+        # Unconstrained, the higher-priority dependent task would take the
+        # earlier matching slot and push the prerequisite after it.
+        slots = [
+            TimeSlot(start=time(9, 0), end=time(10, 0), kind=SlotKind.LIGHT_WORK),
+            TimeSlot(start=time(10, 0), end=time(11, 0), kind=SlotKind.FOCUSED_WORK),
+        ]
+        result = optimize_daily_schedule(
+            tasks=tasks,
+            time_slots=slots,
+            goal_dependencies={"goal_b": ["goal_a"]},
+        )
+        assert result.success is True
+        slot_by_task = {a.task_id: a.slot_index for a in result.assignments}
+        if "dependent" in slot_by_task and "prereq" in slot_by_task:
+            assert slot_by_task["prereq"] <= slot_by_task["dependent"]
+
+    def test_dependency_model_size_is_linear_in_slots(self):
+        """Dependency constraints should not grow with slots squared."""
+        tasks = [
+            SchedulerTask(
+                id=f"task{i}",
+                title=f"Task {i}",
+                estimate_hours=0.5,
+                goal_id="goal_b" if i % 2 else "goal_a",
+            )
+            for i in range(10)
+        ]
+
+        def constraints_for(slot_count: int) -> int:
+            slots = [
+                TimeSlot(
+                    start=time(8 + i // 2, 30 * (i % 2)),
+                    end=time(8 + (i + 1) // 2, 30 * ((i + 1) % 2)),
+                    kind=SlotKind.LIGHT_WORK,
+                )
+                for i in range(slot_count)
+            ]
+            result = optimize_daily_schedule(
+                tasks=tasks,
+                time_slots=slots,
+                config=DailySolverConfig(max_time_in_seconds=1.0),
+                goal_dependencies={"goal_b": ["goal_a"]},
+            )
+            assert result.model_constraints > 0
+            assert result.model_variables > 0
+            return result.model_constraints
+
+        # Doubling the slots should roughly double the model, not quadruple it
+        assert constraints_for(20) < 2.5 * constraints_for(10)
+
 
 class TestDailySolverProjectConstraints:
     """Tests for project-based slot assignment constraints."""
@@ -245,6 +316,81 @@ class TestDailySolverProjectConstraints:
         assert "project_b_task" not in scheduled_ids
 
 
+class TestDailySolverSparseModel:
+    """Tests that impossible task/slot pairs are never materialized."""
+
+    def test_project_locked_slots_create_no_variables(self):
+        """Tasks from other projects get no variables in locked slots."""
+        tasks = [
+            SchedulerTask(
+                id=f"task{i}",
+                title=f"Task {i}",
+                estimate_hours=1.0,
+                project_id="project_b",
+            )
+            for i in range(5)
+        ]
+        open_slot = TimeSlot(
+            start=time(9, 0), end=time(10, 0), kind=SlotKind.LIGHT_WORK
+        )
+        locked_slot = TimeSlot(
+            start=time(10, 0),
+            end=time(11, 0),
+            kind=SlotKind.LIGHT_WORK,
+            assigned_project_id="project_a",
+        )
+
+        open_result = optimize_daily_schedule(
+            tasks=tasks, time_slots=[open_slot, open_slot]
+        )
+        locked_result = optimize_daily_schedule(
+            tasks=tasks, time_slots=[open_slot, locked_slot]
+        )
+
+        assert locked_result.success is True
+        assert all(a.slot_index == 0 for a in locked_result.assignments)
+        assert locked_result.model_variables < open_result.model_variables
+
+    def test_zero_remaining_and_zero_capacity_pairs_skipped(self):
+        """Finished tasks and zero-capacity slots contribute no variables."""
+        tasks = [
+            SchedulerTask(
+                id="done", title="Done", estimate_hours=2.0, actual_hours=2.0
+            ),
+        ]
+        slots = [
+            TimeSlot(
+                start=time(9, 0),
+                end=time(10, 0),
+                kind=SlotKind.LIGHT_WORK,
+                capacity_hours=0.0,
+            ),
+            TimeSlot(start=time(10, 0), end=time(11, 0), kind=SlotKind.LIGHT_WORK),
+        ]
+        result = optimize_daily_schedule(tasks=tasks, time_slots=slots)
+        assert result.success is True
+        assert result.unscheduled_tasks == ["done"]
+        assert result.model_variables == 0
+
+    def test_fixed_task_only_uses_fixed_slot(self):
+        """A fixed task is modelled only in its fixed slot."""
+        tasks = [SchedulerTask(id="task1", title="Task 1", estimate_hours=1.0)]
+        slots = [
+            TimeSlot(start=time(9, 0), end=time(10, 0), kind=SlotKind.LIGHT_WORK),
+            TimeSlot(start=time(10, 0), end=time(11, 0), kind=SlotKind.LIGHT_WORK),
+        ]
+        result = optimize_daily_schedule(
+            tasks=tasks,
+            time_slots=slots,
+            fixed_assignments=[FixedAssignment(task_id="task1", slot_index=1)],
+        )
+        assert result.success is True
+        assert result.assignments[0].slot_index == 1
+        assert result.assignments[0].is_fixed is True
+        # One BoolVar and one IntVar for the single fixed pair
+        assert result.model_variables == 2
+
+
 class TestDailySolverConfig:
     """Tests for solver configuration."""
 
@@ -264,6 +410,24 @@ class TestDailySolverConfig:
         result = optimize_daily_schedule(tasks=tasks, time_slots=slots, config=config)
         assert result.success is True
 
+    def test_search_settings(self):
+        """Worker count, gap limit and early stop should not change feasibility."""
+        config = DailySolverConfig(
+            num_workers=2,
+            relative_gap_limit=0.05,
+            no_improvement_timeout_seconds=0.5,
+        )
+        tasks = [
+            SchedulerTask(id=f"task{i}", title=f"Task {i}", estimate_hours=1.0)
+            for i in range(4)
+        ]
+        slots = [
+            TimeSlot(start=time(9, 0), end=time(12, 0), kind=SlotKind.LIGHT_WORK),
+        ]
+        result = optimize_daily_schedule(tasks=tasks, time_slots=slots, config=config)
+        assert result.success is True
+        assert result.total_scheduled_hours == pytest.approx(3.0)
+
 
 class TestDailySolverRemainingHours:
     """Tests for remaining hours calculation."""
@@ -288,6 +452,135 @@ class TestDailySolverRemainingHours:
         assert result.assignments[0].duration_hours <= 2.0
 
 
+class TestDailySolverWarmStart:
+    """Tests for warm-starting from a previous schedule."""
+
+    @staticmethod
+    def _two_equal_slots():
+        return [
+            TimeSlot(start=time(9, 0), end=time(10, 0), kind=SlotKind.LIGHT_WORK),
+            TimeSlot(start=time(10, 0), end=time(11, 0), kind=SlotKind.LIGHT_WORK),
+        ]
+
+    def test_stability_keeps_previous_slot(self):
+        """With a stability weight, an equally good previous slot is kept."""
+        tasks = [SchedulerTask(id="task1", title="Task 1", estimate_hours=1.0)]
+        previous = [
+            Assignment(
+                task_id="task1",
+                slot_index=1,
+                start_time=time(10, 0),
+                duration_hours=1.0,
+            )
+        ]
+        result = optimize_daily_schedule(
+            tasks=tasks,
+            time_slots=self._two_equal_slots(),
+            config=DailySolverConfig(stability_weight=1),
+            previous_assignments=previous,
+        )
+        assert result.success is True
+        assert result.assignments[0].slot_index == 1
+        assert result.warm_start_hints == 1
+        assert result.changed_assignments == 0
+
+    def test_stability_bonus_is_reported_apart_from_objective(self):
+        """Warm and cold objective values stay comparable."""
+        tasks = [SchedulerTask(id="task1", title="Task 1", estimate_hours=1.0)]
+        previous = [
+            Assignment(
+                task_id="task1",
+                slot_index=1,
+                start_time=time(10, 0),
+                duration_hours=1.0,
+            )
+        ]
+        cold = optimize_daily_schedule(tasks=tasks, time_slots=self._two_equal_slots())
+        warm = optimize_daily_schedule(
+            tasks=tasks,
+            time_slots=self._two_equal_slots(),
+            config=DailySolverConfig(stability_weight=2),
+            previous_assignments=previous,
+        )
+        assert warm.objective_value == cold.objective_value
+        # 60 kept minutes at weight 2
+        assert warm.stability_bonus == 120.0
+        assert cold.stability_bonus == 0.0
+
+    def test_measure_cold_start_reports_both_times(self):
+        """Cold solve time is reported alongside the hinted solve time."""
+        tasks = [SchedulerTask(id="task1", title="Task 1", estimate_hours=1.0)]
+        previous = [
+            Assignment(
+                task_id="task1",
+                slot_index=0,
+                start_time=time(9, 0),
+                duration_hours=1.0,
+            )
+        ]
+        result = optimize_daily_schedule(
+            tasks=tasks,
+            time_slots=self._two_equal_slots(),
+            config=DailySolverConfig(measure_cold_start=True),
+            previous_assignments=previous,
+        )
+        assert result.success is True
+        assert result.cold_solve_time_seconds is not None
+        assert result.solver_wall_time_seconds >= 0.0
+
+    def test_without_previous_assignments(self):
+        """Warm-start fields stay empty for a cold solve."""
+        tasks = [SchedulerTask(id="task1", title="Task 1", estimate_hours=1.0)]
+        result = optimize_daily_schedule(
+            tasks=tasks,
+            time_slots=self._two_equal_slots(),
+            config=DailySolverConfig(measure_cold_start=True),
+        )
+        assert result.warm_start_hints == 0
+        assert result.cold_solve_time_seconds is None
+        assert result.changed_assignments is None
+
+    def test_unknown_previous_tasks_are_ignored(self):
+        """Previous assignments for tasks no longer present count as churn only."""
+        tasks = [SchedulerTask(id="task1", title="Task 1", estimate_hours=1.0)]
+        previous = [
+            Assignment(
+                task_id="gone",
+                slot_index=0,
+                start_time=time(9, 0),
+                duration_hours=1.0,
+            )
+        ]
+        result = optimize_daily_schedule(
+            tasks=tasks,
+            time_slots=self._two_equal_slots(),
+            previous_assignments=previous,
+        )
+        assert result.warm_start_hints == 0
+        # "gone" was removed and "task1" was added
+        assert result.changed_assignments == 2
+
+    def test_previous_assignments_from_plan(self):
+        """Saved plan_json entries are converted and malformed ones skipped."""
+        plan = {
+            "assignments": [
+                {
+                    "task_id": "task1",
+                    "slot_index": 1,
+                    "start_time": "10:30",
+                    "duration_hours": 0.5,
+                },
+                {"task_id": "broken"},
+            ]
+        }
+        assignments = previous_assignments_from_plan(plan)
+        assert len(assignments) == 1
+        assert assignments[0].task_id == "task1"
+        assert assignments[0].slot_index == 1
+        assert assignments[0].start_time == time(10, 30)
+        assert previous_assignments_from_plan(None) == []
+
+
 class TestWeeklySolverBasic:
     """Basic tests for weekly task selection optimization."""
 
@@ -398,6 +691,25 @@ class TestWeeklySolverProjectAllocation:
         # Project A task should not be selected
         assert "proj_a_task" not in result.selected_task_ids
 
+    def test_fractional_hours_do_not_make_allocation_infeasible(self):
+        """Project bounds use the same rounding as the per-task terms."""
+        tasks = [
+            WeeklyTaskSpec(
+                id=f"task{i}",
+                title=f"Task {i}",
+                hours=0.375,
+                priority_score=5.0,
+                project_id="proj1",
+            )
+            for i in range(2)
+        ]
+        allocations = [ProjectAllocationSpec(project_id="proj1", target_hours=20.0)]
+        result = optimize_weekly_selection(
+            tasks=tasks, project_allocations=allocations, total_capacity_hours=40.0
+        )
+        assert result.success is True
+        assert set(result.selected_task_ids) == {"task0", "task1"}
+
 
 class TestWeeklySolverRecurringTasks:
     """Tests for weekly recurring task handling."""
@@ -454,6 +766,52 @@ class TestWeeklySolverConfig:
         )
         assert result.success is True
 
+    def test_configure_cp_solver_applies_search_settings(self):
+        """Non-zero search settings are passed to CP-SAT; zero keeps defaults."""
+        from ortools.sat.python import cp_model
+
+        solver = cp_model.CpSolver()
+        default_workers = solver.parameters.num_workers
+        configure_cp_solver(solver, max_time_in_seconds=3.0)
+        assert solver.parameters.num_workers == default_workers
+
+        configure_cp_solver(
+            solver,
+            max_time_in_seconds=3.0,
+            num_workers=2,
+            relative_gap_limit=0.01,
+            max_deterministic_time=1.5,
+        )
+        assert solver.parameters.max_time_in_seconds == 3.0
+        assert solver.parameters.num_workers == 2
+        assert solver.parameters.relative_gap_limit == pytest.approx(0.01)
+        assert solver.parameters.max_deterministic_time == pytest.approx(1.5)
+
+    def test_early_stop_ends_stalled_search(self):
+        """A search whose incumbent stops improving ends before its time limit."""
+        import random
+
+        from ortools.sat.python import cp_model
+
+        # Subset-sum near half the total: good solutions come fast, proving
+        # optimality does not.
+        rng = random.Random(1)
+        weights = [rng.randint(10**8, 10**9) for _ in range(40)]
+        model = cp_model.CpModel()
+        picks = [model.NewBoolVar(f"pick{i}") for i in range(len(weights))]
+        total = sum(w * x for w, x in zip(weights, picks, strict=True))
+        model.Add(total <= sum(weights) // 2 + 1)
+        model.Maximize(total)
+
+        solver = cp_model.CpSolver()
+        configure_cp_solver(solver, max_time_in_seconds=20.0, num_workers=2)
+        status = solve_with_early_stop(
+            solver, model, no_improvement_timeout_seconds=0.2
+        )
+
+        assert status in (cp_model.OPTIMAL, cp_model.FEASIBLE)
+        assert solver.WallTime() < 10.0
+
 
 class TestWeeklySolverEdgeCases:
     """Edge case tests for weekly solver."""
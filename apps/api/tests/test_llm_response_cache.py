@@ -0,0 +1,163 @@
+"""
+Tests for the content-addressed LLM response cache.
+"""
+
+import json
+from datetime import UTC, date, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from humancompiler_api.ai.models import WeeklyPlanContext
+from humancompiler_api.ai.openai_client import OpenAIClient
+from humancompiler_api.ai.response_cache import (
+    llm_cache_key,
+    llm_response_cache,
+    task_state_fingerprint,
+)
+from humancompiler_api.ai.weekly_task_solver import TaskPriorityExtractor
+
+
+def make_task(task_id: str, estimate_hours: float = 2.0):
+    return SimpleNamespace(
+        id=task_id,
+        title=f"Task {task_id}",
+        description=None,
+        status="pending",
+        estimate_hours=estimate_hours,
+        due_date=date(2025, 6, 30),
+        priority=3,
+        goal_id="goal-1",
+        updated_at=datetime(2025, 6, 1, tzinfo=UTC),
+    )
+
+
+def make_context(tasks) -> WeeklyPlanContext:
+    return WeeklyPlanContext(
+        user_id="user-1",
+        week_start_date=date(2025, 6, 23),
+        projects=[],
+        goals=[],
+        tasks=tasks,
+        weekly_recurring_tasks=[],
+        selected_recurring_task_ids=[],
+        capacity_hours=40.0,
+        preferences={},
+    )
+
+
+def tool_call_response(name: str, arguments: dict) -> Mock:
+    response = Mock()
+    response.choices = [Mock()]
+    tool_call = response.choices[0].message.tool_calls = [Mock()]
+    tool_call[0].function.name = name
+    tool_call[0].function.arguments = json.dumps(arguments)
+    return response
+
+
+def test_key_ignores_formatting_but_not_content():
+    messages = [{"role": "user", "content": "Plan\n\n  my   week"}]
+    state = task_state_fingerprint([make_task("t1"), make_task("t2")])
+    key = llm_cache_key("priorities", "user-1", "gpt-4", messages, None, state)
+
+    reformatted = [{"role": "user", "content": "Plan my week"}]
+    reordered = task_state_fingerprint([make_task("t2"), make_task("t1")])
+    assert key.startswith("llm:priorities:")
+    assert key == llm_cache_key(
+        "priorities", "user-1", "gpt-4", reformatted, None, reordered
+    )
+
+    edited = make_task("t1")
+    edited.updated_at += timedelta(minutes=1)
+    changed_state = task_state_fingerprint([edited, make_task("t2")])
+    assert key != llm_cache_key(
+        "priorities", "user-1", "gpt-4", messages, None, changed_state
+    )
+    assert key != llm_cache_key("priorities", "user-1", "gpt-5", messages, None, state)
+    assert key != llm_cache_key("priorities", "user-2", "gpt-4", messages, None, state)
+
+
+@pytest.mark.asyncio
+async def test_unchanged_backlog_skips_priority_extraction_call():
+    client = Mock()
+    client.chat.completions.create = AsyncMock(
+        return_value=tool_call_response(
+            "extract_task_priorities", {"task_priorities": {"t1": 8.0, "t2": 3.0}}
+        )
+    )
+    extractor = TaskPriorityExtractor(openai_client=client)
+
+    first = await extractor.extract_priorities(
+        make_context([make_task("t1"), make_task("t2")]), "Focus", []
+    )
+    second = await extractor.extract_priorities(
+        make_context([make_task("t1"), make_task("t2")]), "Focus", []
+    )
+    assert first == second == {"t1": 8.0, "t2": 3.0}
+    assert client.chat.completions.create.await_count == 1
+
+    # An edited task or different instructions ask the model again
+    await extractor.extract_priorities(
+        make_context([make_task("t1", 5.0), make_task("t2")]), "Focus", []
+    )
+    await extractor.extract_priorities(
+        make_context([make_task("t1"), make_task("t2")]), "Other", []
+    )
+    assert client.chat.completions.create.await_count == 3
+
+    stats = llm_response_cache.get_stats()
+    assert stats["by_purpose"]["priority_scores"] == {"hits": 2, "misses": 2}
+    assert stats["hit_rate"] == 0.5
+
+
+@pytest.mark.asyncio
+async def test_fallback_priorities_are_not_cached():
+    response = Mock()
+    response.choices = [Mock()]
+    response.choices[0].message.tool_calls = None
+    client = Mock()
+    client.chat.completions.create = AsyncMock(return_value=response)
+    extractor = TaskPriorityExtractor(openai_client=client)
+    context = make_context([make_task("t1")])
+
+    await extractor.extract_priorities(context, None, [])
+    await extractor.extract_priorities(context, None, [])
+
+    assert client.chat.completions.create.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_weekly_plan_reuses_successful_plans_only():
+    client = OpenAIClient(api_key="sk-test", model="gpt-4")
+    client.client = Mock()
+    client.client.chat.completions.create = AsyncMock(
+        side_effect=[
+            Mock(choices=[Mock(message=Mock(tool_calls=None, content=None))]),
+            tool_call_response(
+                "create_weekly_plan",
+                {
+                    "task_plans": [
+                        {
+                            "task_id": "t1",
+                            "estimated_hours": 2.0,
+                            "priority": 1,
+                            "rationale": "Due soon",
+                        }
+                    ],
+                    "recommendations": [],
+                    "insights": [],
+                },
+            ),
+        ]
+    )
+
+    failed = await client.generate_weekly_plan(make_context([make_task("t1")]))
+    planned = await client.generate_weekly_plan(make_context([make_task("t1")]))
+    reused = await client.generate_weekly_plan(make_context([make_task("t1")]))
+
+    assert not failed.success
+    assert planned.success and reused.success
+    assert [plan.task_id for plan in reused.task_plans] == ["t1"]
+    assert reused is not planned
+    assert client.client.chat.completions.create.await_count == 2
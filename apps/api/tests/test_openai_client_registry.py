@@ -0,0 +1,73 @@
+"""
+Tests for the shared async OpenAI client registry.
+"""
+
+import asyncio
+
+import pytest
+from openai import AsyncOpenAI
+
+from humancompiler_api.ai.client_registry import OpenAIClientRegistry, hash_api_key
+
+
+@pytest.fixture
+def registry():
+    return OpenAIClientRegistry(
+        maxsize=2, max_connections=10, max_keepalive_connections=5
+    )
+
+
+def test_clients_are_shared_per_key(registry):
+    first = registry.get("sk-first")
+    second = registry.get("sk-second")
+
+    assert isinstance(first, AsyncOpenAI)
+    assert registry.get("sk-first") is first
+    assert second is not first
+    assert second.api_key == "sk-second"
+    # One connection pool behind every client
+    assert first._client is second._client
+    # Plain keys are never used as registry keys
+    assert "sk-first" not in registry._clients
+    assert hash_api_key("sk-first") in registry._clients
+
+    stats = registry.get_stats()
+    assert (stats["size"], stats["hits"], stats["misses"]) == (2, 1, 2)
+
+
+def test_least_recently_used_client_is_evicted(registry):
+    first = registry.get("sk-first")
+    second = registry.get("sk-second")
+    registry.get("sk-first")
+    registry.get("sk-third")
+
+    assert registry.get("sk-first") is first
+    assert registry.get("sk-second") is not second
+
+    registry.discard("sk-first")
+    assert registry.get("sk-first") is not first
+
+
+@pytest.mark.asyncio
+async def test_aclose_closes_connection_pool(registry):
+    client = registry.get("sk-first")
+    http_client = client._client
+
+    await registry.aclose()
+
+    assert http_client.is_closed
+    replacement = registry.get("sk-first")
+    assert replacement is not client
+    assert not replacement._client.is_closed
+    await registry.aclose()
+
+
+def test_new_event_loop_gets_new_pool(registry):
+    async def get_client():
+        return registry.get("sk-first")
+
+    first = asyncio.run(get_client())
+    second = asyncio.run(get_client())
+
+    assert second is not first
+    assert second._client is not first._client
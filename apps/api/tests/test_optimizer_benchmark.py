@@ -0,0 +1,67 @@
+"""
+Tests for the optimizer benchmark harness.
+"""
+
+import copy
+
+from benchmarks.optimizer_benchmark import (
+    SOLVERS,
+    compare_results,
+    generate_workload,
+    run_benchmarks,
+)
+
+
+def test_workload_generator_is_seeded():
+    first = generate_workload(50, seed=7)
+    second = generate_workload(50, seed=7)
+
+    assert first.tasks == second.tasks
+    assert first.task_dependencies == second.task_dependencies
+    assert first.weekly_tasks == second.weekly_tasks
+    assert generate_workload(50, seed=8).tasks != first.tasks
+    assert len(first.tasks) == 50
+
+
+def test_run_and_compare_against_itself():
+    document = run_benchmarks(sizes=(10,), repeat=1, deterministic_time=1.0)
+
+    assert {entry["solver"] for entry in document["results"]} == set(SOLVERS)
+    for entry in document["results"]:
+        assert entry["status"] in ("OPTIMAL", "FEASIBLE", "PARTIAL", "COMPLETE")
+        assert entry["total_seconds"] >= 0
+    assert compare_results(document, document) == []
+
+
+def test_compare_flags_regressions():
+    baseline = {
+        "results": [
+            {
+                "solver": "optimize_daily_schedule",
+                "size": 200,
+                "build_seconds": 0.1,
+                "solve_seconds": 1.0,
+                "total_seconds": 1.1,
+                "model_variables": 1000,
+                "model_constraints": 1000,
+                "objective": 500.0,
+                "status": "OPTIMAL",
+            }
+        ]
+    }
+    current = copy.deepcopy(baseline)
+    entry = current["results"][0]
+    # Within tolerance / below the absolute noise floor
+    entry["build_seconds"] = 0.14
+    assert compare_results(baseline, current) == []
+
+    entry["solve_seconds"] = 2.0
+    entry["total_seconds"] = 2.1
+    entry["objective"] = 400.0
+    entry["model_variables"] = 2000
+    regressions = compare_results(baseline, current)
+
+    assert any("solve_seconds" in line for line in regressions)
+    assert any("objective" in line for line in regressions)
+    assert any("model_variables" in line for line in regressions)
+    assert not any("build_seconds" in line for line in regressions)
@@ -0,0 +1,246 @@
+"""
+Tests for goal and project progress rollups maintained on task, goal and log writes.
+"""
+
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import object_session
+from sqlmodel import Session
+
+from conftest import create_test_data
+from humancompiler_api.auth import AuthUser, get_current_user
+from humancompiler_api.main import app
+from humancompiler_api.models import (
+    GoalCreate,
+    GoalProgressRollup,
+    GoalUpdate,
+    Log,
+    LogCreate,
+    LogUpdate,
+    ProjectCreate,
+    ProjectProgressRollup,
+    Task,
+    TaskCreate,
+    TaskStatus,
+    TaskUpdate,
+)
+from humancompiler_api.progress_rollups import reconcile_progress_rollups
+from humancompiler_api.routers import progress
+from humancompiler_api.services import (
+    GoalService,
+    LogService,
+    ProjectService,
+    TaskService,
+)
+from humancompiler_api.task_rollups import reconcile_task_rollups
+
+
+def totals(rollup) -> tuple:
+    object_session(rollup).refresh(rollup)
+    return (
+        rollup.task_count,
+        rollup.pending_tasks,
+        rollup.in_progress_tasks,
+        rollup.completed_tasks,
+        Decimal(str(rollup.task_estimate_hours)),
+        rollup.actual_minutes,
+    )
+
+
+@pytest.fixture
+def test_data(session: Session, test_user_id):
+    return create_test_data(session, test_user_id)
+
+
+def test_writes_maintain_goal_and_project_totals(
+    session: Session, test_user_id, test_data
+):
+    goal_id = test_data["goal"].id
+    project_id = test_data["project"].id
+    task_service = TaskService()
+    log_service = LogService()
+
+    first = task_service.create_task(
+        session, TaskCreate(goal_id=goal_id, title="A", estimate_hours=2), test_user_id
+    )
+    second = task_service.create_task(
+        session,
+        TaskCreate(goal_id=goal_id, title="B", estimate_hours=1.5),
+        test_user_id,
+    )
+    log = log_service.create_log(
+        session, LogCreate(task_id=first.id, actual_minutes=30), test_user_id
+    )
+    log_service.update_log(session, log.id, test_user_id, LogUpdate(actual_minutes=45))
+    task_service.update_task(
+        session, first.id, test_user_id, TaskUpdate(status=TaskStatus.COMPLETED)
+    )
+    task_service.update_task(
+        session, second.id, test_user_id, TaskUpdate(estimate_hours=3)
+    )
+
+    goal_rollup = session.get(GoalProgressRollup, goal_id)
+    project_rollup = session.get(ProjectProgressRollup, project_id)
+    expected = (2, 1, 0, 1, Decimal("5.00"), 45)
+    assert totals(goal_rollup) == expected
+    assert totals(project_rollup) == expected
+    assert project_rollup.goal_count == 1
+    assert Decimal(str(project_rollup.goal_estimate_hours)) == Decimal("10.00")
+
+    task_service.delete_task(session, first.id, test_user_id)
+    assert totals(goal_rollup) == (1, 1, 0, 0, Decimal("3.00"), 0)
+
+    # Service writes leave nothing for reconcile to fix
+    reconcile_task_rollups(session)
+    assert reconcile_progress_rollups(session).changed == 0
+
+
+def test_goal_writes_update_project_totals(session: Session, test_user_id, test_data):
+    project_id = test_data["project"].id
+    goal_service = GoalService()
+
+    goal = goal_service.create_goal(
+        session,
+        GoalCreate(project_id=project_id, title="Second", estimate_hours=4),
+        test_user_id,
+    )
+    goal_service.update_goal(
+        session, goal.id, test_user_id, GoalUpdate(estimate_hours=6)
+    )
+    task = TaskService().create_task(
+        session, TaskCreate(goal_id=goal.id, title="T", estimate_hours=2), test_user_id
+    )
+    LogService().create_log(
+        session, LogCreate(task_id=task.id, actual_minutes=20), test_user_id
+    )
+
+    project_rollup = session.get(ProjectProgressRollup, project_id)
+    session.refresh(project_rollup)
+    assert project_rollup.goal_count == 2
+    assert Decimal(str(project_rollup.goal_estimate_hours)) == Decimal("16.00")
+    assert project_rollup.actual_minutes == 20
+
+    goal_service.delete_goal(session, goal.id, test_user_id)
+    assert totals(project_rollup) == (0, 0, 0, 0, Decimal("0.00"), 0)
+    assert project_rollup.goal_count == 1
+    assert Decimal(str(project_rollup.goal_estimate_hours)) == Decimal("10.00")
+    assert session.get(GoalProgressRollup, goal.id) is None
+
+
+def test_reconcile_backfills_and_repairs(session: Session, test_user_id, test_data):
+    goal_id = test_data["goal"].id
+    # Rows inserted outside the services (e.g. imports)
+    task = Task(id=uuid4(), goal_id=goal_id, title="Imported", estimate_hours=3)
+    session.add(task)
+    session.add(Log(id=uuid4(), task_id=task.id, actual_minutes=50))
+    session.commit()
+    reconcile_task_rollups(session)
+
+    dry_run = reconcile_progress_rollups(session, dry_run=True)
+    assert (dry_run.created, dry_run.updated) == (1, 1)
+    assert session.get(GoalProgressRollup, goal_id) is None
+
+    reconcile_progress_rollups(session, owner_id=test_user_id)
+    expected = (1, 1, 0, 0, Decimal("3.00"), 50)
+    assert totals(session.get(GoalProgressRollup, goal_id)) == expected
+
+    project_rollup = session.get(ProjectProgressRollup, test_data["project"].id)
+    project_rollup.task_count = 99
+    session.add(project_rollup)
+    session.commit()
+    assert reconcile_progress_rollups(session).updated == 1
+    assert reconcile_progress_rollups(session).changed == 0
+    assert reconcile_progress_rollups(session, owner_id=uuid4()).checked == 0
+
+
+def test_deleting_project_removes_rollups(session: Session, test_user_id, test_data):
+    TaskService().create_task(
+        session,
+        TaskCreate(goal_id=test_data["goal"].id, title="T", estimate_hours=1),
+        test_user_id,
+    )
+    project_id = test_data["project"].id
+    goal_id = test_data["goal"].id
+
+    ProjectService().delete_project(session, project_id, test_user_id)
+
+    assert session.get(ProjectProgressRollup, project_id) is None
+    assert session.get(GoalProgressRollup, goal_id) is None
+
+
+def test_projects_progress_endpoint(session: Session, test_user_id, test_data):
+    task = TaskService().create_task(
+        session,
+        TaskCreate(goal_id=test_data["goal"].id, title="T", estimate_hours=4),
+        test_user_id,
+    )
+    LogService().create_log(
+        session, LogCreate(task_id=task.id, actual_minutes=90), test_user_id
+    )
+    empty = ProjectService().create_project(
+        session, ProjectCreate(title="Empty"), test_user_id
+    )
+
+    app.dependency_overrides[get_current_user] = lambda: AuthUser(
+        user_id=str(test_user_id), email="test@example.com"
+    )
+    app.dependency_overrides[progress.get_session] = lambda: session
+    try:
+        response = TestClient(app).get("/api/progress/projects")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    by_id = {item["project_id"]: item for item in response.json()}
+    assert set(by_id) == {str(test_data["project"].id), str(empty.id)}
+
+    summary = by_id[str(test_data["project"].id)]
+    assert summary["estimate_hours"] == 10.0
+    assert summary["actual_minutes"] == 90
+    assert summary["progress_percentage"] == 15.0
+    assert (summary["goal_count"], summary["task_count"]) == (1, 1)
+    assert summary["pending_tasks"] == 1
+
+    assert by_id[str(empty.id)]["goal_count"] == 0
+    assert by_id[str(empty.id)]["progress_percentage"] == 0.0
+
+
+async def test_project_and_goal_progress_read_rollups(
+    session: Session, test_user_id, test_data
+):
+    goal = test_data["goal"]
+    task = TaskService().create_task(
+        session,
+        TaskCreate(goal_id=goal.id, title="T", estimate_hours=4),
+        test_user_id,
+    )
+    LogService().create_log(
+        session, LogCreate(task_id=task.id, actual_minutes=90), test_user_id
+    )
+    # Totals come from the rollups, not from summing the task rows
+    rollup = session.get(GoalProgressRollup, goal.id)
+    rollup.actual_minutes = 120
+    session.add(rollup)
+    session.commit()
+    user = AuthUser(user_id=test_user_id, email="test@example.com")
+
+    project_progress = await progress.get_project_progress(
+        goal.project_id, session, user
+    )
+    goal_progress = await progress.get_goal_progress(goal.id, session, user)
+
+    assert project_progress.estimate_hours == Decimal("10")
+    assert project_progress.actual_minutes == 90
+    assert project_progress.progress_percentage == 15.0
+    [project_goal] = project_progress.goals
+    assert (project_goal.actual_minutes, project_goal.progress_percentage) == (
+        120,
+        20.0,
+    )
+    assert [item.actual_minutes for item in project_goal.tasks] == [90]
+
+    assert goal_progress.actual_minutes == 120
+    assert goal_progress.tasks[0].progress_percentage == 37.5
@@ -0,0 +1,179 @@
+"""
+Tests for token-budgeted, chunked AI prompts.
+"""
+
+import json
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from humancompiler_api.ai.models import WeeklyPlanContext
+from humancompiler_api.ai.openai_client import OpenAIClient
+from humancompiler_api.ai.prompt_budget import (
+    PromptBudget,
+    estimate_tokens,
+    fill_capacity,
+    rank_tasks,
+    split_plan_context,
+)
+
+
+def make_task(task_id: str, goal_id: str, due_day: int | None, hours: float = 2.0):
+    return SimpleNamespace(
+        id=task_id,
+        title=f"Task {task_id}",
+        description="word " * 200,
+        status="pending",
+        estimate_hours=hours,
+        due_date=date(2025, 6, due_day) if due_day else None,
+        priority=3,
+        goal_id=goal_id,
+    )
+
+
+def make_context(tasks) -> WeeklyPlanContext:
+    return WeeklyPlanContext(
+        user_id="user-1",
+        week_start_date=date(2025, 6, 23),
+        projects=[],
+        goals=[],
+        tasks=tasks,
+        weekly_recurring_tasks=[],
+        selected_recurring_task_ids=[],
+        capacity_hours=30.0,
+        preferences={},
+    )
+
+
+def test_estimates_and_compacts_text():
+    assert estimate_tokens("abcd" * 10) == 10
+    # Japanese text is counted per character
+    assert estimate_tokens("週間計画") == 4
+
+    budget = PromptBudget(max_tokens=1000, description_chars=10)
+    assert budget.compact("  short\n text ") == "short text"
+    assert budget.compact("a much longer description") == "a much lon…"
+    assert budget.compact(None) is None
+
+
+def test_tasks_ranked_by_urgency_and_grouped_by_goal():
+    tasks = [
+        make_task("late", "goal-b", 28),
+        make_task("undated", "goal-a", None),
+        make_task("soon", "goal-a", 24),
+        make_task("sooner", "goal-b", 23),
+    ]
+
+    ranked = [task.id for task in rank_tasks(tasks)]
+
+    assert ranked == ["sooner", "late", "soon", "undated"]
+
+
+def test_chunks_fit_budget_and_share_capacity():
+    budget = PromptBudget(max_tokens=100)
+    items = ["a", "b", "c", "d", "e"]
+
+    assert budget.chunk(items, lambda item: 30, overhead=20) == [
+        ["a", "b"],
+        ["c", "d"],
+        ["e"],
+    ]
+    assert budget.chunk(items, lambda item: 1, max_items=2) == [
+        ["a", "b"],
+        ["c", "d"],
+        ["e"],
+    ]
+    # An item over the budget is never dropped
+    assert budget.chunk(["big"], lambda item: 500) == [["big"]]
+
+    tasks = [make_task("t1", "g", 24, 3.0), make_task("t2", "g", 25, 1.0)]
+    first, second = split_plan_context(make_context(tasks), [tasks[:1], tasks[1:]])
+    # Each chunk gets its hours; spare capacity stays with the first
+    assert (first.capacity_hours, second.capacity_hours) == (29.0, 1.0)
+    assert [task.id for task in second.tasks] == ["t2"]
+
+
+def test_capacity_fills_most_urgent_chunks_first():
+    tasks = [make_task(f"t{day}", "g", day, 20.0) for day in (24, 25, 26)]
+    chunks = [[task] for task in tasks]
+
+    contexts = split_plan_context(make_context(tasks), chunks)
+
+    # 30 hours cover the first chunk and half of the second; the third is
+    # not planned at all
+    assert [context.capacity_hours for context in contexts] == [20.0, 10.0]
+    assert [context.tasks[0].id for context in contexts] == ["t24", "t25"]
+    limited = split_plan_context(make_context(tasks), chunks, capacity_hours=15.0)
+    assert [context.capacity_hours for context in limited] == [15.0]
+
+
+def test_merged_selection_keeps_urgent_items_within_limits():
+    items = [("a", "p1", 4.0), ("b", "p1", 4.0), ("c", "p2", 3.0), ("d", "p2", 3.0)]
+
+    kept = fill_capacity(
+        items,
+        lambda item: item[2],
+        9.0,
+        group=lambda item: item[1],
+        group_limits={"p1": 5.0},
+    )
+
+    # "b" exceeds its project's maximum, "d" the week's capacity
+    assert [item[0] for item in kept] == ["a", "c"]
+
+
+@pytest.mark.asyncio
+async def test_large_backlog_is_planned_in_chunks_and_merged():
+    tasks = [make_task(f"t{day}", "goal-1", day) for day in (24, 25, 26)]
+
+    async def plan_prompted_task(**kwargs):
+        prompt = kwargs["messages"][1]["content"]
+        task_id = next(task.id for task in tasks if f"ID: {task.id}\n" in prompt)
+        response = Mock()
+        response.usage = Mock(prompt_tokens=100, completion_tokens=20, total_tokens=120)
+        tool_call = Mock()
+        tool_call.function.name = "create_weekly_plan"
+        tool_call.function.arguments = json.dumps(
+            {
+                "task_plans": [
+                    {
+                        "task_id": task_id,
+                        "estimated_hours": 2.0,
+                        "priority": 1,
+                        "rationale": "Due soon",
+                    }
+                ],
+                "recommendations": ["Block mornings"],
+                "insights": [f"Planned {task_id}"],
+            }
+        )
+        response.choices = [Mock(message=Mock(tool_calls=[tool_call]))]
+        return response
+
+    client = OpenAIClient(api_key="sk-test", model="gpt-4")
+    client.client = Mock()
+    client.client.chat.completions.create = AsyncMock(side_effect=plan_prompted_task)
+    # Too small for two tasks, so every task gets its own call
+    client.prompt_budget = PromptBudget(max_tokens=1, description_chars=20)
+
+    plan = await client.generate_weekly_plan(make_context(tasks))
+
+    assert plan.success
+    task_ids = [task_plan.task_id for task_plan in plan.task_plans]
+    assert task_ids == ["t24", "t25", "t26"]
+    assert plan.total_planned_hours == 6.0
+    assert plan.recommendations == ["Block mornings"]
+    assert plan.insights == ["Planned t24", "Planned t25", "Planned t26"]
+
+    usage = plan.token_usage
+    assert (usage.chunks, usage.calls) == (3, 3)
+    assert (usage.prompt_tokens, usage.completion_tokens) == (300, 60)
+    assert usage.total_tokens == 360
+    assert usage.estimated_prompt_tokens > 0
+    prompts = [
+        call.kwargs["messages"][1]["content"]
+        for call in client.client.chat.completions.create.await_args_list
+    ]
+    assert all("word word word word…" in prompt for prompt in prompts)
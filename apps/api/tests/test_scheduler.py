@@ -75,6 +75,12 @@ class TestSchedulerAPI:
         assert block_config_keys.issubset(data["defaults"])
         assert block_config_keys.issubset({item["key"] for item in data["schema"]})
 
+        assert data["search_limits"]["num_workers"] >= 1
+        assert (
+            data["search_defaults"]["num_workers"]
+            <= data["search_limits"]["num_workers"]
+        )
+
     @patch("humancompiler_api.routers.scheduler.goal_service.get_goal")
     @patch("humancompiler_api.routers.scheduler.db.get_session")
     @patch("humancompiler_api.routers.scheduler.task_service.get_tasks_by_goal")
@@ -430,6 +436,115 @@ class TestSchedulerAPI:
         assert assignment.slot_index == 0
         assert assignment.duration_minutes == 30
 
+    def test_prune_daily_candidates_caps_backlog_to_capacity(self):
+        """Backlog pruning keeps top candidates plus fixed tasks and prerequisites."""
+        from datetime import date, time
+
+        from humancompiler_api.routers.scheduler import _prune_daily_candidates
+        from humancompiler_optimizer.daily import (
+            SchedulerTask,
+            SlotKind,
+            TaskKind,
+            TimeSlot,
+        )
+
+        tasks = [
+            SchedulerTask(
+                id=f"low-{i}",
+                title=f"Low {i}",
+                estimate_hours=1.0,
+                priority=5,
+                kind=TaskKind.FOCUSED_WORK,
+            )
+            for i in range(10)
+        ] + [
+            SchedulerTask(
+                id=f"high-{i}",
+                title=f"High {i}",
+                estimate_hours=1.0,
+                priority=1,
+                kind=TaskKind.FOCUSED_WORK,
+            )
+            for i in range(3)
+        ]
+        tasks.append(
+            SchedulerTask(
+                id="locked-out",
+                title="Other project",
+                estimate_hours=1.0,
+                priority=1,
+                project_id="other-project",
+            )
+        )
+        slots = [
+            TimeSlot(
+                start=time(9, 0),
+                end=time(10, 0),
+                kind=SlotKind.FOCUSED_WORK,
+                assigned_project_id="main-project",
+            )
+        ]
+        for task in tasks:
+            if task.id != "locked-out":
+                task.project_id = "main-project"
+
+        kept, pruned = _prune_daily_candidates(
+            tasks,
+            slots,
+            date(2025, 6, 23),
+            task_dependencies={"high-0": ["low-9"]},
+            goal_dependencies={},
+            fixed_task_ids={"low-0"},
+            solver_config=None,
+        )
+
+        # Budget is 3h: the fixed task plus the two best-ranked candidates
+        kept_ids = {task.id for task in kept}
+        assert {"high-0", "high-1"} <= kept_ids
+        assert "high-2" in pruned
+        assert "low-0" in kept_ids  # fixed assignment
+        assert "low-9" in kept_ids  # prerequisite of a kept task
+        assert "locked-out" in pruned
+        assert len(kept_ids) == 4
+        assert kept_ids.isdisjoint(pruned)
+        assert len(kept) + len(pruned) == len(tasks)
+
+    def test_optimize_schedule_reports_pruned_tasks_as_unscheduled(self):
+        """Pruned backlog tasks are returned as unscheduled, not dropped."""
+        from datetime import time
+
+        from humancompiler_api.routers.scheduler import optimize_schedule
+        from humancompiler_optimizer.daily import (
+            SchedulerTask,
+            SlotKind,
+            TaskKind,
+            TimeSlot,
+        )
+
+        tasks = [
+            SchedulerTask(
+                id=f"task-{i}",
+                title=f"Task {i}",
+                estimate_hours=1.0,
+                priority=1 if i == 7 else 5,
+                kind=TaskKind.FOCUSED_WORK,
+            )
+            for i in range(8)
+        ]
+        slots = [
+            TimeSlot(start=time(9, 0), end=time(10, 0), kind=SlotKind.FOCUSED_WORK)
+        ]
+
+        result = optimize_schedule(
+            tasks=tasks,
+            time_slots=slots,
+            date=datetime(2025, 6, 23),
+            prune_candidates=True,
+        )
+
+        assert [a.task_id for a in result.assignments] == ["task-7"]
+        assert sorted(result.unscheduled_tasks) == sorted(f"task-{i}" for i in range(7))
+
     def test_create_daily_schedule_empty_time_slots(self, mock_auth):
         """Test schedule creation with empty time slots."""
         request_data = {"date": "2025-06-23", "goal_id": str(uuid4()), "time_slots": []}
@@ -927,7 +1042,7 @@ class TestSchedulerAPI:
             if db.get_session in app.dependency_overrides:
                 del app.dependency_overrides[db.get_session]
 
-    @patch("humancompiler_api.routers.scheduler.optimize_schedule")
+    @patch("humancompiler_api.routers.scheduler.optimize_schedule_async")
     @patch(
         "humancompiler_api.routers.scheduler._get_task_actual_hours",
         return_value={},
@@ -0,0 +1,104 @@
+"""
+Tests for the solver result cache.
+"""
+
+from datetime import datetime, time
+from unittest.mock import patch
+
+from humancompiler_api.routers import scheduler
+from humancompiler_api.solver_cache import (
+    SolverResultCache,
+    solver_fingerprint,
+    solver_result_cache,
+)
+from humancompiler_optimizer.daily import SchedulerTask, SlotKind, TaskKind, TimeSlot
+from humancompiler_optimizer.weekly import WeeklySolverConfig, WeeklyTaskSpec
+
+
+def _tasks(estimate_hours: float = 1.0) -> list[SchedulerTask]:
+    return [
+        SchedulerTask(
+            id="task-1",
+            title="Write report",
+            estimate_hours=estimate_hours,
+            priority=1,
+            kind=TaskKind.FOCUSED_WORK,
+            due_date=datetime(2025, 6, 24),
+        )
+    ]
+
+
+def _slots() -> list[TimeSlot]:
+    return [TimeSlot(start=time(9, 0), end=time(11, 0), kind=SlotKind.FOCUSED_WORK)]
+
+
+def test_fingerprint_is_stable_and_input_sensitive():
+    spec = WeeklyTaskSpec(id="t1", title="Task", hours=2.0, priority_score=5.0)
+    config = WeeklySolverConfig()
+
+    key = solver_fingerprint("weekly", tasks=[spec], config=config)
+    assert key == solver_fingerprint("weekly", config=config, tasks=[spec])
+    assert key.startswith("weekly:")
+
+    changed = WeeklyTaskSpec(id="t1", title="Task", hours=2.5, priority_score=5.0)
+    assert key != solver_fingerprint("weekly", tasks=[changed], config=config)
+    assert key != solver_fingerprint(
+        "weekly", tasks=[spec], config=WeeklySolverConfig(max_time_in_seconds=5.0)
+    )
+
+
+def test_identical_daily_request_reuses_result():
+    hits_before = solver_result_cache.get_stats()["hits"]
+    with patch.object(
+        scheduler, "plan_daily_schedule", wraps=scheduler.plan_daily_schedule
+    ) as planner:
+        first = scheduler.optimize_schedule(_tasks(), _slots(), datetime(2025, 6, 23))
+        second = scheduler.optimize_schedule(_tasks(), _slots(), datetime(2025, 6, 23))
+
+        assert planner.call_count == 1
+        assert [a.task_id for a in second.assignments] == [
+            a.task_id for a in first.assignments
+        ]
+
+        # A logged hour changes remaining minutes, hence the fixture and key
+        logged = _tasks()
+        logged[0].actual_hours = 0.5
+        third = scheduler.optimize_schedule(logged, _slots(), datetime(2025, 6, 23))
+
+    assert planner.call_count == 2
+    assert third.total_scheduled_hours == 0.5
+    assert solver_result_cache.get_stats()["hits"] == hits_before + 1
+
+
+async def test_get_or_compute_respects_should_cache():
+    cache = SolverResultCache(maxsize=4, ttl_seconds=60)
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        return {"success": False}
+
+    for _ in range(2):
+        await cache.get_or_compute(
+            "key", compute, should_cache=lambda result: result["success"]
+        )
+
+    assert len(calls) == 2
+    assert cache.get_stats()["size"] == 0
+
+
+def test_cached_results_are_copied():
+    cache = SolverResultCache(maxsize=4, ttl_seconds=60)
+    cache.set("key", {"ids": ["a"]})
+
+    cache.get("key")["ids"].append("b")
+
+    assert cache.get("key") == {"ids": ["a"]}
+
+
+def test_zero_size_disables_cache():
+    cache = SolverResultCache(maxsize=0, ttl_seconds=60)
+    cache.set("key", "value")
+
+    assert cache.get("key") is None
+    assert cache.get_stats()["enabled"] is False
@@ -0,0 +1,180 @@
+"""
+Tests for the off-event-loop solver executor.
+"""
+
+import asyncio
+import operator
+import threading
+from datetime import datetime, time
+
+import pytest
+
+from humancompiler_api.solver_executor import (
+    MAX_NO_IMPROVEMENT_TIMEOUT_SECONDS,
+    SolverCancelledError,
+    SolverExecutor,
+    SolverQueueFullError,
+    SolverUserLimitError,
+    max_search_workers,
+    resolve_search_settings,
+)
+from humancompiler_optimizer.daily import SchedulerTask, TaskKind, TimeSlot, SlotKind
+
+
+@pytest.fixture
+def thread_executor():
+    executor = SolverExecutor(
+        max_workers=2,
+        max_queue_size=3,
+        max_concurrent_per_user=1,
+        backend="thread",
+    )
+    yield executor
+    executor.shutdown()
+
+
+def _wait_for(event: threading.Event) -> str:
+    event.wait(timeout=5)
+    return "done"
+
+
+async def test_run_returns_result_and_updates_stats(thread_executor):
+    result = await thread_executor.run(operator.add, 2, 3, user_id="user-1")
+
+    assert result == 5
+    stats = thread_executor.get_stats()
+    assert stats["submitted"] == 1
+    assert stats["completed"] == 1
+    assert stats["in_flight"] == 0
+    assert stats["active_users"] == 0
+
+
+async def test_run_propagates_solver_exception(thread_executor):
+    with pytest.raises(ZeroDivisionError):
+        await thread_executor.run(operator.truediv, 1, 0)
+
+    assert thread_executor.get_stats()["failed"] == 1
+
+
+async def test_per_user_limit_rejects_second_solve(thread_executor):
+    release = threading.Event()
+    first = asyncio.create_task(
+        thread_executor.run(_wait_for, release, user_id="user-1")
+    )
+    await asyncio.sleep(0.05)
+
+    with pytest.raises(SolverUserLimitError) as exc_info:
+        await thread_executor.run(operator.add, 1, 1, user_id="user-1")
+    assert exc_info.value.status_code == 429
+
+    # Other users are unaffected by the per-user cap
+    assert await thread_executor.run(operator.add, 1, 1, user_id="user-2") == 2
+
+    release.set()
+    assert await first == "done"
+    assert thread_executor.get_stats()["rejected_user_limit"] == 1
+
+
+async def test_queue_limit_rejects_when_full(thread_executor):
+    release = threading.Event()
+    pending = [
+        asyncio.create_task(thread_executor.run(_wait_for, release, user_id=f"u{i}"))
+        for i in range(3)
+    ]
+    await asyncio.sleep(0.05)
+
+    stats = thread_executor.get_stats()
+    assert stats["in_flight"] == 3
+    assert stats["queue_depth"] == 1
+
+    with pytest.raises(SolverQueueFullError):
+        await thread_executor.run(operator.add, 1, 1, user_id="u9")
+
+    release.set()
+    assert await asyncio.gather(*pending) == ["done"] * 3
+    assert thread_executor.get_stats()["rejected_queue_full"] == 1
+
+
+async def test_cancel_check_abandons_solve(thread_executor):
+    release = threading.Event()
+
+    async def disconnected() -> bool:
+        return True
+
+    with pytest.raises(SolverCancelledError):
+        await thread_executor.run(
+            _wait_for,
+            release,
+            user_id="user-1",
+            cancel_check=disconnected,
+            poll_interval=0.01,
+        )
+
+    stats = thread_executor.get_stats()
+    assert stats["cancelled"] == 1
+    # The running solve still holds its slot until the worker finishes
+    assert stats["in_flight"] == 1
+
+    release.set()
+    for _ in range(100):
+        if thread_executor.get_stats()["in_flight"] == 0:
+            break
+        await asyncio.sleep(0.01)
+    assert thread_executor.get_stats()["in_flight"] == 0
+
+
+async def test_process_backend_runs_daily_planner():
+    """The daily optimizer path must work across a process boundary."""
+    from humancompiler_api.routers import scheduler
+
+    executor = SolverExecutor(max_workers=1, backend="process")
+    tasks = [
+        SchedulerTask(
+            id="task-1",
+            title="Write report",
+            estimate_hours=1.0,
+            priority=1,
+            kind=TaskKind.FOCUSED_WORK,
+        )
+    ]
+    slots = [
+        TimeSlot(
+            start=time(9, 0),
+            end=time(11, 0),
+            kind=SlotKind.FOCUSED_WORK,
+            capacity_hours=2.0,
+        )
+    ]
+
+    original = scheduler.solver_executor
+    scheduler.solver_executor = executor
+    try:
+        result = await scheduler.optimize_schedule_async(
+            tasks, slots, datetime(2025, 6, 23), user_id="user-1"
+        )
+    finally:
+        scheduler.solver_executor = original
+        executor.shutdown()
+
+    assert result.success
+    assert [a.task_id for a in result.assignments] == ["task-1"]
+    assert executor.get_stats()["completed"] == 1
+
+
+def test_invalid_backend_rejected():
+    with pytest.raises(ValueError):
+        SolverExecutor(backend="gpu")
+
+
+def test_search_settings_are_capped():
+    cap = max_search_workers()
+
+    assert resolve_search_settings()["num_workers"] == cap
+    settings = resolve_search_settings(
+        num_workers=10_000, no_improvement_timeout_seconds=10_000
+    )
+    assert settings["num_workers"] == cap
+    assert settings["no_improvement_timeout_seconds"] == (
+        MAX_NO_IMPROVEMENT_TIMEOUT_SECONDS
+    )
+    assert resolve_search_settings(num_workers=1)["num_workers"] == 1
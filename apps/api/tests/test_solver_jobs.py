@@ -0,0 +1,194 @@
+"""
+Tests for background solver jobs.
+"""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from humancompiler_api.auth import get_current_user_id
+from humancompiler_api.database import get_session
+from humancompiler_api.main import app
+from humancompiler_api.models import SolverJob, SolverJobStatus, SolverJobType, User
+from humancompiler_api.solver_job_service import SolverJobService
+
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def user(session: Session) -> User:
+    user = User(id=uuid4(), email="solver-jobs@example.com")
+    session.add(user)
+    session.commit()
+    return user
+
+
+@pytest.fixture
+def service(session: Session) -> SolverJobService:
+    engine = session.get_bind()
+    return SolverJobService(session_factory=lambda: Session(engine))
+
+
+@pytest.fixture
+def mock_send():
+    with patch(
+        "humancompiler_api.solver_job_service.connection_manager.send_to_user",
+        new_callable=AsyncMock,
+        return_value=1,
+    ) as send:
+        yield send
+
+
+async def test_job_runs_to_completion_and_pushes_event(
+    session: Session, user: User, service: SolverJobService, mock_send
+):
+    job = service.create_job(
+        session, user.id, SolverJobType.WEEKLY_TASK_SOLVER, {"week": "2025-06-23"}
+    )
+    assert job.status == SolverJobStatus.QUEUED
+
+    progress_seen = []
+
+    async def runner(job_session, report_progress):
+        report_progress(50, "solving")
+        progress_seen.append(job_session.get(SolverJob, job.id).progress)
+        return {"selected_tasks": ["task-1"]}
+
+    await service.start(job, runner)
+
+    session.expire_all()
+    stored = service.get_job(session, user.id, job.id)
+    assert stored.status == SolverJobStatus.COMPLETED
+    assert stored.progress == 100
+    assert stored.result_json == {"selected_tasks": ["task-1"]}
+    assert stored.started_at is not None and stored.completed_at is not None
+    assert progress_seen == [50]
+
+    mock_send.assert_awaited_once()
+    user_id, message = mock_send.await_args.args
+    assert user_id == str(user.id)
+    assert message["type"] == "solver_job_completed"
+    assert message["job_id"] == str(job.id)
+    assert message["status"] == "completed"
+
+
+async def test_failed_job_records_error(
+    session: Session, user: User, service: SolverJobService, mock_send
+):
+    job = service.create_job(session, user.id, SolverJobType.DAILY_SCHEDULE, {})
+
+    async def runner(job_session, report_progress):
+        raise HTTPException(
+            status_code=429,
+            detail={"error": {"code": "SOLVER_USER_LIMIT", "message": "busy"}},
+        )
+
+    await service.start(job, runner)
+
+    session.expire_all()
+    stored = service.get_job(session, user.id, job.id)
+    assert stored.status == SolverJobStatus.FAILED
+    assert stored.error_message == "busy"
+    assert mock_send.await_args.args[1]["status"] == "failed"
+
+
+def test_get_job_is_scoped_to_owner(
+    session: Session, user: User, service: SolverJobService
+):
+    job = service.create_job(session, user.id, SolverJobType.DAILY_SCHEDULE, {})
+
+    with pytest.raises(HTTPException) as exc_info:
+        service.get_job(session, uuid4(), job.id)
+    assert exc_info.value.status_code == 404
+
+
+def test_fail_interrupted_jobs(session: Session, user: User, service: SolverJobService):
+    stale = service.create_job(session, user.id, SolverJobType.DAILY_SCHEDULE, {})
+    # Still running elsewhere: its heartbeat is recent
+    live = service.create_job(session, user.id, SolverJobType.DAILY_SCHEDULE, {})
+    done = service.create_job(session, user.id, SolverJobType.DAILY_SCHEDULE, {})
+    stale.updated_at = datetime.now(UTC) - timedelta(hours=1)
+    live.status = SolverJobStatus.RUNNING
+    done.status = SolverJobStatus.COMPLETED
+    done.updated_at = stale.updated_at
+    session.add_all([stale, live, done])
+    session.commit()
+
+    assert service.fail_interrupted_jobs() == 1
+
+    session.expire_all()
+    assert session.get(SolverJob, stale.id).status == SolverJobStatus.FAILED
+    assert session.get(SolverJob, live.id).status == SolverJobStatus.RUNNING
+    assert session.get(SolverJob, done.id).status == SolverJobStatus.COMPLETED
+
+
+async def test_running_job_sends_heartbeats(session: Session, user: User, mock_send):
+    engine = session.get_bind()
+    service = SolverJobService(
+        session_factory=lambda: Session(engine), heartbeat_seconds=0.01
+    )
+    job = service.create_job(session, user.id, SolverJobType.DAILY_SCHEDULE, {})
+
+    async def runner(job_session, report_progress):
+        await asyncio.sleep(0.1)
+        with Session(engine) as check_session:
+            running = check_session.get(SolverJob, job.id)
+            return {"beat": (running.updated_at - running.started_at).total_seconds()}
+
+    await service.start(job, runner)
+
+    session.expire_all()
+    assert session.get(SolverJob, job.id).result_json["beat"] >= 0.01
+
+
+def test_submit_weekly_job_returns_job_id_and_is_pollable(session: Session, user: User):
+    def override_session():
+        yield session
+
+    app.dependency_overrides[get_session] = override_session
+    app.dependency_overrides[get_current_user_id] = lambda: str(user.id)
+
+    try:
+        with patch(
+            "humancompiler_api.routers.ai_planning.solver_job_service.start"
+        ) as mock_start:
+            response = client.post(
+                "/api/ai/weekly-task-solver/jobs",
+                json={"week_start_date": "2099-01-05"},
+            )
+
+        assert response.status_code == 202
+        body = response.json()
+        assert body["status"] == "queued"
+        assert body["job_type"] == "weekly_task_solver"
+        mock_start.assert_called_once()
+
+        poll = client.get(f"/api/solver-jobs/{body['id']}")
+        assert poll.status_code == 200
+        assert poll.json()["id"] == body["id"]
+
+        listing = client.get("/api/solver-jobs")
+        assert listing.status_code == 200
+        assert listing.json()["total"] == 1
+    finally:
+        app.dependency_overrides.pop(get_session, None)
+        app.dependency_overrides.pop(get_current_user_id, None)
+
+
+def test_submit_weekly_job_rejects_invalid_date(session: Session, user: User):
+    app.dependency_overrides[get_current_user_id] = lambda: str(user.id)
+    try:
+        response = client.post(
+            "/api/ai/weekly-task-solver/jobs",
+            json={"week_start_date": "not-a-date"},
+        )
+        assert response.status_code == 400
+    finally:
+        app.dependency_overrides.pop(get_current_user_id, None)
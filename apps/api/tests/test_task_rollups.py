@@ -0,0 +1,108 @@
+"""
+Tests for per-task log rollups maintained on log writes.
+"""
+
+from uuid import uuid4
+
+import pytest
+from sqlmodel import Session
+
+from conftest import create_test_data
+from humancompiler_api.models import (
+    Log,
+    LogCreate,
+    LogUpdate,
+    Task,
+    TaskCreate,
+    TaskLogRollup,
+)
+from humancompiler_api.services import LogService, ProjectService, TaskService
+from humancompiler_api.task_rollups import (
+    get_actual_minutes_map,
+    get_task_rollups,
+    reconcile_task_rollups,
+)
+
+
+@pytest.fixture
+def task(session: Session, test_user_id):
+    test_data = create_test_data(session, test_user_id)
+    return TaskService().create_task(
+        session,
+        TaskCreate(goal_id=test_data["goal"].id, title="Logged", estimate_hours=5),
+        test_user_id,
+    )
+
+
+def test_log_writes_maintain_totals(session: Session, test_user_id, task):
+    log_service = LogService()
+
+    first = log_service.create_log(
+        session, LogCreate(task_id=task.id, actual_minutes=30), test_user_id
+    )
+    log_service.create_log(
+        session, LogCreate(task_id=task.id, actual_minutes=45), test_user_id
+    )
+    assert get_task_rollups(session, [task.id]) == {task.id: (75, 2)}
+
+    log_service.update_log(
+        session, first.id, test_user_id, LogUpdate(actual_minutes=50)
+    )
+    assert get_task_rollups(session, [task.id]) == {task.id: (95, 2)}
+
+    # Comment-only updates leave the totals alone
+    log_service.update_log(session, first.id, test_user_id, LogUpdate(comment="x"))
+    assert get_task_rollups(session, [task.id]) == {task.id: (95, 2)}
+
+    log_service.delete_log(session, first.id, test_user_id)
+    assert get_actual_minutes_map(session, [task.id]) == {str(task.id): 45}
+
+
+def test_reconcile_backfills_and_repairs(session: Session, test_user_id, task):
+    # Logs inserted outside the log service (e.g. imports)
+    session.add_all(
+        [
+            Log(id=uuid4(), task_id=task.id, actual_minutes=20),
+            Log(id=uuid4(), task_id=task.id, actual_minutes=40),
+        ]
+    )
+    session.commit()
+    assert get_task_rollups(session, [task.id]) == {}
+
+    dry_run = reconcile_task_rollups(session, dry_run=True)
+    assert (dry_run.created, dry_run.updated, dry_run.removed) == (1, 0, 0)
+    assert get_task_rollups(session, [task.id]) == {}
+
+    result = reconcile_task_rollups(session, owner_id=test_user_id)
+    assert result.created == 1
+    assert get_task_rollups(session, [task.id]) == {task.id: (60, 2)}
+
+    rollup = session.get(TaskLogRollup, task.id)
+    rollup.actual_minutes = 999
+    session.add(rollup)
+    session.commit()
+    assert reconcile_task_rollups(session).updated == 1
+    assert get_task_rollups(session, [task.id]) == {task.id: (60, 2)}
+
+    assert reconcile_task_rollups(session).changed == 0
+
+
+def test_reconcile_is_scoped_to_owner(session: Session, test_user_id, task):
+    session.add(Log(id=uuid4(), task_id=task.id, actual_minutes=20))
+    session.commit()
+
+    result = reconcile_task_rollups(session, owner_id=uuid4())
+
+    assert result.checked == 0
+    assert get_task_rollups(session, [task.id]) == {}
+
+
+def test_deleting_project_removes_rollups(session: Session, test_user_id, task):
+    LogService().create_log(
+        session, LogCreate(task_id=task.id, actual_minutes=30), test_user_id
+    )
+    project_id = session.get(Task, task.id).goal.project_id
+
+    ProjectService().delete_project(session, project_id, test_user_id)
+
+    assert session.get(TaskLogRollup, task.id) is None
@@ -20,6 +20,8 @@ from humancompiler_api.models import (
 )
 from humancompiler_api.auth import AuthUser, get_current_user
 from humancompiler_api.database import get_session
+from humancompiler_api.routers import timeline
+from humancompiler_api.task_rollups import apply_log_delta
 
 
 # Test helper functions
@@ -122,6 +124,8 @@ def create_test_log(
         created_at=datetime.now(UTC),
     )
     session.add(log)
+    # Keep the task's log totals in step, as the log service does
+    apply_log_delta(session, task_id, actual_minutes, 1)
     session.commit()
     session.refresh(log)
     return log
@@ -463,3 +467,96 @@ class TestTimelineRouter:
                 assert task["status_color"] == "#3b82f6"  # Blue
             elif task["title"] == "Completed Task":
                 assert task["status_color"] == "#22c55e"  # Green
+
+    def test_project_timeline_etag(self, client: TestClient, test_session: Session):
+        """Unchanged timelines return 304; any change issues a new ETag"""
+        user = create_test_user(test_session)
+        project = create_test_project(test_session, user.id)
+        goal = create_test_goal(test_session, project.id)
+        task = create_test_task(test_session, goal.id)
+
+        app.dependency_overrides[get_current_user] = lambda: AuthUser(
+            user_id=str(user.id), email=user.email
+        )
+        app.dependency_overrides[get_session] = lambda: test_session
+
+        url = f"/api/timeline/projects/{project.id}"
+        response = client.get(url)
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+
+        response = client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+
+        # Different query parameters produce a different response
+        response = client.get(
+            url, params={"time_unit": "week"}, headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 200
+
+        create_test_log(test_session, task.id, actual_minutes=30)
+        response = client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        assert response.json()["goals"][0]["tasks"][0]["logs_count"] == 1
+
+    def test_default_range_etag_changes_with_the_day(
+        self, client: TestClient, test_session: Session, monkeypatch
+    ):
+        """A request without dates is not answered 304 once the day has moved"""
+        user = create_test_user(test_session)
+        project = create_test_project(test_session, user.id)
+
+        app.dependency_overrides[get_current_user] = lambda: AuthUser(
+            user_id=str(user.id), email=user.email
+        )
+        app.dependency_overrides[get_session] = lambda: test_session
+
+        url = f"/api/timeline/projects/{project.id}"
+        etag = client.get(url).headers["etag"]
+
+        class Tomorrow(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return datetime.now(tz) + timedelta(days=1)
+
+        monkeypatch.setattr(timeline, "datetime", Tomorrow)
+        response = client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    def test_project_timeline_filters_by_range(
+        self, client: TestClient, test_session: Session
+    ):
+        """Tasks finished before or created after the range are not returned"""
+        user = create_test_user(test_session)
+        project = create_test_project(test_session, user.id)
+        goal = create_test_goal(test_session, project.id)
+        create_test_task(test_session, goal.id, title="Open")
+        finished = create_test_task(
+            test_session, goal.id, title="Finished", status=TaskStatus.COMPLETED
+        )
+        finished.updated_at = datetime.now(UTC) - timedelta(days=60)
+        test_session.add(finished)
+        test_session.commit()
+
+        app.dependency_overrides[get_current_user] = lambda: AuthUser(
+            user_id=str(user.id), email=user.email
+        )
+        app.dependency_overrides[get_session] = lambda: test_session
+
+        url = f"/api/timeline/projects/{project.id}"
+        start_date = (datetime.now(UTC) - timedelta(days=30)).isoformat()
+        response = client.get(url, params={"start_date": start_date})
+        titles = [task["title"] for task in response.json()["goals"][0]["tasks"]]
+        assert titles == ["Open"]
+
+        end_date = (datetime.now(UTC) - timedelta(days=1)).isoformat()
+        response = client.get(url, params={"end_date": end_date})
+        assert response.json()["goals"] == []
+
+        overview = client.get(
+            "/api/timeline/overview", params={"start_date": start_date}
+        ).json()
+        assert overview["projects"][0]["statistics"]["total_tasks"] == 1
@@ -140,7 +140,10 @@ def save_settings(session: Session, user_id, project_allocations, inbox=0, capac
     )
 
 
-def test_capacity_selection_recommends_overflow_cancel(session: Session, triage_user):
+@pytest.mark.asyncio
+async def test_capacity_selection_recommends_overflow_cancel(
+    session: Session, triage_user
+):
     user = triage_user["user"]
     project = triage_user["project"]
     other_project = triage_user["other_project"]
@@ -166,7 +169,7 @@ def test_capacity_selection_recommends_overflow_cancel(session: Session, triage_
         capacity=10,
     )
 
-    run = triage_service.create_run(session, user.id)
+    run = await triage_service.create_run(session, user.id)
     recommendations = {
         item.task_id or item.quick_task_id: item.recommendation for item in run.items
     }
@@ -178,7 +181,8 @@ def test_capacity_selection_recommends_overflow_cancel(session: Session, triage_
     assert run.summary["cancel_candidate_items"] == 2
 
 
-def test_long_term_tasks_use_weekly_capacity_load(session: Session, triage_user):
+@pytest.mark.asyncio
+async def test_long_term_tasks_use_weekly_capacity_load(session: Session, triage_user):
     user = triage_user["user"]
     project = triage_user["project"]
     goal = triage_user["goal"]
@@ -192,7 +196,7 @@ def test_long_term_tasks_use_weekly_capacity_load(session: Session, triage_user)
     )
     save_settings(session, user.id, {project.id: 100}, capacity=5)
 
-    run = triage_service.create_run(session, user.id)
+    run = await triage_service.create_run(session, user.id)
     item = next(item for item in run.items if item.task_id == task.id)
 
     assert item.recommendation == TriageRecommendation.KEEP
@@ -201,7 +205,10 @@ def test_long_term_tasks_use_weekly_capacity_load(session: Session, triage_user)
     assert run.summary["total_remaining_hours"] == 40.0
 
 
-def test_tasks_beyond_twelve_weeks_use_twelve_week_load(session: Session, triage_user):
+@pytest.mark.asyncio
+async def test_tasks_beyond_twelve_weeks_use_twelve_week_load(
+    session: Session, triage_user
+):
     user = triage_user["user"]
     project = triage_user["project"]
     goal = triage_user["goal"]
@@ -215,7 +222,7 @@ def test_tasks_beyond_twelve_weeks_use_twelve_week_load(session: Session, triage
     )
     save_settings(session, user.id, {project.id: 100}, capacity=5)
 
-    run = triage_service.create_run(session, user.id)
+    run = await triage_service.create_run(session, user.id)
     item = next(item for item in run.items if item.task_id == task.id)
 
     assert item.recommendation == TriageRecommendation.KEEP
@@ -226,14 +233,15 @@ def test_tasks_beyond_twelve_weeks_use_twelve_week_load(session: Session, triage
     )
 
 
-def test_triage_enums_persist_lowercase_values(session: Session, triage_user):
+@pytest.mark.asyncio
+async def test_triage_enums_persist_lowercase_values(session: Session, triage_user):
     user = triage_user["user"]
     project = triage_user["project"]
     goal = triage_user["goal"]
     add_task(session, goal.id, "Persisted enum task", "2.00", priority=1)
     save_settings(session, user.id, {project.id: 100}, capacity=4)
 
-    run = triage_service.create_run(session, user.id)
+    run = await triage_service.create_run(session, user.id)
 
     run_row = session.exec(
         text("SELECT source, status FROM task_triage_runs LIMIT 1")
@@ -282,7 +290,8 @@ def test_ai_adjustment_can_change_capacity_order(session: Session, triage_user):
     assert by_id[first_task.id] == TriageRecommendation.CANCEL
 
 
-def test_apply_cancels_regular_and_quick_tasks(session: Session, triage_user):
+@pytest.mark.asyncio
+async def test_apply_cancels_regular_and_quick_tasks(session: Session, triage_user):
     user = triage_user["user"]
     project = triage_user["project"]
     goal = triage_user["goal"]
@@ -290,7 +299,7 @@ def test_apply_cancels_regular_and_quick_tasks(session: Session, triage_user):
     quick_task = add_quick_task(session, user.id, "Quick", "4.00", priority=5)
     save_settings(session, user.id, {project.id: 0}, inbox=100, capacity=4)
 
-    run = triage_service.create_run(session, user.id)
+    run = await triage_service.create_run(session, user.id)
     item_ids = [
         item.id
         for item in run.items
@@ -305,6 +314,35 @@ def test_apply_cancels_regular_and_quick_tasks(session: Session, triage_user):
     assert quick_task.status == TaskStatus.PENDING
 
 
+@pytest.mark.asyncio
+async def test_apply_invalidates_cached_tasks(
+    session: Session, triage_user, monkeypatch
+):
+    from core.cache import CACHE_TAG_TASKS
+    from humancompiler_api.triage import service as service_module
+
+    user = triage_user["user"]
+    project = triage_user["project"]
+    add_task(session, triage_user["goal"].id, "Regular", "4.00", priority=5)
+    save_settings(session, user.id, {project.id: 0}, inbox=100, capacity=4)
+    invalidated = []
+    monkeypatch.setattr(
+        service_module,
+        "invalidate_user_cache",
+        lambda user_id, *tags: invalidated.append((user_id, tags)),
+    )
+
+    run = await triage_service.create_run(session, user.id)
+    item_ids = [
+        item.id
+        for item in run.items
+        if item.recommendation == TriageRecommendation.CANCEL
+    ]
+    triage_service.apply_run(session, user.id, run.id, item_ids)
+
+    assert invalidated == [(user.id, (CACHE_TAG_TASKS,))]
+
+
 def test_settings_validation_requires_total_100(session: Session, triage_user):
     with pytest.raises(HTTPException):
         triage_service.update_settings(
@@ -349,7 +387,8 @@ def test_settings_normalizes_prefixed_project_allocation_keys(
     assert settings.project_allocations_json == {str(project.id): 100}
 
 
-def test_scheduled_generation_creates_run_without_applying(
+@pytest.mark.asyncio
+async def test_scheduled_generation_creates_run_without_applying(
     session: Session, triage_user
 ):
     user = triage_user["user"]
@@ -371,7 +410,7 @@ def test_scheduled_generation_creates_run_without_applying(
         ),
     )
 
-    generated = triage_service.generate_due_scheduled_runs(session)
+    generated = await triage_service.generate_due_scheduled_runs(session)
     runs = session.exec(
         select(TaskTriageRun).where(TaskTriageRun.user_id == user.id)
     ).all()
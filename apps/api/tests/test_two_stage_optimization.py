@@ -2,10 +2,12 @@
 Test the two-stage optimization process: OpenAI Priority Extraction + OR-Tools.
 """
 
+import json
 import pytest
 from datetime import date, timedelta
-from unittest.mock import Mock, AsyncMock
+from unittest.mock import Mock, AsyncMock, patch
 
+from humancompiler_api.ai import weekly_task_solver
 from humancompiler_api.ai.weekly_task_solver import (
     WeeklyTaskSolver,
     TaskSolverRequest,
@@ -14,6 +16,7 @@ from humancompiler_api.ai.weekly_task_solver import (
 )
 from humancompiler_api.ai.models import WeeklyPlanContext
 from humancompiler_api.models import Project, Goal, Task
+from humancompiler_api.solver_executor import SolverCancelledError
 
 
 class TestTwoStageOptimization:
@@ -90,7 +93,7 @@ class TestTwoStageOptimization:
             0
         ].function.arguments = '{"task_priorities": {"task-1": 8.5, "task-2": 6.0}}'
 
-        mock_client.chat.completions.create.return_value = mock_response
+        mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
 
         extractor = TaskPriorityExtractor(openai_client=mock_client)
 
@@ -102,6 +105,53 @@ class TestTwoStageOptimization:
         assert priorities["task-2"] == 6.0
         mock_client.chat.completions.create.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_priority_extraction_only_rescores_changed_tasks(self, mock_context):
+        """Stored scores are reused; only edited tasks go to the model."""
+
+        def scores(**task_priorities):
+            response = Mock()
+            response.choices = [Mock()]
+            response.choices[0].message.tool_calls = [Mock()]
+            tool_call = response.choices[0].message.tool_calls[0]
+            tool_call.function.name = "extract_task_priorities"
+            tool_call.function.arguments = json.dumps(
+                {"task_priorities": task_priorities}
+            )
+            return response
+
+        def prompted_task_ids(call):
+            prompt = call.kwargs["messages"][1]["content"]
+            return {task_id for task_id in ("task-1", "task-2") if task_id in prompt}
+
+        mock_client = Mock()
+        mock_client.chat.completions.create = AsyncMock(
+            side_effect=[
+                scores(**{"task-1": 7.0}),
+                scores(**{"task-2": 4.0}),
+                # The model skips the edited task; the heuristic fills in
+                scores(),
+            ]
+        )
+        extractor = TaskPriorityExtractor(openai_client=mock_client)
+
+        with patch.object(weekly_task_solver, "PRIORITY_BATCH_SIZE", 1):
+            first = await extractor.extract_priorities(mock_context, None, [])
+        assert first == {"task-1": 7.0, "task-2": 4.0}
+        assert mock_client.chat.completions.create.await_count == 2
+
+        assert await extractor.extract_priorities(mock_context, None, []) == first
+        assert mock_client.chat.completions.create.await_count == 2
+
+        mock_context.tasks[1].estimate_hours = 1.0
+        third = await extractor.extract_priorities(mock_context, None, [])
+        calls = mock_client.chat.completions.create.await_args_list
+        assert len(calls) == 3
+        assert prompted_task_ids(calls[2]) == {"task-2"}
+        assert third["task-1"] == 7.0
+        heuristic = extractor._fallback_priority_calculation(mock_context, [])
+        assert third["task-2"] == heuristic["task-2"]
+
     @pytest.mark.asyncio
     async def test_two_stage_optimization_with_ortools(self, mock_context):
         """Test the complete two-stage optimization process."""
@@ -140,6 +190,40 @@ class TestTwoStageOptimization:
         if request.user_prompt:
             assert any("ユーザー指示" in insight for insight in insights)
 
+    @pytest.mark.asyncio
+    async def test_client_disconnect_cancels_ortools_solve(self, mock_context):
+        """A disconnect reported by cancel_check abandons the weekly solve."""
+        solver = WeeklyTaskSolver(openai_client=None)
+        solver.priority_extractor = Mock()
+        solver.priority_extractor.extract_priorities = AsyncMock(
+            return_value={"task-1": 8.0, "task-2": 3.0}
+        )
+        solver.context_collector = Mock()
+        solver.context_collector.collect_weekly_plan_context = AsyncMock(
+            return_value=mock_context
+        )
+
+        async def disconnected() -> bool:
+            return True
+
+        request = TaskSolverRequest(
+            week_start_date="2025-08-18",
+            constraints=WeeklyConstraints(total_capacity_hours=40.0),
+        )
+        run = AsyncMock(side_effect=SolverCancelledError())
+        with (
+            patch.object(
+                solver, "_collect_solver_context", AsyncMock(return_value=mock_context)
+            ),
+            patch.object(weekly_task_solver.solver_executor, "run", run),
+        ):
+            with pytest.raises(SolverCancelledError):
+                await solver.solve_weekly_tasks(
+                    Mock(), "user-1", request, cancel_check=disconnected
+                )
+
+        assert run.await_args.kwargs["cancel_check"] is disconnected
+
     def test_ortools_constraint_formulation(self, mock_context):
         """Test OR-Tools constraint formulation."""
         # This test would verify that constraints are properly formulated
@@ -185,7 +269,9 @@ class TestTwoStageOptimization:
     async def test_priority_extraction_error_handling(self, mock_context):
         """Test error handling in priority extraction."""
         mock_client = Mock()
-        mock_client.chat.completions.create.side_effect = Exception("API Error")
+        mock_client.chat.completions.create = AsyncMock(
+            side_effect=Exception("API Error")
+        )
 
         extractor = TaskPriorityExtractor(openai_client=mock_client)
 
@@ -2,7 +2,7 @@
 
 import pytest
 from datetime import datetime
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 from sqlmodel import Session
 
 from humancompiler_api.ai.report_generator import WeeklyReportGenerator
@@ -160,9 +160,10 @@ class TestWeeklyReportGenerator:
         assert summary.total_tasks_worked == 1
         assert len(summary.daily_breakdown) == 7
 
-    @patch("humancompiler_api.ai.report_generator.OpenAI")
-    def test_generate_markdown_report_with_ai_success(
-        self, mock_openai_class, report_generator
+    @pytest.mark.asyncio
+    @patch("humancompiler_api.ai.report_generator.get_openai_client")
+    async def test_generate_markdown_report_with_ai_success(
+        self, mock_get_client, report_generator
     ):
         """Test successful AI report generation."""
         # Mock OpenAI response
@@ -170,8 +171,8 @@ class TestWeeklyReportGenerator:
         mock_response = Mock()
         mock_response.choices = [Mock()]
         mock_response.choices[0].message.content = "# Weekly Report\n\nTest content"
-        mock_client.chat.completions.create.return_value = mock_response
-        mock_openai_class.return_value = mock_client
+        mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
+        mock_get_client.return_value = mock_client
 
         work_summary = WeeklyWorkSummary(
             total_actual_minutes=120,
@@ -183,22 +184,25 @@ class TestWeeklyReportGenerator:
             project_breakdown={},
         )
 
-        result = report_generator._generate_markdown_report_with_ai(
+        result = await report_generator._generate_markdown_report_with_ai(
             "test-api-key", "2023-12-18", work_summary, [], "gpt-4o-mini"
         )
 
         assert result == "# Weekly Report\n\nTest content"
         mock_client.chat.completions.create.assert_called_once()
 
-    @patch("humancompiler_api.ai.report_generator.OpenAI")
-    def test_generate_markdown_report_with_ai_failure_fallback(
-        self, mock_openai_class, report_generator
+    @pytest.mark.asyncio
+    @patch("humancompiler_api.ai.report_generator.get_openai_client")
+    async def test_generate_markdown_report_with_ai_failure_fallback(
+        self, mock_get_client, report_generator
     ):
         """Test AI report generation failure with fallback."""
         # Mock OpenAI to raise an exception
         mock_client = Mock()
-        mock_client.chat.completions.create.side_effect = Exception("API Error")
-        mock_openai_class.return_value = mock_client
+        mock_client.chat.completions.create = AsyncMock(
+            side_effect=Exception("API Error")
+        )
+        mock_get_client.return_value = mock_client
 
         work_summary = WeeklyWorkSummary(
             total_actual_minutes=120,
@@ -210,7 +214,7 @@ class TestWeeklyReportGenerator:
             project_breakdown={"Test Project": 120},
         )
 
-        result = report_generator._generate_markdown_report_with_ai(
+        result = await report_generator._generate_markdown_report_with_ai(
             "test-api-key", "2023-12-18", work_summary, [], "gpt-4o-mini"
         )
 
@@ -238,8 +242,9 @@ class TestWeeklyReportGenerator:
         assert "**週間合計作業時間**: 2.0時間" in result
         assert "Test Project: 2.0時間" in result
 
+    @pytest.mark.asyncio
     @patch.object(WeeklyReportGenerator, "_get_work_logs_for_week")
-    def test_generate_weekly_report_no_logs(
+    async def test_generate_weekly_report_no_logs(
         self, mock_get_logs, report_generator, mock_session
     ):
         """Test weekly report generation when no work logs exist."""
@@ -247,7 +252,7 @@ class TestWeeklyReportGenerator:
 
         request = WeeklyReportRequest(week_start_date="2023-12-18", project_ids=None)
 
-        result = report_generator.generate_weekly_report(
+        result = await report_generator.generate_weekly_report(
             mock_session, request, "user-123", "test-api-key", "gpt-4o-mini"
         )
 
@@ -255,9 +260,10 @@ class TestWeeklyReportGenerator:
         assert result.work_summary.total_actual_minutes == 0
         assert "作業実績なし" in result.markdown_report
 
+    @pytest.mark.asyncio
     @patch.object(WeeklyReportGenerator, "_get_work_logs_for_week")
     @patch.object(WeeklyReportGenerator, "_generate_markdown_report_with_ai")
-    def test_generate_weekly_report_with_data(
+    async def test_generate_weekly_report_with_data(
         self,
         mock_generate_ai,
         mock_get_logs,
@@ -284,7 +290,7 @@ class TestWeeklyReportGenerator:
             week_start_date="2023-12-18", project_ids=[str(sample_project.id)]
         )
 
-        result = report_generator.generate_weekly_report(
+        result = await report_generator.generate_weekly_report(
             mock_session, request, str(sample_user.id), "test-api-key", "gpt-4o-mini"
         )
 
@@ -344,14 +350,15 @@ class TestWeeklyReportErrorCases:
     def report_generator(self):
         return WeeklyReportGenerator()
 
-    @patch("humancompiler_api.ai.report_generator.OpenAI")
-    def test_openai_api_key_error(self, mock_openai_class, report_generator):
+    @pytest.mark.asyncio
+    @patch("humancompiler_api.ai.report_generator.get_openai_client")
+    async def test_openai_api_key_error(self, mock_get_client, report_generator):
         """Test handling of OpenAI API key authentication errors."""
         mock_client = Mock()
-        mock_client.chat.completions.create.side_effect = Exception(
-            "API key authentication failed"
+        mock_client.chat.completions.create = AsyncMock(
+            side_effect=Exception("API key authentication failed")
         )
-        mock_openai_class.return_value = mock_client
+        mock_get_client.return_value = mock_client
 
         work_summary = WeeklyWorkSummary(
             total_actual_minutes=0,
@@ -364,7 +371,7 @@ class TestWeeklyReportErrorCases:
         )
 
         with patch.object(report_generator, "logger") as mock_logger:
-            result = report_generator._generate_markdown_report_with_ai(
+            result = await report_generator._generate_markdown_report_with_ai(
                 "invalid-key", "2023-12-18", work_summary, [], "gpt-4o-mini"
             )
 
@@ -372,14 +379,15 @@ class TestWeeklyReportErrorCases:
             mock_logger.error.assert_called()
             assert "週間作業報告書" in result
 
-    @patch("humancompiler_api.ai.report_generator.OpenAI")
-    def test_openai_rate_limit_error(self, mock_openai_class, report_generator):
+    @pytest.mark.asyncio
+    @patch("humancompiler_api.ai.report_generator.get_openai_client")
+    async def test_openai_rate_limit_error(self, mock_get_client, report_generator):
         """Test handling of OpenAI rate limit errors."""
         mock_client = Mock()
-        mock_client.chat.completions.create.side_effect = Exception(
-            "rate limit exceeded for requests"
+        mock_client.chat.completions.create = AsyncMock(
+            side_effect=Exception("rate limit exceeded for requests")
         )
-        mock_openai_class.return_value = mock_client
+        mock_get_client.return_value = mock_client
 
         work_summary = WeeklyWorkSummary(
             total_actual_minutes=0,
@@ -392,7 +400,7 @@ class TestWeeklyReportErrorCases:
         )
 
         with patch.object(report_generator, "logger") as mock_logger:
-            result = report_generator._generate_markdown_report_with_ai(
+            result = await report_generator._generate_markdown_report_with_ai(
                 "test-key", "2023-12-18", work_summary, [], "gpt-4o-mini"
             )
 
@@ -400,15 +408,16 @@ class TestWeeklyReportErrorCases:
             mock_logger.warning.assert_called()
             assert "週間作業報告書" in result
 
-    @patch("humancompiler_api.ai.report_generator.OpenAI")
-    def test_custom_model_usage(self, mock_openai_class, report_generator):
+    @pytest.mark.asyncio
+    @patch("humancompiler_api.ai.report_generator.get_openai_client")
+    async def test_custom_model_usage(self, mock_get_client, report_generator):
         """Test that custom OpenAI model is used correctly."""
         mock_client = Mock()
         mock_response = Mock()
         mock_response.choices = [Mock()]
         mock_response.choices[0].message.content = "# Custom Model Report"
-        mock_client.chat.completions.create.return_value = mock_response
-        mock_openai_class.return_value = mock_client
+        mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
+        mock_get_client.return_value = mock_client
 
         work_summary = WeeklyWorkSummary(
             total_actual_minutes=0,
@@ -421,7 +430,7 @@ class TestWeeklyReportErrorCases:
         )
 
         # Test with custom model
-        result = report_generator._generate_markdown_report_with_ai(
+        result = await report_generator._generate_markdown_report_with_ai(
             "test-key", "2023-12-18", work_summary, [], "gpt-4"
         )
 
@@ -436,13 +445,14 @@ class TestWeeklyReportErrorCases:
         with pytest.raises(ValueError):
             report_generator._get_week_dates("invalid-date")
 
-    def test_empty_response_from_openai(self, report_generator):
+    @pytest.mark.asyncio
+    async def test_empty_response_from_openai(self, report_generator):
         """Test handling when OpenAI returns empty response."""
         with patch.object(report_generator, "_get_openai_client") as mock_get_client:
             mock_client = Mock()
             mock_response = Mock()
             mock_response.choices = []
-            mock_client.chat.completions.create.return_value = mock_response
+            mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
             mock_get_client.return_value = mock_client
 
             work_summary = WeeklyWorkSummary(
@@ -456,7 +466,7 @@ class TestWeeklyReportErrorCases:
             )
 
             with patch.object(report_generator, "logger") as mock_logger:
-                result = report_generator._generate_markdown_report_with_ai(
+                result = await report_generator._generate_markdown_report_with_ai(
                     "test-key", "2023-12-18", work_summary, [], "gpt-4o-mini"
                 )
 
@@ -0,0 +1,119 @@
+"""
+Tests for set-based workload metrics.
+"""
+
+from datetime import UTC, date, datetime, time, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlmodel import Session, select
+
+from humancompiler_api.ai.analysis_cache import analyze_workload_cached
+from humancompiler_api.ai.workload_analysis import compute_workload_metrics
+from humancompiler_api.models import (
+    Goal,
+    Project,
+    Task,
+    TaskCreate,
+    TaskStatus,
+    User,
+)
+from humancompiler_api.services import TaskService
+
+TODAY = date(2025, 6, 23)
+
+
+def _due(days: int) -> datetime:
+    return datetime.combine(TODAY, time(9), tzinfo=UTC) + timedelta(days=days)
+
+
+@pytest.fixture
+def workload(session: Session):
+    user = User(id=uuid4(), email="workload@example.com")
+    alpha = Project(id=uuid4(), owner_id=user.id, title="Alpha")
+    beta = Project(id=uuid4(), owner_id=user.id, title="Beta")
+    idle = Project(id=uuid4(), owner_id=user.id, title="Idle")
+    alpha_goal = Goal(id=uuid4(), project_id=alpha.id, title="A", estimate_hours=10)
+    beta_goal = Goal(id=uuid4(), project_id=beta.id, title="B", estimate_hours=10)
+    session.add_all([user, alpha, beta, idle, alpha_goal, beta_goal])
+
+    specs = [
+        (alpha_goal, 2.5, TaskStatus.PENDING, _due(-1)),  # overdue
+        (alpha_goal, 1.0, TaskStatus.IN_PROGRESS, _due(0)),  # urgent
+        (alpha_goal, 4.0, TaskStatus.PENDING, _due(3)),  # urgent (last day)
+        (alpha_goal, 3.0, TaskStatus.PENDING, _due(4)),  # outside the window
+        (alpha_goal, 8.0, TaskStatus.COMPLETED, _due(-5)),  # inactive
+        (beta_goal, 1.5, TaskStatus.PENDING, None),
+        (beta_goal, 6.0, TaskStatus.CANCELLED, _due(1)),  # inactive
+    ]
+    session.add_all(
+        Task(
+            id=uuid4(),
+            goal_id=goal.id,
+            title=f"Task {index}",
+            estimate_hours=hours,
+            status=status,
+            due_date=due_date,
+        )
+        for index, (goal, hours, status, due_date) in enumerate(specs)
+    )
+    session.commit()
+    return user, alpha, beta
+
+
+def test_aggregates_active_tasks_by_project_and_due_window(session: Session, workload):
+    user, _, _ = workload
+
+    metrics = compute_workload_metrics(session, user.id, today=TODAY)
+
+    assert metrics.total_tasks == 5
+    assert metrics.total_estimated_hours == pytest.approx(12.0)
+    assert metrics.overdue_tasks == 1
+    assert metrics.urgent_tasks == 2
+    assert metrics.projects_involved == 3
+    assert metrics.project_distribution == {"Alpha": 10.5, "Beta": 1.5}
+
+
+def test_project_filter(session: Session, workload):
+    user, _, beta = workload
+
+    metrics = compute_workload_metrics(session, user.id, [str(beta.id)], TODAY)
+
+    assert metrics.total_tasks == 1
+    assert metrics.projects_involved == 1
+    assert metrics.project_distribution == {"Beta": 1.5}
+
+
+def test_analyze_workload_keeps_response_structure(session: Session, workload):
+    user, _, _ = workload
+
+    result = analyze_workload_cached(session, str(user.id))
+
+    assert result["success"] is True
+    assert set(result["analysis"]) == {
+        "total_estimated_hours",
+        "total_tasks",
+        "overdue_tasks",
+        "urgent_tasks",
+        "projects_involved",
+        "project_distribution",
+    }
+    assert result["analysis"]["total_tasks"] == 5
+    assert result["recommendations"]
+
+
+def test_task_writes_invalidate_cached_analysis(session: Session, workload):
+    user, alpha, _ = workload
+    goal = session.exec(select(Goal).where(Goal.project_id == alpha.id)).one()
+
+    first = analyze_workload_cached(session, str(user.id))
+    # Served from cache even with a different session object
+    with Session(session.get_bind()) as other_session:
+        assert analyze_workload_cached(other_session, str(user.id)) is first
+
+    TaskService().create_task(
+        session, TaskCreate(goal_id=goal.id, title="New", estimate_hours=1), user.id
+    )
+
+    refreshed = analyze_workload_cached(session, str(user.id))
+    assert refreshed["analysis"]["total_tasks"] == 6